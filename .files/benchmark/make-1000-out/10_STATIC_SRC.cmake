@@ -0,0 +1,52 @@
+set(10_STATIC_SRC
+${SOURCE_DIR}/s500.c
+${SOURCE_DIR}/s501.c
+${SOURCE_DIR}/s502.c
+${SOURCE_DIR}/s503.c
+${SOURCE_DIR}/s504.c
+${SOURCE_DIR}/s505.c
+${SOURCE_DIR}/s506.c
+${SOURCE_DIR}/s507.c
+${SOURCE_DIR}/s508.c
+${SOURCE_DIR}/s509.c
+${SOURCE_DIR}/s510.c
+${SOURCE_DIR}/s511.c
+${SOURCE_DIR}/s512.c
+${SOURCE_DIR}/s513.c
+${SOURCE_DIR}/s514.c
+${SOURCE_DIR}/s515.c
+${SOURCE_DIR}/s516.c
+${SOURCE_DIR}/s517.c
+${SOURCE_DIR}/s518.c
+${SOURCE_DIR}/s519.c
+${SOURCE_DIR}/s520.c
+${SOURCE_DIR}/s521.c
+${SOURCE_DIR}/s522.c
+${SOURCE_DIR}/s523.c
+${SOURCE_DIR}/s524.c
+${SOURCE_DIR}/s525.c
+${SOURCE_DIR}/s526.c
+${SOURCE_DIR}/s527.c
+${SOURCE_DIR}/s528.c
+${SOURCE_DIR}/s529.c
+${SOURCE_DIR}/s530.c
+${SOURCE_DIR}/s531.c
+${SOURCE_DIR}/s532.c
+${SOURCE_DIR}/s533.c
+${SOURCE_DIR}/s534.c
+${SOURCE_DIR}/s535.c
+${SOURCE_DIR}/s536.c
+${SOURCE_DIR}/s537.c
+${SOURCE_DIR}/s538.c
+${SOURCE_DIR}/s539.c
+${SOURCE_DIR}/s540.c
+${SOURCE_DIR}/s541.c
+${SOURCE_DIR}/s542.c
+${SOURCE_DIR}/s543.c
+${SOURCE_DIR}/s544.c
+${SOURCE_DIR}/s545.c
+${SOURCE_DIR}/s546.c
+${SOURCE_DIR}/s547.c
+${SOURCE_DIR}/s548.c
+${SOURCE_DIR}/s549.c
+)
@@ -0,0 +1,52 @@
+set(13_STATIC_SRC
+${SOURCE_DIR}/s650.c
+${SOURCE_DIR}/s651.c
+${SOURCE_DIR}/s652.c
+${SOURCE_DIR}/s653.c
+${SOURCE_DIR}/s654.c
+${SOURCE_DIR}/s655.c
+${SOURCE_DIR}/s656.c
+${SOURCE_DIR}/s657.c
+${SOURCE_DIR}/s658.c
+${SOURCE_DIR}/s659.c
+${SOURCE_DIR}/s660.c
+${SOURCE_DIR}/s661.c
+${SOURCE_DIR}/s662.c
+${SOURCE_DIR}/s663.c
+${SOURCE_DIR}/s664.c
+${SOURCE_DIR}/s665.c
+${SOURCE_DIR}/s666.c
+${SOURCE_DIR}/s667.c
+${SOURCE_DIR}/s668.c
+${SOURCE_DIR}/s669.c
+${SOURCE_DIR}/s670.c
+${SOURCE_DIR}/s671.c
+${SOURCE_DIR}/s672.c
+${SOURCE_DIR}/s673.c
+${SOURCE_DIR}/s674.c
+${SOURCE_DIR}/s675.c
+${SOURCE_DIR}/s676.c
+${SOURCE_DIR}/s677.c
+${SOURCE_DIR}/s678.c
+${SOURCE_DIR}/s679.c
+${SOURCE_DIR}/s680.c
+${SOURCE_DIR}/s681.c
+${SOURCE_DIR}/s682.c
+${SOURCE_DIR}/s683.c
+${SOURCE_DIR}/s684.c
+${SOURCE_DIR}/s685.c
+${SOURCE_DIR}/s686.c
+${SOURCE_DIR}/s687.c
+${SOURCE_DIR}/s688.c
+${SOURCE_DIR}/s689.c
+${SOURCE_DIR}/s690.c
+${SOURCE_DIR}/s691.c
+${SOURCE_DIR}/s692.c
+${SOURCE_DIR}/s693.c
+${SOURCE_DIR}/s694.c
+${SOURCE_DIR}/s695.c
+${SOURCE_DIR}/s696.c
+${SOURCE_DIR}/s697.c
+${SOURCE_DIR}/s698.c
+${SOURCE_DIR}/s699.c
+)
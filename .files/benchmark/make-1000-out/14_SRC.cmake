@@ -0,0 +1,52 @@
+set(14_SRC
+${SOURCE_DIR}/s700.c
+${SOURCE_DIR}/s701.c
+${SOURCE_DIR}/s702.c
+${SOURCE_DIR}/s703.c
+${SOURCE_DIR}/s704.c
+${SOURCE_DIR}/s705.c
+${SOURCE_DIR}/s706.c
+${SOURCE_DIR}/s707.c
+${SOURCE_DIR}/s708.c
+${SOURCE_DIR}/s709.c
+${SOURCE_DIR}/s710.c
+${SOURCE_DIR}/s711.c
+${SOURCE_DIR}/s712.c
+${SOURCE_DIR}/s713.c
+${SOURCE_DIR}/s714.c
+${SOURCE_DIR}/s715.c
+${SOURCE_DIR}/s716.c
+${SOURCE_DIR}/s717.c
+${SOURCE_DIR}/s718.c
+${SOURCE_DIR}/s719.c
+${SOURCE_DIR}/s720.c
+${SOURCE_DIR}/s721.c
+${SOURCE_DIR}/s722.c
+${SOURCE_DIR}/s723.c
+${SOURCE_DIR}/s724.c
+${SOURCE_DIR}/s725.c
+${SOURCE_DIR}/s726.c
+${SOURCE_DIR}/s727.c
+${SOURCE_DIR}/s728.c
+${SOURCE_DIR}/s729.c
+${SOURCE_DIR}/s730.c
+${SOURCE_DIR}/s731.c
+${SOURCE_DIR}/s732.c
+${SOURCE_DIR}/s733.c
+${SOURCE_DIR}/s734.c
+${SOURCE_DIR}/s735.c
+${SOURCE_DIR}/s736.c
+${SOURCE_DIR}/s737.c
+${SOURCE_DIR}/s738.c
+${SOURCE_DIR}/s739.c
+${SOURCE_DIR}/s740.c
+${SOURCE_DIR}/s741.c
+${SOURCE_DIR}/s742.c
+${SOURCE_DIR}/s743.c
+${SOURCE_DIR}/s744.c
+${SOURCE_DIR}/s745.c
+${SOURCE_DIR}/s746.c
+${SOURCE_DIR}/s747.c
+${SOURCE_DIR}/s748.c
+${SOURCE_DIR}/s749.c
+)
@@ -0,0 +1,52 @@
+set(19_SRC
+${SOURCE_DIR}/s950.c
+${SOURCE_DIR}/s951.c
+${SOURCE_DIR}/s952.c
+${SOURCE_DIR}/s953.c
+${SOURCE_DIR}/s954.c
+${SOURCE_DIR}/s955.c
+${SOURCE_DIR}/s956.c
+${SOURCE_DIR}/s957.c
+${SOURCE_DIR}/s958.c
+${SOURCE_DIR}/s959.c
+${SOURCE_DIR}/s960.c
+${SOURCE_DIR}/s961.c
+${SOURCE_DIR}/s962.c
+${SOURCE_DIR}/s963.c
+${SOURCE_DIR}/s964.c
+${SOURCE_DIR}/s965.c
+${SOURCE_DIR}/s966.c
+${SOURCE_DIR}/s967.c
+${SOURCE_DIR}/s968.c
+${SOURCE_DIR}/s969.c
+${SOURCE_DIR}/s970.c
+${SOURCE_DIR}/s971.c
+${SOURCE_DIR}/s972.c
+${SOURCE_DIR}/s973.c
+${SOURCE_DIR}/s974.c
+${SOURCE_DIR}/s975.c
+${SOURCE_DIR}/s976.c
+${SOURCE_DIR}/s977.c
+${SOURCE_DIR}/s978.c
+${SOURCE_DIR}/s979.c
+${SOURCE_DIR}/s980.c
+${SOURCE_DIR}/s981.c
+${SOURCE_DIR}/s982.c
+${SOURCE_DIR}/s983.c
+${SOURCE_DIR}/s984.c
+${SOURCE_DIR}/s985.c
+${SOURCE_DIR}/s986.c
+${SOURCE_DIR}/s987.c
+${SOURCE_DIR}/s988.c
+${SOURCE_DIR}/s989.c
+${SOURCE_DIR}/s990.c
+${SOURCE_DIR}/s991.c
+${SOURCE_DIR}/s992.c
+${SOURCE_DIR}/s993.c
+${SOURCE_DIR}/s994.c
+${SOURCE_DIR}/s995.c
+${SOURCE_DIR}/s996.c
+${SOURCE_DIR}/s997.c
+${SOURCE_DIR}/s998.c
+${SOURCE_DIR}/s999.c
+)
@@ -0,0 +1,52 @@
+set(3_SRC
+${SOURCE_DIR}/s150.c
+${SOURCE_DIR}/s151.c
+${SOURCE_DIR}/s152.c
+${SOURCE_DIR}/s153.c
+${SOURCE_DIR}/s154.c
+${SOURCE_DIR}/s155.c
+${SOURCE_DIR}/s156.c
+${SOURCE_DIR}/s157.c
+${SOURCE_DIR}/s158.c
+${SOURCE_DIR}/s159.c
+${SOURCE_DIR}/s160.c
+${SOURCE_DIR}/s161.c
+${SOURCE_DIR}/s162.c
+${SOURCE_DIR}/s163.c
+${SOURCE_DIR}/s164.c
+${SOURCE_DIR}/s165.c
+${SOURCE_DIR}/s166.c
+${SOURCE_DIR}/s167.c
+${SOURCE_DIR}/s168.c
+${SOURCE_DIR}/s169.c
+${SOURCE_DIR}/s170.c
+${SOURCE_DIR}/s171.c
+${SOURCE_DIR}/s172.c
+${SOURCE_DIR}/s173.c
+${SOURCE_DIR}/s174.c
+${SOURCE_DIR}/s175.c
+${SOURCE_DIR}/s176.c
+${SOURCE_DIR}/s177.c
+${SOURCE_DIR}/s178.c
+${SOURCE_DIR}/s179.c
+${SOURCE_DIR}/s180.c
+${SOURCE_DIR}/s181.c
+${SOURCE_DIR}/s182.c
+${SOURCE_DIR}/s183.c
+${SOURCE_DIR}/s184.c
+${SOURCE_DIR}/s185.c
+${SOURCE_DIR}/s186.c
+${SOURCE_DIR}/s187.c
+${SOURCE_DIR}/s188.c
+${SOURCE_DIR}/s189.c
+${SOURCE_DIR}/s190.c
+${SOURCE_DIR}/s191.c
+${SOURCE_DIR}/s192.c
+${SOURCE_DIR}/s193.c
+${SOURCE_DIR}/s194.c
+${SOURCE_DIR}/s195.c
+${SOURCE_DIR}/s196.c
+${SOURCE_DIR}/s197.c
+${SOURCE_DIR}/s198.c
+${SOURCE_DIR}/s199.c
+)
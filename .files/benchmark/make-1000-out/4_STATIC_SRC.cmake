@@ -0,0 +1,52 @@
+set(4_STATIC_SRC
+${SOURCE_DIR}/s200.c
+${SOURCE_DIR}/s201.c
+${SOURCE_DIR}/s202.c
+${SOURCE_DIR}/s203.c
+${SOURCE_DIR}/s204.c
+${SOURCE_DIR}/s205.c
+${SOURCE_DIR}/s206.c
+${SOURCE_DIR}/s207.c
+${SOURCE_DIR}/s208.c
+${SOURCE_DIR}/s209.c
+${SOURCE_DIR}/s210.c
+${SOURCE_DIR}/s211.c
+${SOURCE_DIR}/s212.c
+${SOURCE_DIR}/s213.c
+${SOURCE_DIR}/s214.c
+${SOURCE_DIR}/s215.c
+${SOURCE_DIR}/s216.c
+${SOURCE_DIR}/s217.c
+${SOURCE_DIR}/s218.c
+${SOURCE_DIR}/s219.c
+${SOURCE_DIR}/s220.c
+${SOURCE_DIR}/s221.c
+${SOURCE_DIR}/s222.c
+${SOURCE_DIR}/s223.c
+${SOURCE_DIR}/s224.c
+${SOURCE_DIR}/s225.c
+${SOURCE_DIR}/s226.c
+${SOURCE_DIR}/s227.c
+${SOURCE_DIR}/s228.c
+${SOURCE_DIR}/s229.c
+${SOURCE_DIR}/s230.c
+${SOURCE_DIR}/s231.c
+${SOURCE_DIR}/s232.c
+${SOURCE_DIR}/s233.c
+${SOURCE_DIR}/s234.c
+${SOURCE_DIR}/s235.c
+${SOURCE_DIR}/s236.c
+${SOURCE_DIR}/s237.c
+${SOURCE_DIR}/s238.c
+${SOURCE_DIR}/s239.c
+${SOURCE_DIR}/s240.c
+${SOURCE_DIR}/s241.c
+${SOURCE_DIR}/s242.c
+${SOURCE_DIR}/s243.c
+${SOURCE_DIR}/s244.c
+${SOURCE_DIR}/s245.c
+${SOURCE_DIR}/s246.c
+${SOURCE_DIR}/s247.c
+${SOURCE_DIR}/s248.c
+${SOURCE_DIR}/s249.c
+)
@@ -0,0 +1,52 @@
+set(5_STATIC_SRC
+${SOURCE_DIR}/s250.c
+${SOURCE_DIR}/s251.c
+${SOURCE_DIR}/s252.c
+${SOURCE_DIR}/s253.c
+${SOURCE_DIR}/s254.c
+${SOURCE_DIR}/s255.c
+${SOURCE_DIR}/s256.c
+${SOURCE_DIR}/s257.c
+${SOURCE_DIR}/s258.c
+${SOURCE_DIR}/s259.c
+${SOURCE_DIR}/s260.c
+${SOURCE_DIR}/s261.c
+${SOURCE_DIR}/s262.c
+${SOURCE_DIR}/s263.c
+${SOURCE_DIR}/s264.c
+${SOURCE_DIR}/s265.c
+${SOURCE_DIR}/s266.c
+${SOURCE_DIR}/s267.c
+${SOURCE_DIR}/s268.c
+${SOURCE_DIR}/s269.c
+${SOURCE_DIR}/s270.c
+${SOURCE_DIR}/s271.c
+${SOURCE_DIR}/s272.c
+${SOURCE_DIR}/s273.c
+${SOURCE_DIR}/s274.c
+${SOURCE_DIR}/s275.c
+${SOURCE_DIR}/s276.c
+${SOURCE_DIR}/s277.c
+${SOURCE_DIR}/s278.c
+${SOURCE_DIR}/s279.c
+${SOURCE_DIR}/s280.c
+${SOURCE_DIR}/s281.c
+${SOURCE_DIR}/s282.c
+${SOURCE_DIR}/s283.c
+${SOURCE_DIR}/s284.c
+${SOURCE_DIR}/s285.c
+${SOURCE_DIR}/s286.c
+${SOURCE_DIR}/s287.c
+${SOURCE_DIR}/s288.c
+${SOURCE_DIR}/s289.c
+${SOURCE_DIR}/s290.c
+${SOURCE_DIR}/s291.c
+${SOURCE_DIR}/s292.c
+${SOURCE_DIR}/s293.c
+${SOURCE_DIR}/s294.c
+${SOURCE_DIR}/s295.c
+${SOURCE_DIR}/s296.c
+${SOURCE_DIR}/s297.c
+${SOURCE_DIR}/s298.c
+${SOURCE_DIR}/s299.c
+)
@@ -0,0 +1,52 @@
+set(7_STATIC_SRC
+${SOURCE_DIR}/s350.c
+${SOURCE_DIR}/s351.c
+${SOURCE_DIR}/s352.c
+${SOURCE_DIR}/s353.c
+${SOURCE_DIR}/s354.c
+${SOURCE_DIR}/s355.c
+${SOURCE_DIR}/s356.c
+${SOURCE_DIR}/s357.c
+${SOURCE_DIR}/s358.c
+${SOURCE_DIR}/s359.c
+${SOURCE_DIR}/s360.c
+${SOURCE_DIR}/s361.c
+${SOURCE_DIR}/s362.c
+${SOURCE_DIR}/s363.c
+${SOURCE_DIR}/s364.c
+${SOURCE_DIR}/s365.c
+${SOURCE_DIR}/s366.c
+${SOURCE_DIR}/s367.c
+${SOURCE_DIR}/s368.c
+${SOURCE_DIR}/s369.c
+${SOURCE_DIR}/s370.c
+${SOURCE_DIR}/s371.c
+${SOURCE_DIR}/s372.c
+${SOURCE_DIR}/s373.c
+${SOURCE_DIR}/s374.c
+${SOURCE_DIR}/s375.c
+${SOURCE_DIR}/s376.c
+${SOURCE_DIR}/s377.c
+${SOURCE_DIR}/s378.c
+${SOURCE_DIR}/s379.c
+${SOURCE_DIR}/s380.c
+${SOURCE_DIR}/s381.c
+${SOURCE_DIR}/s382.c
+${SOURCE_DIR}/s383.c
+${SOURCE_DIR}/s384.c
+${SOURCE_DIR}/s385.c
+${SOURCE_DIR}/s386.c
+${SOURCE_DIR}/s387.c
+${SOURCE_DIR}/s388.c
+${SOURCE_DIR}/s389.c
+${SOURCE_DIR}/s390.c
+${SOURCE_DIR}/s391.c
+${SOURCE_DIR}/s392.c
+${SOURCE_DIR}/s393.c
+${SOURCE_DIR}/s394.c
+${SOURCE_DIR}/s395.c
+${SOURCE_DIR}/s396.c
+${SOURCE_DIR}/s397.c
+${SOURCE_DIR}/s398.c
+${SOURCE_DIR}/s399.c
+)
@@ -0,0 +1,52 @@
+set(8_STATIC_SRC
+${SOURCE_DIR}/s400.c
+${SOURCE_DIR}/s401.c
+${SOURCE_DIR}/s402.c
+${SOURCE_DIR}/s403.c
+${SOURCE_DIR}/s404.c
+${SOURCE_DIR}/s405.c
+${SOURCE_DIR}/s406.c
+${SOURCE_DIR}/s407.c
+${SOURCE_DIR}/s408.c
+${SOURCE_DIR}/s409.c
+${SOURCE_DIR}/s410.c
+${SOURCE_DIR}/s411.c
+${SOURCE_DIR}/s412.c
+${SOURCE_DIR}/s413.c
+${SOURCE_DIR}/s414.c
+${SOURCE_DIR}/s415.c
+${SOURCE_DIR}/s416.c
+${SOURCE_DIR}/s417.c
+${SOURCE_DIR}/s418.c
+${SOURCE_DIR}/s419.c
+${SOURCE_DIR}/s420.c
+${SOURCE_DIR}/s421.c
+${SOURCE_DIR}/s422.c
+${SOURCE_DIR}/s423.c
+${SOURCE_DIR}/s424.c
+${SOURCE_DIR}/s425.c
+${SOURCE_DIR}/s426.c
+${SOURCE_DIR}/s427.c
+${SOURCE_DIR}/s428.c
+${SOURCE_DIR}/s429.c
+${SOURCE_DIR}/s430.c
+${SOURCE_DIR}/s431.c
+${SOURCE_DIR}/s432.c
+${SOURCE_DIR}/s433.c
+${SOURCE_DIR}/s434.c
+${SOURCE_DIR}/s435.c
+${SOURCE_DIR}/s436.c
+${SOURCE_DIR}/s437.c
+${SOURCE_DIR}/s438.c
+${SOURCE_DIR}/s439.c
+${SOURCE_DIR}/s440.c
+${SOURCE_DIR}/s441.c
+${SOURCE_DIR}/s442.c
+${SOURCE_DIR}/s443.c
+${SOURCE_DIR}/s444.c
+${SOURCE_DIR}/s445.c
+${SOURCE_DIR}/s446.c
+${SOURCE_DIR}/s447.c
+${SOURCE_DIR}/s448.c
+${SOURCE_DIR}/s449.c
+)
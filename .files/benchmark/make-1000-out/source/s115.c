@@ -0,0 +1,6 @@
+#include "h15.h"
+#include "h16.h"
+#include "h17.h"
+#include "h18.h"
+#include "h19.h"
+int s115(void) { return 115; }
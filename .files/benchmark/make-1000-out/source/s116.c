@@ -0,0 +1,6 @@
+#include "h16.h"
+#include "h17.h"
+#include "h18.h"
+#include "h19.h"
+#include "h20.h"
+int s116(void) { return 116; }
@@ -0,0 +1,6 @@
+#include "h21.h"
+#include "h22.h"
+#include "h23.h"
+#include "h24.h"
+#include "h25.h"
+int s121(void) { return 121; }
@@ -0,0 +1,6 @@
+#include "h47.h"
+#include "h48.h"
+#include "h49.h"
+#include "h50.h"
+#include "h51.h"
+int s147(void) { return 147; }
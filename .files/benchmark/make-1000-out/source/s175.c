@@ -0,0 +1,6 @@
+#include "h75.h"
+#include "h76.h"
+#include "h77.h"
+#include "h78.h"
+#include "h79.h"
+int s175(void) { return 175; }
@@ -0,0 +1,6 @@
+#include "h85.h"
+#include "h86.h"
+#include "h87.h"
+#include "h88.h"
+#include "h89.h"
+int s185(void) { return 185; }
@@ -0,0 +1,6 @@
+#include "h7.h"
+#include "h8.h"
+#include "h9.h"
+#include "h10.h"
+#include "h11.h"
+int s207(void) { return 207; }
@@ -0,0 +1,6 @@
+#include "h23.h"
+#include "h24.h"
+#include "h25.h"
+#include "h26.h"
+#include "h27.h"
+int s223(void) { return 223; }
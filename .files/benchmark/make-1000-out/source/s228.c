@@ -0,0 +1,6 @@
+#include "h28.h"
+#include "h29.h"
+#include "h30.h"
+#include "h31.h"
+#include "h32.h"
+int s228(void) { return 228; }
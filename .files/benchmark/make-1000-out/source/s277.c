@@ -0,0 +1,6 @@
+#include "h77.h"
+#include "h78.h"
+#include "h79.h"
+#include "h80.h"
+#include "h81.h"
+int s277(void) { return 277; }
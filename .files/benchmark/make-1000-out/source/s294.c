@@ -0,0 +1,6 @@
+#include "h94.h"
+#include "h95.h"
+#include "h96.h"
+#include "h97.h"
+#include "h98.h"
+int s294(void) { return 294; }
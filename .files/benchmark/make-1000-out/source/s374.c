@@ -0,0 +1,6 @@
+#include "h74.h"
+#include "h75.h"
+#include "h76.h"
+#include "h77.h"
+#include "h78.h"
+int s374(void) { return 374; }
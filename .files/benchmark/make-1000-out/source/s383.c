@@ -0,0 +1,6 @@
+#include "h83.h"
+#include "h84.h"
+#include "h85.h"
+#include "h86.h"
+#include "h87.h"
+int s383(void) { return 383; }
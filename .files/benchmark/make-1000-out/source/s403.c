@@ -0,0 +1,6 @@
+#include "h3.h"
+#include "h4.h"
+#include "h5.h"
+#include "h6.h"
+#include "h7.h"
+int s403(void) { return 403; }
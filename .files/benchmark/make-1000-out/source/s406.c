@@ -0,0 +1,6 @@
+#include "h6.h"
+#include "h7.h"
+#include "h8.h"
+#include "h9.h"
+#include "h10.h"
+int s406(void) { return 406; }
@@ -0,0 +1,6 @@
+#include "h8.h"
+#include "h9.h"
+#include "h10.h"
+#include "h11.h"
+#include "h12.h"
+int s408(void) { return 408; }
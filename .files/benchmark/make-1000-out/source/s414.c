@@ -0,0 +1,6 @@
+#include "h14.h"
+#include "h15.h"
+#include "h16.h"
+#include "h17.h"
+#include "h18.h"
+int s414(void) { return 414; }
@@ -0,0 +1,6 @@
+#include "h42.h"
+#include "h43.h"
+#include "h44.h"
+#include "h45.h"
+#include "h46.h"
+int s42(void) { return 42; }
@@ -0,0 +1,6 @@
+#include "h43.h"
+#include "h44.h"
+#include "h45.h"
+#include "h46.h"
+#include "h47.h"
+int s43(void) { return 43; }
@@ -0,0 +1,6 @@
+#include "h38.h"
+#include "h39.h"
+#include "h40.h"
+#include "h41.h"
+#include "h42.h"
+int s438(void) { return 438; }
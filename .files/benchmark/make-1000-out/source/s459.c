@@ -0,0 +1,6 @@
+#include "h59.h"
+#include "h60.h"
+#include "h61.h"
+#include "h62.h"
+#include "h63.h"
+int s459(void) { return 459; }
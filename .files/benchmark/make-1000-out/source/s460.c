@@ -0,0 +1,6 @@
+#include "h60.h"
+#include "h61.h"
+#include "h62.h"
+#include "h63.h"
+#include "h64.h"
+int s460(void) { return 460; }
@@ -0,0 +1,6 @@
+#include "h19.h"
+#include "h20.h"
+#include "h21.h"
+#include "h22.h"
+#include "h23.h"
+int s519(void) { return 519; }
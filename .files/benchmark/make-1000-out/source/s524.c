@@ -0,0 +1,6 @@
+#include "h24.h"
+#include "h25.h"
+#include "h26.h"
+#include "h27.h"
+#include "h28.h"
+int s524(void) { return 524; }
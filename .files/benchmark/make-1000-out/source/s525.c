@@ -0,0 +1,6 @@
+#include "h25.h"
+#include "h26.h"
+#include "h27.h"
+#include "h28.h"
+#include "h29.h"
+int s525(void) { return 525; }
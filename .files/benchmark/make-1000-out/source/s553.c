@@ -0,0 +1,6 @@
+#include "h53.h"
+#include "h54.h"
+#include "h55.h"
+#include "h56.h"
+#include "h57.h"
+int s553(void) { return 553; }
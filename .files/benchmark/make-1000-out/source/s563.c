@@ -0,0 +1,6 @@
+#include "h63.h"
+#include "h64.h"
+#include "h65.h"
+#include "h66.h"
+#include "h67.h"
+int s563(void) { return 563; }
@@ -0,0 +1,6 @@
+#include "h69.h"
+#include "h70.h"
+#include "h71.h"
+#include "h72.h"
+#include "h73.h"
+int s569(void) { return 569; }
@@ -0,0 +1,6 @@
+#include "h79.h"
+#include "h80.h"
+#include "h81.h"
+#include "h82.h"
+#include "h83.h"
+int s579(void) { return 579; }
@@ -0,0 +1,6 @@
+#include "h17.h"
+#include "h18.h"
+#include "h19.h"
+#include "h20.h"
+#include "h21.h"
+int s617(void) { return 617; }
@@ -0,0 +1,6 @@
+#include "h34.h"
+#include "h35.h"
+#include "h36.h"
+#include "h37.h"
+#include "h38.h"
+int s634(void) { return 634; }
@@ -0,0 +1,6 @@
+#include "h49.h"
+#include "h50.h"
+#include "h51.h"
+#include "h52.h"
+#include "h53.h"
+int s649(void) { return 649; }
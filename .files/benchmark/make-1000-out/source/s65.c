@@ -0,0 +1,6 @@
+#include "h65.h"
+#include "h66.h"
+#include "h67.h"
+#include "h68.h"
+#include "h69.h"
+int s65(void) { return 65; }
@@ -0,0 +1,6 @@
+#include "h50.h"
+#include "h51.h"
+#include "h52.h"
+#include "h53.h"
+#include "h54.h"
+int s650(void) { return 650; }
@@ -0,0 +1,6 @@
+#include "h54.h"
+#include "h55.h"
+#include "h56.h"
+#include "h57.h"
+#include "h58.h"
+int s654(void) { return 654; }
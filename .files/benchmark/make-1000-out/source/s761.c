@@ -0,0 +1,6 @@
+#include "h61.h"
+#include "h62.h"
+#include "h63.h"
+#include "h64.h"
+#include "h65.h"
+int s761(void) { return 761; }
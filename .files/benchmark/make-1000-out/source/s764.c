@@ -0,0 +1,6 @@
+#include "h64.h"
+#include "h65.h"
+#include "h66.h"
+#include "h67.h"
+#include "h68.h"
+int s764(void) { return 764; }
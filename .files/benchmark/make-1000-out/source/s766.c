@@ -0,0 +1,6 @@
+#include "h66.h"
+#include "h67.h"
+#include "h68.h"
+#include "h69.h"
+#include "h70.h"
+int s766(void) { return 766; }
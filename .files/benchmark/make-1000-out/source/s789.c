@@ -0,0 +1,6 @@
+#include "h89.h"
+#include "h90.h"
+#include "h91.h"
+#include "h92.h"
+#include "h93.h"
+int s789(void) { return 789; }
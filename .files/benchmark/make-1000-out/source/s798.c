@@ -0,0 +1,6 @@
+#include "h98.h"
+#include "h99.h"
+#include "h0.h"
+#include "h1.h"
+#include "h2.h"
+int s798(void) { return 798; }
@@ -0,0 +1,6 @@
+#include "h5.h"
+#include "h6.h"
+#include "h7.h"
+#include "h8.h"
+#include "h9.h"
+int s805(void) { return 805; }
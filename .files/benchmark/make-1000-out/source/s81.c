@@ -0,0 +1,6 @@
+#include "h81.h"
+#include "h82.h"
+#include "h83.h"
+#include "h84.h"
+#include "h85.h"
+int s81(void) { return 81; }
@@ -0,0 +1,6 @@
+#include "h62.h"
+#include "h63.h"
+#include "h64.h"
+#include "h65.h"
+#include "h66.h"
+int s862(void) { return 862; }
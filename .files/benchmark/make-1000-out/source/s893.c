@@ -0,0 +1,6 @@
+#include "h93.h"
+#include "h94.h"
+#include "h95.h"
+#include "h96.h"
+#include "h97.h"
+int s893(void) { return 893; }
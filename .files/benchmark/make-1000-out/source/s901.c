@@ -0,0 +1,6 @@
+#include "h1.h"
+#include "h2.h"
+#include "h3.h"
+#include "h4.h"
+#include "h5.h"
+int s901(void) { return 901; }
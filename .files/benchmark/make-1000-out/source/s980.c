@@ -0,0 +1,6 @@
+#include "h80.h"
+#include "h81.h"
+#include "h82.h"
+#include "h83.h"
+#include "h84.h"
+int s980(void) { return 980; }
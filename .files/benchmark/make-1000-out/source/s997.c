@@ -0,0 +1,6 @@
+#include "h97.h"
+#include "h98.h"
+#include "h99.h"
+#include "h0.h"
+#include "h1.h"
+int s997(void) { return 997; }
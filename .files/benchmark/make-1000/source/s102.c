@@ -0,0 +1,6 @@
+#include "h2.h"
+#include "h3.h"
+#include "h4.h"
+#include "h5.h"
+#include "h6.h"
+int s102(void) { return 102; }
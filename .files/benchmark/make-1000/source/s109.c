@@ -0,0 +1,6 @@
+#include "h9.h"
+#include "h10.h"
+#include "h11.h"
+#include "h12.h"
+#include "h13.h"
+int s109(void) { return 109; }
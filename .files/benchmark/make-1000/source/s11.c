@@ -0,0 +1,6 @@
+#include "h11.h"
+#include "h12.h"
+#include "h13.h"
+#include "h14.h"
+#include "h15.h"
+int s11(void) { return 11; }
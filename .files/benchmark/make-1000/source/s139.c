@@ -0,0 +1,6 @@
+#include "h39.h"
+#include "h40.h"
+#include "h41.h"
+#include "h42.h"
+#include "h43.h"
+int s139(void) { return 139; }
@@ -0,0 +1,6 @@
+#include "h86.h"
+#include "h87.h"
+#include "h88.h"
+#include "h89.h"
+#include "h90.h"
+int s186(void) { return 186; }
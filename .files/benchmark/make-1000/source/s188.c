@@ -0,0 +1,6 @@
+#include "h88.h"
+#include "h89.h"
+#include "h90.h"
+#include "h91.h"
+#include "h92.h"
+int s188(void) { return 188; }
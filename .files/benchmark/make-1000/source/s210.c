@@ -0,0 +1,6 @@
+#include "h10.h"
+#include "h11.h"
+#include "h12.h"
+#include "h13.h"
+#include "h14.h"
+int s210(void) { return 210; }
@@ -0,0 +1,6 @@
+#include "h12.h"
+#include "h13.h"
+#include "h14.h"
+#include "h15.h"
+#include "h16.h"
+int s212(void) { return 212; }
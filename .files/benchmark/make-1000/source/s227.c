@@ -0,0 +1,6 @@
+#include "h27.h"
+#include "h28.h"
+#include "h29.h"
+#include "h30.h"
+#include "h31.h"
+int s227(void) { return 227; }
@@ -0,0 +1,6 @@
+#include "h29.h"
+#include "h30.h"
+#include "h31.h"
+#include "h32.h"
+#include "h33.h"
+int s229(void) { return 229; }
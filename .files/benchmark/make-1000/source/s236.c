@@ -0,0 +1,6 @@
+#include "h36.h"
+#include "h37.h"
+#include "h38.h"
+#include "h39.h"
+#include "h40.h"
+int s236(void) { return 236; }
@@ -0,0 +1,6 @@
+#include "h41.h"
+#include "h42.h"
+#include "h43.h"
+#include "h44.h"
+#include "h45.h"
+int s241(void) { return 241; }
@@ -0,0 +1,6 @@
+#include "h46.h"
+#include "h47.h"
+#include "h48.h"
+#include "h49.h"
+#include "h50.h"
+int s246(void) { return 246; }
@@ -0,0 +1,6 @@
+#include "h51.h"
+#include "h52.h"
+#include "h53.h"
+#include "h54.h"
+#include "h55.h"
+int s251(void) { return 251; }
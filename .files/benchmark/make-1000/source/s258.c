@@ -0,0 +1,6 @@
+#include "h58.h"
+#include "h59.h"
+#include "h60.h"
+#include "h61.h"
+#include "h62.h"
+int s258(void) { return 258; }
@@ -0,0 +1,6 @@
+#include "h96.h"
+#include "h97.h"
+#include "h98.h"
+#include "h99.h"
+#include "h0.h"
+int s296(void) { return 296; }
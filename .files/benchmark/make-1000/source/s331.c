@@ -0,0 +1,6 @@
+#include "h31.h"
+#include "h32.h"
+#include "h33.h"
+#include "h34.h"
+#include "h35.h"
+int s331(void) { return 331; }
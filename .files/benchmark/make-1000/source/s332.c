@@ -0,0 +1,6 @@
+#include "h32.h"
+#include "h33.h"
+#include "h34.h"
+#include "h35.h"
+#include "h36.h"
+int s332(void) { return 332; }
@@ -0,0 +1,6 @@
+#include "h4.h"
+#include "h5.h"
+#include "h6.h"
+#include "h7.h"
+#include "h8.h"
+int s404(void) { return 404; }
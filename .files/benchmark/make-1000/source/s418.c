@@ -0,0 +1,6 @@
+#include "h18.h"
+#include "h19.h"
+#include "h20.h"
+#include "h21.h"
+#include "h22.h"
+int s418(void) { return 418; }
@@ -0,0 +1,6 @@
+#include "h95.h"
+#include "h96.h"
+#include "h97.h"
+#include "h98.h"
+#include "h99.h"
+int s495(void) { return 495; }
@@ -0,0 +1,6 @@
+#include "h68.h"
+#include "h69.h"
+#include "h70.h"
+#include "h71.h"
+#include "h72.h"
+int s568(void) { return 568; }
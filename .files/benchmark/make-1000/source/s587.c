@@ -0,0 +1,6 @@
+#include "h87.h"
+#include "h88.h"
+#include "h89.h"
+#include "h90.h"
+#include "h91.h"
+int s587(void) { return 587; }
@@ -0,0 +1,6 @@
+#include "h37.h"
+#include "h38.h"
+#include "h39.h"
+#include "h40.h"
+#include "h41.h"
+int s637(void) { return 637; }
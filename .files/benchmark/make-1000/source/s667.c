@@ -0,0 +1,6 @@
+#include "h67.h"
+#include "h68.h"
+#include "h69.h"
+#include "h70.h"
+#include "h71.h"
+int s667(void) { return 667; }
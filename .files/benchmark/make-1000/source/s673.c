@@ -0,0 +1,6 @@
+#include "h73.h"
+#include "h74.h"
+#include "h75.h"
+#include "h76.h"
+#include "h77.h"
+int s673(void) { return 673; }
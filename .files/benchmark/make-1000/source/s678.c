@@ -0,0 +1,6 @@
+#include "h78.h"
+#include "h79.h"
+#include "h80.h"
+#include "h81.h"
+#include "h82.h"
+int s678(void) { return 678; }
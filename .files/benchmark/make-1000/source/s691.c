@@ -0,0 +1,6 @@
+#include "h91.h"
+#include "h92.h"
+#include "h93.h"
+#include "h94.h"
+#include "h95.h"
+int s691(void) { return 691; }
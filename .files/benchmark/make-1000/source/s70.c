@@ -0,0 +1,6 @@
+#include "h70.h"
+#include "h71.h"
+#include "h72.h"
+#include "h73.h"
+#include "h74.h"
+int s70(void) { return 70; }
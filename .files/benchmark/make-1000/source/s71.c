@@ -0,0 +1,6 @@
+#include "h71.h"
+#include "h72.h"
+#include "h73.h"
+#include "h74.h"
+#include "h75.h"
+int s71(void) { return 71; }
@@ -0,0 +1,6 @@
+#include "h48.h"
+#include "h49.h"
+#include "h50.h"
+#include "h51.h"
+#include "h52.h"
+int s748(void) { return 748; }
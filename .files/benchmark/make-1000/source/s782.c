@@ -0,0 +1,6 @@
+#include "h82.h"
+#include "h83.h"
+#include "h84.h"
+#include "h85.h"
+#include "h86.h"
+int s782(void) { return 782; }
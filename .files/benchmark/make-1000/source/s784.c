@@ -0,0 +1,6 @@
+#include "h84.h"
+#include "h85.h"
+#include "h86.h"
+#include "h87.h"
+#include "h88.h"
+int s784(void) { return 784; }
@@ -0,0 +1,6 @@
+#include "h28.h"
+#include "h29.h"
+#include "h30.h"
+#include "h31.h"
+#include "h32.h"
+int s828(void) { return 828; }
@@ -0,0 +1,6 @@
+#include "h30.h"
+#include "h31.h"
+#include "h32.h"
+#include "h33.h"
+#include "h34.h"
+int s830(void) { return 830; }
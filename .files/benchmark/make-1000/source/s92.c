@@ -0,0 +1,6 @@
+#include "h92.h"
+#include "h93.h"
+#include "h94.h"
+#include "h95.h"
+#include "h96.h"
+int s92(void) { return 92; }
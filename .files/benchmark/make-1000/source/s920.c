@@ -0,0 +1,6 @@
+#include "h20.h"
+#include "h21.h"
+#include "h22.h"
+#include "h23.h"
+#include "h24.h"
+int s920(void) { return 920; }
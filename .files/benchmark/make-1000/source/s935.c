@@ -0,0 +1,6 @@
+#include "h35.h"
+#include "h36.h"
+#include "h37.h"
+#include "h38.h"
+#include "h39.h"
+int s935(void) { return 935; }
@@ -0,0 +1,6 @@
+#include "h44.h"
+#include "h45.h"
+#include "h46.h"
+#include "h47.h"
+#include "h48.h"
+int s944(void) { return 944; }
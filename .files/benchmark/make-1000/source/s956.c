@@ -0,0 +1,6 @@
+#include "h56.h"
+#include "h57.h"
+#include "h58.h"
+#include "h59.h"
+#include "h60.h"
+int s956(void) { return 956; }
@@ -0,0 +1,6 @@
+#include "h72.h"
+#include "h73.h"
+#include "h74.h"
+#include "h75.h"
+#include "h76.h"
+int s972(void) { return 972; }
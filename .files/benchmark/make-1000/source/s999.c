@@ -0,0 +1,6 @@
+#include "h99.h"
+#include "h0.h"
+#include "h1.h"
+#include "h2.h"
+#include "h3.h"
+int s999(void) { return 999; }
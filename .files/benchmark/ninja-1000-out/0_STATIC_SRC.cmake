@@ -0,0 +1,52 @@
+set(0_STATIC_SRC
+${SOURCE_DIR}/s0.c
+${SOURCE_DIR}/s1.c
+${SOURCE_DIR}/s2.c
+${SOURCE_DIR}/s3.c
+${SOURCE_DIR}/s4.c
+${SOURCE_DIR}/s5.c
+${SOURCE_DIR}/s6.c
+${SOURCE_DIR}/s7.c
+${SOURCE_DIR}/s8.c
+${SOURCE_DIR}/s9.c
+${SOURCE_DIR}/s10.c
+${SOURCE_DIR}/s11.c
+${SOURCE_DIR}/s12.c
+${SOURCE_DIR}/s13.c
+${SOURCE_DIR}/s14.c
+${SOURCE_DIR}/s15.c
+${SOURCE_DIR}/s16.c
+${SOURCE_DIR}/s17.c
+${SOURCE_DIR}/s18.c
+${SOURCE_DIR}/s19.c
+${SOURCE_DIR}/s20.c
+${SOURCE_DIR}/s21.c
+${SOURCE_DIR}/s22.c
+${SOURCE_DIR}/s23.c
+${SOURCE_DIR}/s24.c
+${SOURCE_DIR}/s25.c
+${SOURCE_DIR}/s26.c
+${SOURCE_DIR}/s27.c
+${SOURCE_DIR}/s28.c
+${SOURCE_DIR}/s29.c
+${SOURCE_DIR}/s30.c
+${SOURCE_DIR}/s31.c
+${SOURCE_DIR}/s32.c
+${SOURCE_DIR}/s33.c
+${SOURCE_DIR}/s34.c
+${SOURCE_DIR}/s35.c
+${SOURCE_DIR}/s36.c
+${SOURCE_DIR}/s37.c
+${SOURCE_DIR}/s38.c
+${SOURCE_DIR}/s39.c
+${SOURCE_DIR}/s40.c
+${SOURCE_DIR}/s41.c
+${SOURCE_DIR}/s42.c
+${SOURCE_DIR}/s43.c
+${SOURCE_DIR}/s44.c
+${SOURCE_DIR}/s45.c
+${SOURCE_DIR}/s46.c
+${SOURCE_DIR}/s47.c
+${SOURCE_DIR}/s48.c
+${SOURCE_DIR}/s49.c
+)
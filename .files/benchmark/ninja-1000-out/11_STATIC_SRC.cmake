@@ -0,0 +1,52 @@
+set(11_STATIC_SRC
+${SOURCE_DIR}/s550.c
+${SOURCE_DIR}/s551.c
+${SOURCE_DIR}/s552.c
+${SOURCE_DIR}/s553.c
+${SOURCE_DIR}/s554.c
+${SOURCE_DIR}/s555.c
+${SOURCE_DIR}/s556.c
+${SOURCE_DIR}/s557.c
+${SOURCE_DIR}/s558.c
+${SOURCE_DIR}/s559.c
+${SOURCE_DIR}/s560.c
+${SOURCE_DIR}/s561.c
+${SOURCE_DIR}/s562.c
+${SOURCE_DIR}/s563.c
+${SOURCE_DIR}/s564.c
+${SOURCE_DIR}/s565.c
+${SOURCE_DIR}/s566.c
+${SOURCE_DIR}/s567.c
+${SOURCE_DIR}/s568.c
+${SOURCE_DIR}/s569.c
+${SOURCE_DIR}/s570.c
+${SOURCE_DIR}/s571.c
+${SOURCE_DIR}/s572.c
+${SOURCE_DIR}/s573.c
+${SOURCE_DIR}/s574.c
+${SOURCE_DIR}/s575.c
+${SOURCE_DIR}/s576.c
+${SOURCE_DIR}/s577.c
+${SOURCE_DIR}/s578.c
+${SOURCE_DIR}/s579.c
+${SOURCE_DIR}/s580.c
+${SOURCE_DIR}/s581.c
+${SOURCE_DIR}/s582.c
+${SOURCE_DIR}/s583.c
+${SOURCE_DIR}/s584.c
+${SOURCE_DIR}/s585.c
+${SOURCE_DIR}/s586.c
+${SOURCE_DIR}/s587.c
+${SOURCE_DIR}/s588.c
+${SOURCE_DIR}/s589.c
+${SOURCE_DIR}/s590.c
+${SOURCE_DIR}/s591.c
+${SOURCE_DIR}/s592.c
+${SOURCE_DIR}/s593.c
+${SOURCE_DIR}/s594.c
+${SOURCE_DIR}/s595.c
+${SOURCE_DIR}/s596.c
+${SOURCE_DIR}/s597.c
+${SOURCE_DIR}/s598.c
+${SOURCE_DIR}/s599.c
+)
@@ -0,0 +1,52 @@
+set(12_SRC
+${SOURCE_DIR}/s600.c
+${SOURCE_DIR}/s601.c
+${SOURCE_DIR}/s602.c
+${SOURCE_DIR}/s603.c
+${SOURCE_DIR}/s604.c
+${SOURCE_DIR}/s605.c
+${SOURCE_DIR}/s606.c
+${SOURCE_DIR}/s607.c
+${SOURCE_DIR}/s608.c
+${SOURCE_DIR}/s609.c
+${SOURCE_DIR}/s610.c
+${SOURCE_DIR}/s611.c
+${SOURCE_DIR}/s612.c
+${SOURCE_DIR}/s613.c
+${SOURCE_DIR}/s614.c
+${SOURCE_DIR}/s615.c
+${SOURCE_DIR}/s616.c
+${SOURCE_DIR}/s617.c
+${SOURCE_DIR}/s618.c
+${SOURCE_DIR}/s619.c
+${SOURCE_DIR}/s620.c
+${SOURCE_DIR}/s621.c
+${SOURCE_DIR}/s622.c
+${SOURCE_DIR}/s623.c
+${SOURCE_DIR}/s624.c
+${SOURCE_DIR}/s625.c
+${SOURCE_DIR}/s626.c
+${SOURCE_DIR}/s627.c
+${SOURCE_DIR}/s628.c
+${SOURCE_DIR}/s629.c
+${SOURCE_DIR}/s630.c
+${SOURCE_DIR}/s631.c
+${SOURCE_DIR}/s632.c
+${SOURCE_DIR}/s633.c
+${SOURCE_DIR}/s634.c
+${SOURCE_DIR}/s635.c
+${SOURCE_DIR}/s636.c
+${SOURCE_DIR}/s637.c
+${SOURCE_DIR}/s638.c
+${SOURCE_DIR}/s639.c
+${SOURCE_DIR}/s640.c
+${SOURCE_DIR}/s641.c
+${SOURCE_DIR}/s642.c
+${SOURCE_DIR}/s643.c
+${SOURCE_DIR}/s644.c
+${SOURCE_DIR}/s645.c
+${SOURCE_DIR}/s646.c
+${SOURCE_DIR}/s647.c
+${SOURCE_DIR}/s648.c
+${SOURCE_DIR}/s649.c
+)
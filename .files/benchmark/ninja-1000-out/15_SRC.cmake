@@ -0,0 +1,52 @@
+set(15_SRC
+${SOURCE_DIR}/s750.c
+${SOURCE_DIR}/s751.c
+${SOURCE_DIR}/s752.c
+${SOURCE_DIR}/s753.c
+${SOURCE_DIR}/s754.c
+${SOURCE_DIR}/s755.c
+${SOURCE_DIR}/s756.c
+${SOURCE_DIR}/s757.c
+${SOURCE_DIR}/s758.c
+${SOURCE_DIR}/s759.c
+${SOURCE_DIR}/s760.c
+${SOURCE_DIR}/s761.c
+${SOURCE_DIR}/s762.c
+${SOURCE_DIR}/s763.c
+${SOURCE_DIR}/s764.c
+${SOURCE_DIR}/s765.c
+${SOURCE_DIR}/s766.c
+${SOURCE_DIR}/s767.c
+${SOURCE_DIR}/s768.c
+${SOURCE_DIR}/s769.c
+${SOURCE_DIR}/s770.c
+${SOURCE_DIR}/s771.c
+${SOURCE_DIR}/s772.c
+${SOURCE_DIR}/s773.c
+${SOURCE_DIR}/s774.c
+${SOURCE_DIR}/s775.c
+${SOURCE_DIR}/s776.c
+${SOURCE_DIR}/s777.c
+${SOURCE_DIR}/s778.c
+${SOURCE_DIR}/s779.c
+${SOURCE_DIR}/s780.c
+${SOURCE_DIR}/s781.c
+${SOURCE_DIR}/s782.c
+${SOURCE_DIR}/s783.c
+${SOURCE_DIR}/s784.c
+${SOURCE_DIR}/s785.c
+${SOURCE_DIR}/s786.c
+${SOURCE_DIR}/s787.c
+${SOURCE_DIR}/s788.c
+${SOURCE_DIR}/s789.c
+${SOURCE_DIR}/s790.c
+${SOURCE_DIR}/s791.c
+${SOURCE_DIR}/s792.c
+${SOURCE_DIR}/s793.c
+${SOURCE_DIR}/s794.c
+${SOURCE_DIR}/s795.c
+${SOURCE_DIR}/s796.c
+${SOURCE_DIR}/s797.c
+${SOURCE_DIR}/s798.c
+${SOURCE_DIR}/s799.c
+)
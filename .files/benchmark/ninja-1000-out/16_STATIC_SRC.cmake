@@ -0,0 +1,52 @@
+set(16_STATIC_SRC
+${SOURCE_DIR}/s800.c
+${SOURCE_DIR}/s801.c
+${SOURCE_DIR}/s802.c
+${SOURCE_DIR}/s803.c
+${SOURCE_DIR}/s804.c
+${SOURCE_DIR}/s805.c
+${SOURCE_DIR}/s806.c
+${SOURCE_DIR}/s807.c
+${SOURCE_DIR}/s808.c
+${SOURCE_DIR}/s809.c
+${SOURCE_DIR}/s810.c
+${SOURCE_DIR}/s811.c
+${SOURCE_DIR}/s812.c
+${SOURCE_DIR}/s813.c
+${SOURCE_DIR}/s814.c
+${SOURCE_DIR}/s815.c
+${SOURCE_DIR}/s816.c
+${SOURCE_DIR}/s817.c
+${SOURCE_DIR}/s818.c
+${SOURCE_DIR}/s819.c
+${SOURCE_DIR}/s820.c
+${SOURCE_DIR}/s821.c
+${SOURCE_DIR}/s822.c
+${SOURCE_DIR}/s823.c
+${SOURCE_DIR}/s824.c
+${SOURCE_DIR}/s825.c
+${SOURCE_DIR}/s826.c
+${SOURCE_DIR}/s827.c
+${SOURCE_DIR}/s828.c
+${SOURCE_DIR}/s829.c
+${SOURCE_DIR}/s830.c
+${SOURCE_DIR}/s831.c
+${SOURCE_DIR}/s832.c
+${SOURCE_DIR}/s833.c
+${SOURCE_DIR}/s834.c
+${SOURCE_DIR}/s835.c
+${SOURCE_DIR}/s836.c
+${SOURCE_DIR}/s837.c
+${SOURCE_DIR}/s838.c
+${SOURCE_DIR}/s839.c
+${SOURCE_DIR}/s840.c
+${SOURCE_DIR}/s841.c
+${SOURCE_DIR}/s842.c
+${SOURCE_DIR}/s843.c
+${SOURCE_DIR}/s844.c
+${SOURCE_DIR}/s845.c
+${SOURCE_DIR}/s846.c
+${SOURCE_DIR}/s847.c
+${SOURCE_DIR}/s848.c
+${SOURCE_DIR}/s849.c
+)
@@ -0,0 +1,52 @@
+set(17_SRC
+${SOURCE_DIR}/s850.c
+${SOURCE_DIR}/s851.c
+${SOURCE_DIR}/s852.c
+${SOURCE_DIR}/s853.c
+${SOURCE_DIR}/s854.c
+${SOURCE_DIR}/s855.c
+${SOURCE_DIR}/s856.c
+${SOURCE_DIR}/s857.c
+${SOURCE_DIR}/s858.c
+${SOURCE_DIR}/s859.c
+${SOURCE_DIR}/s860.c
+${SOURCE_DIR}/s861.c
+${SOURCE_DIR}/s862.c
+${SOURCE_DIR}/s863.c
+${SOURCE_DIR}/s864.c
+${SOURCE_DIR}/s865.c
+${SOURCE_DIR}/s866.c
+${SOURCE_DIR}/s867.c
+${SOURCE_DIR}/s868.c
+${SOURCE_DIR}/s869.c
+${SOURCE_DIR}/s870.c
+${SOURCE_DIR}/s871.c
+${SOURCE_DIR}/s872.c
+${SOURCE_DIR}/s873.c
+${SOURCE_DIR}/s874.c
+${SOURCE_DIR}/s875.c
+${SOURCE_DIR}/s876.c
+${SOURCE_DIR}/s877.c
+${SOURCE_DIR}/s878.c
+${SOURCE_DIR}/s879.c
+${SOURCE_DIR}/s880.c
+${SOURCE_DIR}/s881.c
+${SOURCE_DIR}/s882.c
+${SOURCE_DIR}/s883.c
+${SOURCE_DIR}/s884.c
+${SOURCE_DIR}/s885.c
+${SOURCE_DIR}/s886.c
+${SOURCE_DIR}/s887.c
+${SOURCE_DIR}/s888.c
+${SOURCE_DIR}/s889.c
+${SOURCE_DIR}/s890.c
+${SOURCE_DIR}/s891.c
+${SOURCE_DIR}/s892.c
+${SOURCE_DIR}/s893.c
+${SOURCE_DIR}/s894.c
+${SOURCE_DIR}/s895.c
+${SOURCE_DIR}/s896.c
+${SOURCE_DIR}/s897.c
+${SOURCE_DIR}/s898.c
+${SOURCE_DIR}/s899.c
+)
@@ -0,0 +1,52 @@
+set(18_STATIC_SRC
+${SOURCE_DIR}/s900.c
+${SOURCE_DIR}/s901.c
+${SOURCE_DIR}/s902.c
+${SOURCE_DIR}/s903.c
+${SOURCE_DIR}/s904.c
+${SOURCE_DIR}/s905.c
+${SOURCE_DIR}/s906.c
+${SOURCE_DIR}/s907.c
+${SOURCE_DIR}/s908.c
+${SOURCE_DIR}/s909.c
+${SOURCE_DIR}/s910.c
+${SOURCE_DIR}/s911.c
+${SOURCE_DIR}/s912.c
+${SOURCE_DIR}/s913.c
+${SOURCE_DIR}/s914.c
+${SOURCE_DIR}/s915.c
+${SOURCE_DIR}/s916.c
+${SOURCE_DIR}/s917.c
+${SOURCE_DIR}/s918.c
+${SOURCE_DIR}/s919.c
+${SOURCE_DIR}/s920.c
+${SOURCE_DIR}/s921.c
+${SOURCE_DIR}/s922.c
+${SOURCE_DIR}/s923.c
+${SOURCE_DIR}/s924.c
+${SOURCE_DIR}/s925.c
+${SOURCE_DIR}/s926.c
+${SOURCE_DIR}/s927.c
+${SOURCE_DIR}/s928.c
+${SOURCE_DIR}/s929.c
+${SOURCE_DIR}/s930.c
+${SOURCE_DIR}/s931.c
+${SOURCE_DIR}/s932.c
+${SOURCE_DIR}/s933.c
+${SOURCE_DIR}/s934.c
+${SOURCE_DIR}/s935.c
+${SOURCE_DIR}/s936.c
+${SOURCE_DIR}/s937.c
+${SOURCE_DIR}/s938.c
+${SOURCE_DIR}/s939.c
+${SOURCE_DIR}/s940.c
+${SOURCE_DIR}/s941.c
+${SOURCE_DIR}/s942.c
+${SOURCE_DIR}/s943.c
+${SOURCE_DIR}/s944.c
+${SOURCE_DIR}/s945.c
+${SOURCE_DIR}/s946.c
+${SOURCE_DIR}/s947.c
+${SOURCE_DIR}/s948.c
+${SOURCE_DIR}/s949.c
+)
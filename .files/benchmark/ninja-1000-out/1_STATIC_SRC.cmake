@@ -0,0 +1,52 @@
+set(1_STATIC_SRC
+${SOURCE_DIR}/s50.c
+${SOURCE_DIR}/s51.c
+${SOURCE_DIR}/s52.c
+${SOURCE_DIR}/s53.c
+${SOURCE_DIR}/s54.c
+${SOURCE_DIR}/s55.c
+${SOURCE_DIR}/s56.c
+${SOURCE_DIR}/s57.c
+${SOURCE_DIR}/s58.c
+${SOURCE_DIR}/s59.c
+${SOURCE_DIR}/s60.c
+${SOURCE_DIR}/s61.c
+${SOURCE_DIR}/s62.c
+${SOURCE_DIR}/s63.c
+${SOURCE_DIR}/s64.c
+${SOURCE_DIR}/s65.c
+${SOURCE_DIR}/s66.c
+${SOURCE_DIR}/s67.c
+${SOURCE_DIR}/s68.c
+${SOURCE_DIR}/s69.c
+${SOURCE_DIR}/s70.c
+${SOURCE_DIR}/s71.c
+${SOURCE_DIR}/s72.c
+${SOURCE_DIR}/s73.c
+${SOURCE_DIR}/s74.c
+${SOURCE_DIR}/s75.c
+${SOURCE_DIR}/s76.c
+${SOURCE_DIR}/s77.c
+${SOURCE_DIR}/s78.c
+${SOURCE_DIR}/s79.c
+${SOURCE_DIR}/s80.c
+${SOURCE_DIR}/s81.c
+${SOURCE_DIR}/s82.c
+${SOURCE_DIR}/s83.c
+${SOURCE_DIR}/s84.c
+${SOURCE_DIR}/s85.c
+${SOURCE_DIR}/s86.c
+${SOURCE_DIR}/s87.c
+${SOURCE_DIR}/s88.c
+${SOURCE_DIR}/s89.c
+${SOURCE_DIR}/s90.c
+${SOURCE_DIR}/s91.c
+${SOURCE_DIR}/s92.c
+${SOURCE_DIR}/s93.c
+${SOURCE_DIR}/s94.c
+${SOURCE_DIR}/s95.c
+${SOURCE_DIR}/s96.c
+${SOURCE_DIR}/s97.c
+${SOURCE_DIR}/s98.c
+${SOURCE_DIR}/s99.c
+)
@@ -0,0 +1,52 @@
+set(2_SRC
+${SOURCE_DIR}/s100.c
+${SOURCE_DIR}/s101.c
+${SOURCE_DIR}/s102.c
+${SOURCE_DIR}/s103.c
+${SOURCE_DIR}/s104.c
+${SOURCE_DIR}/s105.c
+${SOURCE_DIR}/s106.c
+${SOURCE_DIR}/s107.c
+${SOURCE_DIR}/s108.c
+${SOURCE_DIR}/s109.c
+${SOURCE_DIR}/s110.c
+${SOURCE_DIR}/s111.c
+${SOURCE_DIR}/s112.c
+${SOURCE_DIR}/s113.c
+${SOURCE_DIR}/s114.c
+${SOURCE_DIR}/s115.c
+${SOURCE_DIR}/s116.c
+${SOURCE_DIR}/s117.c
+${SOURCE_DIR}/s118.c
+${SOURCE_DIR}/s119.c
+${SOURCE_DIR}/s120.c
+${SOURCE_DIR}/s121.c
+${SOURCE_DIR}/s122.c
+${SOURCE_DIR}/s123.c
+${SOURCE_DIR}/s124.c
+${SOURCE_DIR}/s125.c
+${SOURCE_DIR}/s126.c
+${SOURCE_DIR}/s127.c
+${SOURCE_DIR}/s128.c
+${SOURCE_DIR}/s129.c
+${SOURCE_DIR}/s130.c
+${SOURCE_DIR}/s131.c
+${SOURCE_DIR}/s132.c
+${SOURCE_DIR}/s133.c
+${SOURCE_DIR}/s134.c
+${SOURCE_DIR}/s135.c
+${SOURCE_DIR}/s136.c
+${SOURCE_DIR}/s137.c
+${SOURCE_DIR}/s138.c
+${SOURCE_DIR}/s139.c
+${SOURCE_DIR}/s140.c
+${SOURCE_DIR}/s141.c
+${SOURCE_DIR}/s142.c
+${SOURCE_DIR}/s143.c
+${SOURCE_DIR}/s144.c
+${SOURCE_DIR}/s145.c
+${SOURCE_DIR}/s146.c
+${SOURCE_DIR}/s147.c
+${SOURCE_DIR}/s148.c
+${SOURCE_DIR}/s149.c
+)
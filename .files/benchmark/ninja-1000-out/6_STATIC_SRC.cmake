@@ -0,0 +1,52 @@
+set(6_STATIC_SRC
+${SOURCE_DIR}/s300.c
+${SOURCE_DIR}/s301.c
+${SOURCE_DIR}/s302.c
+${SOURCE_DIR}/s303.c
+${SOURCE_DIR}/s304.c
+${SOURCE_DIR}/s305.c
+${SOURCE_DIR}/s306.c
+${SOURCE_DIR}/s307.c
+${SOURCE_DIR}/s308.c
+${SOURCE_DIR}/s309.c
+${SOURCE_DIR}/s310.c
+${SOURCE_DIR}/s311.c
+${SOURCE_DIR}/s312.c
+${SOURCE_DIR}/s313.c
+${SOURCE_DIR}/s314.c
+${SOURCE_DIR}/s315.c
+${SOURCE_DIR}/s316.c
+${SOURCE_DIR}/s317.c
+${SOURCE_DIR}/s318.c
+${SOURCE_DIR}/s319.c
+${SOURCE_DIR}/s320.c
+${SOURCE_DIR}/s321.c
+${SOURCE_DIR}/s322.c
+${SOURCE_DIR}/s323.c
+${SOURCE_DIR}/s324.c
+${SOURCE_DIR}/s325.c
+${SOURCE_DIR}/s326.c
+${SOURCE_DIR}/s327.c
+${SOURCE_DIR}/s328.c
+${SOURCE_DIR}/s329.c
+${SOURCE_DIR}/s330.c
+${SOURCE_DIR}/s331.c
+${SOURCE_DIR}/s332.c
+${SOURCE_DIR}/s333.c
+${SOURCE_DIR}/s334.c
+${SOURCE_DIR}/s335.c
+${SOURCE_DIR}/s336.c
+${SOURCE_DIR}/s337.c
+${SOURCE_DIR}/s338.c
+${SOURCE_DIR}/s339.c
+${SOURCE_DIR}/s340.c
+${SOURCE_DIR}/s341.c
+${SOURCE_DIR}/s342.c
+${SOURCE_DIR}/s343.c
+${SOURCE_DIR}/s344.c
+${SOURCE_DIR}/s345.c
+${SOURCE_DIR}/s346.c
+${SOURCE_DIR}/s347.c
+${SOURCE_DIR}/s348.c
+${SOURCE_DIR}/s349.c
+)
@@ -0,0 +1,52 @@
+set(9_SRC
+${SOURCE_DIR}/s450.c
+${SOURCE_DIR}/s451.c
+${SOURCE_DIR}/s452.c
+${SOURCE_DIR}/s453.c
+${SOURCE_DIR}/s454.c
+${SOURCE_DIR}/s455.c
+${SOURCE_DIR}/s456.c
+${SOURCE_DIR}/s457.c
+${SOURCE_DIR}/s458.c
+${SOURCE_DIR}/s459.c
+${SOURCE_DIR}/s460.c
+${SOURCE_DIR}/s461.c
+${SOURCE_DIR}/s462.c
+${SOURCE_DIR}/s463.c
+${SOURCE_DIR}/s464.c
+${SOURCE_DIR}/s465.c
+${SOURCE_DIR}/s466.c
+${SOURCE_DIR}/s467.c
+${SOURCE_DIR}/s468.c
+${SOURCE_DIR}/s469.c
+${SOURCE_DIR}/s470.c
+${SOURCE_DIR}/s471.c
+${SOURCE_DIR}/s472.c
+${SOURCE_DIR}/s473.c
+${SOURCE_DIR}/s474.c
+${SOURCE_DIR}/s475.c
+${SOURCE_DIR}/s476.c
+${SOURCE_DIR}/s477.c
+${SOURCE_DIR}/s478.c
+${SOURCE_DIR}/s479.c
+${SOURCE_DIR}/s480.c
+${SOURCE_DIR}/s481.c
+${SOURCE_DIR}/s482.c
+${SOURCE_DIR}/s483.c
+${SOURCE_DIR}/s484.c
+${SOURCE_DIR}/s485.c
+${SOURCE_DIR}/s486.c
+${SOURCE_DIR}/s487.c
+${SOURCE_DIR}/s488.c
+${SOURCE_DIR}/s489.c
+${SOURCE_DIR}/s490.c
+${SOURCE_DIR}/s491.c
+${SOURCE_DIR}/s492.c
+${SOURCE_DIR}/s493.c
+${SOURCE_DIR}/s494.c
+${SOURCE_DIR}/s495.c
+${SOURCE_DIR}/s496.c
+${SOURCE_DIR}/s497.c
+${SOURCE_DIR}/s498.c
+${SOURCE_DIR}/s499.c
+)
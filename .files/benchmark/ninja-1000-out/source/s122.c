@@ -0,0 +1,6 @@
+#include "h22.h"
+#include "h23.h"
+#include "h24.h"
+#include "h25.h"
+#include "h26.h"
+int s122(void) { return 122; }
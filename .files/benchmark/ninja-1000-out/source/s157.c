@@ -0,0 +1,6 @@
+#include "h57.h"
+#include "h58.h"
+#include "h59.h"
+#include "h60.h"
+#include "h61.h"
+int s157(void) { return 157; }
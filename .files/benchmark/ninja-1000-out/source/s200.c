@@ -0,0 +1,6 @@
+#include "h0.h"
+#include "h1.h"
+#include "h2.h"
+#include "h3.h"
+#include "h4.h"
+int s200(void) { return 200; }
@@ -0,0 +1,6 @@
+#include "h13.h"
+#include "h14.h"
+#include "h15.h"
+#include "h16.h"
+#include "h17.h"
+int s213(void) { return 213; }
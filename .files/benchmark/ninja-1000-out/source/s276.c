@@ -0,0 +1,6 @@
+#include "h76.h"
+#include "h77.h"
+#include "h78.h"
+#include "h79.h"
+#include "h80.h"
+int s276(void) { return 276; }
@@ -0,0 +1,6 @@
+#include "h45.h"
+#include "h46.h"
+#include "h47.h"
+#include "h48.h"
+#include "h49.h"
+int s345(void) { return 345; }
@@ -0,0 +1,6 @@
+#include "h33.h"
+#include "h34.h"
+#include "h35.h"
+#include "h36.h"
+#include "h37.h"
+int s433(void) { return 433; }
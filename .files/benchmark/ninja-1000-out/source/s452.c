@@ -0,0 +1,6 @@
+#include "h52.h"
+#include "h53.h"
+#include "h54.h"
+#include "h55.h"
+#include "h56.h"
+int s452(void) { return 452; }
@@ -0,0 +1,6 @@
+#include "h55.h"
+#include "h56.h"
+#include "h57.h"
+#include "h58.h"
+#include "h59.h"
+int s455(void) { return 455; }
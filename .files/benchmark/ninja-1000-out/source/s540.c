@@ -0,0 +1,6 @@
+#include "h40.h"
+#include "h41.h"
+#include "h42.h"
+#include "h43.h"
+#include "h44.h"
+int s540(void) { return 540; }
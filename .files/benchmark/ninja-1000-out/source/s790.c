@@ -0,0 +1,6 @@
+#include "h90.h"
+#include "h91.h"
+#include "h92.h"
+#include "h93.h"
+#include "h94.h"
+int s790(void) { return 790; }
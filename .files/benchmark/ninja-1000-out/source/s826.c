@@ -0,0 +1,6 @@
+#include "h26.h"
+#include "h27.h"
+#include "h28.h"
+#include "h29.h"
+#include "h30.h"
+int s826(void) { return 826; }
@@ -0,0 +1 @@
+#include "a.h"
\ No newline at end of file
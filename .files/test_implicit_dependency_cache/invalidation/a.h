@@ -0,0 +1 @@
+#include "b.h"
\ No newline at end of file
@@ -0,0 +1,2 @@
+#include "include/a.h"
+#include "include/b.h"
\ No newline at end of file
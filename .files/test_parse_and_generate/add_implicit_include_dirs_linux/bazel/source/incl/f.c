@@ -0,0 +1 @@
+#include "../include/f.h"
\ No newline at end of file
@@ -0,0 +1,3 @@
+#include "a.h"
+
+void foo (void) {}
\ No newline at end of file
@@ -0,0 +1 @@
+void foo (void);
\ No newline at end of file
@@ -0,0 +1 @@
+#include "config.h"
@@ -0,0 +1,6 @@
+extern void main_impl();
+
+int main()
+{
+	main_impl();
+}
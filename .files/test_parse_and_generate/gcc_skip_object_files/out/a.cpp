@@ -0,0 +1,8 @@
+#include "a.h"
+#include <iostream>
+
+int a()
+{
+    std::cout << MSG_A << std::endl;
+    return 1;
+}
\ No newline at end of file
@@ -0,0 +1 @@
+int a();
\ No newline at end of file
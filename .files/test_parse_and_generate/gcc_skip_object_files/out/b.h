@@ -0,0 +1 @@
+int b();
\ No newline at end of file
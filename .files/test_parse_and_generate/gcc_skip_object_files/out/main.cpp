@@ -0,0 +1,9 @@
+#include "a.h"
+#include "b.h"
+
+int main()
+{
+    a();
+    b();
+    return 1;
+}
\ No newline at end of file
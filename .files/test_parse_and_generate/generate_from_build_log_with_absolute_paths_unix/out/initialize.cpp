@@ -0,0 +1,6 @@
+#include <stdio.h>
+
+#ifdef _WIN32
+#  include <Windows.h>
+#  include <Wincrypt.h>
+#endif
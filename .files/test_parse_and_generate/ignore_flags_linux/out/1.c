@@ -0,0 +1 @@
+#include "stdio.h"
@@ -0,0 +1,4 @@
+#include "a.h"
+#include "common.h"
+
+int a(void) { return A; }
@@ -0,0 +1 @@
+#define COMMON 2
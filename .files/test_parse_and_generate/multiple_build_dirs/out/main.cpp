@@ -0,0 +1,9 @@
+#if defined(BUILD1)
+	#include "build1.h"
+#else
+	#include "build2.h"
+#endif
+int main()
+{
+	return 0;
+}
\ No newline at end of file
@@ -0,0 +1,7 @@
+#include "a.h"
+#include "b.h"
+
+int main()
+{
+	return 0;
+}
\ No newline at end of file
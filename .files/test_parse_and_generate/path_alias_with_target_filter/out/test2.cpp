@@ -0,0 +1,7 @@
+#include "b.h"
+#include "c.h"
+
+int main()
+{
+	return 0;
+}
\ No newline at end of file
@@ -0,0 +1,7 @@
+#include "c.h"
+#include "d.h"
+
+int main()
+{
+	return 0;
+}
\ No newline at end of file
@@ -0,0 +1,3 @@
+void somefunc()
+{
+}
\ No newline at end of file
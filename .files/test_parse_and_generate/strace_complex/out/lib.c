@@ -0,0 +1,5 @@
+
+int lib(int a, int b)
+{
+    return a + b;
+}
@@ -0,0 +1,8 @@
+
+
+extern "C" int lib(int a, int b);
+
+int main()
+{
+    return lib(42, 100500);
+}
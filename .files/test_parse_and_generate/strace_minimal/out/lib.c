@@ -0,0 +1,4 @@
+int lib(int a, int b)
+{
+    return a + b;
+}
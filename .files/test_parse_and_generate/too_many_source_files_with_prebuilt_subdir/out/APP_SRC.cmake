@@ -0,0 +1,34 @@
+set(APP_SRC
+${SOURCE_DIR}/1.c
+${SOURCE_DIR}/2.c
+${SOURCE_DIR}/3.c
+${SOURCE_DIR}/4.c
+${SOURCE_DIR}/5.c
+${SOURCE_DIR}/6.c
+${SOURCE_DIR}/7.c
+${SOURCE_DIR}/8.c
+${SOURCE_DIR}/9.c
+${SOURCE_DIR}/10.c
+${SOURCE_DIR}/11.c
+${SOURCE_DIR}/12.c
+${SOURCE_DIR}/13.c
+${SOURCE_DIR}/14.c
+${SOURCE_DIR}/15.c
+${SOURCE_DIR}/16.c
+${SOURCE_DIR}/17.c
+${SOURCE_DIR}/18.c
+${SOURCE_DIR}/19.c
+${SOURCE_DIR}/20.c
+${SOURCE_DIR}/21.c
+${SOURCE_DIR}/22.c
+${SOURCE_DIR}/23.c
+${SOURCE_DIR}/24.c
+${SOURCE_DIR}/25.c
+${SOURCE_DIR}/26.c
+${SOURCE_DIR}/27.c
+${SOURCE_DIR}/28.c
+${SOURCE_DIR}/29.c
+${SOURCE_DIR}/30.c
+${SOURCE_DIR}/31.c
+${SOURCE_DIR}/32.c
+)
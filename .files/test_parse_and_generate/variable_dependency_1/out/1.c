@@ -0,0 +1,4 @@
+#include <zlib.h>
+#include "common.h"
+
+int main(){}
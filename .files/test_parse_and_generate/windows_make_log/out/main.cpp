@@ -0,0 +1,7 @@
+#include <iostream>
+
+int main()
+{
+    std::cout << TEST1 << " " << TEST2 << std::endl;
+    return 0;
+}
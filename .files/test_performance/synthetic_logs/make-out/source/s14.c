@@ -0,0 +1,3 @@
+#include "h14.h"
+#include "h15.h"
+int s14(void) { return 14; }
@@ -0,0 +1,3 @@
+#include "h16.h"
+#include "h17.h"
+int s16(void) { return 16; }
@@ -0,0 +1,3 @@
+#include "h2.h"
+#include "h3.h"
+int s2(void) { return 2; }
@@ -0,0 +1,3 @@
+#include "h10.h"
+#include "h11.h"
+int s10(void) { return 10; }
@@ -0,0 +1,3 @@
+#include "h17.h"
+#include "h18.h"
+int s17(void) { return 17; }
@@ -0,0 +1,3 @@
+#include "h13.h"
+#include "h14.h"
+int s13(void) { return 13; }
@@ -0,0 +1,3 @@
+#include "h3.h"
+#include "h4.h"
+int s3(void) { return 3; }
@@ -0,0 +1,3 @@
+#include "h0.h"
+#include "h1.h"
+int s0(void) { return 0; }
@@ -0,0 +1,3 @@
+#include "h19.h"
+#include "h20.h"
+int s19(void) { return 19; }
@@ -0,0 +1,3 @@
+#include "h5.h"
+#include "h6.h"
+int s5(void) { return 5; }
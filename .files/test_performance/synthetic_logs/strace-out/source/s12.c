@@ -0,0 +1,3 @@
+#include "h12.h"
+#include "h13.h"
+int s12(void) { return 12; }
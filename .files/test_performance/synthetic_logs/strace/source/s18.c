@@ -0,0 +1,3 @@
+#include "h18.h"
+#include "h19.h"
+int s18(void) { return 18; }
@@ -0,0 +1,3 @@
+#include "h7.h"
+#include "h8.h"
+int s7(void) { return 7; }
@@ -0,0 +1,3 @@
+#include "h9.h"
+#include "h10.h"
+int s9(void) { return 9; }
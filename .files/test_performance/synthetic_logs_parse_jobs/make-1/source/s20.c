@@ -0,0 +1,3 @@
+#include "h20.h"
+#include "h21.h"
+int s20(void) { return 20; }
@@ -0,0 +1,3 @@
+#include "h29.h"
+#include "h30.h"
+int s29(void) { return 29; }
@@ -0,0 +1,3 @@
+#include "h38.h"
+#include "h39.h"
+int s38(void) { return 38; }
@@ -0,0 +1,3 @@
+#include "h33.h"
+#include "h34.h"
+int s33(void) { return 33; }
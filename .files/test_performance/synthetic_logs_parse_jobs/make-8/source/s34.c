@@ -0,0 +1,3 @@
+#include "h34.h"
+#include "h35.h"
+int s34(void) { return 34; }
@@ -0,0 +1,3 @@
+#include "h37.h"
+#include "h38.h"
+int s37(void) { return 37; }
@@ -0,0 +1,3 @@
+#include "h8.h"
+#include "h9.h"
+int s8(void) { return 8; }
@@ -0,0 +1,3 @@
+#include "h35.h"
+#include "h36.h"
+int s35(void) { return 35; }
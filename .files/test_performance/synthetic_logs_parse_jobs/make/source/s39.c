@@ -0,0 +1,3 @@
+#include "h39.h"
+#include "h40.h"
+int s39(void) { return 39; }
@@ -0,0 +1,3 @@
+#include "h1.h"
+#include "h2.h"
+int s1(void) { return 1; }
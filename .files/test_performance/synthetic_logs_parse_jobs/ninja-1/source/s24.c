@@ -0,0 +1,3 @@
+#include "h24.h"
+#include "h25.h"
+int s24(void) { return 24; }
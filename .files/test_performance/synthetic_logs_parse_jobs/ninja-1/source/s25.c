@@ -0,0 +1,3 @@
+#include "h25.h"
+#include "h26.h"
+int s25(void) { return 25; }
@@ -0,0 +1,3 @@
+#include "h31.h"
+#include "h32.h"
+int s31(void) { return 31; }
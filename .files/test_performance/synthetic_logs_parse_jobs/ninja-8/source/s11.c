@@ -0,0 +1,3 @@
+#include "h11.h"
+#include "h12.h"
+int s11(void) { return 11; }
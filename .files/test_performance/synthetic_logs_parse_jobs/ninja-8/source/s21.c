@@ -0,0 +1,3 @@
+#include "h21.h"
+#include "h22.h"
+int s21(void) { return 21; }
@@ -0,0 +1,3 @@
+#include "h22.h"
+#include "h23.h"
+int s22(void) { return 22; }
@@ -0,0 +1,3 @@
+#include "h23.h"
+#include "h24.h"
+int s23(void) { return 23; }
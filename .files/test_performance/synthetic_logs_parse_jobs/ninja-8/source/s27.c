@@ -0,0 +1,3 @@
+#include "h27.h"
+#include "h28.h"
+int s27(void) { return 27; }
@@ -0,0 +1,3 @@
+#include "h28.h"
+#include "h29.h"
+int s28(void) { return 28; }
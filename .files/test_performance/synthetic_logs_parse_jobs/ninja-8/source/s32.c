@@ -0,0 +1,3 @@
+#include "h32.h"
+#include "h33.h"
+int s32(void) { return 32; }
@@ -0,0 +1,3 @@
+#include "h4.h"
+#include "h5.h"
+int s4(void) { return 4; }
@@ -0,0 +1,3 @@
+#include "h15.h"
+#include "h16.h"
+int s15(void) { return 15; }
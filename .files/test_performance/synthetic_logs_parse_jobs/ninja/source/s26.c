@@ -0,0 +1,3 @@
+#include "h26.h"
+#include "h27.h"
+int s26(void) { return 26; }
@@ -0,0 +1,3 @@
+#include "h30.h"
+#include "h31.h"
+int s30(void) { return 30; }
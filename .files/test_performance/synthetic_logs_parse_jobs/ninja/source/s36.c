@@ -0,0 +1,3 @@
+#include "h36.h"
+#include "h37.h"
+int s36(void) { return 36; }
@@ -0,0 +1,3 @@
+#include "h6.h"
+#include "h7.h"
+int s6(void) { return 6; }
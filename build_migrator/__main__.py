@@ -40,10 +40,29 @@ def _add_arguments(parser, add_help=True):
     )
     exclusive_group = parser.add_mutually_exclusive_group()
     exclusive_group.add_argument(
-        "--save", metavar="PATH", help="Save Build Object Model to file."
+        "--save",
+        metavar="PATH",
+        help="Save Build Object Model to file. "
+        "Files with .bom extension are saved in streaming format, "
+        "other files are pickled.",
     )
     exclusive_group.add_argument(
-        "--load", metavar="PATH", help="Load Build Object Model from file.",
+        "--load",
+        metavar="PATH",
+        help="Load Build Object Model from file (.bom or pickle).",
+    )
+    parser.add_argument(
+        "--load_outputs",
+        metavar="OUTPUT",
+        nargs="+",
+        help="Load only targets with given outputs (e.g., @build_dir@/libfoo.a) "
+        "and their dependencies from Build Object Model.",
+    )
+    parser.add_argument(
+        "--metrics_out",
+        metavar="PATH",
+        help="Write timings and counters of parsers, optimizers and generators, "
+        "peak memory usage and cache hit rates to JSON file.",
     )
     parser.add_argument("--verbose", "-v", action="store_true")
 
@@ -106,6 +125,8 @@ def main(argv=None):
         logging.basicConfig(level=logging.INFO)
 
     migrator = BuildMigrator(modules)
+    if args.metrics_out:
+        migrator.enable_metrics()
 
     settings = vars(args)
     settings = {key: value for key, value in settings.items() if value is not None}
@@ -124,7 +145,9 @@ def main(argv=None):
 
     build_object_model = None
     if args.load:
-        build_object_model = migrator.load_build_object_model(args.load)
+        build_object_model = migrator.load_build_object_model(
+            args.load, args.load_outputs
+        )
 
     if args.commands is None or "build" in args.commands:
         migrator.build(**settings)
@@ -145,6 +168,9 @@ def main(argv=None):
 
     migrator.save_settings(persistent_settings_path, settings)
 
+    if args.metrics_out:
+        migrator.save_metrics(args.metrics_out)
+
 
 if __name__ == "__main__":
     main()
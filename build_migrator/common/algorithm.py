@@ -1,4 +1,6 @@
+import collections
 from copy import deepcopy
+import heapq
 
 try:
     # Python 3
@@ -41,24 +43,45 @@ def fitness_by_set_length(candidate, sets):
 # Shaved off 4 characters, hence fitness = 4
 #
 # Best common_set is D (maximum fitness)
+#
+# Sets may contain ids of values instead of values,
+# lengths is a sequence of value lengths by id (see Vocabulary).
 class FitnessByTotalStringLength(object):
-    def __init__(self, placeholder_length=1):
+    def __init__(self, placeholder_length=1, lengths=None):
         self._placeholder_length = placeholder_length
+        self._lengths = lengths
 
     def __call__(self, candidate, sets):
-        candidate_length = sum([len(s) for s in candidate])
+        if self._lengths is None:
+            candidate_length = sum([len(s) for s in candidate])
+        else:
+            lengths = self._lengths
+            candidate_length = sum([lengths[s] for s in candidate])
         return (
             len(sets) * (candidate_length - self._placeholder_length) - candidate_length
         )
 
 
+# Engines of find_best_common_set(), results are the same:
+# * sets: intersections of Python sets
+# * bitset: intersections of bitmasks (Python ints) over values,
+#   see _find_best_common_set_bitset()
+common_set_engines = ("sets", "bitset")
+
+
 # TODO: describe algorithm?
 # Best case compexity: len(union(sets)) * len(sets)
 # Worst case compexity: len(union(sets)) ^ 2 * len(sets)
-def find_best_common_set(sets, fitness_func=None):
+def find_best_common_set(sets, fitness_func=None, engine=None):
     if fitness_func is None:
         fitness_func = fitness_by_set_length
-    sets_with_value = {}
+    if engine == "bitset":
+        return _find_best_common_set_bitset(sets, fitness_func)
+    if engine not in (None, "sets"):
+        raise ValueError("Unknown engine: %r" % engine)
+    # Candidates with equal number of sets are evaluated in order of first
+    # occurrence of their values, as in other engines
+    sets_with_value = collections.OrderedDict()
     for set_ in sets:
         for value in set_:
             if value not in sets_with_value:
@@ -83,6 +106,406 @@ def find_best_common_set(sets, fitness_func=None):
     return common_set, fitness
 
 
+if hasattr(int, "bit_count"):
+    # Python 3.10+
+    _popcount = int.bit_count
+else:
+
+    def _popcount(mask):
+        return bin(mask).count("1")
+
+
+def _iter_bits(mask):
+    """Yields indices of set bits of non-negative mask in ascending order"""
+    # single pass over binary digits: bit operations would take
+    # O(number of bits) each
+    digits = bin(mask)[:1:-1]
+    idx = digits.find("1")
+    while idx != -1:
+        yield idx
+        idx = digits.find("1", idx + 1)
+
+
+class _LengthPlanes(object):
+    """Total length of values selected by bitmask, computed as
+    sum(popcount(mask & plane) << bit) over binary digits of lengths,
+    so values are not iterated one by one."""
+
+    def __init__(self, lengths):
+        self._planes = []
+        for idx, length in enumerate(lengths):
+            bit = 0
+            while length:
+                if length & 1:
+                    while len(self._planes) <= bit:
+                        self._planes.append(0)
+                    self._planes[bit] |= 1 << idx
+                length >>= 1
+                bit += 1
+
+    def __call__(self, mask):
+        return sum(
+            [_popcount(mask & plane) << bit for bit, plane in enumerate(self._planes)]
+        )
+
+
+# Same algorithm as in find_best_common_set(), but each set is a bitmask
+# over values (in order of their first occurrence), and each value has
+# a bitmask over sets that contain it. Intersection of sets with the value
+# is AND of their bitmasks. Values with equal bitmasks over sets have
+# the same candidate, so it's evaluated once.
+# Fitness of fitness_by_set_length() and FitnessByTotalStringLength
+# (len(sets) * (length - placeholder_length) - length) is computed
+# from bitmasks, other fitness functions are called with sets of values.
+def _find_best_common_set_bitset(sets, fitness_func):
+    value_ids = {}
+    values = []
+    sets_with_value = []  # value id => bitmask over sets
+    set_masks = []  # set index => bitmask over values
+    for set_idx, set_ in enumerate(sets):
+        set_bit = 1 << set_idx
+        set_mask = 0
+        for value in set_:
+            value_id = value_ids.get(value)
+            if value_id is None:
+                value_id = value_ids[value] = len(values)
+                values.append(value)
+                sets_with_value.append(0)
+            sets_with_value[value_id] |= set_bit
+            set_mask |= 1 << value_id
+        set_masks.append(set_mask)
+
+    if fitness_func is fitness_by_set_length:
+        placeholder_length = 1
+        get_length = _popcount
+    elif isinstance(fitness_func, FitnessByTotalStringLength):
+        placeholder_length = fitness_func._placeholder_length
+        lengths = fitness_func._lengths
+        if lengths is None:
+            get_length = _LengthPlanes([len(v) for v in values])
+        else:
+            get_length = _LengthPlanes([lengths[v] for v in values])
+    else:
+        placeholder_length = None
+        get_length = None
+
+    counts = [_popcount(m) for m in sets_with_value]
+    total_length = None if get_length is None else get_length((1 << len(values)) - 1)
+    evaluated = set()
+    common_mask = None
+    fitness = 0
+    for value_id in sorted(range(len(values)), key=lambda i: counts[i], reverse=True):
+        count = counts[value_id]
+        sets_mask = sets_with_value[value_id]
+        if sets_mask not in evaluated:
+            evaluated.add(sets_mask)
+            value_bit = 1 << value_id
+            candidate_mask = -1
+            for set_idx in _iter_bits(sets_mask):
+                candidate_mask &= set_masks[set_idx]
+                if candidate_mask == value_bit:
+                    break
+            if get_length is None:
+                candidate_fitness = fitness_func(
+                    set([values[i] for i in _iter_bits(candidate_mask)]),
+                    [sets[i] for i in _iter_bits(sets_mask)],
+                )
+            else:
+                length = get_length(candidate_mask)
+                candidate_fitness = count * (length - placeholder_length) - length
+            if common_mask is None or candidate_fitness > fitness:
+                common_mask = candidate_mask
+                fitness = candidate_fitness
+        if get_length is None:
+            max_fitness = fitness_func(
+                values, [sets[i] for i in _iter_bits(sets_mask)]
+            )
+        else:
+            max_fitness = count * (total_length - placeholder_length) - total_length
+        if fitness >= max_fitness:
+            # next iterations won't reach better fitness
+            break
+
+    if common_mask is None:
+        return None, fitness
+    return set([values[i] for i in _iter_bits(common_mask)]), fitness
+
+
+# Engines of get_common_set_finder(): engines of find_best_common_set()
+# and incremental engine, see IncrementalCommonSetFinder
+common_set_finder_engines = common_set_engines + ("incremental",)
+
+
+# Finds best common sets one by one: each common set found by find()
+# is removed from sets that contain it by extract(), then next one
+# may be found. Sets are modified in place.
+# This implementation calls find_best_common_set()
+# with FitnessByTotalStringLength on current sets every time.
+class CommonSetFinder(object):
+    def __init__(self, sets, lengths=None, engine=None):
+        self.sets = sets
+        self._lengths = lengths
+        self._engine = engine
+        self._common_set = None
+
+    def _get_length(self, value):
+        if self._lengths is None:
+            return len(value)
+        return self._lengths[value]
+
+    def get_total_length(self):
+        """Returns total length of distinct values in sets"""
+        union = set()
+        for s in self.sets:
+            union.update(s)
+        return sum([self._get_length(v) for v in union])
+
+    def find(self, placeholder_length):
+        """Returns (common set, fitness), see find_best_common_set()"""
+        self._common_set, fitness = find_best_common_set(
+            self.sets,
+            FitnessByTotalStringLength(placeholder_length, self._lengths),
+            self._engine,
+        )
+        return self._common_set, fitness
+
+    def extract(self):
+        """Removes common set returned by the last call of find() from sets
+        that contain it, returns indices of these sets in ascending order"""
+        common_set = self._common_set
+        self._common_set = None
+        indices = []
+        for idx, s in enumerate(self.sets):
+            if common_set <= s:
+                s.difference_update(common_set)
+                indices.append(idx)
+        return indices
+
+
+class _ValueGroup(object):
+    """Values that are contained by the same sets"""
+
+    __slots__ = (
+        "set_indices",
+        "first_set_idx",
+        "values",
+        "length",
+        "candidate",
+        "candidate_length",
+        "version",
+    )
+
+    def __init__(self, set_indices):
+        self.set_indices = set_indices
+        self.first_set_idx = min(set_indices)
+        self.values = set()
+        self.length = 0
+        self.candidate = None
+        self.candidate_length = 0
+        self.version = None
+
+
+# Incremental CommonSetFinder: results are the same, but after extract()
+# only affected candidates are evaluated again.
+#
+# Values are grouped by indices of sets that contain them: as noted
+# in _find_best_common_set_bitset(), values of a group have the same
+# candidate and fitness. Groups are kept in priority queue by fitness,
+# and then by order of their values in find_best_common_set(): number
+# of sets (descending) and first occurrence of value in sets.
+#
+# Common set C found for a group is contained exactly by sets M
+# of this group. After it's extracted:
+# * values of C are contained by sets M_v - M, so their groups are moved
+#   (or merged with existing groups)
+# * candidates of groups whose sets intersect M lose values of C
+# Other groups keep their place in queue.
+#
+# Unlike _find_best_common_set_bitset(), sets of indices are used instead
+# of bitmasks: bitmasks over 100k sets take O(values * sets) memory.
+class IncrementalCommonSetFinder(CommonSetFinder):
+    def __init__(self, sets, lengths=None):
+        super(IncrementalCommonSetFinder, self).__init__(sets, lengths)
+        sets_with_value = collections.OrderedDict()  # value => [set index]
+        for set_idx, set_ in enumerate(sets):
+            for value in set_:
+                indices = sets_with_value.get(value)
+                if indices is None:
+                    sets_with_value[value] = [set_idx]
+                else:
+                    indices.append(set_idx)
+
+        self._total_length = 0
+        self._groups = {}  # frozenset of set indices => _ValueGroup
+        self._value_groups = {}  # value => _ValueGroup
+        for value, indices in sets_with_value.items():
+            set_indices = frozenset(indices)
+            group = self._groups.get(set_indices)
+            if group is None:
+                group = self._groups[set_indices] = _ValueGroup(set_indices)
+            length = self._get_length(value)
+            group.values.add(value)
+            group.length += length
+            self._total_length += length
+            self._value_groups[value] = group
+        for group in self._groups.values():
+            self._update_candidate(group)
+
+        self._placeholder_length = None
+        self._queue = []
+        self._version = 0
+
+    def get_total_length(self):
+        return self._total_length
+
+    def _update_candidate(self, group):
+        sets = self.sets
+        first_idx = min(group.set_indices, key=lambda i: len(sets[i]))
+        candidate = set(sets[first_idx])
+        for set_idx in group.set_indices:
+            if len(candidate) == len(group.values):
+                # candidate always contains values of the group
+                break
+            if set_idx != first_idx:
+                candidate.intersection_update(sets[set_idx])
+        group.candidate = candidate
+        group.candidate_length = sum([self._get_length(v) for v in candidate])
+
+    def _push(self, group):
+        self._version += 1
+        group.version = self._version
+        count = len(group.set_indices)
+        length = group.candidate_length
+        fitness = count * (length - self._placeholder_length) - length
+        heapq.heappush(
+            self._queue,
+            (-fitness, -count, group.first_set_idx, group.version, group.set_indices),
+        )
+
+    def _pop(self):
+        """Pops entry of existing group from queue, or returns None"""
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            group = self._groups.get(entry[-1])
+            if group is not None and group.version == entry[-2]:
+                return entry
+        return None
+
+    def _get_first_group(self, entries):
+        """Returns group whose value occurs first in set with index
+        entries[0][2]"""
+        group_ids = set([id(self._groups[e[-1]]) for e in entries])
+        for value in self.sets[entries[0][2]]:
+            group = self._value_groups[value]
+            if id(group) in group_ids:
+                return group
+        raise AssertionError("Value groups are out of sync with sets")
+
+    def find(self, placeholder_length):
+        if self._total_length < placeholder_length:
+            # Fitness of all candidates is negative. find_best_common_set()
+            # may stop before the best one in this case, result must be
+            # the same.
+            return super(IncrementalCommonSetFinder, self).find(placeholder_length)
+
+        if placeholder_length != self._placeholder_length:
+            self._placeholder_length = placeholder_length
+            self._queue = []
+            for group in self._groups.values():
+                self._push(group)
+
+        entry = self._pop()
+        if entry is None:
+            self._common_set = None
+            return None, 0
+        # entries with the same fitness, count and first set
+        entries = [entry]
+        while self._queue and self._queue[0][:3] == entry[:3]:
+            next_entry = self._pop()
+            if next_entry is None:
+                break
+            if next_entry[:3] != entry[:3]:
+                heapq.heappush(self._queue, next_entry)
+                break
+            entries.append(next_entry)
+        for e in entries:
+            heapq.heappush(self._queue, e)
+        if len(entries) == 1:
+            group = self._groups[entry[-1]]
+        else:
+            group = self._get_first_group(entries)
+
+        self._common_set = set(group.candidate)
+        return set(group.candidate), -entry[0]
+
+    def _get_groups(self, values):
+        groups = collections.OrderedDict()
+        for value in values:
+            group = self._value_groups[value]
+            groups[id(group)] = group
+        return list(groups.values())
+
+    def extract(self):
+        common_set = self._common_set
+        self._common_set = None
+        # values of group are either all in common set or not
+        moved = self._get_groups(common_set)
+
+        # sets that contain common set
+        set_indices = frozenset.intersection(*[g.set_indices for g in moved])
+        indices = sorted(set_indices)
+        affected_groups = collections.OrderedDict()
+        for idx in indices:
+            set_ = self.sets[idx]
+            set_.difference_update(common_set)
+            for group in self._get_groups(set_):
+                affected_groups[id(group)] = group
+
+        # candidates of groups whose sets contained common set
+        # lose its values
+        for group in affected_groups.values():
+            if not group.candidate.isdisjoint(common_set):
+                removed = group.candidate & common_set
+                group.candidate -= removed
+                group.candidate_length -= sum([self._get_length(v) for v in removed])
+                if self._placeholder_length is not None:
+                    self._push(group)
+
+        for group in moved:
+            del self._groups[group.set_indices]
+        for group in moved:
+            group.set_indices = group.set_indices - set_indices
+            if not group.set_indices:
+                self._total_length -= group.length
+                for value in group.values:
+                    del self._value_groups[value]
+                continue
+            existing_group = self._groups.get(group.set_indices)
+            if existing_group is not None:
+                # candidate of existing group already contains these values
+                existing_group.values.update(group.values)
+                existing_group.length += group.length
+                for value in group.values:
+                    self._value_groups[value] = existing_group
+                continue
+            group.first_set_idx = min(group.set_indices)
+            self._groups[group.set_indices] = group
+            self._update_candidate(group)
+            if self._placeholder_length is not None:
+                self._push(group)
+        return indices
+
+
+def get_common_set_finder(sets, lengths=None, engine=None):
+    """Returns CommonSetFinder that uses given engine
+    (see common_set_finder_engines). Default: incremental."""
+    if engine in (None, "incremental"):
+        return IncrementalCommonSetFinder(sets, lengths)
+    if engine not in common_set_engines:
+        raise ValueError("Unknown engine: %r" % engine)
+    return CommonSetFinder(sets, lengths, engine)
+
+
 def join_nested_lists(flags, delim=" "):
     for idx, f in enumerate(flags):
         if isinstance(f, list) or isinstance(f, tuple):
@@ -1,4 +1,5 @@
 from argparse import Namespace
+import collections
 from copy import copy, deepcopy
 from functools import partial
 import logging
@@ -8,13 +9,28 @@ import uuid
 logger = logging.getLogger(__name__)
 
 
+# Values returned by TokenParserState without copying
+_immutable_types = (type(b""), type(u""), int, float, type(None))
+
+
+def _copy_value(value):
+    if isinstance(value, _immutable_types):
+        return value
+    if type(value) is list:
+        return [_copy_value(v) for v in value]
+    return deepcopy(value)
+
+
 class SavepointContextManager(object):
     def __init__(self, savepoint_id, all_savepoints, state):
         if savepoint_id in all_savepoints:
             raise ValueError("Savepoint already exists: %r" % savepoint_id)
         self._dismissed = False
-        self._savepoint = all_savepoints.setdefault(savepoint_id, {})
-        self._state_dict = state.__dict__
+        self._state = state
+        # state is restored by undoing journal entries recorded after this point
+        self._journal_length = len(state._journal)
+        self._position = state._position
+        all_savepoints[savepoint_id] = self
         self._id = savepoint_id
         self._savepoints = all_savepoints
 
@@ -27,23 +43,17 @@ class SavepointContextManager(object):
         Get tokens that were removed or modified between currently saved state
         and state provided in the argument.
         """
-        cur_tokens = state._tokens
-        old_tokens = self._savepoint.get("_tokens")
-        if old_tokens:
-            diff = len(old_tokens) - len(cur_tokens)
-            if diff == 0 and old_tokens[0] != cur_tokens[1]:
-                # leading token was modified
-                diff = 1
-            return old_tokens[0:diff]
-        else:
-            return []
+        return state._get_tokens_since(self._journal_length, self._position)
 
     def load(self):
-        self._state_dict.update(self._savepoint)
+        self._state._rollback(self._journal_length, self._position)
 
     def cleanup(self):
         self._savepoints.pop(self._id)
-        self._savepoint = None
+        if not self._savepoints:
+            # nothing can be rolled back anymore
+            del self._state._journal[:]
+        self._state = None
         self._id = None
 
     def __enter__(self):
@@ -56,61 +66,76 @@ class SavepointContextManager(object):
 
 
 class TokenParserState(object):
+    """
+    Tokens are consumed by moving a cursor over a private copy of token list.
+    Modifications made while savepoints exist are recorded in a journal
+    (undo log), loading a savepoint undoes journal entries recorded after it.
+
+    Lists created by the state (see append_attribute and extend_attribute)
+    are owned by it and modified in place, values set by callers are copied
+    on first modification. get_attribute, get_token and fetch return values
+    that may be modified by caller.
+    """
+
+    _missing = object()
+    # journal entry types
+    _token_entry = 0  # (type, index, old value)
+    _attribute_entry = 1  # (type, name, old value, old value was owned)
+    _extend_entry = 2  # (type, name, old length)
+    _storage_entry = 3  # (type, key, old value)
+
     def __init__(self, tokens, namespace=None):
         if namespace is None:
             namespace = Namespace()
         self._namespace = namespace
-        self._tokens = tokens
+        self._tokens = list(tokens)
+        self._position = 0
+        self._last_inspected = -1  # index of the last token seen by rules
         self._savepoints = {}
+        self._journal = []
+        self._owned = set()  # names of attributes owned by state
         self._storage = {}
 
     def next_tokens(self, n):
-        if len(self._tokens) >= n:
-            self._save_attribute("_tokens")
-            tokens = self._tokens[0:n]
-            self._tokens = self._tokens[n:]
+        end = self._position + n
+        self._last_inspected = max(self._last_inspected, end - 1)
+        if end <= len(self._tokens):
+            tokens = self._tokens[self._position : end]
+            self._position = end
             return tokens
         return None
 
     def get_tokens_length(self):
-        return len(self._tokens)
+        return len(self._tokens) - self._position
 
     def get_token(self, idx):
-        return deepcopy(self._tokens[idx])
+        idx = self._get_token_index(idx)
+        self._last_inspected = max(self._last_inspected, idx)
+        return _copy_value(self._tokens[idx])
 
     def set_token(self, idx, value, savepoint=True):
-        if savepoint:
-            self._save_attribute("_tokens")
+        idx = self._get_token_index(idx)
+        self._last_inspected = max(self._last_inspected, idx)
+        if savepoint and self._savepoints:
+            self._journal.append((self._token_entry, idx, self._tokens[idx]))
         self._tokens[idx] = value
 
     def get_attribute(self, name, default):
-        return deepcopy(getattr(self._namespace, name, default))
+        return _copy_value(getattr(self._namespace, name, default))
 
     def set_attribute(self, name, value, savepoint=True):
-        if savepoint:
-            self._save_attribute("_namespace")
-        setattr(self._namespace, name, value)
+        self._set_attribute(name, value, False, savepoint)
 
     def set_attribute_first(self, name, value, savepoint=True):
-        if savepoint:
-            self._save_attribute("_namespace")
         if isinstance(value, list):
             value = value[0]
-        setattr(self._namespace, name, value)
+        self._set_attribute(name, value, False, savepoint)
 
     def append_attribute(self, name, value, savepoint=True):
-        cur_value = self.get_attribute(name, [])
-        cur_value.append(value)
-        if savepoint:
-            self._save_attribute("_namespace")
-        setattr(self._namespace, name, cur_value)
+        self._modify_list_attribute(name, lambda v: v.append(value), savepoint)
 
     def extend_attribute(self, name, value, savepoint=True):
-        cur_value = self.get_attribute(name, [])
-        cur_value.extend(value)
-        if savepoint:
-            self._save_attribute("_namespace")
-        setattr(self._namespace, name, cur_value)
+        self._modify_list_attribute(name, lambda v: v.extend(value), savepoint)
 
     def append_or_extend_attribute(self, name, value, savepoint=True):
         if len(value) <= 1:
@@ -119,20 +144,46 @@ class TokenParserState(object):
             self.append_attribute(name, value, savepoint=savepoint)
 
     def fetch(self, context, key, default=None):
-        return deepcopy(self._storage.get(self._get_full_key(context, key), default))
+        return _copy_value(self._storage.get(self._get_full_key(context, key), default))
 
     def store(self, context, key, value):
-        self._save_attribute("_storage")
-        self._storage[self._get_full_key(context, key)] = value
+        key = self._get_full_key(context, key)
+        if self._savepoints:
+            old_value = self._storage.get(key, self._missing)
+            self._journal.append((self._storage_entry, key, old_value))
+        self._storage[key] = value
 
     def save(self, context):
         return SavepointContextManager(str(id(context)), self._savepoints, self)
 
+    def get_last_inspected_token_index(self):
+        return self._last_inspected
+
+    def get_snapshot(self):
+        """Returns copy of namespace, storage and position"""
+        namespace = dict((k, _copy_value(v)) for k, v in vars(self._namespace).items())
+        storage = dict((k, _copy_value(v)) for k, v in self._storage.items())
+        return namespace, storage, self._position
+
+    def load_snapshot(self, snapshot):
+        namespace, storage, position = snapshot
+        self._namespace = Namespace()
+        self._owned = set()
+        for name, value in namespace.items():
+            value = _copy_value(value)
+            setattr(self._namespace, name, value)
+            if type(value) is list:
+                self._owned.add(name)
+        self._storage = dict((k, _copy_value(v)) for k, v in storage.items())
+        self._position = position
+
     def finalize(self):
         if len(self._savepoints):
             raise ValueError("Orphaned savepoints found")
-        if len(self._tokens):
-            raise ValueError("Cannot finalize, tokens left: %r" % self._tokens)
+        if self.get_tokens_length():
+            raise ValueError(
+                "Cannot finalize, tokens left: %r" % self._tokens[self._position :]
+            )
         return self._namespace
 
     def _get_full_key(self, context, key):
@@ -140,40 +191,272 @@ class TokenParserState(object):
             key = str(id(context)) + "." + key
         return key
 
-    def _save_attribute(self, name):
-        for _id, dict in self._savepoints.items():
-            if name not in dict:
-                dict[name] = deepcopy(self.__dict__[name])
+    def _get_token_index(self, idx):
+        if idx < 0:
+            idx += len(self._tokens)
+        else:
+            idx += self._position
+        if idx < self._position or idx >= len(self._tokens):
+            raise IndexError("token index out of range")
+        return idx
+
+    def _set_attribute(self, name, value, owned, savepoint):
+        if savepoint and self._savepoints:
+            old_value = getattr(self._namespace, name, self._missing)
+            self._journal.append(
+                (self._attribute_entry, name, old_value, name in self._owned)
+            )
+        setattr(self._namespace, name, value)
+        if owned:
+            self._owned.add(name)
+        else:
+            self._owned.discard(name)
+
+    def _modify_list_attribute(self, name, modify, savepoint):
+        if name in self._owned:
+            value = getattr(self._namespace, name)
+            if savepoint and self._savepoints:
+                self._journal.append((self._extend_entry, name, len(value)))
+            modify(value)
+        else:
+            # copy on write
+            value = copy(getattr(self._namespace, name, []))
+            modify(value)
+            self._set_attribute(name, value, True, savepoint)
+
+    def _rollback(self, journal_length, position):
+        journal = self._journal
+        while len(journal) > journal_length:
+            entry = journal.pop()
+            entry_type = entry[0]
+            if entry_type == self._token_entry:
+                self._tokens[entry[1]] = entry[2]
+            elif entry_type == self._extend_entry:
+                del getattr(self._namespace, entry[1])[entry[2] :]
+            elif entry_type == self._attribute_entry:
+                unused_, name, old_value, owned = entry
+                if old_value is self._missing:
+                    delattr(self._namespace, name)
+                else:
+                    setattr(self._namespace, name, old_value)
+                if owned:
+                    self._owned.add(name)
+                else:
+                    self._owned.discard(name)
+            else:
+                unused_, key, old_value = entry
+                if old_value is self._missing:
+                    del self._storage[key]
+                else:
+                    self._storage[key] = old_value
+        self._position = position
+
+    def _get_tokens_since(self, journal_length, position):
+        """Returns original values of tokens consumed since the given point"""
+        old_tokens = {}
+        for entry in reversed(self._journal[journal_length:]):
+            if entry[0] == self._token_entry:
+                old_tokens[entry[1]] = entry[2]
+        end = self._position
+        if end == position and position in old_tokens:
+            # leading token was modified
+            if old_tokens[position] != self._tokens[position]:
+                end += 1
+        return [old_tokens.get(i, self._tokens[i]) for i in range(position, end)]
+
+
+# Dispatch key types, see get_dispatch_keys()
+_exact_key = 0
+_prefix_key = 1
+
+
+def get_dispatch_keys(rule):
+    """
+    Returns list of (key type, key, ignore case) describing the first token
+    that may be accepted by the rule, or None if rule may accept any token.
+    """
+    get_keys = getattr(rule, "get_dispatch_keys", None)
+    if get_keys is None:
+        return None
+    return get_keys()
+
+
+class RuleIndex(object):
+    """
+    Finds rules that may accept the token by exact value or prefix of
+    the token. Rules without dispatch keys (e.g., positional arguments)
+    are candidates for any token. Candidates are returned in order of rules.
+    """
+
+    def __init__(self, rules):
+        self._any_token = []
+        # ignore case => {key => [rule index]}
+        self._exact = {False: {}, True: {}}
+        self._prefixes = {False: {}, True: {}}
+        # ignore case => sorted lengths of keys in self._prefixes
+        self._prefix_lengths = {False: [], True: []}
+        for idx, rule in enumerate(rules):
+            keys = get_dispatch_keys(rule)
+            if keys is None:
+                self._any_token.append(idx)
+                continue
+            for key_type, key, ignore_case in keys:
+                ignore_case = bool(ignore_case)
+                if ignore_case:
+                    key = key.lower()
+                if key_type == _exact_key:
+                    index = self._exact[ignore_case]
+                else:
+                    index = self._prefixes[ignore_case]
+                index.setdefault(key, []).append(idx)
+        for ignore_case, prefixes in self._prefixes.items():
+            self._prefix_lengths[ignore_case] = sorted(set(len(p) for p in prefixes))
+
+    def get_candidates(self, token):
+        indices = set(self._any_token)
+        for ignore_case in (False, True):
+            key = token.lower() if ignore_case else token
+            indices.update(self._exact[ignore_case].get(key, []))
+            prefixes = self._prefixes[ignore_case]
+            for length in self._prefix_lengths[ignore_case]:
+                if length > len(key):
+                    break
+                indices.update(prefixes.get(key[:length], []))
+        return sorted(indices)
+
+
+class ParseMemo(object):
+    """
+    Least recently used parse results of leading flags, shared by commands
+    that differ only in the rest of arguments (e.g., source and output paths).
+    """
+
+    def __init__(self, size=1024):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+
+    def get(self, key):
+        value = self._entries.pop(key, None)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries[key] = value
+        return value
+
+    def put(self, key, value):
+        self._entries.pop(key, None)
+        self._entries[key] = value
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
 
 
 class TokenParser(object):
-    def __init__(self, rules=None, validators=None):
+    def __init__(
+        self, rules=None, validators=None, context_rules=None, prefix_chars="-"
+    ):
         if rules is None:
             rules = []
         if validators is None:
             validators = []
-        self._rule = Any(*rules)
+        self._rules = rules
+        self._rule_index = RuleIndex(rules)
         self._validators = validators
+        # Rules with handlers that depend on anything but tokens
+        # (e.g., resolve paths), their results are never memoized
+        context_rules = context_rules or []
+        self._context_rules = set(
+            idx
+            for idx, rule in enumerate(rules)
+            if any(rule is r for r in context_rules)
+        )
+        self._prefix_chars = tuple(prefix_chars or "")
+
+    def _get_memo_key(self, tokens, strict, unknown_dest):
+        # leading flags, up to the first token that looks like a value
+        end = 0
+        while end < len(tokens) and tokens[end].startswith(self._prefix_chars):
+            end += 1
+        if end == 0:
+            return None
+        if isinstance(unknown_dest, list):
+            unknown_dest = tuple(unknown_dest)
+        # rules also depend on presence of the next token
+        return tuple(tokens[:end]), end < len(tokens), strict, unknown_dest
+
+    def _may_apply_context_rules(self, state):
+        if not self._context_rules:
+            return False
+        candidates = self._rule_index.get_candidates(state.get_token(0))
+        return any(idx in self._context_rules for idx in candidates)
+
+    def _apply_rules(self, state):
+        """Applies the first rule that accepts the leading token"""
+        token = state.get_token(0)
+        with state.save(self) as savepoint:
+            for idx in self._rule_index.get_candidates(token):
+                if self._rules[idx](state):
+                    savepoint.dismiss()
+                    return True
+            return False
 
-    def parse(self, tokens, namespace=None, strict=True, unknown_dest=None):
+    def _parse_next(self, state, strict, unknown_dest):
+        """Parses leading token(s), returns list of unparsed tokens"""
+        if self._apply_rules(state):
+            return []
+        skip_n = 1
+        if strict:
+            skip_n = state.get_tokens_length()
+        tokens = state.next_tokens(skip_n)
+        if unknown_dest is not None:
+            if isinstance(unknown_dest, list):
+                dests = unknown_dest
+            else:
+                dests = [unknown_dest]
+            for dest in dests:
+                state.extend_attribute(dest, tokens)
+        return tokens
+
+    def parse(
+        self, tokens, namespace=None, strict=True, unknown_dest=None, memo=None
+    ):
         state = TokenParserState(tokens, namespace)
 
         unparsed_tokens = []
+        memo_key = None
+        if memo is not None and namespace is None:
+            memo_key = self._get_memo_key(tokens, strict, unknown_dest)
+        if memo_key is not None:
+            cached = memo.get(memo_key)
+            if cached is not None:
+                snapshot, unparsed_tokens = cached
+                state.load_snapshot(snapshot)
+                unparsed_tokens = list(unparsed_tokens)
+                memo_key = None
+
         while state.get_tokens_length() > 0:
-            if self._rule(state):
+            if memo_key is None:
+                unparsed_tokens.extend(self._parse_next(state, strict, unknown_dest))
                 continue
-            skip_n = 1
-            if strict:
-                skip_n = state.get_tokens_length()
-            tokens = state.next_tokens(skip_n)
-            if unknown_dest is not None:
-                if isinstance(unknown_dest, list):
-                    dests = unknown_dest
-                else:
-                    dests = [unknown_dest]
-                for dest in dests:
-                    state.extend_attribute(dest, tokens, savepoint=False)
+            # Results are memoized up to the first rule that looks beyond
+            # leading flags or may depend on anything but tokens
+            tokens = None
+            if not self._may_apply_context_rules(state):
+                with state.save(memo) as savepoint:
+                    tokens = self._parse_next(state, strict, unknown_dest)
+                    if state.get_last_inspected_token_index() < len(memo_key[0]):
+                        savepoint.dismiss()
+                    else:
+                        tokens = None
+            if tokens is None:
+                memo.put(memo_key, (state.get_snapshot(), list(unparsed_tokens)))
+                memo_key = None
+                tokens = self._parse_next(state, strict, unknown_dest)
             unparsed_tokens.extend(tokens)
+        if memo_key is not None:
+            memo.put(memo_key, (state.get_snapshot(), list(unparsed_tokens)))
 
         if len(unparsed_tokens) > 0 and strict:
             raise ValueError("Unparsed tokens: %r" % unparsed_tokens)
@@ -220,12 +503,17 @@ class IsEmpty(Check):
 class IsIn(Check):
     def __init__(self, *values, **kwargs):
         ignore_case = kwargs.get("ignore_case")
+        self._values = values
+        self._ignore_case = ignore_case
         if ignore_case:
             values = [v.lower() for v in values]
             super(IsIn, self).__init__(lambda t: t.lower() in values)
         else:
             super(IsIn, self).__init__(lambda t: t in values)
 
+    def get_dispatch_keys(self):
+        return [(_exact_key, v, self._ignore_case) for v in self._values]
+
 
 class Not(object):
     def __init__(self, rule):
@@ -259,6 +547,10 @@ class Transform(object):
 class RemovePrefix(Transform):
     def __init__(self, *prefixes):
         super(RemovePrefix, self).__init__(partial(self._remove_prefix, prefixes))
+        self._prefixes = prefixes
+
+    def get_dispatch_keys(self):
+        return [(_prefix_key, p, False) for p in self._prefixes]
 
     @staticmethod
     def _remove_prefix(prefixes, token):
@@ -273,6 +565,10 @@ class RemovePrefixCaseInsensitive(Transform):
         super(RemovePrefixCaseInsensitive, self).__init__(
             partial(self._remove_prefix, prefixes)
         )
+        self._prefixes = prefixes
+
+    def get_dispatch_keys(self):
+        return [(_prefix_key, p, True) for p in self._prefixes]
 
     @staticmethod
     def _remove_prefix(prefixes, token):
@@ -312,11 +608,26 @@ class All(object):
             savepoint.dismiss()
             return True
 
+    def get_dispatch_keys(self):
+        # the first rule must accept the leading token
+        if not self._rules:
+            return None
+        return get_dispatch_keys(self._rules[0])
+
 
 class Any(object):
     def __init__(self, *rules):
         self._rules = rules
 
+    def get_dispatch_keys(self):
+        keys = []
+        for rule in self._rules:
+            rule_keys = get_dispatch_keys(rule)
+            if rule_keys is None:
+                return None
+            keys.extend(rule_keys)
+        return keys
+
     def __call__(self, state):
         with state.save(self) as savepoint:
             for rule in self._rules:
@@ -443,6 +754,9 @@ class AppendTokensConsumedByRule(object):
         self._format = format
         self._handler = handler
 
+    def get_dispatch_keys(self):
+        return get_dispatch_keys(self._rule)
+
     def __call__(self, state):
         with state.save(self) as savepoint:
             if not self._rule(state):
@@ -554,6 +868,9 @@ class ArgumentParserEx(object):
 
         self._rules = []
         self._validators = []
+        self._context_rules = []
+        # see ParseMemo
+        self.memo = None
         self._invalidate_parser()
 
     def add_argument(self, *args, **kwargs):
@@ -579,18 +896,26 @@ class ArgumentParserEx(object):
             del kwargs["action"]
         rule, validators = get_rule(**kwargs)
         self._rules.append(rule)
+        if kwargs.get("handler") or kwargs.get("raw_handler"):
+            self._context_rules.append(rule)
         self._invalidate_parser()
         self._validators.extend(validators)
         return rule
 
     def parse_args(self, args, namespace=None):
         self._ensure_parser_is_ready()
-        return self._parser.parse(args, strict=True, namespace=namespace)
+        return self._parser.parse(
+            args, strict=True, namespace=namespace, memo=self.memo
+        )
 
     def parse_known_args(self, args, namespace=None, unknown_dest=None):
         self._ensure_parser_is_ready()
         return self._parser.parse(
-            args, strict=False, namespace=namespace, unknown_dest=unknown_dest
+            args,
+            strict=False,
+            namespace=namespace,
+            unknown_dest=unknown_dest,
+            memo=self.memo,
         )
 
     def set(self, **kwargs):
@@ -771,7 +1096,12 @@ class ArgumentParserEx(object):
 
     def _ensure_parser_is_ready(self):
         if not self._parser:
-            self._parser = TokenParser(self._rules, self._validators)
+            self._parser = TokenParser(
+                self._rules,
+                self._validators,
+                context_rules=self._context_rules,
+                prefix_chars=self._kwargs["prefix_chars"],
+            )
 
     def _get_positional_kwargs(self, name, **kwargs):
         """Prepare kwargs for positional arguments"""
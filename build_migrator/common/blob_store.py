@@ -0,0 +1,121 @@
+import hashlib
+import os
+import shutil
+import tempfile
+
+
+# Content-addressed storage for contents of file targets.
+#
+# Blobs are stored as separate files named after SHA-1 of their content,
+# so identical files are stored once. Blob files are never modified:
+# changed content (e.g., by FileTargetGsub) is stored as a new blob.
+# File targets refer to blobs by "content_hash" and "size" keys,
+# see helpers.get_file_content().
+#
+# New blobs are always written to directory, which is created when the
+# first blob is stored. Blobs that are missing there
+# are looked up in fallback_dirs (e.g., blob stores of loaded Build Object
+# Models), so a store can read blobs it doesn't own.
+class BlobStore(object):
+    chunk_size = 1024 * 1024
+
+    def __init__(self, directory, fallback_dirs=None):
+        self.directory = directory
+        self.fallback_dirs = fallback_dirs or []
+
+    def _own_path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def path(self, key):
+        path = self._own_path(key)
+        if not os.path.exists(path):
+            for directory in self.fallback_dirs:
+                fallback_path = os.path.join(directory, key[:2], key)
+                if os.path.exists(fallback_path):
+                    return fallback_path
+        return path
+
+    def __contains__(self, key):
+        return os.path.exists(self.path(key))
+
+    def _hash_file(self, path):
+        sha1 = hashlib.sha1()
+        size = 0
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                sha1.update(chunk)
+                size += len(chunk)
+        return sha1.hexdigest(), size
+
+    def _store(self, key, write):
+        path = self._own_path(key)
+        if os.path.exists(path):
+            return
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # created concurrently
+                if not os.path.isdir(directory):
+                    raise
+        # write to temporary file first, so incomplete blobs are never visible
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            if not os.path.exists(path):
+                os.rename(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _store_file(self, key, path):
+        def _copy(f):
+            with open(path, "rb") as src:
+                shutil.copyfileobj(src, f, self.chunk_size)
+
+        self._store(key, _copy)
+
+    def put(self, data):
+        """Stores bytes, returns key"""
+        key = hashlib.sha1(data).hexdigest()
+        self._store(key, lambda f: f.write(data))
+        return key
+
+    def put_file(self, path):
+        """Stores file contents without reading it into memory.
+        Returns (key, size)."""
+        key, size = self._hash_file(path)
+        self._store_file(key, path)
+        return key, size
+
+    def get(self, key):
+        """Returns bytes stored under key"""
+        with open(self.path(key), "rb") as f:
+            return f.read()
+
+    def copy(self, key, path):
+        """Copies blob to path without reading it into memory"""
+        shutil.copyfile(self.path(key), path)
+
+    def import_blob(self, key):
+        """Copies blob from fallback directory to own directory"""
+        self._store_file(key, self.path(key))
+
+
+def get_blob_store(out_dir, build_migrator=None):
+    """Returns blob store of the given output directory,
+    or None if out_dir is None (file contents are kept in targets).
+    Blob stores known to build_migrator (see BuildMigrator.blob_dirs)
+    are used as fallback directories."""
+    if out_dir is None:
+        return None
+    directory = os.path.abspath(os.path.join(out_dir, "blobs"))
+    if build_migrator is None:
+        return BlobStore(directory)
+    blob_dirs = getattr(build_migrator, "blob_dirs", [])
+    fallback_dirs = [d for d in blob_dirs if d != directory]
+    if directory not in blob_dirs:
+        blob_dirs.append(directory)
+    return BlobStore(directory, fallback_dirs)
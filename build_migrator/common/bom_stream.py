@@ -0,0 +1,231 @@
+"""Streaming Build Object Model format.
+
+File layout (all integers are little-endian):
+
+    header: MAGIC, version (uint16), marshal version (uint16)
+    records: kind (uint8), payload length (uint32), payload
+
+Record kinds:
+
+    TARGETS  list of up to CHUNK_SIZE targets, encoded by marshal.
+    PICKLED  the same list, pickled. Used if targets contain values
+             that marshal doesn't support.
+    END      number of targets (uint32). Detects truncated files.
+
+Compact target records (see build_migrator.common.records) are stored
+as tuples (record type code, values of fields, other keys), so keys
+aren't repeated in every target. Record type codes are indices
+in _record_classes. Other targets are stored as dictionaries.
+
+marshal (version 3+, Python 3.4+) refers to repeated string objects
+(paths and flags shared through Vocabulary) instead of writing them again,
+so strings are stored once per record, and the loaded Build Object Model
+shares them.
+Targets are written and read one chunk at a time, and encoded by C
+implementation of marshal, which doesn't call methods of each record
+like pickle does: saving is faster than pickle, loading takes about
+the same time. Files written by newer Python (with newer marshal
+version) can't be read by older one.
+"""
+
+import marshal
+import pickle
+import struct
+
+from build_migrator.common.records import (
+    ClassRecord,
+    CommandRecord,
+    CopyRecord,
+    DirectoryRecord,
+    FileRecord,
+    InterfaceRecord,
+    ModuleCopyRecord,
+    ModuleRecord,
+    SourceRecord,
+    VariableRecord,
+    mapping_types,
+)
+
+MAGIC = b"BMBOM\0"
+VERSION = 1
+EXTENSION = ".bom"
+CHUNK_SIZE = 1000
+
+# version 2 is the latest one supported by Python 2
+MARSHAL_VERSION = min(marshal.version, 4)
+
+_TARGETS = 1
+_PICKLED = 2
+_END = 3
+
+_header = struct.Struct("<%dsHH" % len(MAGIC))
+_record_header = struct.Struct("<BI")
+_uint32 = struct.Struct("<I")
+
+# Part of the format: append new classes only
+_record_classes = (
+    ModuleRecord,
+    InterfaceRecord,
+    ModuleCopyRecord,
+    ClassRecord,
+    FileRecord,
+    DirectoryRecord,
+    CopyRecord,
+    VariableRecord,
+    CommandRecord,
+    SourceRecord,
+)
+_record_codes = dict((cls, code) for code, cls in enumerate(_record_classes))
+# record type code => index of 'sources' in values of fields, or None
+_sources_idx = [
+    cls.fields.index("sources") if "sources" in cls.fields else None
+    for cls in _record_classes
+]
+
+
+def is_bom_stream_path(path):
+    return path.endswith(EXTENSION)
+
+
+def _encode(target):
+    code = _record_codes.get(type(target))
+    if code is None:
+        if type(target) is not dict and isinstance(target, mapping_types):
+            target = dict(target.items())
+        sources = target.get("sources")
+        if sources and type(sources[0]) is not dict:
+            target = dict(target)
+            target["sources"] = [_encode(s) for s in sources]
+        return target
+
+    values, extra = target.get_state()
+    idx = _sources_idx[code]
+    if idx is not None:
+        sources = values[idx]
+        if sources and sources is not Ellipsis:
+            values = list(values)
+            values[idx] = [_encode(s) for s in sources]
+    return code, values, extra
+
+
+def _decode(target):
+    if type(target) is not tuple:
+        sources = target.get("sources")
+        if sources:
+            target["sources"] = [_decode(s) for s in sources]
+        return target
+
+    code, values, extra = target
+    record = _record_classes[code].from_state(values, extra)
+    idx = _sources_idx[code]
+    if idx is not None:
+        sources = values[idx]
+        if sources and sources is not Ellipsis:
+            record["sources"] = [_decode(s) for s in sources]
+    return record
+
+
+class BomWriter(object):
+    """Writes targets to a binary file object one by one"""
+
+    def __init__(self, f):
+        self.f = f
+        self.count = 0
+        self._chunk = []
+        f.write(_header.pack(MAGIC, VERSION, MARSHAL_VERSION))
+
+    def _write_record(self, kind, payload):
+        self.f.write(_record_header.pack(kind, len(payload)))
+        self.f.write(payload)
+
+    def _flush(self):
+        if not self._chunk:
+            return
+        try:
+            self._write_record(
+                _TARGETS, marshal.dumps(self._chunk, MARSHAL_VERSION)
+            )
+        except ValueError:
+            # types that are not expected in Build Object Model
+            self._write_record(_PICKLED, pickle.dumps(self._chunk, protocol=2))
+        self._chunk = []
+
+    def write(self, target):
+        self._chunk.append(_encode(target))
+        self.count += 1
+        if len(self._chunk) >= CHUNK_SIZE:
+            self._flush()
+
+    def close(self):
+        self._flush()
+        self._write_record(_END, _uint32.pack(self.count))
+
+
+class BomReader(object):
+    """Reads targets from a binary file object"""
+
+    def __init__(self, f):
+        self.f = f
+        header = f.read(_header.size)
+        if len(header) != _header.size:
+            raise ValueError("Not a Build Object Model file")
+        magic, version, marshal_version = _header.unpack(header)
+        if magic != MAGIC:
+            raise ValueError("Not a Build Object Model file")
+        if version > VERSION:
+            raise ValueError(
+                "Unsupported Build Object Model version: %d (expected <= %d)"
+                % (version, VERSION)
+            )
+        if marshal_version > marshal.version:
+            raise ValueError(
+                "Build Object Model is saved by newer version of Python "
+                "(marshal version %d, expected <= %d)"
+                % (marshal_version, marshal.version)
+            )
+
+    def _read(self, size):
+        data = self.f.read(size)
+        if len(data) != size:
+            raise ValueError("Build Object Model file is truncated")
+        return data
+
+    def __iter__(self):
+        count = 0
+        while True:
+            kind, length = _record_header.unpack(self._read(_record_header.size))
+            payload = self._read(length)
+            if kind == _TARGETS or kind == _PICKLED:
+                try:
+                    if kind == _TARGETS:
+                        targets = marshal.loads(payload)
+                    else:
+                        targets = pickle.loads(payload)
+                except (EOFError, TypeError, ValueError):
+                    raise ValueError("Build Object Model file is corrupted")
+                count += len(targets)
+                for target in targets:
+                    yield _decode(target)
+            elif kind == _END:
+                if _uint32.unpack(payload)[0] != count:
+                    raise ValueError("Build Object Model file is corrupted")
+                return
+            else:
+                raise ValueError("Corrupted Build Object Model: unknown record")
+
+    def read(self):
+        """Returns list of targets"""
+        return list(self)
+
+
+def save(path, targets):
+    with open(path, "wb") as f:
+        writer = BomWriter(f)
+        for target in targets:
+            writer.write(target)
+        writer.close()
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return BomReader(f).read()
@@ -0,0 +1,89 @@
+import collections
+
+
+def iter_target_and_dependencies(target, index, skip_set):
+    """Yields dependencies of target (depth-first, in order of 'dependencies'
+    lists) followed by the target itself. Outputs of yielded targets are added
+    to skip_set, targets with outputs found in skip_set are skipped.
+    index maps outputs to targets: dictionary or DependencyGraph."""
+    if target["output"] in skip_set:
+        return
+    skip_set.add(target["output"])
+    # explicit stack: dependency chains may be deeper than recursion limit
+    stack = [(target, iter(target.get("dependencies") or []))]
+    while stack:
+        current, dependencies = stack[-1]
+        for dep in dependencies:
+            if dep in index:
+                dep_target = index[dep]
+                if dep_target["output"] not in skip_set:
+                    skip_set.add(dep_target["output"])
+                    stack.append(
+                        (dep_target, iter(dep_target.get("dependencies") or []))
+                    )
+                    break
+        else:
+            stack.pop()
+            yield current
+
+
+# Index of targets by their outputs (including 'msvc_import_lib' aliases)
+# with forward and reverse adjacency of 'dependencies'.
+#
+# Modules build a graph of the targets they are given, as they did with
+# output => target dictionaries: optimizers add, remove and modify targets
+# in place, so the graph isn't kept between calls. If multiple targets have
+# the same output (e.g., object libraries), the last one is indexed.
+# Reverse adjacency is only built if it's needed.
+#
+# The graph can be used instead of output => target dictionaries:
+# graph[output], graph.get(output), output in graph.
+class DependencyGraph(object):
+    def __init__(self, targets):
+        self._targets = list(targets)
+        self._index = {}  # output => target
+        for target in self._targets:
+            if "output" in target:
+                self._index[target["output"]] = target
+            for o in target.get("msvc_import_lib") or []:
+                self._index[o] = target
+        self._dependents = None  # id(target) => {id(dependent): dependent}
+
+    def __contains__(self, output):
+        return output in self._index
+
+    def __getitem__(self, output):
+        return self._index[output]
+
+    def __len__(self):
+        return len(self._index)
+
+    def get(self, output, default=None):
+        return self._index.get(output, default)
+
+    def get_dependencies(self, target):
+        """Returns targets found in dependencies of target"""
+        return [
+            self._index[dep]
+            for dep in target.get("dependencies") or []
+            if dep in self._index
+        ]
+
+    def get_dependents(self, target):
+        """Returns targets that depend on outputs of target,
+        in order of targets of the graph"""
+        if self._dependents is None:
+            self._dependents = {}
+            for dependent in self._targets:
+                for dep_target in self.get_dependencies(dependent):
+                    self._dependents.setdefault(
+                        id(dep_target), collections.OrderedDict()
+                    )[id(dependent)] = dependent
+        return list((self._dependents.get(id(target)) or {}).values())
+
+    def iter_target_and_dependencies(self, target, skip_set=None):
+        """See iter_target_and_dependencies()"""
+        if skip_set is None:
+            skip_set = set()
+        return iter_target_and_dependencies(target, self, skip_set)
+
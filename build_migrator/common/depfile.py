@@ -0,0 +1,90 @@
+import os
+import re
+
+
+# Makefile-style dependency files produced by gcc/clang (-MD, -MMD, -MF),
+# nasm (-MD) and many other tools. Example:
+#
+#   out/a.o: ../src/a.c ../src/a.h \
+#     ../src/dir\ with\ spaces/b.h
+#   ../src/a.h:
+#
+# Spaces and '#' are escaped with backslash, '$' is escaped as '$$'.
+# Backslashes in Windows paths are not escaped.
+_continuation_re = re.compile(r"\\\r?\n")
+_token_re = re.compile(r"(?:\\.|[^\s\\])+|\\")
+_escape_re = re.compile(r"\\([ #])")
+
+
+def _unescape(token):
+    if "\\" in token:
+        token = _escape_re.sub(r"\1", token)
+    if "$$" in token:
+        token = token.replace("$$", "$")
+    return token
+
+
+def parse_depfile(content):
+    """Returns list of (targets, prerequisites) tuples, one per rule."""
+    rules = []
+    for line in _continuation_re.sub(" ", content).splitlines():
+        targets = []
+        prerequisites = None
+        for token in _token_re.findall(line):
+            if prerequisites is not None:
+                prerequisites.append(_unescape(token))
+            elif token == ":":
+                prerequisites = []
+            elif token.endswith(":"):
+                targets.append(_unescape(token[:-1]))
+                prerequisites = []
+            else:
+                targets.append(_unescape(token))
+        if prerequisites is not None:
+            rules.append((targets, prerequisites))
+    return rules
+
+
+def read_depfile(path):
+    """Returns prerequisites of all rules in dependency file,
+    in order of appearance, without duplicates."""
+    with open(path, "rb") as f:
+        content = f.read()
+    if type(content) is not str:
+        content = content.decode("utf-8", "replace")
+    result = []
+    visited = set()
+    for _, prerequisites in parse_depfile(content):
+        for p in prerequisites:
+            if p not in visited:
+                visited.add(p)
+                result.append(p)
+    return result
+
+
+def check_recorded_dependencies(
+    dependencies, mtime, sources, cwd, require_sources=False
+):
+    """Validates dependencies recorded during the build (depfile, .ninja_deps).
+
+    Returns dependencies without sources, or None if any of them
+    doesn't exist or is newer than mtime (i.e., the record is outdated).
+    If require_sources is True, all sources must be listed as well.
+    Relative paths are evaluated relative to cwd.
+    """
+    missing_sources = set(os.path.normpath(os.path.join(cwd, s)) for s in sources)
+    result = []
+    for dep in dependencies:
+        path = os.path.normpath(os.path.join(cwd, dep))
+        try:
+            if os.path.getmtime(path) > mtime:
+                return None
+        except OSError:
+            return None
+        if path in missing_sources:
+            missing_sources.remove(path)
+            continue
+        result.append(dep)
+    if require_sources and missing_sources:
+        return None
+    return result
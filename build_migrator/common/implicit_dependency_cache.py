@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import traceback
+
+
+logger = logging.getLogger(__name__)
+
+
+# Persistent cache for implicit dependencies (headers, includes)
+# reported by compilers and assemblers.
+#
+# Entry key is computed from the command line, working directory
+# and contents of source files. Each entry stores dependency list
+# along with content hashes of dependencies. Entry is valid only
+# if none of the dependencies has changed since it was stored.
+#
+# Entries are stored as separate files, so the cache can be shared
+# by multiple worker threads and processes. Least recently used entries are removed
+# in close() if total cache size exceeds max_size.
+class ImplicitDependencyCache(object):
+    version = 1
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._file_hashes = {}
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def _get_file_hash(self, path):
+        result = self._file_hashes.get(path)
+        if result is None:
+            try:
+                with open(path, "rb") as f:
+                    result = hashlib.sha1(f.read()).hexdigest()
+            except (IOError, OSError):
+                result = ""
+            self._file_hashes[path] = result
+        return result
+
+    def _get_key(self, tool, cmd, cwd, sources):
+        key = [
+            self.version,
+            tool,
+            cmd,
+            cwd,
+            [
+                [s, self._get_file_hash(os.path.join(cwd, s))]
+                for s in sources
+            ],
+        ]
+        return hashlib.sha1(
+            json.dumps(key, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _get_entry_path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, tool, cmd, cwd, sources):
+        """Returns cached dependency list or None."""
+        path = self._get_entry_path(self._get_key(tool, cmd, cwd, sources))
+        try:
+            with open(path, "rt") as f:
+                entry = json.load(f)
+        except (IOError, OSError, ValueError):
+            self._count(False)
+            return None
+
+        dependencies = []
+        for dep, dep_hash in entry["dependencies"]:
+            if self._get_file_hash(os.path.join(cwd, dep)) != dep_hash:
+                self._count(False)
+                return None
+            dependencies.append(dep)
+
+        try:
+            # update access time for eviction
+            os.utime(path, None)
+        except OSError:
+            pass
+        self._count(True)
+        return dependencies
+
+    def put(self, tool, cmd, cwd, sources, dependencies):
+        path = self._get_entry_path(self._get_key(tool, cmd, cwd, sources))
+        entry = {
+            "dependencies": [
+                [dep, self._get_file_hash(os.path.join(cwd, dep))]
+                for dep in dependencies
+            ]
+        }
+        tmp_path = "{}.{}.{}.tmp".format(
+            path, os.getpid(), threading.current_thread().ident
+        )
+        try:
+            entry_dir = os.path.dirname(path)
+            if not os.path.exists(entry_dir):
+                try:
+                    os.makedirs(entry_dir)
+                except OSError:
+                    # created by another thread
+                    pass
+            with open(tmp_path, "wt") as f:
+                json.dump(entry, f)
+            if os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp_path, path)
+        except (IOError, OSError):
+            logger.error(traceback.format_exc())
+
+    def close(self):
+        entries = []
+        total_size = 0
+        for root, _, files in os.walk(self.directory):
+            for f in files:
+                path = os.path.join(root, f)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+
+        if total_size > self.max_size:
+            entries.sort()
+            for _, size, path in entries:
+                if total_size <= self.max_size:
+                    break
+                os.remove(path)
+                total_size -= size
+
+        logger.info(
+            "Implicit dependency cache: {} hits, {} misses".format(
+                self.hits, self.misses
+            )
+        )
+
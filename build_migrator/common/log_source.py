@@ -0,0 +1,175 @@
+import bz2
+import gzip
+import itertools
+import mmap
+import os
+
+try:
+    import lzma
+except ImportError:
+    # Python 2
+    lzma = None
+
+
+# Build log readers. Each of them yields lines of text without line endings.
+# Logs are read and decoded in chunks (UTF-8, invalid characters are replaced),
+# so memory usage doesn't depend on log size. '\r\n', '\n' and '\r' are
+# recognized as line endings, same as in io.open(newline=None).
+#
+# Usage:
+#   with open_log_source(path) as lines:
+#       for line in lines:
+#           ...
+class LogSource(object):
+    encoding = "utf-8"
+    chunk_size = 64 * 1024
+
+    def __init__(self, path):
+        self.path = path
+
+    # Returns True if the file at path can be read by this class.
+    # header contains the first bytes of the file.
+    @classmethod
+    def matches(cls, path, header):
+        return False
+
+    # Yields file contents in chunks of arbitrary size
+    def _iter_chunks(self):
+        raise NotImplementedError()
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._iter_line_lists())
+
+    def _iter_line_lists(self):
+        tail = b""
+        for chunk in self._iter_chunks():
+            # split on the last '\n': UTF-8 characters and '\r\n' are never
+            # split between chunks
+            end = chunk.rfind(b"\n") + 1
+            if end == 0:
+                tail += chunk
+                continue
+            yield self._split_lines(tail + chunk[:end])
+            tail = chunk[end:]
+        if tail:
+            yield self._split_lines(tail)
+
+    def _split_lines(self, data):
+        text = data.decode(self.encoding, "replace")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        lines = text.split("\n")
+        if not lines[-1]:
+            lines.pop()
+        return lines
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class MappedFileLogSource(LogSource):
+    """Uncompressed log, memory-mapped to avoid copying it through buffers."""
+
+    def __init__(self, path):
+        LogSource.__init__(self, path)
+        self._file = open(path, "rb")
+        self._mmap = None
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def matches(cls, path, header):
+        return True
+
+    def _iter_chunks(self):
+        if self._mmap is None:
+            return
+        size = len(self._mmap)
+        for offset in range(0, size, self.chunk_size):
+            yield self._mmap[offset: offset + self.chunk_size]
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _CompressedLogSource(LogSource):
+    """Compressed log, decompressed on the fly."""
+
+    extensions = ()
+    magic = None
+
+    def __init__(self, path):
+        LogSource.__init__(self, path)
+        self._file = self._open(path)
+
+    @classmethod
+    def matches(cls, path, header):
+        if os.path.splitext(path)[1].lower() in cls.extensions:
+            return True
+        return header.startswith(cls.magic)
+
+    @staticmethod
+    def _open(path):
+        raise NotImplementedError()
+
+    def _iter_chunks(self):
+        return iter(lambda: self._file.read(self.chunk_size), b"")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class GzipLogSource(_CompressedLogSource):
+    extensions = (".gz",)
+    magic = b"\x1f\x8b"
+
+    @staticmethod
+    def _open(path):
+        return gzip.GzipFile(path, "rb")
+
+
+class Bz2LogSource(_CompressedLogSource):
+    extensions = (".bz2",)
+    magic = b"BZh"
+
+    @staticmethod
+    def _open(path):
+        return bz2.BZ2File(path, "rb")
+
+
+class XzLogSource(_CompressedLogSource):
+    extensions = (".xz", ".lzma")
+    magic = b"\xfd7zXZ\x00"
+
+    @staticmethod
+    def _open(path):
+        if lzma is None:
+            raise ValueError("lzma module is not available: %s" % path)
+        return lzma.LZMAFile(path, "rb")
+
+
+# Checked in order, the first matching class is used.
+# Append custom LogSource subclasses here to support other formats.
+log_source_types = [GzipLogSource, Bz2LogSource, XzLogSource, MappedFileLogSource]
+
+
+def open_log_source(path):
+    with open(path, "rb") as f:
+        header = f.read(16)
+    for log_source_type in log_source_types:
+        if log_source_type.matches(path, header):
+            return log_source_type(path)
+    raise ValueError("Unsupported log format: %s" % path)
@@ -0,0 +1,50 @@
+import json
+from pprint import pformat
+
+
+# Message argument that is formatted only if the message is actually emitted:
+#   logger.debug("Target: %s", LazyFormat(pformat, target))
+# Use it instead of formatting messages eagerly on hot paths,
+# where most messages are discarded by log level.
+class LazyFormat(object):
+    __slots__ = ("func", "args")
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return str(self.func(*self.args))
+
+    __repr__ = __str__
+
+
+def lazy_pformat(obj):
+    return LazyFormat(pformat, obj)
+
+
+# Writes compact structured trace of build log parsing, one JSON object per line:
+#   {"event":"log","log":"build.log","type":"make"}
+#   {"event":"target","line":12,"output":"@build_dir@/a.o","type":"module",...}
+class TraceWriter(object):
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "w")
+
+    def write(self, event, **fields):
+        fields["event"] = event
+        self._file.write(
+            json.dumps(fields, sort_keys=True, separators=(",", ":")) + "\n"
+        )
+
+    def write_raw(self, data):
+        """Appends events written by another TraceWriter"""
+        self._file.write(data)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
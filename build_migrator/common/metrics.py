@@ -0,0 +1,146 @@
+import collections
+import contextlib
+import json
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+timer = getattr(time, "perf_counter", time.time)
+
+
+def get_peak_rss():
+    """Returns peak resident set size of current process in bytes,
+    or None if it's not available on current platform."""
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak_rss
+    # kilobytes on Linux
+    return peak_rss * 1024
+
+
+class ModuleMetrics(object):
+    __slots__ = ("calls", "time", "targets_in", "targets_out")
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.targets_in = 0
+        self.targets_out = 0
+
+    def add(self, elapsed, targets_in, targets_out):
+        self.calls += 1
+        self.time += elapsed
+        self.targets_in += targets_in
+        self.targets_out += targets_out
+
+    def merge(self, other):
+        self.calls += other.calls
+        self.time += other.time
+        self.targets_in += other.targets_in
+        self.targets_out += other.targets_out
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "time": self.time,
+            "targets_in": self.targets_in,
+            "targets_out": self.targets_out,
+        }
+
+
+# Collects wall time, call counts and number of processed targets
+# for stages (parse, optimize, generate) and for modules inside them,
+# as well as peak RSS and cache hit rates.
+# Enabled by BuildMigrator.enable_metrics() or --metrics_out.
+class Metrics(object):
+    def __init__(self):
+        self.stages = collections.OrderedDict()  # stage => dict
+        self.modules = collections.OrderedDict()  # stage => {name => ModuleMetrics}
+        self.caches = collections.OrderedDict()  # name => {"hits": N, "misses": N}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Measures wall time of the stage. Yields dictionary
+        for additional values (e.g., number of resulting targets)."""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = {"calls": 0, "time": 0.0}
+        start = timer()
+        try:
+            yield stage
+        finally:
+            stage["calls"] += 1
+            stage["time"] += timer() - start
+            stage["peak_rss"] = get_peak_rss()
+
+    def module(self, stage, name):
+        modules = self.modules.get(stage)
+        if modules is None:
+            modules = self.modules[stage] = collections.OrderedDict()
+        module = modules.get(name)
+        if module is None:
+            module = modules[name] = ModuleMetrics()
+        return module
+
+    def add_cache_stats(self, name, hits, misses):
+        cache = self.caches.get(name)
+        if cache is None:
+            cache = self.caches[name] = {"hits": 0, "misses": 0}
+        cache["hits"] += hits
+        cache["misses"] += misses
+
+    def merge(self, other):
+        """Adds module and cache metrics collected by another Metrics object,
+        e.g. in a subprocess"""
+        for stage, modules in other.modules.items():
+            for name, module in modules.items():
+                self.module(stage, name).merge(module)
+        for name, cache in other.caches.items():
+            self.add_cache_stats(name, cache["hits"], cache["misses"])
+
+    def to_dict(self):
+        caches = collections.OrderedDict()
+        for name, cache in self.caches.items():
+            lookups = cache["hits"] + cache["misses"]
+            caches[name] = dict(
+                cache, hit_rate=float(cache["hits"]) / lookups if lookups else None
+            )
+        modules = collections.OrderedDict()
+        for stage, stage_modules in self.modules.items():
+            modules[stage] = collections.OrderedDict(
+                (name, m.to_dict()) for name, m in stage_modules.items()
+            )
+        return {"stages": self.stages, "modules": modules, "caches": caches}
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def count_targets(result):
+    """Number of targets passed to or returned by a module. Generators return
+    True if the target was handled."""
+    if result is None or result is False:
+        return 0
+    if isinstance(result, list):
+        return len(result)
+    return 1
+
+
+def call_measured(metrics, stage, name, func, targets):
+    """Calls func(targets), recording its wall time and number of targets
+    in and out under metrics.modules[stage][name]."""
+    targets_in = count_targets(targets)
+    start = timer()
+    result = func(targets)
+    metrics.module(stage, name).add(
+        timer() - start, targets_in, count_targets(result)
+    )
+    return result
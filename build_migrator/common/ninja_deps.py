@@ -0,0 +1,99 @@
+import mmap
+import os
+import struct
+
+
+# Reader for .ninja_deps, the binary log where Ninja stores implicit
+# dependencies of build outputs (deps = gcc | msvc).
+# See src/deps_log.cc in Ninja sources.
+#
+# File format (little-endian):
+#   "# ninjadeps\n"
+#   int32 version (3 or 4)
+#   records:
+#     uint32 size; if the highest bit is set, it's a deps record
+#     path record: path, zero-padded to multiple of 4 bytes, uint32 checksum (~id)
+#                  path id is the index of the record among path records
+#     deps record: int32 output id, mtime (int32 in v3, int64 in v4), int32 input ids
+#
+# Later deps records for the same output replace earlier ones.
+class NinjaDeps(object):
+    signature = b"# ninjadeps\n"
+    supported_versions = (3, 4)
+
+    def __init__(self, path):
+        self.path = path
+        self.directory = os.path.dirname(os.path.abspath(path))
+        self._index = {}  # normalized output path => [dependencies]
+        self._load()
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < len(self.signature) + 4:
+                raise ValueError("Invalid .ninja_deps file: %r" % self.path)
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self._parse(data, size)
+            finally:
+                data.close()
+
+    def _parse(self, data, size):
+        if data[: len(self.signature)] != self.signature:
+            raise ValueError("Invalid .ninja_deps signature: %r" % self.path)
+        offset = len(self.signature)
+        (version,) = struct.unpack_from("<i", data, offset)
+        if version not in self.supported_versions:
+            raise ValueError(
+                "Unsupported .ninja_deps version %r: %r" % (version, self.path)
+            )
+        offset += 4
+        deps_header_size = 12 if version >= 4 else 8
+
+        paths = []
+        deps = {}  # output id => [input ids]
+        while offset + 4 <= size:
+            (record_size,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            is_deps_record = record_size & 0x80000000
+            record_size &= 0x7FFFFFFF
+            if offset + record_size > size:
+                # truncated record, Ninja ignores it too
+                break
+            if is_deps_record:
+                (output_id,) = struct.unpack_from("<i", data, offset)
+                count = (record_size - deps_header_size) // 4
+                deps[output_id] = struct.unpack_from(
+                    "<%di" % count, data, offset + deps_header_size
+                )
+            else:
+                (checksum,) = struct.unpack_from(
+                    "<I", data, offset + record_size - 4
+                )
+                if checksum != ~len(paths) & 0xFFFFFFFF:
+                    # corrupted record, Ninja ignores the rest of the file
+                    break
+                path = data[offset: offset + record_size - 4].rstrip(b"\0")
+                if type(path) is not str:
+                    path = path.decode("utf-8", "replace")
+                paths.append(path)
+            offset += record_size
+
+        for output_id, input_ids in deps.items():
+            try:
+                self._index[self._normalize(paths[output_id])] = [
+                    paths[i] for i in input_ids
+                ]
+            except IndexError:
+                pass
+
+    def _normalize(self, path):
+        return os.path.normpath(os.path.join(self.directory, path))
+
+    def get(self, output):
+        """Returns dependencies recorded for output, or None.
+        Relative paths are relative to the directory of .ninja_deps file."""
+        return self._index.get(self._normalize(output))
+
+    def __len__(self):
+        return len(self._index)
@@ -0,0 +1,400 @@
+from itertools import compress, repeat
+import operator
+
+try:
+    # Python 3
+    from collections.abc import MutableMapping
+except ImportError:
+    # Python 2
+    from collections import MutableMapping
+
+
+_missing = object()
+
+
+# Compact Build Object Model records.
+#
+# Targets and source file references are created in large numbers
+# (one per compiled source), and a dictionary keeps its own hash table
+# in every instance. Records keep well-known keys of each target type
+# in __slots__, other keys (e.g., language-specific flags) are kept
+# in a small dictionary that is created on first use.
+#
+# Records behave like dictionaries: target["key"], get(), pop(), "in",
+# iteration, items(), equality with dictionaries, copy and pickle.
+# A key is missing until it's assigned, as in dictionaries: its slot
+# holds _missing, so values of all slots are read at once by _getter.
+# Iteration order is the order of fields, then the order of other keys.
+# Use isinstance(value, mapping_types) instead of checking for dict.
+#
+# Records trade time for memory: item access is implemented in Python,
+# so it's about 4 times slower than dictionary lookup, and synthetic
+# benchmarks (tests/benchmark.py) take 5-10% longer than with dictionaries.
+# items(), comparison and copy read all slots at once to keep the gap small.
+class Record(object):
+    __slots__ = ("_extra",)
+    fields = ()
+    _field_set = frozenset()
+
+    # unhashable, like dict
+    __hash__ = None
+
+    def __init__(self, *args, **kwargs):
+        for key in self.fields:
+            setattr(self, key, _missing)
+        self._extra = None
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def get_state(self):
+        """Returns (tuple of values of fields, dictionary of other keys
+        or None). Values of missing keys are Ellipsis, which isn't used
+        in Build Object Model. See from_state()."""
+        values = self._getter(self)
+        if _missing in values:
+            values = tuple([Ellipsis if v is _missing else v for v in values])
+        return values, self._extra
+
+    @classmethod
+    def from_state(cls, values, extra):
+        """Returns record with state returned by get_state()"""
+        record = cls.__new__(cls)
+        for key, value in zip(cls.fields, values):
+            setattr(record, key, _missing if value is Ellipsis else value)
+        record._extra = extra
+        return record
+
+    @classmethod
+    def from_dict(cls, d):
+        """Returns record with items of dictionary d, faster than cls(d)"""
+        record = cls.__new__(cls)
+        get = d.get
+        missing = 0
+        for key in cls.fields:
+            value = get(key, _missing)
+            if value is _missing:
+                missing += 1
+            setattr(record, key, value)
+        record._extra = None
+        if len(d) > len(cls.fields) - missing:
+            field_set = cls._field_set
+            record._extra = dict([(k, v) for k, v in d.items() if k not in field_set])
+        return record
+
+    @staticmethod
+    def _getter(record):
+        """Returns values of slots of fields, in order of fields"""
+        return ()
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            value = getattr(self, key)
+            if value is _missing:
+                raise KeyError(key)
+            return value
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self._field_set:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._field_set:
+            if getattr(self, key) is _missing:
+                raise KeyError(key)
+            setattr(self, key, _missing)
+        else:
+            if self._extra is None:
+                raise KeyError(key)
+            del self._extra[key]
+            if not self._extra:
+                self._extra = None
+
+    def __contains__(self, key):
+        if key in self._field_set:
+            return getattr(self, key) is not _missing
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        count = len(self.fields) - self._getter(self).count(_missing)
+        if self._extra is not None:
+            count += len(self._extra)
+        return count
+
+    def get(self, key, default=None):
+        if key in self._field_set:
+            value = getattr(self, key)
+            if value is _missing:
+                return default
+            return value
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def pop(self, key, default=_missing):
+        try:
+            value = self[key]
+        except KeyError:
+            if default is _missing:
+                raise
+            return default
+        del self[key]
+        return value
+
+    def setdefault(self, key, default=None):
+        value = self.get(key, _missing)
+        if value is _missing:
+            self[key] = value = default
+        return value
+
+    def update(self, *args, **kwargs):
+        if args:
+            other = args[0]
+            if hasattr(other, "keys"):
+                for key in other.keys():
+                    self[key] = other[key]
+            else:
+                for key, value in other:
+                    self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    @staticmethod
+    def _select(data, values):
+        """Returns items of data that correspond to values that aren't missing"""
+        return list(
+            compress(data, map(operator.is_not, values, repeat(_missing, len(values))))
+        )
+
+    def keys(self):
+        values = self._getter(self)
+        keys = self._select(self.fields, values)
+        if self._extra is not None:
+            keys.extend(self._extra)
+        return keys
+
+    def values(self):
+        values = self._getter(self)
+        values = self._select(values, values)
+        if self._extra is not None:
+            values.extend(self._extra.values())
+        return values
+
+    def items(self):
+        values = self._getter(self)
+        items = self._select(zip(self.fields, values), values)
+        if self._extra is not None:
+            items.extend(self._extra.items())
+        return items
+
+    def clear(self):
+        for key in self.fields:
+            setattr(self, key, _missing)
+        self._extra = None
+
+    def copy(self):
+        """Shallow copy, like dict.copy()"""
+        record = self.__class__.__new__(self.__class__)
+        for key, value in zip(self.fields, self._getter(self)):
+            setattr(record, key, value)
+        record._extra = None if self._extra is None else dict(self._extra)
+        return record
+
+    __copy__ = copy
+
+    def __reduce__(self):
+        return self.__class__, (), None, None, iter(self.items())
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            # values of slots are compared at once, missing ones are equal
+            return self._getter(self) == other._getter(other) and (
+                (self._extra or {}) == (other._extra or {})
+            )
+        if isinstance(other, dict):
+            return len(self) == len(other) and dict(self.items()) == other
+        if isinstance(other, Record):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def to_dict(self):
+        """Returns dictionary, nested records are converted too (see to_dict())"""
+        return to_dict(self)
+
+
+MutableMapping.register(Record)
+
+# Use instead of dict in isinstance() checks of targets and sources
+mapping_types = (dict, Record)
+
+
+# Subclasses list their keys in __slots__ and fields (in iteration order)
+class ModuleRecord(Record):
+    __slots__ = fields = (
+        "type",
+        "module_type",
+        "output",
+        "msvc_import_lib",
+        "compile_flags",
+        "include_dirs",
+        "link_flags",
+        "libs",
+        "name",
+        "objects",
+        "sources",
+        "version",
+        "compatibility_version",
+        "dependencies",
+        "post_build_commands",
+    )
+    _field_set = frozenset(fields)
+    _getter = operator.attrgetter(*fields)
+
+
+# Module with module_type "interface": the same keys, distinct type
+class InterfaceRecord(ModuleRecord):
+    __slots__ = ()
+
+
+class ModuleCopyRecord(Record):
+    __slots__ = fields = ("name", "type", "output", "source", "dependencies")
+    _field_set = frozenset(fields)
+    _getter = operator.attrgetter(*fields)
+
+
+class ClassRecord(Record):
+    __slots__ = fields = ("name", "type", "properties", "conditions", "dependencies")
+    _field_set = frozenset(fields)
+    _getter = operator.attrgetter(*fields)
+
+
+class FileRecord(Record):
+    __slots__ = fields = (
+        "type",
+        "content",
+        "content_hash",
+        "size",
+        "output",
+        "dependencies",
+    )
+    _field_set = frozenset(fields)
+    _getter = operator.attrgetter(*fields)
+
+
+class DirectoryRecord(Record):
+    __slots__ = fields = ("type", "output", "dependencies")
+    _field_set = frozenset(fields)
+    _getter = operator.attrgetter(*fields)
+
+
+class CopyRecord(Record):
+    __slots__ = fields = ("type", "name", "source", "output", "dependencies")
+    _field_set = frozenset(fields)
+    _getter = operator.attrgetter(*fields)
+
+
+class VariableRecord(Record):
+    __slots__ = fields = (
+        "type",
+        "name",
+        "placeholder",
+        "value",
+        "output",
+        "dependencies",
+    )
+    _field_set = frozenset(fields)
+    _getter = operator.attrgetter(*fields)
+
+
+class CommandRecord(Record):
+    __slots__ = fields = (
+        "name",
+        "type",
+        "program",
+        "args",
+        "working_dir",
+        "dependencies",
+        "output",
+        "msvc_import_lib",
+    )
+    _field_set = frozenset(fields)
+    _getter = operator.attrgetter(*fields)
+
+
+class SourceRecord(Record):
+    __slots__ = fields = (
+        "path",
+        "language",
+        "compile_flags",
+        "include_dirs",
+        "dependencies",
+    )
+    _field_set = frozenset(fields)
+    _getter = operator.attrgetter(*fields)
+
+
+_record_classes = {
+    "module": ModuleRecord,
+    "module_copy": ModuleCopyRecord,
+    "class": ClassRecord,
+    "file": FileRecord,
+    "directory": DirectoryRecord,
+    "copy": CopyRecord,
+    "variable": VariableRecord,
+    "cmd": CommandRecord,
+}
+
+
+def get_record_class(target):
+    """Returns Record subclass for target dictionary, or None
+    if target type is unknown"""
+    target_type = target.get("type")
+    if target_type == "module" and target.get("module_type") == "interface":
+        return InterfaceRecord
+    return _record_classes.get(target_type)
+
+
+def to_record(target):
+    """Converts target dictionary (e.g., loaded from .bom file) and its
+    source file references to records. Records and targets
+    of unknown types are returned as is."""
+    if type(target) is not dict:
+        return target
+    cls = get_record_class(target)
+    if cls is None:
+        return target
+    record = cls.from_dict(target)
+    sources = record.get("sources")
+    if sources:
+        record["sources"] = [
+            SourceRecord.from_dict(s) if type(s) is dict else s for s in sources
+        ]
+    return record
+
+
+def to_dict(value):
+    """Converts records and dictionaries to dictionaries recursively,
+    lists are copied. E.g., for pprint, which only formats dict instances."""
+    if isinstance(value, mapping_types):
+        return dict([(key, to_dict(item)) for key, item in value.items()])
+    if isinstance(value, list):
+        return [to_dict(item) for item in value]
+    return value
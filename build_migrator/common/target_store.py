@@ -0,0 +1,101 @@
+import collections
+
+
+# Insertion-ordered collection of Build Object Model targets,
+# indexed by output (including MSVC import libraries) and by name.
+# Adding, removing, renaming and changing output of a target
+# take O(1) time, iteration order is the order of addition.
+#
+# Indexes are updated only by methods of this class: use set_output()
+# and set_name() to modify targets that are already added.
+class TargetStore(object):
+    def __init__(self, targets=None):
+        self._targets = collections.OrderedDict()  # id(target) => target
+        self.index = {}  # output => target
+        self._names = {}  # name => OrderedDict(id(target) => target)
+        for target in targets or []:
+            self.add(target)
+
+    def __len__(self):
+        return len(self._targets)
+
+    def __iter__(self):
+        return iter(self._targets.values())
+
+    def __contains__(self, target):
+        return id(target) in self._targets
+
+    @staticmethod
+    def _get_outputs(target):
+        outputs = []
+        if "output" in target:
+            outputs.append(target["output"])
+        outputs.extend(target.get("msvc_import_lib") or [])
+        return outputs
+
+    def _add_name(self, target):
+        name = target.get("name")
+        if name is not None:
+            if name not in self._names:
+                self._names[name] = collections.OrderedDict()
+            self._names[name][id(target)] = target
+
+    def _remove_name(self, target):
+        name = target.get("name")
+        if name is not None:
+            targets = self._names[name]
+            del targets[id(target)]
+            if not targets:
+                del self._names[name]
+
+    def add(self, target):
+        key = id(target)
+        if key in self._targets:
+            raise ValueError("Target is already added: %s" % target.get("output"))
+        self._targets[key] = target
+        for output in self._get_outputs(target):
+            self.index[output] = target
+        self._add_name(target)
+
+    def remove(self, target):
+        del self._targets[id(target)]
+        for output in self._get_outputs(target):
+            if self.index.get(output) is target:
+                del self.index[output]
+        self._remove_name(target)
+
+    # list-compatible alias
+    append = add
+
+    def find(self, output):
+        return self.index.get(output)
+
+    def find_by_name(self, name):
+        """Returns list of targets with the given name, in order of addition"""
+        targets = self._names.get(name)
+        if targets is None:
+            return []
+        return list(targets.values())
+
+    def set_output(self, target, output):
+        if id(target) in self._targets:
+            if self.index.get(target["output"]) is target:
+                del self.index[target["output"]]
+            self.index[output] = target
+        target["output"] = output
+
+    def set_name(self, target, name):
+        if id(target) not in self._targets:
+            target["name"] = name
+            return
+        self._remove_name(target)
+        target["name"] = name
+        self._add_name(target)
+
+    def get_duplicate_names(self):
+        """Returns groups of targets that share the same name"""
+        return [
+            list(targets.values())
+            for targets in self._names.values()
+            if len(targets) > 1
+        ]
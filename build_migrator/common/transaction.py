@@ -0,0 +1,54 @@
+_missing = object()
+
+
+class Transaction(object):
+    """
+    Records edits of targets, source file references and other mappings,
+    so they can be undone if an error occurs before the edits are complete.
+
+    Values are replaced via set(), never modified in place: the journal
+    (undo log) keeps the original value of each (object, key) pair edited
+    in the transaction, the objects themselves aren't copied.
+
+    Usage:
+        with Transaction() as transaction:
+            transaction.set(target, "compile_flags", new_flags)
+    Edits are committed when the block completes, or rolled back
+    if an exception is raised.
+    """
+
+    def __init__(self):
+        self._journal = []  # (object, key, original value or _missing)
+        self._edited = set()  # (id(object), key)
+
+    def __len__(self):
+        return len(self._journal)
+
+    def set(self, obj, key, value):
+        edit = (id(obj), key)
+        if edit not in self._edited:
+            self._edited.add(edit)
+            self._journal.append((obj, key, obj.get(key, _missing)))
+        obj[key] = value
+
+    def commit(self):
+        del self._journal[:]
+        self._edited.clear()
+
+    def rollback(self):
+        while self._journal:
+            obj, key, value = self._journal.pop()
+            if value is _missing:
+                obj.pop(key, None)
+            else:
+                obj[key] = value
+        self._edited.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
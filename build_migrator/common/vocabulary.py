@@ -0,0 +1,68 @@
+from build_migrator.common.algorithm import make_hashable
+from build_migrator.common.records import mapping_types
+
+_string_types = (type(b""), type(u""))
+
+
+# Build Object Model-wide vocabulary of flags and paths.
+#
+# Equal strings found in targets (flags, multi-token flags, paths) are
+# replaced with a single shared object, so tens of thousands of sources
+# compiled with the same flags don't keep their own copies.
+# Lists, dictionaries and records are kept as is (they are modified
+# in place by optimizers), only their string items are shared.
+#
+# Values may also be referred to by integer ids: set operations on ids
+# are cheaper than on strings and tuples (see GroupCommonFlagsV2).
+class Vocabulary(object):
+    # Keys that aren't interned: file contents are unique
+    ignored_keys = ("content",)
+
+    def __init__(self):
+        self._strings = {}
+        self._ids = {}  # hashable value => id
+        self.values = []  # id => hashable value (lists are converted to tuples)
+        self.lengths = []  # id => len(value)
+
+    def __len__(self):
+        return len(self.values)
+
+    def intern(self, value):
+        """Returns shared instance of string. Strings inside lists,
+        dictionaries and records are replaced in place,
+        the same container is returned."""
+        if isinstance(value, _string_types):
+            return self._strings.setdefault(value, value)
+        if isinstance(value, list):
+            for idx, item in enumerate(value):
+                value[idx] = self.intern(item)
+        elif isinstance(value, mapping_types):
+            for key, item in value.items():
+                if key not in self.ignored_keys:
+                    value[key] = self.intern(item)
+        return value
+
+    def intern_target(self, target):
+        return self.intern(target)
+
+    def get_id(self, value):
+        if not isinstance(value, _string_types):
+            value = make_hashable(value)
+        id_ = self._ids.get(value)
+        if id_ is None:
+            id_ = self._ids[value] = len(self.values)
+            self.values.append(value)
+            self.lengths.append(len(value))
+        return id_
+
+    def get_value(self, id_):
+        return self.values[id_]
+
+
+def get_vocabulary(build_migrator=None):
+    """Returns vocabulary shared by modules of build_migrator
+    (see BuildMigrator.vocabulary), or a new one."""
+    vocabulary = getattr(build_migrator, "vocabulary", None)
+    if vocabulary is None:
+        vocabulary = Vocabulary()
+    return vocabulary
@@ -1,11 +1,38 @@
+import contextlib
+import gc
 import json
 import logging
 import os
 import pickle
 import pprint
+from build_migrator.common import bom_stream
+from build_migrator.common.blob_store import get_blob_store
+from build_migrator.common.logging_ex import LazyFormat
+from build_migrator.common.metrics import Metrics
+from build_migrator.common.records import to_record
+from build_migrator.common.vocabulary import Vocabulary
+from build_migrator.helpers import filter_top_level_targets
 from build_migrator.modules import ModuleLoader
 
 
+@contextlib.contextmanager
+def _no_metrics():
+    yield {}
+
+
+# Loading creates lots of containers, which trigger cyclic garbage
+# collection over and over again, although none of them is garbage
+@contextlib.contextmanager
+def _gc_disabled():
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
 class BuildMigrator(object):
     """
     BuildMigrator class.
@@ -52,6 +79,41 @@ class BuildMigrator(object):
         if 'out_dir' not in settings:
             settings['out_dir'] = os.path.abspath(os.getcwd())
         self._settings = settings
+        self.metrics = None
+        # Blob stores with contents of file targets, see BlobStore
+        self.blob_dirs = []
+        # Flags and paths shared by targets, see Vocabulary
+        self.vocabulary = Vocabulary()
+
+    def enable_metrics(self):
+        """
+        Start collecting timings and counters of stages and modules
+        (parsers, optimizers, generators), peak RSS and cache hit rates.
+
+        Returns
+        -------
+        build_migrator.common.metrics.Metrics
+        """
+        if self.metrics is None:
+            self.metrics = Metrics()
+        return self.metrics
+
+    def save_metrics(self, path):
+        """
+        Save metrics collected since enable_metrics() call to JSON file
+
+        Parameters
+        ----------
+        path : path-like object
+            Path to output file
+        """
+        self._logger.info("Saving metrics to %s", path)
+        self.metrics.save(path)
+
+    def _measure_stage(self, name):
+        if self.metrics is None:
+            return _no_metrics()
+        return self.metrics.stage(name)
 
     def build(self, **settings):
         """
@@ -69,13 +131,15 @@ class BuildMigrator(object):
         kwargs.update(settings or {})
         if kwargs:
             self._logger.debug(
-                "Building using settings: %s", self._pretty_printer.pformat(settings)
+                "Building using settings: %s",
+                LazyFormat(self._pretty_printer.pformat, settings),
             )
         else:
             self._logger.debug("Building")
 
-        entry_point, builders = self.modules.create_builders(self, **settings)
-        return entry_point.build(builders)
+        with self._measure_stage("build"):
+            entry_point, builders = self.modules.create_builders(self, **settings)
+            return entry_point.build(builders)
 
     def parse(self, build_object_model=None, **settings):
         """
@@ -102,13 +166,17 @@ class BuildMigrator(object):
         kwargs.update(settings or {})
         if kwargs:
             self._logger.debug(
-                "Parsing using settings: %s", self._pretty_printer.pformat(kwargs)
+                "Parsing using settings: %s",
+                LazyFormat(self._pretty_printer.pformat, kwargs),
             )
         else:
             self._logger.debug("Parsing")
 
-        entry_point, parsers = self.modules.create_parsers(self, **kwargs)
-        return entry_point.parse(build_object_model, parsers)
+        with self._measure_stage("parse") as stage:
+            entry_point, parsers = self.modules.create_parsers(self, **kwargs)
+            build_object_model = entry_point.parse(build_object_model, parsers)
+            stage["targets"] = len(build_object_model)
+            return build_object_model
 
     def optimize(self, build_object_model, **settings):
         """
@@ -134,13 +202,17 @@ class BuildMigrator(object):
         kwargs.update(settings or {})
         if kwargs:
             self._logger.debug(
-                "Optimizing using settings: %s", self._pretty_printer.pformat(settings)
+                "Optimizing using settings: %s",
+                LazyFormat(self._pretty_printer.pformat, settings),
             )
         else:
             self._logger.debug("Optimizing")
 
-        entry_point, optimizers = self.modules.create_optimizers(self, **kwargs)
-        return entry_point.optimize(build_object_model, optimizers)
+        with self._measure_stage("optimize") as stage:
+            entry_point, optimizers = self.modules.create_optimizers(self, **kwargs)
+            build_object_model = entry_point.optimize(build_object_model, optimizers)
+            stage["targets"] = len(build_object_model)
+            return build_object_model
 
     def generate(self, build_object_model, **settings):
         """
@@ -162,17 +234,21 @@ class BuildMigrator(object):
         kwargs.update(settings or {})
         if kwargs:
             self._logger.debug(
-                "Generating using settings: %s", self._pretty_printer.pformat(settings)
+                "Generating using settings: %s",
+                LazyFormat(self._pretty_printer.pformat, settings),
             )
         else:
             self._logger.debug("Generating")
 
-        entry_point, generators = self.modules.create_generators(self, **kwargs)
-        entry_point.generate(build_object_model, generators)
+        with self._measure_stage("generate"):
+            entry_point, generators = self.modules.create_generators(self, **kwargs)
+            entry_point.generate(build_object_model, generators)
 
     def save_build_object_model(self, path, build_object_model):
         """
-        Save Build Object Model to file
+        Save Build Object Model to file.
+        Files with .bom extension are written in streaming format
+        (see build_migrator.common.bom_stream), other files are pickled.
 
         Parameters
         ----------
@@ -182,8 +258,18 @@ class BuildMigrator(object):
             Build Object Model
         """
         self._logger.info("Saving Build Object Model to %s", path)
-        with open(path, "wb") as f:
-            pickle.dump(build_object_model, f, protocol=2)
+        if bom_stream.is_bom_stream_path(path):
+            bom_stream.save(path, build_object_model)
+        else:
+            with open(path, "wb") as f:
+                pickle.dump(build_object_model, f, protocol=2)
+        # keep contents of file targets next to the Build Object Model
+        blob_store = None
+        for target in build_object_model:
+            if target.get("content_hash"):
+                if blob_store is None:
+                    blob_store = get_blob_store(os.path.dirname(path), self)
+                blob_store.import_blob(target["content_hash"])
 
     def save_settings(self, path, user_settings=None):
         """
@@ -209,7 +295,9 @@ class BuildMigrator(object):
                 "optimizers",
                 "generators",
                 "build_commands",
-                "commands"
+                "commands",
+                "metrics_out",
+                "load_outputs",
             )
             settings = self._settings.copy()
             settings.update(user_settings)
@@ -218,22 +306,40 @@ class BuildMigrator(object):
                     del settings[attr]
             json.dump(settings, f)
 
-    def load_build_object_model(self, path):
+    def load_build_object_model(self, path, top_level_outputs=None):
         """
         Load Build Object Model from file
 
         Parameters
         ----------
         path : path-like object
-            Path to input file
+            Path to input file (.bom or pickle, see save_build_object_model())
+        top_level_outputs : list of str, optional
+            Load only targets with given outputs and their dependencies
+            (as well as targets without output), see filter_top_level_targets().
+            ValueError is raised if a target isn't found.
 
         Returns
         -------
         Build Object Model
         """
         self._logger.info("Loading Build Object Model from %s", path)
-        with open(path, "rb") as f:
-            return pickle.load(f)
+        blob_dir = os.path.abspath(os.path.join(os.path.dirname(path), "blobs"))
+        if os.path.isdir(blob_dir) and blob_dir not in self.blob_dirs:
+            self.blob_dirs.append(blob_dir)
+        with _gc_disabled():
+            if bom_stream.is_bom_stream_path(path):
+                build_object_model = bom_stream.load(path)
+            else:
+                with open(path, "rb") as f:
+                    build_object_model = pickle.load(f)
+        if top_level_outputs:
+            build_object_model = filter_top_level_targets(
+                build_object_model, top_level_outputs
+            )
+        if bom_stream.is_bom_stream_path(path):
+            build_object_model = [to_record(t) for t in build_object_model]
+        return build_object_model
 
     def load_settings(self, path, user_settings=None):
         """
@@ -1,21 +1,22 @@
 import argparse
 import logging
 import os
-from pprint import pformat
 import re
 import shutil
 import sys
 import traceback
 from build_migrator.generators._bazel.rule_cc import RuleCc
 from build_migrator.generators._bazel.skylib import CopyFile
+from build_migrator.common.blob_store import get_blob_store
+from build_migrator.common.dependency_graph import DependencyGraph
+from build_migrator.common.metrics import call_measured
 from build_migrator.modules import EntryPoint, Generator
 from build_migrator.parsers.build_log_parser import (
     BuildLogParserContext as ParserContext,
 )
 from build_migrator.common.os_ext import get_host_system_name, get_platform
 from build_migrator.helpers import (
-    get_minified_target,
-    get_target_outputs,
+    lazy_format_target,
     ModuleTypes,
 )
 
@@ -67,6 +68,7 @@ class BazelContext(EntryPoint, Generator):
         build_filename=None,
         platform=None,
     ):
+        self.metrics = getattr(build_migrator, "metrics", None)
         if prebuilt_subdir is None:
             prebuilt_subdir = "prebuilt"
         self.prebuilt_subdir = prebuilt_subdir.replace("\\", "/")
@@ -77,6 +79,7 @@ class BazelContext(EntryPoint, Generator):
             build_filename = "BUILD.bazel"
         self.build_filename = build_filename
         self.out_dir = out_dir
+        self.blob_store = get_blob_store(out_dir, build_migrator)
         if platform is None:
             platform = get_host_system_name()
         self.platform_name = platform
@@ -170,7 +173,7 @@ class BazelContext(EntryPoint, Generator):
             self.write_header(targets)
             for target in targets:
                 logger.debug(" > Generate Bazel for target:")
-                logger.debug(pformat(get_minified_target(target)))
+                logger.debug("%s", lazy_format_target(target))
                 success = False
                 builtin_generator = self._builtin_generators.get(target["type"])
                 if builtin_generator:
@@ -180,7 +183,7 @@ class BazelContext(EntryPoint, Generator):
                     for generator in generators:
                         logger.debug(type(generator).__name__)
                         try:
-                            if generator.generate(target):
+                            if self._call_generator(generator, target):
                                 success = True
                                 break
                         except Exception:
@@ -189,6 +192,17 @@ class BazelContext(EntryPoint, Generator):
                     raise ValueError("Generator not found")
             self.file = None
 
+    def _call_generator(self, generator, target):
+        if self.metrics is None:
+            return generator.generate(target)
+        return call_measured(
+            self.metrics,
+            "generate",
+            type(generator).__name__,
+            generator.generate,
+            target,
+        )
+
     def write_header(self, targets):
         # Write something at the beginning of build script
         pass
@@ -223,10 +237,7 @@ class BazelContext(EntryPoint, Generator):
         return targets
 
     def _create_target_index(self, targets):
-        self.target_index = {}
-        for target in targets:
-            for output in get_target_outputs(target):
-                self.target_index[output] = target
+        self.target_index = DependencyGraph(targets)
 
     def _target_is_in_source_dir(self, target):
         return target["output"].startswith(self.source_dir_placeholder)
@@ -249,10 +260,6 @@ class BazelContext(EntryPoint, Generator):
         if subdir is not None:
             location = os.path.join(subdir, location)
 
-        if sys.version_info >= (3, 0) and isinstance(target["content"], str):
-            mode = "wt"
-        else:
-            mode = "wb"
         location = os.path.join(self.out_dir, location)
 
         if self.apply_map_file_workaround and not self.for_windows:
@@ -271,8 +278,16 @@ class BazelContext(EntryPoint, Generator):
         parent_dir = os.path.dirname(location)
         if not os.path.exists(parent_dir):
             os.makedirs(parent_dir)
-        with open(location, mode) as f:
-            f.write(target["content"])
+        if "content" in target:
+            content = target["content"]
+            if sys.version_info >= (3, 0) and isinstance(content, str):
+                mode = "wt"
+            else:
+                mode = "wb"
+            with open(location, mode) as f:
+                f.write(content)
+        else:
+            self.blob_store.copy(target["content_hash"], location)
 
     def _generate_directory(self, target):
         # Do nothing
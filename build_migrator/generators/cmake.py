@@ -6,21 +6,22 @@ from __future__ import absolute_import
 import argparse
 import logging
 import os
-from pprint import pformat
 import re
 import shutil
 import sys
 import traceback
 
 from build_migrator.common.algorithm import flatten_list
+from build_migrator.common.blob_store import get_blob_store
+from build_migrator.common.metrics import call_measured
 from build_migrator.common.os_ext import get_host_system_name, get_platform, Unix
 
 from build_migrator.parsers.build_log_parser import (
     BuildLogParserContext as ParserContext,
 )
 from ..helpers import (
-    get_minified_target,
-    get_minified_targets,
+    lazy_format_target,
+    lazy_format_targets,
     resolve_properties,
     remove_value_from_property,
     ModuleTypes,
@@ -142,7 +143,9 @@ class CMakeContext(EntryPoint, Generator):
         self.platform_name = platform
         self.platform = get_platform(platform)
         self.project_name = cmake_project_name
+        self.metrics = getattr(build_migrator, "metrics", None)
         self.out_dir = out_dir
+        self.blob_store = get_blob_store(out_dir, build_migrator)
         self.project_version = cmake_project_version
         if source_subdir is None:
             source_subdir = "source"
@@ -779,13 +782,23 @@ class CMakeContext(EntryPoint, Generator):
         optimizers = list(filter(lambda g: hasattr(g, "optimize"), generators))
         generators = list(filter(lambda g: hasattr(g, "generate"), generators))
 
+        debug = logger.isEnabledFor(logging.DEBUG)
         for optimizer in optimizers:
             logger.debug(type(optimizer).__name__)
             try:
-                result = optimizer.optimize(targets)
-                if result != targets:
+                if self.metrics is not None:
+                    result = call_measured(
+                        self.metrics,
+                        "generate",
+                        type(optimizer).__name__,
+                        optimizer.optimize,
+                        targets,
+                    )
+                else:
+                    result = optimizer.optimize(targets)
+                if debug and result != targets:
                     logger.debug(" > Modified:")
-                    logger.debug(pformat(get_minified_targets(result)))
+                    logger.debug("%s", lazy_format_targets(result))
                 targets = result
             except Exception:
                 logging.error(traceback.format_exc())
@@ -798,10 +811,10 @@ class CMakeContext(EntryPoint, Generator):
                 # custom BOM attribute for cmake generator
                 # used by CMakeRemoveRedundantDirectoryTargets
                 logger.debug(" > Skipping target due to 'skip' attribute:")
-                logger.debug(pformat(get_minified_target(target)))
+                logger.debug("%s", lazy_format_target(target))
                 continue
             logger.debug(" > Generate CMake for target:")
-            logger.debug(pformat(get_minified_target(target)))
+            logger.debug("%s", lazy_format_target(target))
             success = False
             builtin_generator = self._builtin_generators.get(target["type"])
             if builtin_generator:
@@ -811,7 +824,7 @@ class CMakeContext(EntryPoint, Generator):
                 for generator in generators:
                     logger.debug(type(generator).__name__)
                     try:
-                        if generator.generate(target):
+                        if self._call_generator(generator, target):
                             success = True
                             break
                     except Exception:
@@ -819,6 +832,17 @@ class CMakeContext(EntryPoint, Generator):
             assert success, target
         self.finalize_cmakelists()
 
+    def _call_generator(self, generator, target):
+        if self.metrics is None:
+            return generator.generate(target)
+        return call_measured(
+            self.metrics,
+            "generate",
+            type(generator).__name__,
+            generator.generate,
+            target,
+        )
+
     def _generate_for_directory(self, target):
         if self._target_is_in_source_dir(target):
             return
@@ -842,11 +866,6 @@ endforeach()
 """
 
     def _generate_for_file(self, target):
-        if sys.version_info >= (3, 0) and isinstance(target["content"], str):
-            mode = "wt"
-        else:
-            mode = "wb"
-
         subdir = None
         if self._target_is_in_build_dir(target):
             location = target["output"][len(self.build_dir_placeholder) + 1:]
@@ -863,8 +882,21 @@ endforeach()
         if location[0] == "/":
             location = location[1:]
 
-        with self.open(location, mode) as target_file:
-            target_file.write(target["content"])
+        if "content" in target:
+            content = target["content"]
+            if sys.version_info >= (3, 0) and isinstance(content, str):
+                mode = "wt"
+            else:
+                mode = "wb"
+            with self.open(location, mode) as target_file:
+                target_file.write(content)
+        else:
+            # copy from blob store without loading content into memory
+            full_path = os.path.join(self.out_dir, location)
+            basedir = os.path.dirname(full_path)
+            if not os.path.exists(basedir):
+                os.makedirs(basedir)
+            self.blob_store.copy(target["content_hash"], full_path)
 
         if self._target_is_in_source_dir(target):
             return
@@ -1,6 +1,27 @@
 import argparse
 import copy
 import os
+from pprint import pformat
+
+from build_migrator.common.dependency_graph import (
+    DependencyGraph,
+    iter_target_and_dependencies,
+)
+from build_migrator.common.logging_ex import LazyFormat
+from build_migrator.common.records import (
+    ClassRecord,
+    CommandRecord,
+    CopyRecord,
+    DirectoryRecord,
+    FileRecord,
+    InterfaceRecord,
+    ModuleCopyRecord,
+    ModuleRecord,
+    SourceRecord,
+    VariableRecord,
+    mapping_types,
+    to_dict,
+)
 
 
 class ModuleTypes:
@@ -45,22 +66,22 @@ def get_module_target(
     if msvc_import_lib and not isinstance(msvc_import_lib, list):
         msvc_import_lib = [msvc_import_lib]
 
-    target = {
-        "type": "module",
-        "module_type": module_type,
-        "output": output,
-        "msvc_import_lib": msvc_import_lib,
-        "compile_flags": compile_flags,  # + c_flags, cxx_flags, etc
-        "include_dirs": include_dirs,  # + c_includes, cxx_includes, etc
-        "link_flags": link_flags,
-        "libs": libs,
-        "name": name,
-        "objects": objects,
-        "sources": sources,
-        "version": version,
-        "compatibility_version": compatibility_version,
-        "dependencies": dependencies,
-    }
+    target = ModuleRecord(
+        type="module",
+        module_type=module_type,
+        output=output,
+        msvc_import_lib=msvc_import_lib,
+        compile_flags=compile_flags,  # + c_flags, cxx_flags, etc
+        include_dirs=include_dirs,  # + c_includes, cxx_includes, etc
+        link_flags=link_flags,
+        libs=libs,
+        name=name,
+        objects=objects,
+        sources=sources,
+        version=version,
+        compatibility_version=compatibility_version,
+        dependencies=dependencies,
+    )
     if post_build_commands is not None:
         target["post_build_commands"] = post_build_commands
     return target
@@ -70,25 +91,25 @@ def get_module_copy(name, source, output, dependencies=None):
     if dependencies is None:
         dependencies = []
 
-    return {
-        "name": name,
-        "type": "module_copy",
-        "output": output,
-        "source": source,
-        "dependencies": dependencies,
-    }
+    return ModuleCopyRecord(
+        name=name,
+        type="module_copy",
+        output=output,
+        source=source,
+        dependencies=dependencies,
+    )
 
 
 def get_class_target(name, properties=None, conditions=None):
     if properties is None:
         properties = {}
-    return {
-        "name": name,
-        "type": "class",
-        "properties": properties,
-        "conditions": conditions,
-        "dependencies": [],
-    }
+    return ClassRecord(
+        name=name,
+        type="class",
+        properties=properties,
+        conditions=conditions,
+        dependencies=[],
+    )
 
 
 def get_file_target(content, output, dependencies=None):
@@ -110,7 +131,7 @@ def get_file_target(content, output, dependencies=None):
         file target
     """
 
-    target = {"type": "file", "content": content, "output": output}
+    target = FileRecord(type="file", content=content, output=output)
 
     if dependencies:
         target["dependencies"] = dependencies
@@ -118,12 +139,72 @@ def get_file_target(content, output, dependencies=None):
     return target
 
 
+def get_blob_file_target(content_hash, size, output, dependencies=None):
+    """
+    Get a target that creates a file whose content is kept in a blob store
+
+    Parameters
+    ----------
+    content_hash : str
+        key of file content in blob store
+    size : int
+        file size in bytes
+    output : str
+        copy destination during build
+    dependencies : list of str, optional
+        outputs of target's dependencies, by default None
+
+    Returns
+    -------
+    dict
+        file target
+    """
+
+    target = FileRecord(
+        type="file",
+        content_hash=content_hash,
+        size=size,
+        output=output,
+    )
+
+    if dependencies:
+        target["dependencies"] = dependencies
+
+    return target
+
+
+def get_file_content(target, blob_store=None):
+    """Returns content of file target: either inline "content",
+    or bytes loaded from blob store by "content_hash"."""
+    if "content" in target:
+        return target["content"]
+    if blob_store is None:
+        raise ValueError(
+            "File target %s refers to blob %s, but blob store is not available"
+            % (target["output"], target["content_hash"])
+        )
+    return blob_store.get(target["content_hash"])
+
+
+def set_file_content(target, content, blob_store=None):
+    """Replaces content of file target. Content is stored in blob store
+    if it's available, otherwise it's kept inline."""
+    if blob_store is None:
+        target.pop("content_hash", None)
+        target.pop("size", None)
+        target["content"] = content
+    else:
+        target.pop("content", None)
+        target["content_hash"] = blob_store.put(content)
+        target["size"] = len(content)
+
+
 def get_directory_target(output, dependencies=None):
-    target = {
-        "type": "directory",
-        "output": output,
-        "dependencies": dependencies,
-    }
+    target = DirectoryRecord(
+        type="directory",
+        output=output,
+        dependencies=dependencies,
+    )
 
     return target
 
@@ -131,26 +212,26 @@ def get_directory_target(output, dependencies=None):
 def get_copy_target(name, source, output, dependencies=None, origin=None):
     if dependencies is None:
         dependencies = []
-    return {
-        "type": "copy",
-        "name": name,
-        "source": source,
-        "output": output,
-        "dependencies": dependencies,
-    }
+    return CopyRecord(
+        type="copy",
+        name=name,
+        source=source,
+        output=output,
+        dependencies=dependencies,
+    )
 
 
 def get_variable_target(name, placeholder, value, dependencies=None):
     if dependencies is None:
         dependencies = []
-    return {
-        "type": "variable",
-        "name": name,
-        "placeholder": placeholder,
-        "value": value,
-        "output": placeholder,
-        "dependencies": dependencies,
-    }
+    return VariableRecord(
+        type="variable",
+        name=name,
+        placeholder=placeholder,
+        value=value,
+        output=placeholder,
+        dependencies=dependencies,
+    )
 
 
 def get_command_target(name, program, args, output, dependencies=None):
@@ -161,31 +242,31 @@ def get_command_target(name, program, args, output, dependencies=None):
         output = output[0]
     else:
         extra_outputs = None
-    return {
-        "name": name,
-        "type": "cmd",
-        "program": program,
-        "args": args,
-        "dependencies": dependencies,
-        "output": output,
-        "msvc_import_lib": extra_outputs,
-    }
+    return CommandRecord(
+        name=name,
+        type="cmd",
+        program=program,
+        args=args,
+        dependencies=dependencies,
+        output=output,
+        msvc_import_lib=extra_outputs,
+    )
 
 
 def get_interface_target(name, include_dirs=None, libs=None, dependencies=None):
-    return {
-        "name": name,
-        "type": "module",
-        "module_type": ModuleTypes.interface,
-        "include_dirs": include_dirs or [],
-        "libs": libs or [],
-        "dependencies": dependencies or [],
-        "output": name,
-        "sources": [],
-        "compile_flags": [],
-        "link_flags": [],
-        "objects": []
-    }
+    return InterfaceRecord(
+        name=name,
+        type="module",
+        module_type=ModuleTypes.interface,
+        include_dirs=include_dirs or [],
+        libs=libs or [],
+        dependencies=dependencies or [],
+        output=name,
+        sources=[],
+        compile_flags=[],
+        link_flags=[],
+        objects=[]
+    )
 
 
 def get_source_file_reference(
@@ -196,26 +277,27 @@ def get_source_file_reference(
     if include_dirs is None:
         include_dirs = []
 
-    return {
-        "path": path,
-        "language": language,
-        "compile_flags": compile_flags,
-        "include_dirs": include_dirs,
-        "dependencies": dependencies,
-    }
+    return SourceRecord(
+        path=path,
+        language=language,
+        compile_flags=compile_flags,
+        include_dirs=include_dirs,
+        dependencies=dependencies,
+    )
 
 
 def minify_target(target):
     if "content" in target:
         target["content"] = "..."
     for t in target.get("dependencies") or []:
-        if isinstance(t, dict):
+        if isinstance(t, mapping_types):
             minify_target(t)
     return target
 
 
 def get_minified_target(target):
-    target = copy.deepcopy(target)
+    # copy as dictionaries: records are formatted in one line by pprint
+    target = to_dict(target)
     minify_target(target)
     return target
 
@@ -224,6 +306,23 @@ def get_minified_targets(targets):
     return list(map(get_minified_target, targets))
 
 
+def _format_minified_targets(targets):
+    return pformat(get_minified_targets(targets))
+
+
+def _format_minified_target(target):
+    return pformat(get_minified_target(target))
+
+
+# For logging: target is copied and formatted only if message is emitted
+def lazy_format_target(target):
+    return LazyFormat(_format_minified_target, target)
+
+
+def lazy_format_targets(targets):
+    return LazyFormat(_format_minified_targets, targets)
+
+
 class ArgumentParserNoExit(argparse.ArgumentParser):
     """ArgumentParser subclass that does not call exit() on error()
     """
@@ -427,15 +526,7 @@ def format_flag_gnu(lst):
 
 
 def get_target_and_dependencies(target, index, skip_set=set()):
-    if target["output"] not in skip_set:
-        skip_set.add(target["output"])
-        for dep in target.get("dependencies") or []:
-            if dep in index:
-                for dep_target in get_target_and_dependencies(
-                    index[dep], index, skip_set
-                ):
-                    yield dep_target
-        yield target
+    return iter_target_and_dependencies(target, index, skip_set)
 
 
 def filter_top_level_targets(
@@ -449,18 +540,13 @@ def filter_top_level_targets(
 
     result = []
     if index is None:
-        index = {}
-        for t in targets:
-            output = t.get("output")
-            if output is not None:
-                index[output] = t
-            extra_outputs = t.get("msvc_import_lib") or []
-            for o in extra_outputs:
-                index[o] = t
+        index = DependencyGraph(targets)
 
     skip_set = set()
     deps = []
     for o in top_level_output:
+        if o not in index:
+            raise ValueError("Target not found in Build Object Model: %r" % o)
         deps.extend(
             [
                 t["output"]
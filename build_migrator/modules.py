@@ -149,6 +149,10 @@ class Parser(object):
     - priority : int
         optional, default value: maxint
         Parsers are ordered by this attribute
+    - target_keys : tuple of str
+        optional, default value: None
+        Parser is called only for targets that have non-empty value
+        for at least one of these keys (e.g., ("tokens",))
 
     Methods
     -------
@@ -167,6 +171,16 @@ class Parser(object):
         Returns:
             If Parser is not applicable: same target
             Otherwise: new target, or list of targets
+    - get_state(self), set_state(self, state)
+        optional
+        Parsers that keep state between commands (e.g., variable assignments
+        that apply to the next command) return it from get_state(),
+        or None if there's no state. set_state() restores the returned value.
+        Used when single build log is parsed in shards (see --parse_jobs).
+    - close(self)
+        optional
+        Releases resources (e.g., worker threads) when parsing is finished.
+        Called in each process that parsed build logs (see --parse_jobs).
     """
 
     pass
@@ -1,3 +1,4 @@
+from build_migrator.helpers import get_file_content, set_file_content
 from build_migrator.modules import Optimizer
 from build_migrator.common.encoding_detection import (
     read_lines_from_binary,
@@ -49,9 +50,10 @@ class FileTargetChangeEncoding(Optimizer):
                     path = file.get("location")
                 if not mask.match(path):
                     continue
-                lines = read_lines_from_binary(file["content"], encoding=src_enc)
+                content = get_file_content(file, self.context.blob_store)
+                lines = read_lines_from_binary(content, encoding=src_enc)
                 data = convert_lines_to_binary(lines, encoding=dest_enc)
-                file["content"] = data
+                set_file_content(file, data, self.context.blob_store)
 
         return targets
 
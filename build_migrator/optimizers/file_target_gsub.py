@@ -1,4 +1,5 @@
 import re
+from build_migrator.helpers import get_file_content, set_file_content
 from build_migrator.modules import Optimizer
 from build_migrator.common.encoding_detection import (
     detect_encoding_by_bom,
@@ -54,14 +55,15 @@ class FileTargetGsub(Optimizer):
                 if not mask.match(path):
                     continue
 
-                encoding = detect_encoding_by_bom(data=file["content"])[0]
+                content = get_file_content(file, self.context.blob_store)
+                encoding = detect_encoding_by_bom(data=content)[0]
                 lines = []
-                for line in read_lines_from_binary(file["content"], encoding=encoding):
+                for line in read_lines_from_binary(content, encoding=encoding):
                     line = regex.sub(repl, line)
                     lines.append(line)
 
                 data = convert_lines_to_binary(lines, encoding=encoding)
-                file["content"] = data
+                set_file_content(file, data, self.context.blob_store)
 
         return targets
 
@@ -1,5 +1,4 @@
-from copy import deepcopy
-from itertools import chain
+import operator
 from build_migrator.helpers import (
     get_class_target,
     get_source_with_inherited_flags,
@@ -8,11 +7,13 @@ from build_migrator.helpers import (
 from build_migrator.modules import Optimizer
 from build_migrator.common.algorithm import (
     add_unique_stable,
-    find_best_common_set,
+    common_set_finder_engines,
+    get_common_set_finder,
     intersect_unique_stable,
-    FitnessByTotalStringLength,
-    make_hashable,
 )
+from build_migrator.common.dependency_graph import DependencyGraph
+from build_migrator.common.transaction import Transaction
+from build_migrator.common.vocabulary import get_vocabulary
 from build_migrator.parsers.build_log_parser import (
     BuildLogParserContext as ParserContext,
 )
@@ -57,6 +58,12 @@ class GroupCommonFlagsV2(Optimizer):
             help="Move common flags and options to global scope "
             "if amount of targets is greater than given value",
         )
+        arg_parser.add_argument(
+            "--common_set_engine",
+            choices=common_set_finder_engines,
+            help="Algorithm that finds common flags for variables in aggressive "
+            "optimization mode. Results are the same. Default: incremental.",
+        )
     
     @staticmethod
     def _is_predefined_variable(flag):
@@ -72,6 +79,7 @@ class GroupCommonFlagsV2(Optimizer):
         flag_optimizer_ver=None,
         aggressive_optimization=None,
         class_optimization_threshold=None,
+        common_set_engine=None,
         generators=None,
     ):
         if generators is None:
@@ -83,24 +91,33 @@ class GroupCommonFlagsV2(Optimizer):
         if self.is_disabled:
             return
         self.platform = context.platform_name
+        self.vocabulary = getattr(context, "vocabulary", None) or get_vocabulary()
         self.aggressive_optimization = aggressive_optimization
         self.class_optimization_threshold = class_optimization_threshold
+        self.common_set_engine = common_set_engine
 
     @staticmethod
-    def _remove_property_values(targets, property, values):
+    def _remove_property_values(transaction, targets, property, values):
         for t in targets:
             if t.get("type") == "class":
                 t = t["properties"]
             if property not in t:
                 continue
+            new_values = list(t[property])
             for v in values:
-                while v in t[property]:
-                    t[property].remove(v)
-
+                while v in new_values:
+                    new_values.remove(v)
+            if len(new_values) != len(t[property]):
+                transaction.set(t, property, new_values)
+
+    # Edits of target, dependency_target and source_targets are recorded
+    # in transaction. If it's None, they are edited directly (used for
+    # objects created by the optimizer).
     @staticmethod
     def _move_common_flags_to_target(
+        transaction,
         target,
-        target_dependencies,
+        dependency_target,
         source_targets,
         property,
         target_property=None,
@@ -108,6 +125,7 @@ class GroupCommonFlagsV2(Optimizer):
         source_filter=None,
         threshold=None,
     ):
+        set_value = operator.setitem if transaction is None else transaction.set
         if threshold is None:
             threshold = 2
         if target_property is None:
@@ -124,6 +142,7 @@ class GroupCommonFlagsV2(Optimizer):
         if common_flags is None:
             return None
 
+        dependencies = []
         for flag in common_flags:
             if not isinstance(flag, list):
                 # Sometimes flag may be list of subflag,
@@ -134,15 +153,27 @@ class GroupCommonFlagsV2(Optimizer):
                         continue
                     if subflag.startswith("@"):
                         variable_name = subflag[:subflag.find("@", 1) + 1]
-                        target_dependencies.append(variable_name)
+                        dependencies.append(variable_name)
+        if dependencies:
+            set_value(
+                dependency_target,
+                "dependencies",
+                dependency_target["dependencies"] + dependencies,
+            )
 
-        if target_property not in target:
-            target[target_property] = []
         if flag_filter:
             common_flags = [f for f in common_flags if flag_filter(f)]
-        add_unique_stable(target[target_property], *common_flags)
+        if target_property not in target:
+            set_value(target, target_property, [])
+        if not common_flags:
+            return common_flags
+        values = list(target[target_property])
+        add_unique_stable(values, *common_flags)
+        set_value(target, target_property, values)
         for src in source_targets:
-            src[property] = [f for f in src[property] if f not in common_flags]
+            set_value(
+                src, property, [f for f in src[property] if f not in common_flags]
+            )
         return common_flags
 
     class DefaultSourceFilter(object):
@@ -156,19 +187,21 @@ class GroupCommonFlagsV2(Optimizer):
         if self.is_disabled:
             return targets
 
-        module_target_index = {}
+        # Targets and source file references are edited in place.
+        # Edits are recorded and undone if optimization fails,
+        # so the targets are left as they were.
+        with Transaction() as transaction:
+            return self._optimize(transaction, targets)
+
+    def _optimize(self, transaction, targets):
+        graph = DependencyGraph(targets)
         variable_target_index = {}
-        targets = deepcopy(targets)
         linkable_targets = []
         nonstatic_linkable_targets = []
         for t in targets:
             if t["type"] == "variable":
                 variable_target_index[t["output"]] = t
-            if t["type"].startswith("module"):
-                module_target_index[t["output"]] = t
             if t["type"] == "module":
-                for o in t.get("msvc_import_lib") or []:
-                    module_target_index[o] = t
                 if (
                     t["module_type"] == "object_lib"
                     or t["module_type"] == "static_lib"
@@ -177,7 +210,7 @@ class GroupCommonFlagsV2(Optimizer):
                     # Target link flags can be ignored if:
                     # 1. target is an OBJECT library
                     # 2. target is a STATIC library assembled with 'ar'
-                    t["link_flags"] = []
+                    transaction.set(t, "link_flags", [])
                     continue
                 linkable_targets.append(t)
                 if t["module_type"] != "static_lib":
@@ -198,18 +231,12 @@ class GroupCommonFlagsV2(Optimizer):
                         # One source file may compile under multiple targets
                         # with different flags. Distinguish such instances by
                         # a temporary identifier.
-                        s["_id"] = len(compileable_sources)
+                        transaction.set(s, "_id", len(compileable_sources))
                         target_by_source[s["_id"]] = t
                 if not sources_by_target[t["output"]]:
                     # Ignore target compilation flags and include dirs if:
                     # * Target has no compileable sources (only object files, .def files, .manifests etc)
-                    t["compile_flags"] = []
-
-        src_copies_with_target_flags = []
-        for t in compileable_targets:
-            for s in sources_by_target[t["output"]]:
-                s = get_source_with_inherited_flags(t, s)
-                src_copies_with_target_flags.append(s)
+                    transaction.set(t, "compile_flags", [])
 
         # Optimization is achieved by moving common flags to upper scope levels (examples in CMake):
         # * Global compiler flags for all languages: add_compile_options(flags)
@@ -317,6 +344,13 @@ class GroupCommonFlagsV2(Optimizer):
         # Add global flags and include dirs to global class target
         class_targets = []
         if not self.bazel_mode:
+            # Temporary copies, only needed until global class is complete
+            src_copies_with_target_flags = []
+            for t in compileable_targets:
+                for s in sources_by_target[t["output"]]:
+                    s = get_source_with_inherited_flags(t, s)
+                    src_copies_with_target_flags.append(s)
+
             global_class = get_class_target("#global")
             for (
                 target_property,
@@ -332,8 +366,9 @@ class GroupCommonFlagsV2(Optimizer):
                 ):
                     flag_filter = self._definitions_only
                 common_values = self._move_common_flags_to_target(
+                    None,
                     global_class["properties"],
-                    global_class.setdefault("dependencies", []),
+                    global_class,
                     src_copies_with_target_flags,
                     source_property,
                     target_property=target_property,
@@ -344,35 +379,44 @@ class GroupCommonFlagsV2(Optimizer):
                 if common_values is None:
                     continue
                 self._remove_property_values(
-                    compileable_targets, target_property, common_values
+                    transaction, compileable_targets, target_property, common_values
                 )
                 if target_property != source_property:
                     self._remove_property_values(
-                        compileable_targets, source_property, common_values
+                        transaction,
+                        compileable_targets,
+                        source_property,
+                        common_values,
                     )
                 self._remove_property_values(
+                    transaction,
                     filter(source_filter, compileable_sources),
                     source_property,
                     common_values,
                 )
 
+            del src_copies_with_target_flags
+
             self._move_common_flags_to_target(
+                transaction,
                 global_class["properties"],
-                global_class.setdefault("dependencies", []),
+                global_class,
                 linkable_targets,
                 "link_flags",
                 threshold=self.class_optimization_threshold
             )
 
             def lib_filter(flag):
-                if isinstance(flag, str):
-                    return flag not in module_target_index
-                else:
-                    return flag['value'] not in module_target_index
+                if not isinstance(flag, str):
+                    flag = flag['value']
+                # skip libraries built by module and module_copy targets
+                target = graph.get(flag)
+                return target is None or not target["type"].startswith("module")
 
             self._move_common_flags_to_target(
+                transaction,
                 global_class["properties"],
-                global_class.setdefault("dependencies", []),
+                global_class,
                 nonstatic_linkable_targets,
                 "libs",
                 flag_filter=lib_filter,
@@ -384,8 +428,9 @@ class GroupCommonFlagsV2(Optimizer):
                     "#" + module_type, conditions={"module_type": module_type}
                 )
                 self._move_common_flags_to_target(
+                    transaction,
                     class_target["properties"],
-                    class_target.setdefault("dependencies", []),
+                    class_target,
                     filter(lambda t: t["module_type"] == module_type, linkable_targets),
                     "link_flags",
                     threshold=self.class_optimization_threshold
@@ -417,9 +462,12 @@ class GroupCommonFlagsV2(Optimizer):
                         and source_property == "compile_flags"
                     ):
                         flag_filter = self._definitions_only
+                if "dependencies" not in t:
+                    transaction.set(t, "dependencies", [])
                 common_values = self._move_common_flags_to_target(
+                    transaction,
+                    t,
                     t,
-                    t.setdefault("dependencies", []),
                     srcs,
                     source_property,
                     target_property=target_property,
@@ -470,6 +518,9 @@ class GroupCommonFlagsV2(Optimizer):
                     (["link_flags"], compileable_targets + class_targets, None),
                     (["libs"], compileable_targets + class_targets, lib_filter),
                 ]
+                # flag sets contain vocabulary ids of flags
+                get_id = self.vocabulary.get_id
+                lengths = self.vocabulary.lengths
                 for properties, targets_, flag_filter in var_optimization_definitions:
                     increment = 1
                     flag_sets = []
@@ -478,7 +529,7 @@ class GroupCommonFlagsV2(Optimizer):
                             [
                                 set(
                                     [
-                                        make_hashable(f)
+                                        get_id(f)
                                         for f in (self._get_property_values(t, p) or [])
                                         if flag_filter is None or flag_filter(f)
                                     ]
@@ -486,22 +537,23 @@ class GroupCommonFlagsV2(Optimizer):
                                 for t in targets_
                             ]
                         )
+                    finder = get_common_set_finder(
+                        flag_sets, lengths, self.common_set_engine
+                    )
                     while flag_sets:
-                        flags_length = sum(
-                            [len(s) for s in set(chain.from_iterable(flag_sets))]
-                        )
+                        flags_length = finder.get_total_length()
                         var_name = "{}_{}".format(properties[0], increment)
                         placeholder = "@{}@".format(var_name)
-                        common_set, characters_saved = find_best_common_set(
-                            flag_sets,
-                            fitness_func=FitnessByTotalStringLength(len(placeholder)),
-                        )
+                        common_ids, characters_saved = finder.find(len(placeholder))
                         if characters_saved < 10:
                             break
                         ratio = float(characters_saved) / flags_length
                         # ensure that we save at least 5% text for current flag set
                         if ratio < 0.05:
                             break
+                        common_set = set(
+                            self.vocabulary.get_value(i) for i in common_ids
+                        )
                         flags = sorted(common_set, key=lambda f: f if isinstance(f, str) else " ".join(f))
                         dependencies = []
                         for f in flags:
@@ -518,25 +570,35 @@ class GroupCommonFlagsV2(Optimizer):
                         var_target = get_variable_target(
                             var_name, placeholder, flags, dependencies=dependencies
                         )
-                        for idx, s in enumerate(flag_sets):
-                            if common_set <= s:
-                                s.difference_update(common_set)
-                                t = targets_[idx % len(targets_)]
-                                property = properties[idx // len(targets_)]
-                                self._remove_property_values([t], property, common_set)
-                                values = self._get_property_values(t, property)
-                                values.insert(
-                                    self._get_index_for_next_variable(values), placeholder
+                        for idx in finder.extract():
+                            t = targets_[idx % len(targets_)]
+                            property = properties[idx // len(targets_)]
+                            self._remove_property_values(
+                                transaction, [t], property, common_set
+                            )
+                            container = t
+                            if t.get("type") == "class":
+                                container = t["properties"]
+                            values = list(container[property])
+                            values.insert(
+                                self._get_index_for_next_variable(values), placeholder
+                            )
+                            transaction.set(container, property, values)
+                            if "language" in t:
+                                # TODO: source objects should support dependencies
+                                #       add dependency to parent target
+                                t = target_by_source[t["_id"]]
+                            if var_target["output"] not in t["dependencies"]:
+                                transaction.set(
+                                    t,
+                                    "dependencies",
+                                    t["dependencies"] + [var_target["output"]],
                                 )
-                                if "language" in t:
-                                    # TODO: source objects should support dependencies
-                                    #       add dependency to parent target
-                                    t = target_by_source[t["_id"]]
-                                if var_target["output"] not in t["dependencies"]:
-                                    t["dependencies"].append(var_target["output"])
                         variable_targets.append(var_target)
                         variable_target_index[var_target["output"]] = var_target
                         increment += 1
+                    # don't keep flag sets while the next ones are created
+                    del flag_sets, finder
 
         # Remove temp identifiers from sources
         for s in compileable_sources:
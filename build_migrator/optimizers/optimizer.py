@@ -1,9 +1,11 @@
 import argparse
 import logging
-from pprint import pformat
 import traceback
-from build_migrator.helpers import get_minified_targets
+from build_migrator.helpers import lazy_format_targets
 from build_migrator.modules import EntryPoint, Optimizer
+from build_migrator.common.blob_store import get_blob_store
+from build_migrator.common.vocabulary import get_vocabulary
+from build_migrator.common.metrics import call_measured
 from build_migrator.common.os_ext import get_host_system_name
 
 logger = logging.getLogger(__name__)
@@ -32,26 +34,41 @@ class OptimizerContext(Optimizer, EntryPoint):
             "some generators may produce unreadable results (cmake).",
         )
 
-    def __init__(self, build_migrator, platform=None, dont_optimize=False):
+    def __init__(
+        self, build_migrator, platform=None, dont_optimize=False, out_dir=None
+    ):
         if platform is None:
             platform = get_host_system_name()
         self.dont_optimize = dont_optimize
         self.platform_name = platform
+        self.blob_store = get_blob_store(out_dir, build_migrator)
+        self.vocabulary = get_vocabulary(build_migrator)
+        self.metrics = getattr(build_migrator, "metrics", None)
 
     def optimize(self, targets, optimizers):
         if self.dont_optimize:
             logger.debug("Skipping optimizations due to --dont_optimize flag")
             return targets
 
+        debug = logger.isEnabledFor(logging.DEBUG)
         logger.debug(" > Begin optimizing:")
-        logger.debug(pformat(get_minified_targets(targets)))
+        logger.debug("%s", lazy_format_targets(targets))
         for optimizer in optimizers:
             logger.debug(type(optimizer).__name__)
             try:
-                result = optimizer.optimize(targets)
-                if result != targets:
+                if self.metrics is not None:
+                    result = call_measured(
+                        self.metrics,
+                        "optimize",
+                        type(optimizer).__name__,
+                        optimizer.optimize,
+                        targets,
+                    )
+                else:
+                    result = optimizer.optimize(targets)
+                if debug and result != targets:
                     logger.debug(" > Optimized:")
-                    logger.debug(pformat(get_minified_targets(result)))
+                    logger.debug("%s", lazy_format_targets(result))
                 targets = result
             except Exception:
                 logging.error(traceback.format_exc())
@@ -1,57 +1,76 @@
 import logging
+from build_migrator.common.dependency_graph import DependencyGraph
 from build_migrator.modules import Optimizer
 
 
 logger = logging.getLogger(__name__)
 
 
+# Stable topological sort: each target is preceded by its dependencies,
+# otherwise targets keep their original order. Dependencies are placed
+# right before the first target that needs them, in original order.
+#
+# Depth-first search visits targets in original order, and dependencies
+# of each target in original order, too. Targets are emitted in post-order.
+# Dependency that leads back to a target being visited closes a cycle:
+# it's reported and ignored.
 class OrderTargetByDependency(Optimizer):
+    _new = 0
+    _visiting = 1
+    _done = 2
+
+    def _get_dependencies(self, targets):
+        # Returns lists of indices of dependencies of each target,
+        # in ascending order. Lists are filled in order of dependencies
+        # using reverse adjacency of the graph, so sorting isn't needed.
+        graph = DependencyGraph(targets)
+        position = {}
+        for idx, t in enumerate(targets):
+            position[id(t)] = idx
+        dependencies = [[] for _ in targets]
+        for idx, t in enumerate(targets):
+            for dependent in graph.get_dependents(t):
+                dependencies[position[id(dependent)]].append(idx)
+        return dependencies
+
     def optimize(self, targets):
-        output_index = {}
-        order_index = {}
-        for i in range(0, len(targets)):
-            t = targets[i]
-            if "output" in targets[i]:
-                output_index[t["output"]] = t
-                order_index[t["output"]] = i
-            for o in t.get("msvc_import_lib") or []:
-                output_index[o] = t
-                order_index[o] = i
-
-        # First, (stable) sort targets in order of dependency
-        _targets_ready = set()
-        _cycle_detector = set()
-        i = 0
-        while i < len(targets):
-            deps = filter(order_index.get, targets[i].get("dependencies") or [])
-            unordered_dependencies = []
-            for d in deps:
-                if d not in _targets_ready and d not in unordered_dependencies:
-                    unordered_dependencies.append(d)
-            if unordered_dependencies:
-                unordered_dependencies = sorted(
-                    unordered_dependencies, key=order_index.get, reverse=True
-                )
-                for d in unordered_dependencies:
-                    pair = (targets[i].get("output"), d)
-                    if pair in _cycle_detector:
-                        logger.error("Cycle found: {}".format(pair))
-                        _targets_ready.add(d)
-                        continue
-                    _cycle_detector.add(pair)
-                    if d in output_index:
-                        targets.remove(output_index[d])
-                        targets.insert(i, output_index[d])
-                    else:
-                        _targets_ready.add(d)
-            else:
-                t = targets[i]
-                if "output" in t:
-                    _targets_ready.add(t["output"])
-                for o in t.get("msvc_import_lib") or []:
-                    _targets_ready.add(o)
-                i += 1
+        dependencies = self._get_dependencies(targets)
+        state = [self._new] * len(targets)
+        ordered = []
+        cycles = []
+        for root in range(len(targets)):
+            if state[root] != self._new:
+                continue
+            state[root] = self._visiting
+            # path from root to the current target
+            stack = [(root, iter(dependencies[root]))]
+            stack_position = {root: 0}
+            while stack:
+                idx, pending = stack[-1]
+                for dep in pending:
+                    if state[dep] == self._new:
+                        state[dep] = self._visiting
+                        stack_position[dep] = len(stack)
+                        stack.append((dep, iter(dependencies[dep])))
+                        break
+                    if state[dep] == self._visiting:
+                        cycle = [i for i, _ in stack[stack_position[dep] :]]
+                        cycles.append(cycle + [dep])
+                else:
+                    stack.pop()
+                    del stack_position[idx]
+                    state[idx] = self._done
+                    ordered.append(targets[idx])
+
+        if cycles:
+            logger.error(
+                "Dependency cycles found:\n%s",
+                "\n".join(
+                    " -> ".join(targets[i]["output"] for i in cycle) for cycle in cycles
+                ),
+            )
 
+        targets[:] = ordered
         return targets
 
 
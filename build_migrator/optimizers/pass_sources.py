@@ -1,5 +1,6 @@
 from copy import copy, deepcopy
 from build_migrator.common.algorithm import add_unique_stable
+from build_migrator.common.dependency_graph import DependencyGraph
 from build_migrator.helpers import get_minified_target, get_final_module_copy_source
 from build_migrator.modules import Optimizer
 
@@ -17,7 +18,7 @@ class PassSources(Optimizer):
         self.context = context
 
     def optimize(self, targets):
-        index = self._get_target_index(targets)
+        index = DependencyGraph(targets)
         optimized_targets = []
         skipset = self._get_module_copy_skipset(
             index, targets
@@ -146,7 +147,7 @@ class PassSources(Optimizer):
 
             optimized_targets.append(target)
 
-        index = self._get_target_index(optimized_targets)
+        index = DependencyGraph(optimized_targets)
         # find module_copy targets without source and remove them
         pending_removal = []
         for t in optimized_targets:
@@ -231,14 +232,5 @@ class PassSources(Optimizer):
 
         return skip_set
 
-    def _get_target_index(self, targets):
-        index = {}
-        for target in targets:
-            if "output" in target:
-                index[target["output"]] = target
-            for o in target.get("msvc_import_lib") or []:
-                index[o] = target
-        return index
-
 
 __all__ = ["PassSources"]
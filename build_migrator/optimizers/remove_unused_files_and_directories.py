@@ -1,5 +1,5 @@
 import logging
-from build_migrator.helpers import get_target_and_dependencies
+from build_migrator.common.dependency_graph import DependencyGraph
 from build_migrator.modules import Optimizer
 
 
@@ -10,18 +10,13 @@ class RemoveUnusedFilesAndDirectories(Optimizer):
     priority = 0
 
     def optimize(self, targets):
-        index = {}
-        for t in targets:
-            if "output" in t:
-                index[t["output"]] = t
-            for o in t.get("msvc_import_lib") or []:
-                index[o] = t
+        graph = DependencyGraph(targets)
 
         skip_set = set()
         for t in targets:
             if t["type"] not in ("directory", "file"):
                 # force execution of yield'ing function
-                list(get_target_and_dependencies(t, index, skip_set))
+                list(graph.iter_target_and_dependencies(t, skip_set))
 
         optimized_targets = []
         for t in targets:
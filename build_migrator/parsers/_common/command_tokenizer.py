@@ -51,6 +51,7 @@ class CommandTokenizer(Parser):
     subcommand_split_re = re.compile(r"`(.+)`|\$\((.+)\)")
 
     priority = 4
+    target_keys = ("line",)
 
     @staticmethod
     def add_arguments(arg_parser):
@@ -93,6 +94,13 @@ class CommandTokenizer(Parser):
         else:
             self.regex = POSIX_RX
 
+    # Parameters that precede command are stored until the next command
+    def get_state(self):
+        return dict(self.parameters) if self.parameters else None
+
+    def set_state(self, state):
+        self.parameters = dict(state or {})
+
     def parse(self, target):
         line = target.get("line")
 
@@ -9,6 +9,7 @@ logger = logging.getLogger(__name__)
 # Also used by StraceTokenizer
 class ContextWorkingDirWorkaround(Parser):
     priority = 2
+    target_keys = ("context.working_dir",)
 
     @staticmethod
     def add_arguments(arg_parser):
@@ -13,6 +13,7 @@ logger = logging.getLogger(__name__)
 # echo line3 >> C:\Temp\nm16A5.tmp
 class InlineFileContent(Parser):
     priority = 4
+    target_keys = ("tokens",)
 
     def __init__(self, context):
         self.context = context
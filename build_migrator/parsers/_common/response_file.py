@@ -1,5 +1,6 @@
 import logging
 import os
+from build_migrator.helpers import get_file_content
 from build_migrator.modules import Parser
 from build_migrator.parsers._common.command_tokenizer import CommandTokenizer
 
@@ -9,6 +10,7 @@ logger = logging.getLogger(__name__)
 
 class ResponseFile(Parser):
     priority = 5
+    target_keys = ("tokens",)
 
     @staticmethod
     def add_arguments(arg_parser):
@@ -37,9 +39,12 @@ class ResponseFile(Parser):
                     output = self.context.get_output(path)
                     response_file_target = self.context.target_index.get(output)
                     if response_file_target is not None:
-                        tokens[idx:idx+1] = self._get_args(
-                            response_file_target["content"]
+                        content = get_file_content(
+                            response_file_target, self.context.blob_store
                         )
+                        if not isinstance(content, str):
+                            content = content.decode("utf-8")
+                        tokens[idx:idx+1] = self._get_args(content)
                     else:
                         logger.error(
                             "Response file not found: %s. Log may be parsed incorrectly.",
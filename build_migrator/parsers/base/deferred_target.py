@@ -0,0 +1,14 @@
+class DeferredTarget(object):
+    """Parser result which is completed later, after all targets
+    preceding it in the build log are registered.
+
+    result: object with blocking get() method (e.g., AsyncResult)
+    callback: function that receives result value and returns parsed target
+    """
+
+    def __init__(self, result, callback):
+        self.result = result
+        self.callback = callback
+
+    def complete(self):
+        return self.callback(self.result.get())
@@ -1,10 +1,36 @@
+from build_migrator.common.argument_parser_ex import ParseMemo
 from build_migrator.modules import Parser
 
 
 class ParserBase(Parser):
+    # Maximum number of memoized parse results per argument parser
+    argument_memo_size = 1024
+
     def __init__(self, context):
         self.context = context
 
+    def parse_arguments(self, parser, tokens, strict=False, **kwargs):
+        """Parses tokens with ArgumentParserEx. Results of parsing leading flags
+        are memoized: commands often differ only in source and output paths.
+        Returns the same value as parser.parse_args() if strict,
+        parser.parse_known_args() otherwise."""
+        if parser.memo is None:
+            parser.memo = ParseMemo(self.argument_memo_size)
+        hits = parser.memo.hits
+        misses = parser.memo.misses
+        if strict:
+            result = parser.parse_args(tokens, **kwargs)
+        else:
+            result = parser.parse_known_args(tokens, **kwargs)
+        metrics = getattr(self.context, "metrics", None)
+        if metrics is not None:
+            metrics.add_cache_stats(
+                "argument_parser",
+                parser.memo.hits - hits,
+                parser.memo.misses - misses,
+            )
+        return result
+
     @staticmethod
     def is_applicable(log_type=None):
         return True
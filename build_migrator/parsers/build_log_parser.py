@@ -1,15 +1,21 @@
 import argparse
+import collections
+import contextlib
 import copy
 import fnmatch
+import functools
 import glob
-import io
 import logging
+import multiprocessing
 import os
+import pickle
 from pprint import pformat
 import sys
 import traceback
 from build_migrator.helpers import (
+    lazy_format_target,
     get_directory_target,
+    get_blob_file_target,
     get_file_target,
     get_variable_target,
     get_minified_target,
@@ -18,8 +24,18 @@ from build_migrator.helpers import (
     get_module_copy,
 )
 from build_migrator.modules import EntryPoint, Parser
+from build_migrator.parsers.base.deferred_target import DeferredTarget
 from build_migrator.common.algorithm import add_unique_stable
 from build_migrator.common.argparse_actions import Extend
+from build_migrator.common.blob_store import get_blob_store
+from build_migrator.common.vocabulary import get_vocabulary
+from build_migrator.common.implicit_dependency_cache import ImplicitDependencyCache
+from build_migrator.common.log_source import open_log_source
+from build_migrator.common.logging_ex import TraceWriter
+from build_migrator.common.metrics import Metrics, call_measured
+from build_migrator.common.ninja_deps import NinjaDeps
+from build_migrator.common.records import mapping_types
+from build_migrator.common.target_store import TargetStore
 import build_migrator.common.os_ext as os_ext
 import build_migrator.common.path_ext as path_ext
 
@@ -30,6 +46,11 @@ class BuildLogParserContext(Parser, EntryPoint):
     build_dir_placeholder = "@build_dir@"
     source_dir_placeholder = "@source_dir@"
     known_log_types = ("ninja", "make", "msbuild", "strace")
+    # Single log of these types can be parsed in shards (see --parse_jobs)
+    shardable_log_types = ("ninja", "make")
+    shards_per_job = 4
+    # Maximum number of deferred targets waiting for completion
+    max_pending_targets = 1024
 
     @classmethod
     def add_arguments(cls, arg_parser):
@@ -62,7 +83,8 @@ class BuildLogParserContext(Parser, EntryPoint):
             nargs="+",
             action=Extend,
             help="Path to build log. For allowed log types, see --log_type argument. "
-            "Logs are processed in order.",
+            "Logs are processed in order. Logs compressed with gzip, bzip2 "
+            "or xz are decompressed on the fly.",
         )
         arg_parser.add_argument(
             "--log_type",
@@ -137,6 +159,38 @@ class BuildLogParserContext(Parser, EntryPoint):
             help="Don't store source files in Build Object Model.",
             default=None,
         )
+        arg_parser.add_argument(
+            "--implicit_deps_cache_size",
+            metavar="MB",
+            type=int,
+            help="Store implicit dependencies (headers) found by compilers "
+            "in output directory and reuse them during subsequent parsing. "
+            "Cached dependencies are discarded if command line, "
+            "source files or any of the dependencies change. "
+            "Least recently used entries are removed if cache size exceeds "
+            "the specified value. Default: 0 (disabled).",
+        )
+        arg_parser.add_argument(
+            "--parse_jobs",
+            metavar="N",
+            type=int,
+            help="Number of build logs that may be parsed concurrently "
+            "in separate processes. Each log is parsed without targets "
+            "found in other logs, then targets are merged in order "
+            "of --logs. Logs that refer to outputs of previous logs "
+            "are parsed again sequentially, so independent logs (e.g., "
+            "of different build directories) benefit most. Single make "
+            "or ninja log is split into shards parsed concurrently. "
+            "Result is the same as without this option. "
+            "Requires fork() (not available on Windows). Default: 1.",
+        )
+        arg_parser.add_argument(
+            "--trace_out",
+            metavar="PATH",
+            help="Write trace of build log parsing to the specified file "
+            "in JSON Lines format: registered targets and parser errors, "
+            "along with build log line numbers.",
+        )
 
     def _list_files(self, directory, pattern=None):
         if pattern is not None:
@@ -195,6 +249,10 @@ class BuildLogParserContext(Parser, EntryPoint):
         capture_sources=None,
         log_type=None,
         dont_capture_sources=None,
+        out_dir=None,
+        implicit_deps_cache_size=None,
+        trace_out=None,
+        parse_jobs=None,
     ):
         if platform is None:
             platform = os_ext.get_host_system_name()
@@ -207,7 +265,14 @@ class BuildLogParserContext(Parser, EntryPoint):
                 "capture_sources cannot be specified if dont_capture_sources is True"
             )
 
+        if parse_jobs is not None and parse_jobs < 1:
+            raise ValueError("parse_jobs must be positive")
+        self.parse_jobs = parse_jobs or 1
+
         self.current_target = None
+        self.log_type = None
+        self.log_path = None
+        self.log_line = None
         self.platform_name = platform
         self.platform = os_ext.get_platform(platform)
         self.logs = self._parse_logs(logs, log_type)
@@ -226,9 +291,15 @@ class BuildLogParserContext(Parser, EntryPoint):
             self._working_dir = self.build_dirs[0]
         self.max_relpath_level = max_relpath_level
         self.path_aliases = None
-        self.target_index = None  # target_output => target
-        self.targets = None
+        self._targets = None  # TargetStore
+        self._pending_targets = collections.deque()
+        self._pending_targets_allowed = False
         self._variable_targets = {}
+        self._ninja_deps = {}  # directory => NinjaDeps
+        # see _parse_log_in_shards() and _parse_log_in_subprocess()
+        self._lookup_recorder = None
+        self._shard_tokens = None  # token => target
+        self._modified_targets = None  # see _mark_modified_targets()
         self._arg_path_aliases = path_aliases
         self._arg_dont_capture_sources = dont_capture_sources
         self._arg_capture_sources = capture_sources
@@ -245,6 +316,10 @@ class BuildLogParserContext(Parser, EntryPoint):
             0: {},
             1: {},
         }
+        self._path_normalizer_hits = 0
+        # number of cache entries that were added before parsing started
+        # (in parent process, see _parse_log_in_subprocess())
+        self._path_normalizer_initial_size = 0
 
         self.required_targets = None
         if targets:
@@ -269,6 +344,25 @@ class BuildLogParserContext(Parser, EntryPoint):
         for output, name in force_target_name or []:
             self.force_target_name[output] = name
 
+        self.implicit_dependency_cache = None
+        if implicit_deps_cache_size:
+            if out_dir is None:
+                raise ValueError("implicit_deps_cache_size requires out_dir")
+            self.implicit_dependency_cache = ImplicitDependencyCache(
+                os.path.join(out_dir, "implicit_deps_cache"),
+                implicit_deps_cache_size * 1024 * 1024,
+            )
+
+        # captured file contents are stored in <out_dir>/blobs
+        self.blob_store = get_blob_store(out_dir, build_migrator)
+        self.vocabulary = get_vocabulary(build_migrator)
+
+        self.metrics = getattr(build_migrator, "metrics", None)
+
+        self.trace = None
+        if trace_out:
+            self.trace = TraceWriter(trace_out)
+
     def _capture_explicitly_specified_sources(self, capture_sources):
         for src in capture_sources:
             paths = self._list_files(self.source_dir, src)
@@ -294,13 +388,19 @@ class BuildLogParserContext(Parser, EntryPoint):
             self.path_aliases.append((path, alias))
 
     def parse(self, targets, parsers):
-        self.target_index = {}
-        if targets:
-            for target in targets:
-                self._add_target_to_index(target)
-            self.targets = targets
-        else:
-            self.targets = []
+        try:
+            self._parse(targets, parsers)
+            if self.trace is not None:
+                self.trace.write("end", targets=len(self.targets))
+        finally:
+            if self.trace is not None:
+                self.trace.close()
+        return list(self.targets)
+
+    def _parse(self, targets, parsers):
+        self.targets = TargetStore()
+        for target in targets or []:
+            self._add_target(target)
 
         self._initialize_path_aliases(self._arg_path_aliases)
 
@@ -310,34 +410,577 @@ class BuildLogParserContext(Parser, EntryPoint):
             # don't capture any more source files
             self.capture_sources = False
 
-        for log in self.logs:
-            # newline=None argument allows processing logs from any platform,
-            # irregardless of line ending type.
-            with io.open(
-                log.path, newline=None, encoding="utf-8", errors="replace"
-            ) as f:
-                for line in f:
-                    line = line.strip()
-                    logger.info(" > " + line)
-                    # Don't use Unicode strings in Python 2,
-                    # or each regular expression will have to
-                    # have a second Unicode version.
-                    if sys.version_info <= (3, 0):
-                        line = line.encode("utf-8")
-                    targets = [{"line": line}]
-                    parse_targets(
-                        targets, self, parsers, log_type=log.type
-                    )
-
-                logger.info(" > (EOF)")
-                # 'end of file' instructs parsers like line_accumulator and response_file to pass on any accumulated data
-                targets = [{"eof": True}]
-                parse_targets(
-                    targets, self, parsers, log_type=log.type
+        fork_context = None
+        if self.parse_jobs > 1:
+            fork_context = _get_fork_context()
+            if fork_context is None:
+                logger.warning(
+                    "parse_jobs requires fork(), parsing logs sequentially"
                 )
 
+        try:
+            if fork_context is not None and len(self.logs) > 1:
+                self._parse_logs_in_subprocesses(parsers, fork_context)
+            else:
+                chains = {}  # log type => parser chain
+                for log in self.logs:
+                    if log.type not in chains:
+                        chains[log.type] = get_parser_chain(
+                            parsers, log.type, self.metrics
+                        )
+                    if (
+                        fork_context is not None
+                        and log.type in self.shardable_log_types
+                    ):
+                        self._parse_log_in_shards(
+                            log, chains[log.type], parsers, fork_context
+                        )
+                    else:
+                        self._parse_log(log, chains[log.type])
+
+            self.complete_pending_targets()
+        finally:
+            _close_parsers(parsers)
+        self.log_path = None
+        self.log_line = None
+        if self.implicit_dependency_cache is not None:
+            self.implicit_dependency_cache.close()
+        if self.metrics is not None:
+            self._add_cache_metrics()
         finalize(self)
-        return self.targets
+
+    def _read_log(self, log):
+        """Yields (line number, line) of build log"""
+        log_lines = logger.isEnabledFor(logging.INFO)
+        # Logs from any platform are supported, irregardless of line ending type.
+        # Compressed logs are decompressed on the fly.
+        with open_log_source(log.path) as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if log_lines:
+                    logger.info(" > %s", line)
+                # Don't use Unicode strings in Python 2,
+                # or each regular expression will have to
+                # have a second Unicode version.
+                if sys.version_info <= (3, 0):
+                    line = line.encode("utf-8")
+                yield line_number, line
+        if log_lines:
+            logger.info(" > (EOF)")
+
+    def _start_parsing_log(self, log):
+        self.log_type = log.type
+        self.log_path = log.path
+        self.log_line = None
+        if self.trace is not None:
+            self.trace.write("log", log=log.path, type=log.type)
+
+    def _parse_log(self, log, chain):
+        self._start_parsing_log(log)
+        for line_number, line in self._read_log(log):
+            self.log_line = line_number
+            run_parser_chain([{"line": line}], self, chain)
+        # 'end of file' instructs parsers like line_accumulator and response_file to pass on any accumulated data
+        run_parser_chain([{"eof": True}], self, chain)
+
+    def _get_subprocess_trace_path(self, log_idx):
+        return "%s.%d" % (self.trace.path, log_idx)
+
+    # Metrics of forked process are collected separately and merged
+    # by parent process (see _receive_subprocess_result())
+    def _reset_metrics_in_subprocess(self):
+        if self.metrics is not None:
+            self.metrics = Metrics()
+            self._path_normalizer_hits = 0
+            self._path_normalizer_initial_size = self._get_path_normalizer_cache_size()
+        if self.implicit_dependency_cache is not None:
+            self.implicit_dependency_cache.hits = 0
+            self.implicit_dependency_cache.misses = 0
+
+    def _start_subprocess(self, fork_context, func, *args):
+        """Calls func(*args, conn) in forked process, returns (process, conn)"""
+        # buffered output would be written by both processes
+        if self.trace is not None:
+            self.trace.flush()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        parent_conn, child_conn = fork_context.Pipe(duplex=False)
+        process = fork_context.Process(target=func, args=args + (child_conn,))
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def _receive_subprocess_result(self, process, conn, log_path):
+        """Returns result sent by subprocess, merges its metrics"""
+        result, metrics, error = conn.recv()
+        conn.close()
+        process.join()
+        if error is not None:
+            raise RuntimeError("Failed to parse {}:\n{}".format(log_path, error))
+        if self.metrics is not None:
+            self.metrics.merge(metrics)
+        return result
+
+    # Runs in forked process: context and parsers are copies of parent's objects,
+    # so parsing of this log doesn't affect other logs.
+    # Sends new targets, lookups of _LogRecorder (and metrics) to parent process.
+    def _parse_log_in_subprocess(self, log_idx, parsers, conn):
+        try:
+            initial_targets = list(self.targets)
+            initial_target_ids = set(id(t) for t in initial_targets)
+            self._reset_metrics_in_subprocess()
+            recorder = _LogRecorder(initial_target_ids)
+            self._lookup_recorder = recorder
+            self._targets.index = _RecordingIndex(self._targets.index, self)
+            if self.trace is not None:
+                self.trace = TraceWriter(self._get_subprocess_trace_path(log_idx))
+
+            log = self.logs[log_idx]
+            self._parse_log(log, get_parser_chain(parsers, log.type, self.metrics))
+            self.complete_pending_targets()
+
+            if self.metrics is not None:
+                self._add_cache_metrics()
+            targets = [t for t in self.targets if id(t) not in initial_target_ids]
+            conn.send(((targets, recorder.lookups), self.metrics, None))
+        except Exception:
+            conn.send((None, None, traceback.format_exc()))
+        finally:
+            _close_parsers(parsers)
+            if self.trace is not None:
+                self.trace.close()
+            conn.close()
+
+    def _find_changed_lookup(self, lookups, targets):
+        """Returns output or name, which lookup finds other targets than
+        in subprocess (i.e., targets of previous logs), or None"""
+        new_targets = None  # output => target registered by subprocess
+        for key, target_ids in lookups.items():
+            if isinstance(key, tuple):
+                # lookup by name
+                found = self._targets.find_by_name(key[1])
+                if tuple(id(t) for t in found) != target_ids:
+                    return key[1]
+                continue
+            target = self._targets.index.get(key)
+            if target is None:
+                if target_ids:
+                    return key
+                continue
+            if target_ids == (id(target),):
+                continue
+            if target_ids:
+                return key
+            # Target wasn't registered when log was parsed, and log has
+            # registered the same one (e.g., source file used by both logs).
+            if new_targets is None:
+                new_targets = dict((t.get("output"), t) for t in targets)
+            if target != new_targets.get(key):
+                return key
+        return None
+
+    def _merge_subprocess_targets(self, log_idx, process, conn, parsers):
+        log = self.logs[log_idx]
+        targets, lookups = self._receive_subprocess_result(process, conn, log.path)
+        trace_path = None
+        if self.trace is not None:
+            trace_path = self._get_subprocess_trace_path(log_idx)
+
+        self.complete_pending_targets()
+        dependency = self._find_changed_lookup(lookups, targets)
+        if dependency is not None:
+            # Log refers to outputs of previous logs, which subprocess
+            # didn't know about: parse it again, as if logs were parsed
+            # sequentially
+            logger.warning(
+                "%s depends on %s from previous build logs, parsing it again",
+                log.path,
+                dependency,
+            )
+            if trace_path is not None:
+                os.remove(trace_path)
+            self._parse_log(log, get_parser_chain(parsers, log.type, self.metrics))
+            self.complete_pending_targets()
+            return
+
+        if trace_path is not None:
+            with open(trace_path) as f:
+                self.trace.write_raw(f.read())
+            os.remove(trace_path)
+
+        # Conflicts between logs are resolved as if logs were parsed sequentially
+        trace = self.trace
+        self.trace = None
+        try:
+            for target in targets:
+                self.register_target(target)
+        finally:
+            self.trace = trace
+
+    # Each log is parsed in a separate process. Targets are merged
+    # in order of logs, so Build Object Model doesn't depend on parse_jobs.
+    def _parse_logs_in_subprocesses(self, parsers, fork_context):
+        self.complete_pending_targets()
+
+        running = collections.deque()  # (log index, process, connection)
+        log_idx = 0
+        try:
+            while log_idx < len(self.logs) or running:
+                while log_idx < len(self.logs) and len(running) < self.parse_jobs:
+                    process, conn = self._start_subprocess(
+                        fork_context, self._parse_log_in_subprocess, log_idx, parsers
+                    )
+                    running.append((log_idx, process, conn))
+                    log_idx += 1
+                idx, process, conn = running.popleft()
+                self._merge_subprocess_targets(idx, process, conn, parsers)
+        finally:
+            for _, process, _ in running:
+                process.terminate()
+                process.join()
+
+    # Single make or ninja log is parsed in shards:
+    # 1. Lines are passed through line preprocessors (leading parsers without
+    #    target_keys, e.g. NinjaLog and LineAccumulator) in this process,
+    #    so directory changes and line continuations are resolved.
+    # 2. Commands are split into shards, which are tokenized and parsed
+    #    in forked processes, started with targets registered so far.
+    #    _ShardRecorder records targets registered by each command
+    #    and targets the command has looked up.
+    # 3. Shards are merged in order of the log. Targets of the command are
+    #    registered again if lookups give the same result as in subprocess,
+    #    otherwise (e.g., link command refers to objects from previous shard)
+    #    the command is parsed again in this process.
+    # So Build Object Model doesn't depend on parse_jobs.
+    def _parse_log_in_shards(self, log, chain, parsers, fork_context):
+        preprocessors = 0
+        while preprocessors < len(chain) and chain[preprocessors].target_keys is None:
+            preprocessors += 1
+        if preprocessors == 0 or preprocessors == len(chain):
+            self._parse_log(log, chain)
+            return
+
+        self._start_parsing_log(log)
+        commands = self._preprocess_log(log, chain, preprocessors)
+        shard_size = max(
+            -(-len(commands) // (self.parse_jobs * self.shards_per_job)), 1
+        )
+        shards = [
+            commands[idx:idx + shard_size]
+            for idx in range(0, len(commands), shard_size)
+        ]
+        stateful_parsers = _get_stateful_parsers(chain[preprocessors:])
+        state = _get_parsers_state(stateful_parsers)
+
+        self._shard_tokens = {}
+        self._modified_targets = {}
+        # targets that existed when subprocesses were started,
+        # their ids are used by _ShardRecorder
+        known_targets = {}
+        reused = 0
+        reparsed = 0
+        running = collections.deque()  # (shard index, process, connection)
+        shard_idx = 0
+        try:
+            while shard_idx < len(shards) or running:
+                while shard_idx < len(shards) and len(running) < self.parse_jobs:
+                    self.complete_pending_targets()
+                    known_targets.update((id(t), t) for t in self._targets)
+                    process, conn = self._start_subprocess(
+                        fork_context,
+                        self._parse_shard_in_subprocess,
+                        shard_idx,
+                        shards[shard_idx],
+                        parsers,
+                        preprocessors,
+                    )
+                    running.append((shard_idx, process, conn))
+                    shard_idx += 1
+                idx, process, conn = running.popleft()
+                records = self._receive_subprocess_result(process, conn, log.path)
+                for line_number, working_dir, targets in shards[idx]:
+                    record = records[line_number]
+                    self.complete_pending_targets()
+                    self.log_line = line_number
+                    self._working_dir = working_dir
+                    self.current_target = None
+                    if self._can_replay_shard_record(record, state, idx):
+                        self._replay_shard_record(record)
+                        state = record["state_after"]
+                        reused += 1
+                    else:
+                        _set_parsers_state(stateful_parsers, state)
+                        run_parser_chain(targets, self, chain, preprocessors)
+                        state = _get_parsers_state(stateful_parsers)
+                        reparsed += 1
+                        if record["modifies_targets"]:
+                            self._mark_modified_targets(record, shard_idx)
+        finally:
+            for _, process, _ in running:
+                process.terminate()
+                process.join()
+            self._shard_tokens = None
+            self._modified_targets = None
+        self._working_dir = commands[-1][1]
+        _set_parsers_state(stateful_parsers, state)
+        if self.metrics is not None:
+            self.metrics.add_cache_stats("log_shards", reused, reparsed)
+
+    def _preprocess_log(self, log, chain, preprocessors):
+        """Passes build log through line preprocessors chain[:preprocessors].
+        Returns list of (line number, working dir, targets)."""
+        commands = []
+        for line_number, line in self._read_log(log):
+            self.log_line = line_number
+            targets = run_parser_chain(
+                [{"line": line}], self, chain, stop=preprocessors
+            )
+            commands.append((line_number, self._working_dir, targets))
+        targets = run_parser_chain([{"eof": True}], self, chain, stop=preprocessors)
+        if commands:
+            # parsed as part of the last line
+            commands[-1][2].extend(targets)
+        else:
+            commands.append((None, self._working_dir, targets))
+        return commands
+
+    # Runs in forked process, sends records of _ShardRecorder
+    # (and metrics) to parent process.
+    def _parse_shard_in_subprocess(self, shard_idx, commands, parsers, start, conn):
+        try:
+            self._reset_metrics_in_subprocess()
+            recorder = _ShardRecorder(shard_idx)
+            self._lookup_recorder = recorder
+            if self.trace is not None:
+                self.trace = recorder
+            self._targets.index = _RecordingIndex(self._targets.index, self)
+
+            chain = get_parser_chain(parsers, self.log_type, self.metrics)
+            stateful_parsers = _get_stateful_parsers(chain[start:])
+            # shard is assumed to start in initial state,
+            # parent process checks it
+            _set_parsers_state(stateful_parsers, None)
+            state = _get_parsers_state(stateful_parsers)
+            for line_number, working_dir, targets in commands:
+                self.log_line = line_number
+                self._working_dir = working_dir
+                self.current_target = None
+                record = recorder.get_record(line_number)
+                record["state_before"] = state
+                run_parser_chain(targets, self, chain, start)
+                state = _get_parsers_state(stateful_parsers)
+                record["state_after"] = state
+                recorder.check_modified_targets()
+            self.complete_pending_targets()
+            recorder.check_modified_targets()
+
+            if self.metrics is not None:
+                self._add_cache_metrics()
+            conn.send((recorder.records, self.metrics, None))
+        except Exception:
+            conn.send((None, None, traceback.format_exc()))
+        finally:
+            _close_parsers(parsers)
+            conn.close()
+
+    def _mark_modified_targets(self, record, started_shards):
+        """Marks targets found by command, which has modified them
+        in this process (e.g., appended content of inline file).
+        Shards started earlier have seen previous version of targets."""
+        for key, _ in record["lookups"]:
+            if isinstance(key, tuple):
+                found = self._targets.find_by_name(key[1])
+            else:
+                found = [self._targets.index.get(key)]
+            for target in found:
+                if target is not None:
+                    self._modified_targets[id(target)] = started_shards
+
+    def _match_shard_token(self, token, target, shard_idx):
+        if token is None:
+            return target is None
+        if target is None:
+            return False
+        if token[0] == _ShardRecorder.existing_target:
+            return (
+                id(target) == token[1]
+                and self._modified_targets.get(token[1], 0) <= shard_idx
+            )
+        return self._shard_tokens.get(token) is target
+
+    def _can_replay_shard_record(self, record, state, shard_idx):
+        if record["modifies_targets"] or record["state_before"] != state:
+            return False
+        dependencies = None
+        for key, token in record["lookups"]:
+            if isinstance(key, tuple):
+                # lookup by name
+                targets = self._targets.find_by_name(key[1])
+                if len(targets) != len(token):
+                    return False
+                for target_token, target in zip(token, targets):
+                    if not self._match_shard_token(target_token, target, shard_idx):
+                        return False
+                continue
+            target = self._targets.index.get(key)
+            if self._match_shard_token(token, target, shard_idx):
+                continue
+            if token is not None or target is None:
+                return False
+            # Target wasn't registered when shard was parsed, so command has
+            # created new one as a dependency (e.g., directory or header).
+            # It's the same as if existing target was found, if they're equal.
+            if dependencies is None:
+                dependencies = {}
+                for blob, _ in record["registrations"]:
+                    for dep in _iter_target_tree(pickle.loads(blob)):
+                        dependencies[dep.get("output")] = _with_dependency_outputs(
+                            dep
+                        )
+            if target != dependencies.get(key):
+                return False
+        return True
+
+    def _replay_shard_record(self, record):
+        if self.trace is not None:
+            for event, fields in record["events"]:
+                self.trace.write(event, **fields)
+        replayed = {}  # output => registered targets, including dependencies
+        for blob, working_dir in record["registrations"]:
+            target = pickle.loads(blob)
+            for dep in _iter_target_tree(target):
+                replayed.setdefault(dep.get("output"), []).append(dep)
+            self._working_dir = working_dir
+            self.register_target(target)
+        for token, output in record["added"]:
+            target = self._targets.index.get(output)
+            if target is None:
+                continue
+            for replayed_target in replayed.get(output, []):
+                if target is replayed_target or target == _with_dependency_outputs(
+                    replayed_target
+                ):
+                    self._shard_tokens[token] = target
+                    break
+
+    def _get_path_normalizer_cache_size(self):
+        return len(self._path_normalizer_cache[1]) + sum(
+            len(cache) for cache in self._path_normalizer_cache[0].values()
+        )
+
+    def _add_cache_metrics(self):
+        # Each cache miss adds an entry
+        misses = (
+            self._get_path_normalizer_cache_size()
+            - self._path_normalizer_initial_size
+        )
+        self.metrics.add_cache_stats(
+            "path_normalizer", self._path_normalizer_hits, misses
+        )
+        if self.implicit_dependency_cache is not None:
+            self.metrics.add_cache_stats(
+                "implicit_dependency",
+                self.implicit_dependency_cache.hits,
+                self.implicit_dependency_cache.misses,
+            )
+
+    # Deferred targets are registered in the same order they appear in the build log.
+    # Any access to registered targets completes pending targets first,
+    # unless it's done inside allow_pending_targets() block.
+    @property
+    def target_index(self):
+        """Registered targets by output. Read-only, use register_target()."""
+        self.complete_pending_targets()
+        return self._targets.index
+
+    @property
+    def targets(self):
+        """Registered targets in order of registration (TargetStore)"""
+        self.complete_pending_targets()
+        return self._targets
+
+    @targets.setter
+    def targets(self, value):
+        if not isinstance(value, TargetStore):
+            value = TargetStore(value)
+        self._targets = value
+
+    @contextlib.contextmanager
+    def allow_pending_targets(self):
+        """Access registered targets without completing pending targets.
+
+        Use only if the code inside doesn't depend on targets that can be
+        registered by pending targets, or handles their absence the same
+        way (e.g., creates equal file and directory targets).
+        """
+        allowed = self._pending_targets_allowed
+        self._pending_targets_allowed = True
+        try:
+            yield
+        finally:
+            self._pending_targets_allowed = allowed
+
+    def defer_target(self, deferred_target, chain, start):
+        self._pending_targets.append(
+            (
+                deferred_target,
+                chain,
+                start,
+                self.current_target,
+                self._working_dir,
+                self.log_path,
+                self.log_line,
+            )
+        )
+        while len(self._pending_targets) > self.max_pending_targets:
+            self._complete_pending_target()
+
+    def complete_pending_targets(self):
+        if self._pending_targets_allowed:
+            return
+        while self._pending_targets:
+            self._complete_pending_target()
+
+    def _complete_pending_target(self):
+        (
+            deferred_target,
+            chain,
+            start,
+            current_target,
+            working_dir,
+            log_path,
+            log_line,
+        ) = self._pending_targets.popleft()
+        saved_state = (
+            self.current_target,
+            self._working_dir,
+            self.log_path,
+            self.log_line,
+            self._pending_targets_allowed,
+        )
+        self.current_target = current_target
+        self._working_dir = working_dir
+        self.log_path = log_path
+        self.log_line = log_line
+        self._pending_targets_allowed = True
+        try:
+            try:
+                targets = deferred_target.complete()
+            except Exception:
+                logging.error(traceback.format_exc())
+                # same as in run_parser_chain: continue with unmodified target
+                targets = current_target
+            if not isinstance(targets, list):
+                targets = [targets]
+            run_parser_chain(targets, self, chain, start)
+        finally:
+            (
+                self.current_target,
+                self._working_dir,
+                self.log_path,
+                self.log_line,
+                self._pending_targets_allowed,
+            ) = saved_state
 
     @property
     def working_dir(self):
@@ -361,6 +1004,7 @@ class BuildLogParserContext(Parser, EntryPoint):
             cache = cache[working_dir]
             result = cache.get(path)
             if result is not None:
+                self._path_normalizer_hits += 1
                 return result
             result = self.platform.normalize_path(
                 self.platform.path_join(working_dir, path)
@@ -370,6 +1014,7 @@ class BuildLogParserContext(Parser, EntryPoint):
             cache = self._path_normalizer_cache[1]
             result = cache.get(path)
             if result is not None:
+                self._path_normalizer_hits += 1
                 return result
             result = self.platform.normalize_path(path)
             cache[path] = result
@@ -598,9 +1243,13 @@ class BuildLogParserContext(Parser, EntryPoint):
             )
 
         content = None
+        content_hash = None
         try:
-            with open(full_path, "rb") as f:
-                content = f.read()
+            if self.blob_store is None:
+                with open(full_path, "rb") as f:
+                    content = f.read()
+            else:
+                content_hash, size = self.blob_store.put_file(full_path)
         except IOError:
             logging.error(traceback.format_exc())
             return None
@@ -613,6 +1262,10 @@ class BuildLogParserContext(Parser, EntryPoint):
         if parent_dir_target:
             dependencies = [parent_dir_target]
 
+        if content_hash is not None:
+            return get_blob_file_target(
+                content_hash, size, output=relocatable_path, dependencies=dependencies
+            )
         return get_file_target(
             content, output=relocatable_path, dependencies=dependencies
         )
@@ -695,7 +1348,10 @@ class BuildLogParserContext(Parser, EntryPoint):
                     )
                     assert ctgt_descr["version"] != target_descr["version"]
                     if ctgt_descr["version"]:
-                        conflicting_target["name"] += "." + ctgt_descr["version"]
+                        self.targets.set_name(
+                            conflicting_target,
+                            conflicting_target["name"] + "." + ctgt_descr["version"],
+                        )
                     if target_descr["version"]:
                         target_name += "." + target_descr["version"]
             return get_module_copy(
@@ -711,15 +1367,41 @@ class BuildLogParserContext(Parser, EntryPoint):
 
         return get_copy_target(None, source, output, dependencies)
 
+    def get_ninja_dependencies(self, output):
+        """Returns implicit dependencies of output recorded by Ninja
+        in .ninja_deps file in current working directory, or None.
+        Relative paths are relative to current working directory.
+        """
+        if self.log_type != "ninja":
+            return None
+        directory = self.working_dir
+        if directory not in self._ninja_deps:
+            ninja_deps = None
+            path = os.path.join(directory, ".ninja_deps")
+            if os.path.exists(path):
+                try:
+                    ninja_deps = NinjaDeps(path)
+                    logger.info(
+                        "Loaded dependencies of {} outputs from {}".format(
+                            len(ninja_deps), path
+                        )
+                    )
+                except Exception:
+                    logging.error(traceback.format_exc())
+            self._ninja_deps[directory] = ninja_deps
+        ninja_deps = self._ninja_deps[directory]
+        if ninja_deps is None:
+            return None
+        return ninja_deps.get(output)
+
     def find_target(self, output):
-        if output in self.target_index:
-            return self.target_index[output]
-        return None
+        return self.targets.find(output)
 
     def find_targets_by_name(self, name):
-        for target in self.targets:
-            if target.get("name") == name:
-                yield target
+        targets = self.targets.find_by_name(name)
+        if self._lookup_recorder is not None:
+            self._lookup_recorder.lookup(self.log_line, ("name", name), targets)
+        return targets
 
     def find_target_by_path(self, path):
         path = self._construct_path_arg(path)
@@ -758,9 +1440,7 @@ class BuildLogParserContext(Parser, EntryPoint):
             deps = tgt.get("objects")
             if deps:
                 tgt["objects"] = [output if dep == old_output else dep for dep in deps]
-        del self.target_index[old_output]
-        target["output"] = output
-        self.target_index[output] = target
+        self.targets.set_output(target, output)
 
     # overwrite old_target's output by new_target,
     # but keep existing references to old_target
@@ -782,6 +1462,8 @@ class BuildLogParserContext(Parser, EntryPoint):
 
     def register_target(self, target):
         assert target["output"]
+        if self._lookup_recorder is not None and not self._lookup_recorder.registering:
+            return self._lookup_recorder.register_target(self, target)
         registered_targets = []
 
         if "dependencies" not in target:
@@ -798,7 +1480,6 @@ class BuildLogParserContext(Parser, EntryPoint):
                 new_target_is_not_file = target.get("type") != "file"
                 if existing_target_is_file and new_target_is_not_file:
                     logger.warning("Replacing existing file target")
-                    del self.target_index[existing_target["output"]]
                     self.targets.remove(existing_target)
                 elif self._is_object_lib(existing_target) and self._is_object_lib(
                     target
@@ -809,9 +1490,10 @@ class BuildLogParserContext(Parser, EntryPoint):
                         "Only targets with type=module and module_type=object_lib are allowed to have the same output path"
                     )
                     logger.info("Old target:")
-                    logger.info(pformat(get_minified_target(existing_target)))
+                    logger.info("%s", lazy_format_target(existing_target))
                     logger.info("New target:")
-                    logger.info(pformat(get_minified_target(target)))
+                    logger.info("%s", lazy_format_target(target))
+                    self.trace_event("conflict", target)
                     return registered_targets
             else:
                 return registered_targets
@@ -823,10 +1505,11 @@ class BuildLogParserContext(Parser, EntryPoint):
         if working_dir:
             target["working_dir"] = self.get_dir_arg(working_dir)
 
-        logger.info(" > Registering new target:")
-        logger.info(pformat(get_minified_target(target)))
-        self.targets.append(target)
-        self._add_target_to_index(target)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(" > Registering new target:")
+            logger.info("%s", lazy_format_target(target))
+        self.trace_event("target", target)
+        self._add_target(target)
         registered_targets.append(target)
 
         for dep_target in dependencies:
@@ -834,24 +1517,34 @@ class BuildLogParserContext(Parser, EntryPoint):
 
         return registered_targets
 
+    def trace_event(self, event, target=None, **fields):
+        if self.trace is None:
+            return
+        if target is not None:
+            for key in ("type", "output", "module_type", "name"):
+                if key in target:
+                    fields[key] = target[key]
+        self.trace.write(event, line=self.log_line, **fields)
+
     def split_target_dependencies(self, target, log=True):
         dependencies = []
         for idx, dep in enumerate(target["dependencies"] or []):
-            if type(dep) is dict:
+            if isinstance(dep, mapping_types):
                 dependencies.append(dep)
                 target["dependencies"][idx] = dep["output"]
         return target, dependencies
 
-    def _add_target_to_index(self, target):
-        if "output" in target:
-            self.target_index[target["output"]] = target
-            for output in target.get("msvc_import_lib") or []:
-                self.target_index[output] = target
-        else:
+    def _add_target(self, target):
+        if "output" not in target:
             logger.warn("Target has no output:")
-            logger.warn(pformat(get_minified_target(target)))
+            logger.warn("%s", lazy_format_target(target))
+        # equal flags and paths of all targets share the same objects
+        self.vocabulary.intern_target(target)
+        self.targets.add(target)
         if target["type"] == "variable":
             self._variable_targets[target["output"]] = target
+        if self._lookup_recorder is not None:
+            self._lookup_recorder.add(self.log_line, target)
 
     def get_implicit_include_dirs(
         self,
@@ -886,55 +1579,324 @@ class BuildLogParserContext(Parser, EntryPoint):
         return implicit_include_dirs
 
 
-def _group_by_duplicate_names(targets):
-    name_groups = {}
-    duplicate_name_groups = []
-    for t in targets:
-        if "name" not in t:
-            continue
-        name = t["name"]
-        if name not in name_groups:
-            name_groups[name] = []
-        elif len(name_groups[name]) == 1:
-            duplicate_name_groups.append(name_groups[name])
-        name_groups[name].append(t)
-    return duplicate_name_groups
+class ParserChainEntry(object):
+    __slots__ = ("parser", "parse", "name", "target_keys")
+
+    def __init__(self, parser, metrics=None):
+        self.parser = parser
+        self.parse = parser.parse
+        self.name = type(parser).__name__
+        if metrics is not None:
+            self.parse = functools.partial(
+                call_measured, metrics, "parse", self.name, parser.parse
+            )
+        # Prefilter: parser is skipped unless target has a non-empty value
+        # for at least one of these keys (e.g., "tokens")
+        self.target_keys = getattr(parser, "target_keys", None)
+
+
+def _get_fork_context():
+    """Returns multiprocessing context that starts processes with fork(),
+    or None if fork() is not available"""
+    if not hasattr(os, "fork"):
+        return None
+    get_context = getattr(multiprocessing, "get_context", None)
+    if get_context is None:
+        # Python 2: fork() is the only start method on Unix
+        return multiprocessing
+    return get_context("fork")
+
+
+# Records how each command of a shard (see
+# BuildLogParserContext._parse_log_in_shards()) is parsed in subprocess:
+# targets passed to register_target() (before registration), tokens
+# of targets found by lookups, tokens of added targets and trace events.
+# Token identifies target across processes: targets that existed
+# when subprocess was started are identified by their id(),
+# new targets by shard index and sequence number.
+class _ShardRecorder(object):
+    existing_target = "existing"
+
+    def __init__(self, shard_idx):
+        self.shard_idx = shard_idx
+        self.records = {}  # log line => record
+        self.registering = False
+        self._tokens = {}  # id(target) => (token, target)
+        self._added = 0
+        # targets found by lookups since last check_modified_targets() call:
+        # id(target) => (target, pickled target, [log lines])
+        self._found_targets = {}
+
+    def get_record(self, line):
+        record = self.records.get(line)
+        if record is None:
+            record = self.records[line] = {
+                "lookups": [],  # (key, token)
+                "registrations": [],  # (pickled target, working dir)
+                "added": [],  # (token, output)
+                "events": [],  # (event, fields)
+                "modifies_targets": False,
+                "state_before": None,
+                "state_after": None,
+            }
+        return record
+
+    def get_token(self, target):
+        if target is None:
+            return None
+        token = self._tokens.get(id(target))
+        if token is not None:
+            return token[0]
+        return (self.existing_target, id(target))
+
+    def lookup(self, line, key, value):
+        if self.registering:
+            # registration is repeated by parent process
+            return
+        if isinstance(value, list):
+            found = value
+            token = tuple(self.get_token(t) for t in value)
+        else:
+            found = [value] if value is not None else []
+            token = self.get_token(value)
+        self.get_record(line)["lookups"].append((key, token))
+        for target in found:
+            self._add_found_target(line, target)
+
+    def _add_found_target(self, line, target):
+        found_target = self._found_targets.get(id(target))
+        if found_target is None:
+            self._found_targets[id(target)] = (
+                target,
+                pickle.dumps(target, pickle.HIGHEST_PROTOCOL),
+                [line],
+            )
+        else:
+            found_target[2].append(line)
+
+    def check_modified_targets(self):
+        """Marks commands that have modified targets after they were found
+        or registered (e.g., objcopy modifies existing module), such commands
+        are parsed again by parent process"""
+        for target, pickled, lines in self._found_targets.values():
+            if pickle.dumps(target, pickle.HIGHEST_PROTOCOL) != pickled:
+                for line in lines:
+                    self.get_record(line)["modifies_targets"] = True
+        self._found_targets = {}
+
+    def register_target(self, context, target):
+        # the same as in register_target(), but before target is recorded
+        context.complete_pending_targets()
+        self.get_record(context.log_line)["registrations"].append(
+            (pickle.dumps(target, pickle.HIGHEST_PROTOCOL), context.working_dir)
+        )
+        self.registering = True
+        try:
+            registered_targets = context.register_target(target)
+        finally:
+            self.registering = False
+        for registered_target in registered_targets:
+            self._add_found_target(context.log_line, registered_target)
+        return registered_targets
+
+    def add(self, line, target):
+        self._added += 1
+        token = (self.shard_idx, self._added)
+        self._tokens[id(target)] = (token, target)
+        if "output" in target:
+            self.get_record(line)["added"].append((token, target["output"]))
+
+    # TraceWriter interface: registration events are written
+    # by parent process
+    def write(self, event, **fields):
+        if not self.registering:
+            self.get_record(fields.get("line"))["events"].append((event, fields))
+
+
+# Records results of lookups made while log is parsed in forked process:
+# targets that existed before (their ids) found by output or by name.
+# Parent process parses log again if lookups find other targets
+# after previous logs are merged (see _merge_subprocess_targets()).
+class _LogRecorder(object):
+    def __init__(self, initial_target_ids):
+        self.initial_target_ids = initial_target_ids
+        self.registering = False
+        self.lookups = {}  # output or ("name", name) => tuple of target ids
+
+    def lookup(self, line, key, value):
+        if self.registering or key in self.lookups:
+            return
+        if isinstance(value, list):
+            found = value
+        else:
+            found = [value] if value is not None else []
+        self.lookups[key] = tuple(
+            id(t) for t in found if id(t) in self.initial_target_ids
+        )
+
+    def register_target(self, context, target):
+        # registration is repeated by parent process
+        self.registering = True
+        try:
+            return context.register_target(target)
+        finally:
+            self.registering = False
+
+    def add(self, line, target):
+        pass
+
+
+# Index of TargetStore that reports lookups to _ShardRecorder or _LogRecorder
+class _RecordingIndex(dict):
+    def __init__(self, index, context):
+        dict.__init__(self, index)
+        self.context = context
+
+    def _record(self, key):
+        self.context._lookup_recorder.lookup(
+            self.context.log_line, key, dict.get(self, key)
+        )
+
+    def get(self, key, default=None):
+        self._record(key)
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        self._record(key)
+        return dict.__contains__(self, key)
+
+    def __getitem__(self, key):
+        self._record(key)
+        return dict.__getitem__(self, key)
+
+
+def _iter_target_tree(target):
+    """Yields target and dependencies that are specified as targets"""
+    stack = [target]
+    while stack:
+        target = stack.pop()
+        yield target
+        for dep in target.get("dependencies") or []:
+            if isinstance(dep, mapping_types):
+                stack.append(dep)
+
+
+def _with_dependency_outputs(target):
+    """Returns copy of target with dependencies replaced by their outputs,
+    as in registered target"""
+    result = dict(target)
+    if "dependencies" not in target:
+        result["dependencies"] = []
+    elif target["dependencies"]:
+        result["dependencies"] = [
+            dep["output"] if isinstance(dep, mapping_types) else dep
+            for dep in target["dependencies"]
+        ]
+    return result
+
+
+def _get_stateful_parsers(chain):
+    return [
+        entry.parser for entry in chain if hasattr(entry.parser, "get_state")
+    ]
+
+
+def _get_parsers_state(parsers):
+    return tuple(parser.get_state() for parser in parsers)
+
+
+def _set_parsers_state(parsers, state):
+    if state is None:
+        state = (None,) * len(parsers)
+    for parser, parser_state in zip(parsers, state):
+        parser.set_state(parser_state)
+
+
+def _close_parsers(parsers):
+    for parser in parsers:
+        close = getattr(parser, "close", None)
+        if close is not None:
+            close()
+
+
+def get_parser_chain(parsers, log_type=None, metrics=None):
+    """Returns immutable sequence of parsers applicable to log_type.
+    If metrics is specified, parser calls are measured."""
+    chain = []
+    for parser in parsers:
+        is_applicable = getattr(parser, "is_applicable", None)
+        if is_applicable is None or is_applicable(log_type=log_type):
+            chain.append(ParserChainEntry(parser, metrics))
+    return tuple(chain)
 
 
 def parse_targets(targets, context, parsers, log_type=None):
-    result_targets = []
+    return run_parser_chain(targets, context, get_parser_chain(parsers, log_type))
 
-    for target in targets:
-        logger.debug(" > Parsing target:")
-        logger.debug(pformat(get_minified_target(target)))
 
-        for idx, parser in enumerate(parsers):
-            is_applicable = getattr(parser, "is_applicable", None)
-            if is_applicable is None or is_applicable(log_type=log_type):
-                logger.debug(type(parser).__name__)
-                try:
-                    context.current_target = target
-                    result = parser.parse(target)
-                    if isinstance(
-                        result, list
-                    ):  # parser is allowed to return multiple targets
-                        target = None
-                        result_targets += parse_targets(
-                            result,
-                            context,
-                            parsers[idx + 1:],
-                            log_type=log_type,
-                        )
+def run_parser_chain(targets, context, chain, start=0, stop=None):
+    """Passes targets through parsers chain[start:] and registers results.
+
+    Parser may return modified target, list of targets (each of them is
+    processed by the rest of the chain), or DeferredTarget.
+
+    If stop is specified, targets are passed through chain[start:stop]
+    and returned without registration.
+    """
+    result_targets = []
+    debug = logger.isEnabledFor(logging.DEBUG)
+    chain_length = len(chain) if stop is None else stop
+    # (target, index of the next parser)
+    stack = [(target, start) for target in reversed(targets)]
+    while stack:
+        target, idx = stack.pop()
+        if debug:
+            logger.debug(" > Parsing target:")
+            logger.debug("%s", lazy_format_target(target))
+
+        while idx < chain_length and target is not None:
+            entry = chain[idx]
+            idx += 1
+            if entry.target_keys is not None:
+                for key in entry.target_keys:
+                    if target.get(key):
                         break
-                    else:
-                        if target != result:
-                            logger.debug(" > Modified target:")
-                            logger.debug(pformat(get_minified_target(result)))
-                        target = result
-                except Exception:
-                    logging.error(traceback.format_exc())
+                else:
+                    continue
+            if debug:
+                logger.debug(entry.name)
+            try:
+                context.current_target = target
+                result = entry.parse(target)
+                if result is target:
+                    # target is unchanged or modified in place
+                    continue
+                if isinstance(result, DeferredTarget):
+                    # target will be parsed by remaining parsers
+                    # and registered later
+                    target = None
+                    context.defer_target(result, chain, idx)
+                elif isinstance(result, list):
+                    # parser is allowed to return multiple targets
+                    target = None
+                    stack.extend((t, idx) for t in reversed(result))
+                else:
+                    if debug and target != result:
+                        logger.debug(" > Modified target:")
+                        logger.debug("%s", lazy_format_target(result))
+                    target = result
+            except Exception:
+                logging.error(traceback.format_exc())
+                context.trace_event(
+                    "error",
+                    parser=entry.name,
+                    message=traceback.format_exc().splitlines()[-1],
+                )
 
-        if target and "output" in target:
+        if stop is not None:
+            if target is not None:
+                result_targets.append(target)
+        elif target and "output" in target:
             result_targets.append(target)
             context.register_target(target)
 
@@ -942,10 +1904,11 @@ def parse_targets(targets, context, parsers, log_type=None):
 
 
 def deduplicate_target_names(targets):
+    """targets: TargetStore"""
     duplicates_found = True
     while duplicates_found:
         duplicates_found = False
-        for dups_by_name in _group_by_duplicate_names(targets):
+        for dups_by_name in targets.get_duplicate_names():
             duplicates_found = True
             group_by_basename = {}
             for t in dups_by_name:
@@ -970,26 +1933,24 @@ def deduplicate_target_names(targets):
                         path = os.path.dirname(path)
                         if path:
                             path = "".join([c if c.isalnum() else "_" for c in path])
-                            t["name"] = path + "_" + t["name"]
+                            targets.set_name(t, path + "_" + t["name"])
                 else:
                     # If duplicate targets have different basenames (filenames),
                     # change their names to actual filenames
                     t = dups_by_basename[0]
-                    t["name"] = os.path.basename(t["output"]).replace(".", "_")
+                    targets.set_name(
+                        t, os.path.basename(t["output"]).replace(".", "_")
+                    )
 
 
 def provide_required_targets(context):
     # targets may have duplicate names, let's keep that in mind
     if context.required_targets:
-        name_index = {}
         targets = []
         skip_set = set()
         for t in context.targets:
             if "name" not in t:
                 continue
-            lst = name_index.get(t["name"], [])
-            lst.append(t)
-            name_index[t["name"]] = lst
             if t.get("top_level"):
                 targets += list(
                     get_target_and_dependencies(t, context.target_index, skip_set)
@@ -998,9 +1959,10 @@ def provide_required_targets(context):
         for key in context.required_targets:
             output = context.normalize_path(key)
             output = context._construct_path_arg(output).relocatable
-            if key in name_index:
+            targets_by_name = context.find_targets_by_name(key)
+            if targets_by_name:
                 # filter by name
-                for t in name_index[key]:
+                for t in targets_by_name:
                     targets += list(
                         get_target_and_dependencies(t, context.target_index, skip_set)
                     )
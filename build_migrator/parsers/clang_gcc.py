@@ -1,10 +1,13 @@
+import argparse
 from copy import deepcopy
 from itertools import chain
 import logging
+from multiprocessing.pool import ThreadPool
 import os
 import re
 import subprocess
 from build_migrator.common.algorithm import flatten_list
+from build_migrator.common.depfile import read_depfile, check_recorded_dependencies
 from build_migrator.helpers import (
     get_module_target,
     ModuleTypes,
@@ -16,6 +19,7 @@ from build_migrator.common.os_ext import get_host_system_name
 from build_migrator.common.argument_parser_ex import ArgumentParserEx
 from .base.compiler_parser import CompilerParser
 from .base.linker_parser import LinkerParser
+from .base.deferred_target import DeferredTarget
 
 
 logger = logging.getLogger(__name__)
@@ -42,23 +46,44 @@ class Clang_Gcc(CompilerParser, LinkerParser):
         dynamic = "-Bdynamic"
 
     priority = 7
+    target_keys = ("tokens",)
 
     @staticmethod
     def add_arguments(arg_parser):
         CompilerParser.add_arguments(arg_parser)
         LinkerParser.add_arguments(arg_parser)
+        try:
+            arg_parser.add_argument(
+                "--implicit_deps_jobs",
+                metavar="N",
+                type=int,
+                help="Number of preprocessor commands that may run concurrently "
+                "while searching for implicit dependencies (headers). "
+                "Build Object Model doesn't depend on this value. "
+                "Default: 1.",
+            )
+        except argparse.ArgumentError:
+            # Already added somewhere else
+            pass
 
     def __init__(
         self,
         context,
         ignore_link_flags=None,
         ignore_compile_flags=None,
+        implicit_deps_jobs=None,
     ):
         CompilerParser.__init__(
             self, context, ignore_compile_flags=ignore_compile_flags
         )
         LinkerParser.__init__(self, context, ignore_link_flags=ignore_link_flags)
 
+        if implicit_deps_jobs is not None and implicit_deps_jobs < 1:
+            raise ValueError("implicit_deps_jobs must be positive")
+        self.implicit_deps_jobs = implicit_deps_jobs or 1
+        self._implicit_deps_pool = None
+        self._implicit_deps_pool_pid = None
+
         self.platform_name = context.platform_name
         self.platform = context.platform
         self.program_re = self.platform.get_program_path_re(
@@ -78,6 +103,8 @@ class Clang_Gcc(CompilerParser, LinkerParser):
             include_dirs=[],
             link_flags=[],
             compile_flags=[],
+            write_depfile=False,
+            depfile=None,
         )
 
         # control flags
@@ -85,9 +112,9 @@ class Clang_Gcc(CompilerParser, LinkerParser):
         self.parser.add_argument(
             "-E", action="store_const", const=self.Mode.preprocess, dest="mode"
         )
-        self.parser.add_argument("-MD", action="store_true")
-        self.parser.add_argument("-MF")
-        self.parser.add_argument("-MMD", action="store_true")
+        self.parser.add_argument("-MD", action="store_true", dest="write_depfile")
+        self.parser.add_argument("-MF", dest="depfile")
+        self.parser.add_argument("-MMD", action="store_true", dest="write_depfile")
         self.parser.add_argument("-MP", action="store_true")
         self.parser.add_argument("-MT")
         self.parser.add_argument(
@@ -210,18 +237,94 @@ class Clang_Gcc(CompilerParser, LinkerParser):
         else:
             return [compile_flags]
 
-    def _add_implicit_dependencies(
+    # Runs `compiler -M`, returns list of dependencies and exit code.
+    def _run_preprocessor(self, cmd, cwd, sources):
+        p = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd
+        )
+        stdout, stderr = p.communicate()
+        if type(stdout) is not str:
+            stdout = stdout.decode("utf-8", "replace")
+        if type(stderr) is not str:
+            stderr = stderr.decode("utf-8", "replace")
+        retcode = p.poll()
+        if retcode:
+            cmd_str = " ".join(cmd)
+            logger.error(
+                "Command '{}' returned non-zero exit code {}\n{}".format(
+                    cmd_str, retcode, stderr
+                )
+            )
+
+        result = []
+        for line in stdout.splitlines():
+            files = line.rstrip("\\").lstrip().split(" ")
+            for f in files:
+                if not f or f.endswith(":") or f in sources:
+                    continue
+                result.append(f)
+        return result, retcode
+
+    # Returns dependencies recorded during the build:
+    # * by Ninja in .ninja_deps (must not be older than output)
+    # * by compiler in depfile (-MD, -MMD; must not be older than depfile)
+    # Returns None if there're no records or they are outdated.
+    # Note: -MMD depfiles don't list system headers. It doesn't matter,
+    # because files outside of source and build dirs aren't captured anyway.
+    def _get_recorded_dependencies(
+        self, sources, cwd, output, depfile, ninja_dependencies
+    ):
+        if ninja_dependencies is not None:
+            try:
+                result = check_recorded_dependencies(
+                    ninja_dependencies, os.path.getmtime(output), sources, cwd
+                )
+                if result is not None:
+                    return result
+            except OSError:
+                pass
+            logger.debug("Ninja dependencies are outdated: {}".format(output))
+
+        if depfile is not None:
+            try:
+                result = check_recorded_dependencies(
+                    read_depfile(depfile),
+                    os.path.getmtime(depfile),
+                    sources,
+                    cwd,
+                    require_sources=True,
+                )
+                if result is not None:
+                    return result
+            except (IOError, OSError):
+                pass
+            logger.debug("Depfile is missing or outdated: {}".format(depfile))
+
+        return None
+
+    # Returns implicit dependencies of given sources as reported by
+    # compiler, without resolving them. Doesn't access registered targets,
+    # so it's safe to run it in worker thread.
+    def _get_implicit_dependencies(
         self,
         compiler,
-        dependencies,
         compile_flags,
         include_dirs,
         sources,
         target_platform,
         cwd,
+        output=None,
+        depfile=None,
+        ninja_dependencies=None,
     ):
         if not sources:
-            return
+            return []
+
+        implicit_dependencies = self._get_recorded_dependencies(
+            sources, cwd, output, depfile, ninja_dependencies
+        )
+        if implicit_dependencies is not None:
+            return implicit_dependencies
 
         include_dir_args = ["-I" + d for d in include_dirs]
         sources = [s for s in sources]
@@ -236,6 +339,7 @@ class Clang_Gcc(CompilerParser, LinkerParser):
                 if target_platform == "darwin":
                     compile_flags = compile_flags + ["--target=i686-apple-darwin10"]
 
+        cache = self.context.implicit_dependency_cache
         implicit_dependencies = []
         implicit_dependencies_set = set()
         for compile_flags in self._split_compile_flags_for_multiarch(compile_flags):
@@ -245,37 +349,62 @@ class Clang_Gcc(CompilerParser, LinkerParser):
                 + include_dir_args
                 + sources
             )
-            p = subprocess.Popen(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd
-            )
-            stdout, stderr = p.communicate()
-            if type(stdout) is not str:
-                stdout = stdout.decode("utf-8", "replace")
-            if type(stderr) is not str:
-                stderr = stderr.decode("utf-8", "replace")
-            retcode = p.poll()
-            if retcode:
-                cmd_str = " ".join(cmd)
-                logger.error(
-                    "Command '{}' returned non-zero exit code {}\n{}".format(
-                        cmd_str, retcode, stderr
-                    )
-                )
-
-            for line in stdout.splitlines():
-                files = line.rstrip("\\").lstrip().split(" ")
-                for f in files:
-                    if not f or f.endswith(":") or f in sources:
-                        continue
-                    if f not in implicit_dependencies_set:
-                        implicit_dependencies.append(f)
-                        implicit_dependencies_set.add(f)
-
+            files = None
+            if cache is not None:
+                files = cache.get("clang_gcc", cmd, cwd, sources)
+            if files is None:
+                files, retcode = self._run_preprocessor(cmd, cwd, sources)
+                # don't store incomplete results
+                if not retcode and cache is not None:
+                    cache.put("clang_gcc", cmd, cwd, sources, files)
+
+            for f in files:
+                if f not in implicit_dependencies_set:
+                    implicit_dependencies.append(f)
+                    implicit_dependencies_set.add(f)
+
+        return implicit_dependencies
+
+    def _add_implicit_dependencies(self, dependencies, implicit_dependencies):
         return [
             self.context.get_file_arg(self.context.normalize_path(dep), dependencies)
             for dep in implicit_dependencies
         ]
 
+    # Compilation without linking can be finished after preprocessor
+    # completes in worker thread, as long as it doesn't refer
+    # to outputs of other build commands (e.g., object files).
+    def _can_defer_implicit_dependencies(self, namespace):
+        if self.implicit_deps_jobs < 2:
+            return False
+        if namespace.mode != self.Mode.assemble or not namespace.infiles:
+            return False
+        for infile in namespace.infiles:
+            if os.path.splitext(infile)[1] not in self.source_exts:
+                return False
+        return True
+
+    def _get_implicit_deps_pool(self):
+        # Worker threads don't survive fork(), forked process needs its own pool
+        # (see --parse_jobs)
+        if (
+            self._implicit_deps_pool is None
+            or self._implicit_deps_pool_pid != os.getpid()
+        ):
+            self._implicit_deps_pool = ThreadPool(self.implicit_deps_jobs)
+            self._implicit_deps_pool_pid = os.getpid()
+        return self._implicit_deps_pool
+
+    def close(self):
+        if self._implicit_deps_pool is None:
+            return
+        # Pool inherited from parent process has no worker threads here
+        if self._implicit_deps_pool_pid == os.getpid():
+            self._implicit_deps_pool.close()
+            self._implicit_deps_pool.join()
+        self._implicit_deps_pool = None
+        self._implicit_deps_pool_pid = None
+
     # filter libs from linker flags
     def _filter_lib_args(self, ns, dependencies):
         libs = []
@@ -414,8 +543,8 @@ class Clang_Gcc(CompilerParser, LinkerParser):
         gcc = tokens.pop(0)
         gcc = self.context.apply_path_aliases(self.context.normalize_path(gcc, ignore_working_dir=True))
 
-        namespace, _ = self.parser.parse_known_args(
-            tokens, unknown_dest=["compile_flags", "link_flags"]
+        namespace, _ = self.parse_arguments(
+            self.parser, tokens, unknown_dest=["compile_flags", "link_flags"]
         )
         if namespace.mode not in [self.Mode.link, self.Mode.assemble]:
             return target
@@ -425,6 +554,12 @@ class Clang_Gcc(CompilerParser, LinkerParser):
             namespace.lib_dirs = []
             namespace.libs = []
 
+        if self._can_defer_implicit_dependencies(namespace):
+            with self.context.allow_pending_targets():
+                return self._parse_namespace(gcc, namespace, defer=True)
+        return self._parse_namespace(gcc, namespace)
+
+    def _parse_namespace(self, gcc, namespace, defer=False):
         dependencies = []
         namespace.lib_dirs = list(
             map(
@@ -508,14 +643,64 @@ class Clang_Gcc(CompilerParser, LinkerParser):
                 version = None
 
         namespace.output = self.context.normalize_path(namespace.output)
-        normalize_implicit_dependencies = self._add_implicit_dependencies(
+        depfile = None
+        ninja_dependencies = None
+        if namespace.mode == self.Mode.assemble:
+            ninja_dependencies = self.context.get_ninja_dependencies(
+                namespace.output
+            )
+            if namespace.write_depfile:
+                if namespace.depfile:
+                    depfile = self.context.normalize_path(namespace.depfile)
+                else:
+                    depfile = os.path.splitext(namespace.output)[0] + ".d"
+        implicit_dependencies_args = (
             gcc,
-            dependencies,
             namespace.compile_flags,
             include_dirs_not_relocatable,
             original_srcs,
             self.platform_name,
             self.context.working_dir,
+            namespace.output,
+            depfile,
+            ninja_dependencies,
+        )
+
+        def _create_target(implicit_dependencies):
+            return self._create_target(
+                namespace,
+                dependencies,
+                implicit_dependencies,
+                module_type,
+                name,
+                version,
+                objects,
+                sources,
+            )
+
+        if defer:
+            result = self._get_implicit_deps_pool().apply_async(
+                self._get_implicit_dependencies, implicit_dependencies_args
+            )
+            return DeferredTarget(result, _create_target)
+
+        return _create_target(
+            self._get_implicit_dependencies(*implicit_dependencies_args)
+        )
+
+    def _create_target(
+        self,
+        namespace,
+        dependencies,
+        implicit_dependencies,
+        module_type,
+        name,
+        version,
+        objects,
+        sources,
+    ):
+        normalize_implicit_dependencies = self._add_implicit_dependencies(
+            dependencies, implicit_dependencies
         )
         namespace.output = self.context.get_output(namespace.output, dependencies)
 
@@ -11,6 +11,7 @@ logger = logging.getLogger(__name__)
 
 class CMake(Parser):
     priority = 7
+    target_keys = ("tokens",)
 
     @staticmethod
     def add_arguments(arg_parser):
@@ -16,6 +16,7 @@ class GnuAr(Parser):
         before = "before"
 
     priority = 7
+    target_keys = ("tokens",)
 
     @staticmethod
     def add_arguments(arg_parser):
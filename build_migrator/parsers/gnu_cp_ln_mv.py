@@ -12,6 +12,7 @@ class GnuCpLnMv(Parser):
     filename_re = os_ext.Unix.get_program_path_re("cp", "ln", "mv")
 
     priority = 7
+    target_keys = ("tokens",)
 
     @staticmethod
     def add_arguments(arg_parser):
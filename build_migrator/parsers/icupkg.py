@@ -10,6 +10,7 @@ logger = logging.getLogger(__name__)
 
 class Icupkg(ParserBase):
     priority = 7
+    target_keys = ("tokens",)
 
     def __init__(self, context):
         ParserBase.__init__(self, context)
@@ -9,6 +9,7 @@ logger = logging.getLogger(__name__)
 
 class Libtool(Parser):
     priority = 7
+    target_keys = ("tokens",)
 
     @staticmethod
     def add_arguments(arg_parser):
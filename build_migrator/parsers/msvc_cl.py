@@ -5,6 +5,7 @@ import re
 
 from build_migrator.common.algorithm import flatten_list
 from build_migrator.common.argument_parser_ex import ArgumentParserEx
+from build_migrator.common.depfile import check_recorded_dependencies
 import build_migrator.common.os_ext as os_ext
 from build_migrator.common import subprocess_ex
 from build_migrator.helpers import (
@@ -19,6 +20,7 @@ from build_migrator.helpers import (
 from .msvc_link import get_msvc_link_parser
 
 from .base.compiler_parser import CompilerParser
+from .base.deferred_target import DeferredTarget
 from .base.linker_parser import LinkerParser
 
 logger = logging.getLogger(__name__)
@@ -51,6 +53,78 @@ def prepare_toolchain_include_dirs(dirs, context):
     return [tid for tid in dirs if not any([d.startswith(tid) for d in ignore_dirs])]
 
 
+class _Result(object):
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class _ResultList(object):
+    def __init__(self, results):
+        self.results = results
+
+    def get(self):
+        return [r.get() for r in self.results]
+
+
+# Sources compiled with the same compiler, flags, include dirs and working directory
+# are passed to single `cl /Zs /showIncludes` invocation.
+# cl.exe prints name of each source file before its includes,
+# that's how includes are attributed to sources.
+class _ShowIncludesBatch(object):
+    class Request(object):
+        def __init__(self, batch, sources):
+            self.batch = batch
+            self.sources = sources
+            self.included_files = None
+
+        def get(self):
+            self.batch.run()
+            return self.included_files
+
+    def __init__(self, parser, compiler, compile_flags, include_dirs, cwd):
+        self.parser = parser
+        self.compiler = compiler
+        self.compile_flags = compile_flags
+        self.include_dirs = include_dirs
+        self.cwd = cwd
+        self.requests = []
+        self.done = False
+        self._source_names = set()
+
+    @staticmethod
+    def _get_source_name(source):
+        return os.path.basename(source.replace("\\", "/")).lower()
+
+    @property
+    def source_count(self):
+        return len(self._source_names)
+
+    def can_add(self, sources, max_sources):
+        if self.requests and self.source_count + len(sources) > max_sources:
+            return False
+        # cl.exe prints only file name, names must be unique
+        for s in sources:
+            if self._get_source_name(s) in self._source_names:
+                return False
+        return not self.done
+
+    def add(self, sources):
+        for s in sources:
+            self._source_names.add(self._get_source_name(s))
+        request = self.Request(self, sources)
+        self.requests.append(request)
+        return request
+
+    def run(self):
+        if self.done:
+            return
+        self.done = True
+        self.parser._run_show_includes_batch(self)
+
+
 # TODO: put all unknown flags into compile_flags?
 class MsvcCl(CompilerParser, LinkerParser):
     filename_re = os_ext.Windows.get_program_path_re("cl")
@@ -61,18 +135,40 @@ class MsvcCl(CompilerParser, LinkerParser):
     source_exts = c_exts + cpp_exts
 
     priority = 7
+    target_keys = ("tokens",)
 
     @staticmethod
     def add_arguments(arg_parser):
         CompilerParser.add_arguments(arg_parser)
         LinkerParser.add_arguments(arg_parser)
+        arg_parser.add_argument(
+            "--show_includes_batch_size",
+            metavar="N",
+            type=int,
+            help="Maximum number of source files passed to single "
+            "'cl.exe /Zs /showIncludes' invocation while searching for "
+            "implicit dependencies (headers). Only sources compiled with "
+            "the same flags are grouped together. Not applicable to clang-cl. "
+            "Default: 1.",
+        )
 
-    def __init__(self, context, ignore_compile_flags=None, ignore_link_flags=None):
+    def __init__(
+        self,
+        context,
+        ignore_compile_flags=None,
+        ignore_link_flags=None,
+        show_includes_batch_size=None,
+    ):
         CompilerParser.__init__(
             self, context, ignore_compile_flags=ignore_compile_flags
         )
         LinkerParser.__init__(self, context, ignore_link_flags=ignore_link_flags)
 
+        if show_includes_batch_size is not None and show_includes_batch_size < 1:
+            raise ValueError("show_includes_batch_size must be positive")
+        self.show_includes_batch_size = show_includes_batch_size or 1
+        self._show_includes_batches = {}
+
         # /showIncludes flag doesn't allow filtering toolchain includes,
         # se we have to do that ourselves.
         msvc_include_dirs = os.environ.get("INCLUDE", [])
@@ -272,52 +368,227 @@ class MsvcCl(CompilerParser, LinkerParser):
     re_str = r"^Note: including file:\s+(?P<path>[^\s].*)$"
     include_note_re = re.compile(re_str, re.IGNORECASE)
 
-    def _add_implicit_dependencies(
-        self,
-        compiler,
-        dependencies,
-        compile_flags,
-        include_dirs,
-        sources,
-        cwd,
-        is_clang_cl=False,
+    def _get_show_includes_cmd(
+        self, compiler, compile_flags, include_dirs, sources, cwd
     ):
-        if not sources:
-            return
-
         _compiler = os.path.join(cwd, compiler)
         if os.path.exists(_compiler):
             compiler = _compiler
 
         cmd = [compiler, "/Zs", "/showIncludes"]
         cmd += ["-I" + d for d in include_dirs] + flatten_list(compile_flags) + sources
+        return cmd
+
+    # Returns list of included files or None if compiler failed
+    def _run_show_includes(self, compiler, compile_flags, include_dirs, sources, cwd):
+        cmd = self._get_show_includes_cmd(
+            compiler, compile_flags, include_dirs, sources, cwd
+        )
+        cache = self.context.implicit_dependency_cache
+        if cache is not None:
+            included_files = cache.get("msvc_cl", cmd, cwd, sources)
+            if included_files is not None:
+                return included_files
+
         try:
             stdout, stderr = subprocess_ex.check_output(cmd, cwd=cwd)
         except subprocess_ex.CalledProcessError as e:
             logger.error("{}\nstderr:\n{}stdout:\n{}".format(e, e.stderr, e.stdout))
+            return None
+
+        included_files = []
+        for line in stdout.splitlines():
+            m = self.include_note_re.match(line.strip())
+            if m:
+                included_files.append(m.group("path"))
+        if cache is not None:
+            cache.put("msvc_cl", cmd, cwd, sources, included_files)
+        return included_files
+
+    # Splits output of batched /showIncludes invocation between requests.
+    # Returns None if output cannot be attributed to source files.
+    def _split_show_includes_output(self, stdout, requests):
+        source_owners = []
+        for idx, request in enumerate(requests):
+            for s in request.sources:
+                source_owners.append((_ShowIncludesBatch._get_source_name(s), idx))
+
+        result = [[] for _ in requests]
+        current = None
+        next_source = 0
+        for line in stdout.splitlines():
+            line = line.strip()
+            m = self.include_note_re.match(line)
+            if m:
+                if current is None:
+                    return None
+                result[current].append(m.group("path"))
+            elif (
+                next_source < len(source_owners)
+                and line.lower() == source_owners[next_source][0]
+            ):
+                current = source_owners[next_source][1]
+                next_source += 1
+        if next_source != len(source_owners):
+            return None
+        return result
+
+    def _run_show_includes_batch(self, batch):
+        if len(batch.requests) > 1:
+            sources = [s for r in batch.requests for s in r.sources]
+            cmd = self._get_show_includes_cmd(
+                batch.compiler,
+                batch.compile_flags,
+                batch.include_dirs,
+                sources,
+                batch.cwd,
+            )
+            try:
+                stdout, stderr = subprocess_ex.check_output(cmd, cwd=batch.cwd)
+                result = self._split_show_includes_output(stdout, batch.requests)
+            except subprocess_ex.CalledProcessError:
+                result = None
+            if result is not None:
+                cache = self.context.implicit_dependency_cache
+                for request, included_files in zip(batch.requests, result):
+                    request.included_files = included_files
+                    if cache is not None:
+                        cmd = self._get_show_includes_cmd(
+                            batch.compiler,
+                            batch.compile_flags,
+                            batch.include_dirs,
+                            request.sources,
+                            batch.cwd,
+                        )
+                        cache.put(
+                            "msvc_cl", cmd, batch.cwd, request.sources, included_files
+                        )
+                return
+            logger.warning(
+                "Batched /showIncludes invocation failed, processing sources one by one"
+            )
+
+        for request in batch.requests:
+            request.included_files = self._run_show_includes(
+                batch.compiler,
+                batch.compile_flags,
+                batch.include_dirs,
+                request.sources,
+                batch.cwd,
+            )
+
+    def _add_to_show_includes_batch(
+        self, compiler, compile_flags, include_dirs, sources, cwd
+    ):
+        key = (
+            compiler,
+            tuple(flatten_list(compile_flags)),
+            tuple(include_dirs),
+            cwd,
+        )
+        batch = self._show_includes_batches.get(key)
+        if batch is None or not batch.can_add(
+            sources, self.show_includes_batch_size
+        ):
+            batch = _ShowIncludesBatch(
+                self, compiler, compile_flags, include_dirs, cwd
+            )
+            self._show_includes_batches[key] = batch
+        request = batch.add(sources)
+        if batch.source_count >= self.show_includes_batch_size:
+            # batch is full, it will be processed as soon as any result is requested
+            del self._show_includes_batches[key]
+        return request
+
+    # Returns object with get() method, which returns list of included files
+    # or None if they cannot be determined
+    def _get_included_files(
+        self,
+        compiler,
+        compile_flags,
+        include_dirs,
+        sources,
+        cwd,
+        output=None,
+        batch=False,
+    ):
+        if not sources:
+            return _Result(None)
+
+        if output is not None:
+            included_files = self._get_ninja_dependencies(output, sources, cwd)
+            if included_files is not None:
+                return _Result(included_files)
+
+        if batch:
+            cache = self.context.implicit_dependency_cache
+            if cache is not None:
+                cmd = self._get_show_includes_cmd(
+                    compiler, compile_flags, include_dirs, sources, cwd
+                )
+                included_files = cache.get("msvc_cl", cmd, cwd, sources)
+                if included_files is not None:
+                    return _Result(included_files)
+            return self._add_to_show_includes_batch(
+                compiler, compile_flags, include_dirs, sources, cwd
+            )
+
+        return _Result(
+            self._run_show_includes(compiler, compile_flags, include_dirs, sources, cwd)
+        )
+
+    def _add_implicit_dependencies(
+        self, dependencies, included_files, is_clang_cl=False,
+    ):
+        if included_files is None:
             return
 
         normalize_implicit_dependencies = []
         toolchain_include_dirs = self.msvc_include_dirs
         if is_clang_cl and self.clang_cl_include_dirs:
             toolchain_include_dirs = self.clang_cl_include_dirs
-        for line in stdout.splitlines():
-            m = self.include_note_re.match(line.strip())
-            if m:
-                try:
-                    path = self.context.normalize_path(m.group("path"))
-                    is_toolchain_header = False
-                    for d in toolchain_include_dirs:
-                        if path.startswith(d):
-                            is_toolchain_header = True
-                            break
-                    if not is_toolchain_header:
-                        normalize_implicit_dependencies.append(self.context.get_file_arg(path, dependencies))
-                except ValueError:
-                    # Path is on drive c:, build dir on drive d:
-                    pass
+        for included_file in included_files:
+            try:
+                path = self.context.normalize_path(included_file)
+                is_toolchain_header = False
+                for d in toolchain_include_dirs:
+                    if path.startswith(d):
+                        is_toolchain_header = True
+                        break
+                if not is_toolchain_header:
+                    normalize_implicit_dependencies.append(self.context.get_file_arg(path, dependencies))
+            except ValueError:
+                # Path is on drive c:, build dir on drive d:
+                pass
         return normalize_implicit_dependencies
 
+    def _get_ninja_dependencies(self, output, sources, cwd):
+        ninja_dependencies = self.context.get_ninja_dependencies(output)
+        if ninja_dependencies is None:
+            return None
+        try:
+            return check_recorded_dependencies(
+                ninja_dependencies, os.path.getmtime(output), sources, cwd
+            )
+        except OSError:
+            return None
+
+    # Compilation without linking can be finished after the batch
+    # containing its sources is processed, as long as it doesn't refer
+    # to outputs of other build commands (e.g., object files).
+    # clang-cl doesn't print source file names, so its output can't be split.
+    def _can_batch_show_includes(self, namespace, is_clang_cl):
+        if self.show_includes_batch_size < 2 or is_clang_cl:
+            return False
+        if not namespace.compile_only or namespace.link_flags:
+            return False
+        if namespace.syntax_check_only or not namespace.infiles:
+            return False
+        for infile in namespace.infiles:
+            if os.path.splitext(infile)[1].lower() not in self.source_exts:
+                return False
+        return True
+
     def _get_clang_cl_toolchain_include_dirs(self, compiler):
         try:
             clang_cl_include_dirs_c = get_gcc_toolchain_include_dirs(
@@ -356,12 +627,12 @@ class MsvcCl(CompilerParser, LinkerParser):
         ))
 
         if not is_clang_cl:
-            namespace, _ = self.parser.parse_known_args(
-                tokens, unknown_dest="compile_flags"
+            namespace, _ = self.parse_arguments(
+                self.parser, tokens, unknown_dest="compile_flags"
             )
         else:
-            namespace, _ = self.clang_cl_parser.parse_known_args(
-                tokens, unknown_dest="compile_flags"
+            namespace, _ = self.parse_arguments(
+                self.clang_cl_parser, tokens, unknown_dest="compile_flags"
             )
             if self.clang_cl_include_dirs is None:
                 self.clang_cl_include_dirs = self._get_clang_cl_toolchain_include_dirs(
@@ -369,6 +640,14 @@ class MsvcCl(CompilerParser, LinkerParser):
                 )
                 logger.debug("clang-cl include dirs: %r" % self.clang_cl_include_dirs)
 
+        if self._can_batch_show_includes(namespace, is_clang_cl):
+            with self.context.allow_pending_targets():
+                return self._parse_namespace(
+                    target, compiler, is_clang_cl, namespace, batch=True
+                )
+        return self._parse_namespace(target, compiler, is_clang_cl, namespace)
+
+    def _parse_namespace(self, target, compiler, is_clang_cl, namespace, batch=False):
         lib_dirs = []
         dependencies = []
         if namespace.link_flags:
@@ -502,65 +781,80 @@ class MsvcCl(CompilerParser, LinkerParser):
                 compile_flags.append(f)
             namespace.compile_flags = compile_flags
 
-        targets = []
+        outputs = []
+        results = []
         for output, sources in output_dict.items():
-            deps_local = deepcopy(dependencies)
-            original_sources = []
-            for s in sources:
-                deps_local.extend(src_info[s["path"]]["dependencies"])
-                original_sources.append(src_info[s["path"]]["unmodified_path"])
-            normalize_implicit_dependencies = self._add_implicit_dependencies(
-                compiler,
-                deps_local,
-                compile_flags_not_relocatable,
-                include_dirs_not_relocatable,
-                original_sources,
-                self.context.working_dir,
-                is_clang_cl=is_clang_cl,
-            )
-            namespace.include_dirs.extend(
-                self.context.get_implicit_include_dirs(
-                    sources,
-                    namespace.include_dirs,
-                    normalize_implicit_dependencies,
+            original_sources = [src_info[s["path"]]["unmodified_path"] for s in sources]
+            outputs.append((output, sources))
+            results.append(
+                self._get_included_files(
+                    compiler,
+                    compile_flags_not_relocatable,
+                    include_dirs_not_relocatable,
+                    original_sources,
+                    self.context.working_dir,
+                    output=output if namespace.compile_only else None,
+                    batch=batch,
                 )
             )
-            import_lib = None
-            descr = {}
-            if namespace.compile_only:
-                module_type = ModuleTypes.object_lib
-            elif namespace.is_dll:
-                assert os_ext.Windows.is_shared_lib(output), output
-                module_type = ModuleTypes.shared_lib
-                descr = os_ext.Windows.parse_shared_lib(output)
-                import_lib = self.context.get_output(
-                    os.path.splitext(output)[0] + ".lib", deps_local
+
+        def _create_targets(included_files_list):
+            targets = []
+            for (output, sources), included_files in zip(outputs, included_files_list):
+                deps_local = deepcopy(dependencies)
+                for s in sources:
+                    deps_local.extend(src_info[s["path"]]["dependencies"])
+                normalize_implicit_dependencies = self._add_implicit_dependencies(
+                    deps_local, included_files, is_clang_cl=is_clang_cl
                 )
-            else:
-                module_type = ModuleTypes.executable
-                descr = os_ext.Windows.parse_executable(output)
-
-            output = self.context.get_output(output, deps_local)
-            name = descr.get("target_name")
-
-            LinkerParser.process_namespace(self, namespace)
-
-            targets.append(
-                get_module_target(
-                    module_type,
-                    name,
-                    output,
-                    msvc_import_lib=import_lib,
-                    compile_flags=namespace.compile_flags,
-                    dependencies=deps_local,
-                    include_dirs=namespace.include_dirs,
-                    link_flags=namespace.link_flags,
-                    objects=objects,
-                    libs=libs,
-                    sources=sources,
+                namespace.include_dirs.extend(
+                    self.context.get_implicit_include_dirs(
+                        sources,
+                        namespace.include_dirs,
+                        normalize_implicit_dependencies,
+                    )
                 )
-            )
-        return targets
+                import_lib = None
+                descr = {}
+                if namespace.compile_only:
+                    module_type = ModuleTypes.object_lib
+                elif namespace.is_dll:
+                    assert os_ext.Windows.is_shared_lib(output), output
+                    module_type = ModuleTypes.shared_lib
+                    descr = os_ext.Windows.parse_shared_lib(output)
+                    import_lib = self.context.get_output(
+                        os.path.splitext(output)[0] + ".lib", deps_local
+                    )
+                else:
+                    module_type = ModuleTypes.executable
+                    descr = os_ext.Windows.parse_executable(output)
+
+                output = self.context.get_output(output, deps_local)
+                name = descr.get("target_name")
+
+                LinkerParser.process_namespace(self, namespace)
+
+                targets.append(
+                    get_module_target(
+                        module_type,
+                        name,
+                        output,
+                        msvc_import_lib=import_lib,
+                        compile_flags=namespace.compile_flags,
+                        dependencies=deps_local,
+                        include_dirs=namespace.include_dirs,
+                        link_flags=namespace.link_flags,
+                        objects=objects,
+                        libs=libs,
+                        sources=sources,
+                    )
+                )
+            return targets
+
+        result = _ResultList(results)
+        if batch:
+            return DeferredTarget(result, _create_targets)
+        return _create_targets(result.get())
 
 
 __all__ = ["MsvcCl"]
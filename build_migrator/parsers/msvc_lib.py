@@ -13,6 +13,7 @@ class MsvcLib(Parser):
     lld_link_re = os_ext.Windows.get_program_path_re("lld-link")
 
     priority = 7
+    target_keys = ("tokens",)
 
     @staticmethod
     def add_arguments(arg_parser):
@@ -26,6 +26,7 @@ class MsvcLink(LinkerParser):
     lld_link_re = os_ext.Windows.get_program_path_re("lld-link")
 
     priority = 7
+    target_keys = ("tokens",)
 
     def __init__(self, context, ignore_link_flags=None):
         LinkerParser.__init__(self, context, ignore_link_flags=ignore_link_flags)
@@ -147,12 +148,14 @@ class MsvcLink(LinkerParser):
         tokens.pop(0)
 
         if is_lld_link:
-            namespace, _ = self.lld_link_parser.parse_known_args(
-                tokens, unknown_dest=["compile_flags", "link_flags"]
+            namespace, _ = self.parse_arguments(
+                self.lld_link_parser,
+                tokens,
+                unknown_dest=["compile_flags", "link_flags"],
             )
         else:
-            namespace, _ = self.parser.parse_known_args(
-                tokens, unknown_dest=["compile_flags", "link_flags"]
+            namespace, _ = self.parse_arguments(
+                self.parser, tokens, unknown_dest=["compile_flags", "link_flags"]
             )
 
         dependencies = []
@@ -12,6 +12,7 @@ logger = logging.getLogger(__name__)
 
 class MsvcMc(ParserBase):
     priority = 7
+    target_keys = ("tokens",)
 
     @staticmethod
     def add_arguments(arg_parser):
@@ -103,6 +103,7 @@ class MsvcMl(CompilerParser):
     filename_re = os_ext.Windows.get_program_path_re("ml", "ml64")
 
     priority = 7
+    target_keys = ("tokens",)
 
     def __init__(self, context, ignore_compile_flags=None):
         CompilerParser.__init__(
@@ -180,7 +181,7 @@ class MsvcMl(CompilerParser):
 
         tokens.pop(0)
 
-        namespace = self.parser.parse_args(tokens)
+        namespace = self.parse_arguments(self.parser, tokens, strict=True)
         assert namespace.compile_only
 
         dependencies = []
@@ -37,6 +37,7 @@ class MsvcRc(CompilerParser):
     filename_re = os_ext.Windows.get_program_path_re("rc")
 
     priority = 7
+    target_keys = ("tokens",)
 
     def __init__(self, context, ignore_compile_flags=None):
         CompilerParser.__init__(
@@ -85,8 +86,8 @@ class MsvcRc(CompilerParser):
 
         tokens.pop(0)
 
-        namespace, _ = self.parser.parse_known_args(
-            tokens, unknown_dest="compile_flags"
+        namespace, _ = self.parse_arguments(
+            self.parser, tokens, unknown_dest="compile_flags"
         )
 
         dependencies = []
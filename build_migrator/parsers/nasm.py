@@ -20,6 +20,7 @@ class Nasm(CompilerParser):
     filename_re = os_ext.Windows.get_program_path_re("nasm")
 
     priority = 7
+    target_keys = ("tokens",)
 
     def __init__(self, context, ignore_compile_flags=None):
         CompilerParser.__init__(
@@ -86,31 +87,39 @@ class Nasm(CompilerParser):
             + include_dir_args
             + [source]
         )
-        p = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd
-        )
-        stdout, stderr = p.communicate()
-        if type(stdout) is not str:
-            stdout = stdout.decode("utf-8", "replace")
-        if type(stderr) is not str:
-            stderr = stderr.decode("utf-8", "replace")
-        retcode = p.poll()
-        if retcode:
-            logger.error(
-                "Command '{}' returned non-zero exit code {}\n{}".format(
-                    " ".join(cmd), retcode, stderr
-                )
+        cache = self.context.implicit_dependency_cache
+        implicit_dependencies = None
+        if cache is not None:
+            implicit_dependencies = cache.get("nasm", cmd, cwd, [source])
+        if implicit_dependencies is None:
+            p = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd
             )
+            stdout, stderr = p.communicate()
+            if type(stdout) is not str:
+                stdout = stdout.decode("utf-8", "replace")
+            if type(stderr) is not str:
+                stderr = stderr.decode("utf-8", "replace")
+            retcode = p.poll()
+            if retcode:
+                logger.error(
+                    "Command '{}' returned non-zero exit code {}\n{}".format(
+                        " ".join(cmd), retcode, stderr
+                    )
+                )
 
-        implicit_dependencies = []
-        for line in stdout.splitlines():
-            files = line.rstrip("\\").lstrip().split(" ")
-            if len(files) > 1 and files[1] == ":":
-                files = [files[0] + files[1]] + files[2:]
-            for f in files:
-                if not f or f.endswith(":") or f == source:
-                    continue
-                implicit_dependencies.append(f)
+            implicit_dependencies = []
+            for line in stdout.splitlines():
+                files = line.rstrip("\\").lstrip().split(" ")
+                if len(files) > 1 and files[1] == ":":
+                    files = [files[0] + files[1]] + files[2:]
+                for f in files:
+                    if not f or f.endswith(":") or f == source:
+                        continue
+                    implicit_dependencies.append(f)
+            # don't store incomplete results
+            if not retcode and cache is not None:
+                cache.put("nasm", cmd, cwd, [source], implicit_dependencies)
         return [
             self.context.get_file_arg(self.context.normalize_path(dep), dependencies)
             for dep in implicit_dependencies
@@ -126,7 +135,7 @@ class Nasm(CompilerParser):
 
         compiler = tokens.pop(0)
 
-        namespace = self.parser.parse_args(tokens)
+        namespace = self.parse_arguments(self.parser, tokens, strict=True)
 
         dependencies = []
 
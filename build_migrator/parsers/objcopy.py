@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 
 
 class Objcopy(ParserBase):
+    target_keys = ("tokens",)
+
     def __init__(self, context):
         ParserBase.__init__(self, context)
 
@@ -12,6 +12,7 @@ logger = logging.getLogger(__name__)
 class Pkgdata(ParserBase):
     # Should be lower than MsvcRc (because we expect that rc target should present)
     priority = 7.1
+    target_keys = ("tokens",)
 
     def __init__(self, context):
         ParserBase.__init__(self, context)
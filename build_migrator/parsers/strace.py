@@ -1,8 +1,8 @@
 from copy import deepcopy
 import logging
 import os
-from pprint import pformat
 import re
+from build_migrator.common.logging_ex import lazy_pformat
 from build_migrator.modules import Parser
 from build_migrator.parsers._common.context_working_dir_workaround import (
     ContextWorkingDirWorkaround,
@@ -211,7 +211,7 @@ class StraceTokenizer(Parser):
     def parse_execve_syscall(self, target):
         execve_entry = self.execve_regex.split(target["strace.raw_arguments"])
 
-        logger.info("execve_entry: " + pformat(execve_entry))
+        logger.info("execve_entry: %s", lazy_pformat(execve_entry))
         if execve_entry[3] != "0":
             logger.debug("skipping execve with non-zero code")
             return []
@@ -221,7 +221,7 @@ class StraceTokenizer(Parser):
         )
         target["tokens"] = list(eval(execve_entry[2]))
 
-        logger.info("execve target: " + pformat(target))
+        logger.info("execve target: %s", lazy_pformat(target))
 
         return [target]
 
@@ -0,0 +1,2 @@
+#include "a.h"
+#include "include_sub/a_sub.h"
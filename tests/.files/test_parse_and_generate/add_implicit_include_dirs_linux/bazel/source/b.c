@@ -0,0 +1,3 @@
+#include "b.h"
+#include "b_src.h"
+#include "include_sub/b_sub.h"
\ No newline at end of file
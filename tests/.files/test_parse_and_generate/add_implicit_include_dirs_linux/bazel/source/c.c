@@ -0,0 +1 @@
+#include "include/c.h"
\ No newline at end of file
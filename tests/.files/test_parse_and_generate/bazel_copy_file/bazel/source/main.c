@@ -0,0 +1 @@
+int main (void) { return 0; }
\ No newline at end of file
@@ -0,0 +1 @@
+// build
\ No newline at end of file
@@ -0,0 +1,6 @@
+#include "external.h"
+
+int main()
+{
+	return 0;
+}
\ No newline at end of file
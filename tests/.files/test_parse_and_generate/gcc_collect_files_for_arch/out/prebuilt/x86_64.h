@@ -0,0 +1 @@
+#pragma message("x86_64")
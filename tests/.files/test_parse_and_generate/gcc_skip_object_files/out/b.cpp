@@ -0,0 +1,8 @@
+#include "b.h"
+#include <iostream>
+
+int b()
+{
+    std::cout << MSG_B << std::endl;
+    return 1;
+}
\ No newline at end of file
@@ -0,0 +1 @@
+#include <sqlite.h>
@@ -0,0 +1,3 @@
+#include "common.h"
+
+int b(void) { return COMMON; }
@@ -0,0 +1 @@
+#define A 1
@@ -0,0 +1,2 @@
+#include <openssl/ssl.h>
+#include <openssl/bio.h>
@@ -0,0 +1 @@
+// source
\ No newline at end of file
@@ -0,0 +1 @@
+void foo() {}
\ No newline at end of file
@@ -0,0 +1,6 @@
+extern "C" int lib(int a, int b);
+
+int main()
+{
+    return lib(42, 100500);
+}
@@ -257,6 +257,7 @@ class TestBase(unittest.TestCase):
         source_subdir=None,
         flag_optimizer_ver=None,
         test_data_dir=None,
+        metrics_out=None,
         **kwargs
     ):
         if test_data_dir is None:
@@ -374,6 +375,8 @@ class TestBase(unittest.TestCase):
             )
 
         migrator = BuildMigrator(modules)
+        if metrics_out:
+            migrator.enable_metrics()
 
         targets = []
         if load:
@@ -399,6 +402,9 @@ class TestBase(unittest.TestCase):
             self.assertTrue(os.path.exists(result_cmake))
             self.assertFilesEqual(expected_cmake, result_cmake)
 
+        if metrics_out:
+            migrator.save_metrics(metrics_out)
+
     def parse_and_generate_bazel(
         self,
         test_platform,
@@ -0,0 +1,727 @@
+"""Benchmark suite for parse / optimize / generate stages.
+
+Generates synthetic projects (sources, headers, stub compilers and archivers,
+build log of the selected type) at configurable scale, runs BuildMigrator
+on them and reports wall time of each stage, as well as save / load time
+and size of Build Object Model in pickle and .bom formats. Everything runs
+offline on Linux: stub tools are shell scripts, no real compiler is required.
+
+Usage:
+    # measure and store baseline
+    python tests/benchmark.py --scale 1000 10000 --save baseline.json
+    # compare with baseline, exit code 1 on regressions above 20%
+    python tests/benchmark.py --scale 1000 10000 --compare baseline.json
+    # compare memory used by dictionaries and compact records
+    python tests/benchmark.py --bom_sources 100000
+    # compare memory used by GroupCommonFlagsV2 with and without BOM copy
+    python tests/benchmark.py --optimizer_sources 20000
+
+See also BUILD_MIGRATOR_BENCHMARK* environment variables in test_performance.py.
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import time
+from copy import deepcopy
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(__module_dir))
+sys.path.insert(0, __module_dir)
+from build_migrator import BuildMigrator, ModuleLoader, SettingsLoader  # noqa: E402
+from build_migrator.modules import ModuleGroups  # noqa: E402
+from build_migrator.optimizers.group_common_flags_v2 import (  # noqa: E402
+    GroupCommonFlagsV2,
+)
+from build_migrator.common.algorithm import get_subdict  # noqa: E402
+from build_migrator.common.metrics import get_peak_rss  # noqa: E402
+from build_migrator.common.vocabulary import Vocabulary  # noqa: E402
+from build_migrator.helpers import (  # noqa: E402
+    ModuleTypes,
+    get_module_target,
+    get_source_file_reference,
+)
+from test_ninja_deps import write_ninja_deps  # noqa: E402
+
+
+logger = logging.getLogger(__name__)
+
+log_types = ("make", "ninja", "strace", "msbuild")
+stages = ("parse", "optimize", "generate")
+# Build Object Model file formats, see BuildMigrator.save_build_object_model()
+bom_formats = ("pickle", "bom")
+# In-memory representations of targets: plain dictionaries
+# and compact records created by helpers (see build_migrator.common.records)
+memory_layouts = ("dict", "record")
+# How GroupCommonFlagsV2 keeps its input intact if optimization fails:
+# a copy of Build Object Model (previous implementation)
+# or a journal of edits (see build_migrator.common.transaction)
+optimizer_modes = ("copy", "transaction")
+
+# Imitates 'cc -M': prints make rule with source files and
+# their '#include "..."' headers. Other invocations do nothing.
+_cc_stub = """#!/bin/sh
+preprocess=
+include_dir=.
+for arg in "$@"; do
+    case "$arg" in
+        -M) preprocess=1 ;;
+        -I*) include_dir="${arg#-I}" ;;
+    esac
+done
+[ -z "$preprocess" ] && exit 0
+for arg in "$@"; do
+    case "$arg" in
+        *.c)
+            printf '%s.o: %s' "$(basename "$arg" .c)" "$arg"
+            sed -n "s|^#include \\"\\(.*\\)\\"\\$| $include_dir/\\1|p" "$arg" | tr -d '\\n'
+            echo
+            ;;
+    esac
+done
+"""
+
+# Imitates output of 'cl.exe /Zs /showIncludes':
+# name of each source file followed by its includes.
+_cl_stub = """#!/bin/sh
+include_dir=.
+for arg in "$@"; do
+    case "$arg" in
+        /I* | -I*) include_dir="${arg#??}" ;;
+    esac
+done
+for arg in "$@"; do
+    case "$arg" in
+        *.c)
+            basename "$arg"
+            sed -n "s|^#include \\"\\(.*\\)\\"\\$|Note: including file: $include_dir/\\1|p" "$arg"
+            ;;
+    esac
+done
+"""
+
+# Archiver, linker
+_noop_stub = """#!/bin/sh
+exit 0
+"""
+
+
+class SyntheticProject(object):
+    """Synthetic C project built by single log of the given type.
+
+    commands: number of compile commands (one source file each)
+    sources_per_lib: number of sources linked into each library
+    dependency_depth: length of library dependency chains
+        (each library links the previous one)
+    flags: number of compile flags per command, half of them are shared
+        by all commands, the rest are shared by sources of the same library
+    headers: number of headers included by each source
+    preprocess_every: every N-th compile command has no recorded dependencies
+        (depfile, .ninja_deps), so they are obtained from the stub compiler.
+        0 disables it. Not applicable to msbuild logs, where all dependencies
+        are obtained from the stub 'cl /showIncludes'.
+
+    msbuild logs link executables instead of libraries: static and import
+    libraries can be parsed only on Windows hosts. dependency_depth
+    is not applicable to them.
+    """
+
+    def __init__(
+        self,
+        path,
+        log_type,
+        commands,
+        sources_per_lib=50,
+        dependency_depth=10,
+        flags=20,
+        headers=5,
+        preprocess_every=10,
+    ):
+        if log_type not in log_types:
+            raise ValueError("Unknown log type: %s" % log_type)
+        self.path = os.path.abspath(path)
+        self.log_type = log_type
+        self.commands = commands
+        self.sources_per_lib = sources_per_lib
+        self.dependency_depth = dependency_depth
+        self.flags = flags
+        self.headers = headers
+        self.preprocess_every = preprocess_every
+        self.source_dir = os.path.join(self.path, "source")
+        self.build_dir = os.path.join(self.path, "build")
+        self.tools_dir = os.path.join(self.path, "tools")
+        self.log = os.path.join(self.path, "build.log")
+
+    @property
+    def platform(self):
+        return "windows" if self.log_type == "msbuild" else "linux"
+
+    @property
+    def libs(self):
+        return (self.commands + self.sources_per_lib - 1) // self.sources_per_lib
+
+    def get_presets(self):
+        if self.log_type == "msbuild":
+            return ["windows", "msbuild"]
+        if self.log_type == "make":
+            return ["linux", "autotools"]
+        return ["linux", self.log_type]
+
+    def get_settings(self):
+        """BuildMigrator settings required to parse the project"""
+        settings = {
+            "logs": [self.log],
+            "source_dir": self.source_dir,
+            "build_dirs": [self.build_dir],
+        }
+        if self.log_type == "msbuild":
+            settings["tokenizer_ruleset"] = "posix"
+            settings["show_includes_batch_size"] = self.sources_per_lib
+        return settings
+
+    def _write(self, path, content):
+        with open(path, "w") as f:
+            f.write(content)
+
+    def _write_tool(self, name, content):
+        path = os.path.join(self.tools_dir, name)
+        self._write(path, content)
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP)
+        return path
+
+    def _get_headers(self, idx):
+        return ["h%d.h" % ((idx + i) % 100) for i in range(self.headers)]
+
+    def _get_flags(self, lib):
+        common = self.flags // 2
+        result = ["-DCOMMON_%d" % i for i in range(common)]
+        result += ["-DLIB%d_%d" % (lib, i) for i in range(self.flags - common)]
+        if self.log_type == "msbuild":
+            result = ["/" + f[1:] for f in result]
+        return result
+
+    def _get_dependency(self, lib):
+        if lib % self.dependency_depth == 0:
+            return None
+        return lib - 1
+
+    def _iter_libs(self):
+        """Yields (lib, [source indices])"""
+        for lib in range(self.libs):
+            first = lib * self.sources_per_lib
+            last = min(first + self.sources_per_lib, self.commands)
+            yield lib, list(range(first, last))
+
+    def create(self):
+        """Writes sources, stub tools and build log. Build artifacts
+        (outputs, depfiles, .ninja_deps) are written after sources,
+        so recorded dependencies are up to date."""
+        if os.path.exists(self.path):
+            shutil.rmtree(self.path)
+        include_dir = os.path.join(self.source_dir, "include")
+        for d in [include_dir, self.build_dir, self.tools_dir]:
+            os.makedirs(d)
+
+        for i in range(100):
+            self._write(os.path.join(include_dir, "h%d.h" % i), "#pragma once\n")
+        for idx in range(self.commands):
+            self._write(
+                os.path.join(self.source_dir, "s%d.c" % idx),
+                "".join('#include "%s"\n' % h for h in self._get_headers(idx))
+                + "int s%d(void) { return %d; }\n" % (idx, idx),
+            )
+
+        writer = getattr(self, "_write_%s_log" % self.log_type)
+        with open(self.log, "w") as f:
+            writer(f)
+
+    def _has_recorded_dependencies(self, idx):
+        return not self.preprocess_every or (idx + 1) % self.preprocess_every
+
+    def _get_compile_args(self, lib, idx, include_dir):
+        args = ["-c"] + self._get_flags(lib) + ["-I" + include_dir]
+        args += ["-o", "s%d.o" % idx, "../source/s%d.c" % idx]
+        if self._has_recorded_dependencies(idx) and self.log_type != "ninja":
+            args[1:1] = ["-MD", "-MF", "s%d.d" % idx]
+        return args
+
+    def _iter_unix_commands(self):
+        """Yields (args, recorded dependencies or None, output)
+        in the build order."""
+        cc = self._write_tool("cc", _cc_stub)
+        ar = self._write_tool("ar", _noop_stub)
+        include_dir = "../source/include"
+        for lib, sources in self._iter_libs():
+            for idx in sources:
+                deps = None
+                if self._has_recorded_dependencies(idx):
+                    deps = ["../source/s%d.c" % idx] + [
+                        include_dir + "/" + h for h in self._get_headers(idx)
+                    ]
+                yield (
+                    [cc] + self._get_compile_args(lib, idx, include_dir),
+                    deps,
+                    "s%d.o" % idx,
+                )
+            objects = ["s%d.o" % idx for idx in sources]
+            yield [ar, "cr", "lib%d.a" % lib] + objects, None, "lib%d.a" % lib
+            dependency = self._get_dependency(lib)
+            args = [cc, "-shared", "-o", "lib%d.so" % lib] + objects
+            if dependency is not None:
+                args.append("lib%d.so" % dependency)
+            yield args, None, "lib%d.so" % lib
+
+    def _write_outputs(self, commands):
+        ninja_deps = []
+        for args, deps, output in commands:
+            if deps is not None:
+                if self.log_type == "ninja":
+                    ninja_deps.append((output, deps))
+                else:
+                    depfile = os.path.join(self.build_dir, output[:-2] + ".d")
+                    self._write(depfile, "%s: %s\n" % (output, " ".join(deps)))
+            self._write(os.path.join(self.build_dir, output), "")
+        if ninja_deps:
+            write_ninja_deps(os.path.join(self.build_dir, ".ninja_deps"), ninja_deps)
+
+    def _write_make_log(self, f):
+        commands = list(self._iter_unix_commands())
+        f.write("make[1]: Entering directory '%s'\n" % self.build_dir)
+        for args, _, output in commands:
+            f.write(" ".join(args) + "\n")
+        f.write("make[1]: Leaving directory '%s'\n" % self.build_dir)
+        self._write_outputs(commands)
+
+    def _write_ninja_log(self, f):
+        commands = list(self._iter_unix_commands())
+        for idx, (args, _, _) in enumerate(commands, 1):
+            f.write("[%d/%d] %s\n" % (idx, len(commands), " ".join(args)))
+        self._write_outputs(commands)
+
+    def _write_strace_log(self, f):
+        commands = list(self._iter_unix_commands())
+        f.write('1    chdir("%s") = 0\n' % self.build_dir)
+        for idx, (args, _, _) in enumerate(commands, 2):
+            f.write("1    vfork() = %d\n" % idx)
+            f.write(
+                '%d    execve("%s", [%s], [/* 2 vars */]) = 0\n'
+                % (idx, args[0], ", ".join('"%s"' % a for a in args))
+            )
+            f.write("%d    exit_group(0)                     = ?\n" % idx)
+            f.write("%d    +++ exited with 0 +++\n" % idx)
+        self._write_outputs(commands)
+
+    def _write_msbuild_log(self, f):
+        cl = self._write_tool("cl", _cl_stub)
+        link = self._write_tool("link", _noop_stub)
+        include_dir = os.path.join(self.source_dir, "include")
+        sln = os.path.join(self.source_dir, "project.sln")
+        f.write('Project "%s" on node 1 (Build target(s)).\n' % sln)
+        outputs = []
+        for lib, sources in self._iter_libs():
+            project = os.path.join(self.source_dir, "lib%d.vcxproj" % lib)
+            obj_dir = "%s/lib%d/" % (self.build_dir, lib)
+            f.write(
+                'Project "%s" (1) is building "%s" (%d) on node 1 (default targets).\n'
+                % (sln, project, lib + 2)
+            )
+            f.write("ClCompile:\n")
+            args = [cl, "/c", "/nologo"] + self._get_flags(lib)
+            args += ["/I" + include_dir, "/Fo" + obj_dir]
+            args += ["s%d.c" % idx for idx in sources]
+            f.write("  " + " ".join(args) + "\n")
+            for idx in sources:
+                f.write("  s%d.c\n" % idx)
+                outputs.append(obj_dir + "s%d.obj" % idx)
+            output = "%s/app%d.exe" % (self.build_dir, lib)
+            f.write("Link:\n")
+            f.write("  %s /OUT:%s /NOLOGO\n" % (link, output))
+            # relative to project directory: absolute Unix paths
+            # look like options to link.exe
+            for idx in sources:
+                f.write("  ../build/lib%d/s%d.obj\n" % (lib, idx))
+            f.write("  lib%d.vcxproj -> %s\n" % (lib, output))
+            f.write("FinalizeBuildStatus:\n")
+            outputs.append(output)
+        for output in outputs:
+            if not os.path.exists(os.path.dirname(output)):
+                os.makedirs(os.path.dirname(output))
+            self._write(output, "")
+
+
+def measure_bom_formats(migrator, targets, out_dir):
+    """Returns save and load time (in seconds) and file size (in bytes)
+    of Build Object Model in each of bom_formats"""
+    result = {}
+    for bom_format in bom_formats:
+        path = os.path.join(out_dir, "bom." + bom_format)
+        start = time.time()
+        migrator.save_build_object_model(path, targets)
+        result["save_" + bom_format] = time.time() - start
+        start = time.time()
+        migrator.load_build_object_model(path)
+        result["load_" + bom_format] = time.time() - start
+        result["size_" + bom_format] = os.path.getsize(path)
+    return result
+
+
+def run_benchmark(project, out_dir, repeat=1, **settings):
+    """Runs parse, optimize and generate stages on SyntheticProject,
+    returns the best wall time of each stage (in seconds) and the number
+    of targets in Build Object Model after parsing and after optimization,
+    as well as save / load time and size of Build Object Model after parsing
+    (see measure_bom_formats())."""
+    loader = SettingsLoader()
+    settings = loader.merge(
+        loader.load(project.get_presets()), dict(project.get_settings(), **settings)
+    )
+    settings["out_dir"] = out_dir
+    modules = ModuleLoader(settings.get("module_dirs")).load(
+        **get_subdict(
+            settings,
+            ModuleGroups.BUILDERS,
+            ModuleGroups.PARSERS,
+            ModuleGroups.OPTIMIZERS,
+            ModuleGroups.GENERATORS,
+        )
+    )
+
+    result = None
+    for _ in range(repeat):
+        if os.path.exists(out_dir):
+            shutil.rmtree(out_dir)
+        os.makedirs(out_dir)
+        migrator = BuildMigrator(modules)
+        metrics = migrator.enable_metrics()
+        targets = migrator.parse([], **settings)
+        bom_measurement = measure_bom_formats(migrator, targets, out_dir)
+        targets = migrator.optimize(targets, **settings)
+        migrator.generate(targets, **settings)
+        measurement = {"peak_rss": metrics.stages["generate"]["peak_rss"]}
+        for stage in stages:
+            measurement[stage] = metrics.stages[stage]["time"]
+            if "targets" in metrics.stages[stage]:
+                measurement[stage + "_targets"] = metrics.stages[stage]["targets"]
+        measurement["total"] = sum(measurement[stage] for stage in stages)
+        measurement.update(bom_measurement)
+        if result is None or measurement["total"] < result["total"]:
+            result = measurement
+    return result
+
+
+def _to_dict(target):
+    result = dict(target.items())
+    if result.get("sources"):
+        result["sources"] = [dict(s.items()) for s in result["sources"]]
+    return result
+
+
+def get_synthetic_bom(sources, layout, sources_per_lib=50, flags=20, headers=5):
+    """Returns Build Object Model as it is after parsing: object library
+    per source file, with flags and include directories, and static library
+    per sources_per_lib sources. Strings are interned, as in parsers."""
+    vocabulary = Vocabulary()
+    targets = []
+
+    def add(target):
+        vocabulary.intern_target(target)
+        if layout == "dict":
+            target = _to_dict(target)
+        targets.append(target)
+
+    for lib in range((sources + sources_per_lib - 1) // sources_per_lib):
+        objects = []
+        first = lib * sources_per_lib
+        for idx in range(first, min(first + sources_per_lib, sources)):
+            compile_flags = ["-DCOMMON_%d" % i for i in range(flags // 2)]
+            compile_flags += ["-DLIB%d_%d" % (lib, i) for i in range(flags // 2)]
+            include_dirs = ["@source_dir@/include%d" % i for i in range(headers)]
+            output = "@build_dir@/lib%d/src%d.o" % (lib, idx)
+            source = get_source_file_reference(
+                "@source_dir@/lib%d/src%d.c" % (lib, idx),
+                "C",
+                compile_flags,
+                include_dirs,
+            )
+            target = get_module_target(
+                ModuleTypes.object_lib,
+                None,
+                output,
+                sources=[source],
+                dependencies=[source["path"]],
+            )
+            add(target)
+            objects.append(output)
+        target = get_module_target(
+            ModuleTypes.static_lib,
+            "lib%d" % lib,
+            "@build_dir@/liblib%d.a" % lib,
+            objects=objects,
+            dependencies=list(objects),
+        )
+        add(target)
+    return targets
+
+
+def _measure_bom_memory(sources, layout):
+    """Returns growth of peak RSS of current process (in bytes)
+    caused by creation of synthetic Build Object Model"""
+    start = get_peak_rss()
+    targets = get_synthetic_bom(sources, layout)
+    result = get_peak_rss() - start
+    del targets
+    return result
+
+
+def _measure_in_subprocess(args):
+    """Runs this script with given arguments, returns the number
+    it prints. Peak RSS never decreases, so each measurement
+    needs a new process."""
+    output = subprocess.check_output([sys.executable, os.path.abspath(__file__)] + args)
+    return int(output.decode().strip().splitlines()[-1])
+
+
+def measure_bom_memory(sources):
+    """Returns growth of peak RSS (in bytes) caused by synthetic
+    Build Object Model of given number of sources in each of memory_layouts."""
+    result = {}
+    for layout in memory_layouts:
+        result["rss_" + layout] = _measure_in_subprocess(
+            ["--measure_bom_memory", layout, "--bom_sources", str(sources)]
+        )
+    return result
+
+
+def _measure_optimizer_memory(sources, mode):
+    """Returns growth of peak RSS of current process (in bytes) caused by
+    aggressive GroupCommonFlagsV2 optimization of synthetic Build Object Model"""
+    targets = get_synthetic_bom(sources, "record")
+    context = argparse.Namespace(platform_name="linux", vocabulary=Vocabulary())
+    optimizer = GroupCommonFlagsV2(
+        context, flag_optimizer_ver=2, aggressive_optimization=True
+    )
+    start = get_peak_rss()
+    # targets are kept alive by caller during optimization (see OptimizerContext)
+    optimizer.optimize(deepcopy(targets) if mode == "copy" else targets)
+    return get_peak_rss() - start
+
+
+def measure_optimizer_memory(sources):
+    """Returns growth of peak RSS (in bytes) caused by GroupCommonFlagsV2
+    optimization of synthetic Build Object Model of given number of sources
+    in each of optimizer_modes."""
+    result = {}
+    for mode in optimizer_modes:
+        result["rss_" + mode] = _measure_in_subprocess(
+            ["--measure_optimizer_memory", mode, "--optimizer_sources", str(sources)]
+        )
+    return result
+
+
+def get_benchmark_name(log_type, commands):
+    return "%s-%d" % (log_type, commands)
+
+
+def compare(baseline, results, threshold, min_delta=0.05):
+    """Returns list of regressions (name, stage, baseline time, time): stages
+    that are slower than in baseline by more than threshold (0.2 = 20%)
+    and min_delta seconds. Benchmarks missing in baseline are ignored."""
+    regressions = []
+    for name, result in sorted(results.items()):
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for stage in stages + ("total",):
+            if stage not in expected:
+                continue
+            delta = result[stage] - expected[stage]
+            if delta > min_delta and delta > expected[stage] * threshold:
+                regressions.append((name, stage, expected[stage], result[stage]))
+    return regressions
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)["benchmarks"]
+
+
+def save_baseline(path, results):
+    with open(path, "w") as f:
+        json.dump({"version": 1, "benchmarks": results}, f, indent=2, sort_keys=True)
+
+
+def run_benchmarks(work_dir, log_types, scales, repeat=1, **project_args):
+    """Returns {benchmark name => run_benchmark() result}"""
+    results = {}
+    for scale in scales:
+        for log_type in log_types:
+            name = get_benchmark_name(log_type, scale)
+            project = SyntheticProject(
+                os.path.join(work_dir, name), log_type, scale, **project_args
+            )
+            start = time.time()
+            project.create()
+            logger.warning(
+                "%s: generated in %.2f s, running benchmark",
+                name,
+                time.time() - start,
+            )
+            results[name] = run_benchmark(
+                project, os.path.join(work_dir, name + "-out"), repeat=repeat
+            )
+            logger.warning(
+                "%s: %s",
+                name,
+                ", ".join(
+                    "%s %.3f s" % (stage, results[name][stage])
+                    for stage in stages + ("total",)
+                ),
+            )
+            logger.warning(
+                "%s: Build Object Model %s",
+                name,
+                ", ".join(
+                    "%s: save %.3f s, load %.3f s, %d bytes"
+                    % (
+                        bom_format,
+                        results[name]["save_" + bom_format],
+                        results[name]["load_" + bom_format],
+                        results[name]["size_" + bom_format],
+                    )
+                    for bom_format in bom_formats
+                ),
+            )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark BuildMigrator on synthetic build logs"
+    )
+    parser.add_argument(
+        "--work_dir",
+        default=os.path.join(os.path.dirname(__module_dir), ".files", "benchmark"),
+        help="Directory for generated projects. Default: .files/benchmark",
+    )
+    parser.add_argument("--logs", nargs="+", choices=log_types, default=log_types)
+    parser.add_argument(
+        "--scale",
+        nargs="+",
+        type=int,
+        default=[1000],
+        metavar="N",
+        help="Number of compile commands in each log. Default: 1000.",
+    )
+    parser.add_argument("--sources_per_lib", type=int, default=50)
+    parser.add_argument("--dependency_depth", type=int, default=10)
+    parser.add_argument("--flags", type=int, default=20)
+    parser.add_argument("--headers", type=int, default=5)
+    parser.add_argument("--preprocess_every", type=int, default=10)
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Report the best of N runs."
+    )
+    parser.add_argument("--save", metavar="PATH", help="Save results as baseline.")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="Compare results with baseline."
+    )
+    parser.add_argument(
+        "--bom_sources",
+        type=int,
+        metavar="N",
+        help="Measure memory used by Build Object Model with N sources "
+        "in each of memory layouts (%s)." % ", ".join(memory_layouts),
+    )
+    parser.add_argument(
+        "--measure_bom_memory", choices=memory_layouts, help=argparse.SUPPRESS
+    )
+    parser.add_argument(
+        "--optimizer_sources",
+        type=int,
+        metavar="N",
+        help="Measure memory used by GroupCommonFlagsV2 on Build Object Model "
+        "with N sources in each of modes (%s)." % ", ".join(optimizer_modes),
+    )
+    parser.add_argument(
+        "--measure_optimizer_memory", choices=optimizer_modes, help=argparse.SUPPRESS
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as regression. Default: 0.2.",
+    )
+    args = parser.parse_args(argv)
+
+    # base.py (imported by test_ninja_deps) enables debug logging
+    logging.getLogger().setLevel(logging.WARNING)
+    if args.measure_bom_memory:
+        # child process of measure_bom_memory()
+        print(_measure_bom_memory(args.bom_sources, args.measure_bom_memory))
+        return 0
+    if args.measure_optimizer_memory:
+        # child process of measure_optimizer_memory()
+        print(
+            _measure_optimizer_memory(
+                args.optimizer_sources, args.measure_optimizer_memory
+            )
+        )
+        return 0
+    if args.bom_sources:
+        result = measure_bom_memory(args.bom_sources)
+        print(
+            "Build Object Model with {} sources: {}".format(
+                args.bom_sources,
+                ", ".join(
+                    "{} {:.1f} MiB".format(layout, result["rss_" + layout] / 2.0 ** 20)
+                    for layout in memory_layouts
+                ),
+            )
+        )
+        return 0
+    if args.optimizer_sources:
+        result = measure_optimizer_memory(args.optimizer_sources)
+        print(
+            "GroupCommonFlagsV2 on {} sources: {}".format(
+                args.optimizer_sources,
+                ", ".join(
+                    "{} {:.1f} MiB".format(mode, result["rss_" + mode] / 2.0 ** 20)
+                    for mode in optimizer_modes
+                ),
+            )
+        )
+        return 0
+    results = run_benchmarks(
+        args.work_dir,
+        args.logs,
+        args.scale,
+        repeat=args.repeat,
+        sources_per_lib=args.sources_per_lib,
+        dependency_depth=args.dependency_depth,
+        flags=args.flags,
+        headers=args.headers,
+        preprocess_every=args.preprocess_every,
+    )
+    if args.save:
+        save_baseline(args.save, results)
+
+    if args.compare:
+        regressions = compare(load_baseline(args.compare), results, args.threshold)
+        for name, stage, expected, actual in regressions:
+            print(
+                "REGRESSION {} {}: {:.3f} s -> {:.3f} s (+{:.0%})".format(
+                    name, stage, expected, actual, actual / expected - 1
+                )
+            )
+        if regressions:
+            return 1
+        print("No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+#define GENERATED 1
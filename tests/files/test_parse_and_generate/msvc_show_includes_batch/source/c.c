@@ -0,0 +1,3 @@
+#include "c.h"
+
+int main(void) { return C; }
@@ -0,0 +1 @@
+#define C 3
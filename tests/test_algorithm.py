@@ -1,4 +1,6 @@
+import functools
 import os
+import random
 import sys
 
 __module_dir = os.path.dirname(os.path.abspath(__file__))
@@ -7,6 +9,9 @@ import base  # noqa: E402
 from build_migrator.common.algorithm import (
     add_unique_stable,
     add_unique_stable_by_key,
+    common_set_engines,
+    common_set_finder_engines,
+    get_common_set_finder,
     intersect_unique_stable,
     find_best_common_set,
     FitnessByTotalStringLength,
@@ -104,6 +109,12 @@ class TestAlgorithms(base.TestBase):
         self.assertListEqual([], r)
 
     def test_find_best_common_set(self):
+        for engine in common_set_engines:
+            self._test_find_best_common_set(
+                functools.partial(find_best_common_set, engine=engine)
+            )
+
+    def _test_find_best_common_set(self, find_best_common_set):
         cs, f = find_best_common_set([{1, 2, 3, 4}, {2, 3, 4}, {3, 4, 5}, {3, 4}])
         self.assertSetEqual({3, 4}, cs)
         self.assertEqual(2, f)
@@ -210,3 +221,53 @@ class TestAlgorithms(base.TestBase):
             cs,
         )
         self.assertEqual(101, f)
+
+    def test_find_best_common_set_engines(self):
+        rnd = random.Random(0)
+        for _ in range(500):
+            lengths = [rnd.randint(1, 30) for _ in range(rnd.randint(0, 40))]
+            values = list(range(len(lengths)))
+            sets = [
+                set(rnd.sample(values, rnd.randint(0, len(values))))
+                for _ in range(rnd.randint(0, 15))
+            ]
+            for fitness_func in [
+                fitness_by_set_length,
+                FitnessByTotalStringLength(rnd.randint(1, 20), lengths),
+                # not vectorized
+                lambda candidate, sets: len(sets) * len(candidate) - 3 * len(candidate),
+            ]:
+                self.assertEqual(
+                    find_best_common_set(sets, fitness_func, engine="sets"),
+                    find_best_common_set(sets, fitness_func, engine="bitset"),
+                )
+
+    def test_common_set_finder_engines(self):
+        rnd = random.Random(0)
+        for _ in range(300):
+            lengths = [rnd.choice([3, 5, rnd.randint(1, 30)]) for _ in range(40)]
+            values = list(range(len(lengths)))
+            sets = []
+            for _ in range(rnd.randint(0, 20)):
+                # overlapping ranges of values, as flags of targets
+                first = rnd.randint(0, len(values) - 1)
+                set_ = set(values[first : first + rnd.randint(0, 12)])
+                set_.update(rnd.sample(values, rnd.randint(0, 3)))
+                sets.append(set_)
+
+            results = []
+            for engine in common_set_finder_engines:
+                finder = get_common_set_finder(
+                    [set(s) for s in sets], lengths, engine=engine
+                )
+                result = []
+                for increment in range(1, 100):
+                    total_length = finder.get_total_length()
+                    common_set, fitness = finder.find(len("@flags_%d@" % increment))
+                    result.append((total_length, common_set, fitness))
+                    if common_set is None:
+                        break
+                    result.append((finder.extract(), [set(s) for s in finder.sets]))
+                results.append(result)
+            for result in results[1:]:
+                self.assertEqual(results[0], result)
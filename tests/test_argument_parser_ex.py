@@ -1,3 +1,4 @@
+from argparse import Namespace
 from copy import deepcopy
 import os
 import re
@@ -6,7 +7,10 @@ import sys
 __module_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, __module_dir)
 import base  # noqa: E402
-from build_migrator.common.argument_parser_ex import ArgumentParserEx  # noqa: E402
+from build_migrator.common.argument_parser_ex import (  # noqa: E402
+    ArgumentParserEx,
+    ParseMemo,
+)
 
 
 class TestArgumentParserEx(base.TestBase):
@@ -960,6 +964,112 @@ class TestArgumentParserEx(base.TestBase):
         self.assertListEqual(["-b", "1"], remaining)
         self.assertIsNone(vars(ns).get("b"))
 
+    def test_initial_values_are_not_modified(self):
+        parser = ArgumentParserEx()
+        parser.add_argument("-I", dest="include_dirs", action="append")
+        parser.add_argument("-D", dest="definitions", action="append", nargs=2)
+        parser.add_argument("infiles", nargs="*", raw_dest="args")
+
+        tokens = ["-Ia", "a.c", "-D", "X", "1", "-Ib", "b.c", "-D", "Y"]
+        include_dirs = ["z"]
+        namespace = Namespace(include_dirs=include_dirs)
+        ns, remaining = parser.parse_known_args(tokens, namespace=namespace)
+        self.assertListEqual(["z", "a", "b"], ns.include_dirs)
+        self.assertListEqual([["X", "1"]], ns.definitions)
+        # '-D Y' is rolled back: not enough values
+        self.assertListEqual(["a.c", "b.c", "Y"], ns.infiles)
+        self.assertListEqual(["a.c", "b.c", "Y"], ns.args)
+        self.assertListEqual(["-D"], remaining)
+        self.assertListEqual(["z"], include_dirs)
+        self.assertListEqual(
+            ["-Ia", "a.c", "-D", "X", "1", "-Ib", "b.c", "-D", "Y"], tokens
+        )
+
+    def test_overlapping_prefixes(self):
+        # rules are tried in order of addition, regardless of prefix length
+        parser = ArgumentParserEx()
+        parser.add_argument("-Wl,", dest="linker_flags", action="append", prefix=True)
+        parser.add_argument("-W", dest="warnings", action="append", prefix=True)
+        parser.add_argument("-Wp,", dest="preprocessor_flags", action="append")
+        parser.add_argument(prefixes=["/Fo"], dest="output", ignore_case=True)
+        parser.add_argument("infiles", nargs="*")
+
+        ns = parser.parse_args(
+            ["-Wall", "-Wl,-z,defs", "a.c", "-Wp,-MD", "/fOa.obj", "-W", "error"]
+        )
+        self.assertListEqual(["-z,defs"], ns.linker_flags)
+        self.assertListEqual(["all", "p,-MD", "error"], ns.warnings)
+        self.assertIsNone(ns.preprocessor_flags)
+        self.assertEqual("a.obj", ns.output)
+        self.assertListEqual(["a.c"], ns.infiles)
+
+    def test_memo(self):
+        resolved = []
+
+        def resolve(state, dest, value):
+            resolved.append(value[0])
+            state.set_attribute(dest, "resolved/" + value[0])
+
+        parser = ArgumentParserEx()
+        parser.memo = ParseMemo(size=2)
+        parser.add_argument("-D", dest="definitions", action="append")
+        parser.add_argument("-o", dest="output")
+        parser.add_argument("-g", nargs="?")
+        parser.add_argument("--map", handler=resolve)
+        parser.add_argument("infiles", nargs="*")
+
+        def parse(tokens):
+            ns, remaining = parser.parse_known_args(tokens, unknown_dest="flags")
+            return vars(ns), remaining
+
+        self.assertEqual(
+            (
+                {
+                    "definitions": ["A", "B"],
+                    "flags": ["-x"],
+                    "g": None,
+                    "infiles": ["a.c"],
+                    "map": None,
+                    "output": "a.o",
+                },
+                ["-x"],
+            ),
+            parse(["-DA", "-x", "-D", "B", "-o", "a.o", "a.c"]),
+        )
+        self.assertEqual((0, 1), (parser.memo.hits, parser.memo.misses))
+        self.assertEqual(
+            (
+                {
+                    "definitions": ["A", "B"],
+                    "flags": ["-x"],
+                    "g": None,
+                    "infiles": ["b.c"],
+                    "map": None,
+                    "output": "b.o",
+                },
+                ["-x"],
+            ),
+            parse(["-DA", "-x", "-D", "B", "-o", "b.o", "b.c"]),
+        )
+        self.assertEqual((1, 1), (parser.memo.hits, parser.memo.misses))
+
+        # -g consumes the next token only if it's not a flag
+        ns, unused_ = parse(["-DA", "-g", "b.c"])
+        self.assertEqual(["b.c"], ns["g"])
+        self.assertEqual([], ns["infiles"])
+        ns, unused_ = parse(["-DA", "-g"])
+        self.assertEqual([], ns["g"])
+        ns, unused_ = parse(["-DA", "-g", "c.c"])
+        self.assertEqual(["c.c"], ns["g"])
+        self.assertEqual((2, 3), (parser.memo.hits, parser.memo.misses))
+
+        # results of handlers are never reused
+        ns, unused_ = parse(["--map", "a", "-o", "a.o"])
+        self.assertEqual("resolved/a", ns["map"])
+        ns, unused_ = parse(["--map", "a", "-o", "b.o"])
+        self.assertEqual("resolved/a", ns["map"])
+        self.assertListEqual(["a", "a"], resolved)
+
     def test_deepcopy_1(self):
         parser = ArgumentParserEx()
         parser.add_argument("-a")
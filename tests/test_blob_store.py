@@ -0,0 +1,93 @@
+import os
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.blob_store import BlobStore, get_blob_store  # noqa: E402
+from build_migrator.helpers import (  # noqa: E402
+    get_blob_file_target,
+    get_file_content,
+    get_file_target,
+    set_file_content,
+)
+
+
+class TestBlobStore(base.TestBase):
+    def test_put_and_get(self):
+        store = BlobStore(os.path.join(self.test_method_out_dir, "blobs"))
+        # directory is created when the first blob is stored
+        self.assertFalse(os.path.exists(store.directory))
+        self.assertNotIn("0" * 40, store)
+        key = store.put(b"content")
+        self.assertEqual(key, store.put(b"content"))
+        self.assertNotEqual(key, store.put(b"other content"))
+        self.assertIn(key, store)
+        self.assertEqual(b"content", store.get(key))
+
+    def test_put_file(self):
+        store = get_blob_store(self.test_method_out_dir)
+        paths = []
+        for name in ["a.txt", "b.txt"]:
+            path = os.path.join(self.test_method_out_dir, name)
+            with open(path, "wb") as f:
+                f.write(b"same\0content")
+            paths.append(path)
+
+        key, size = store.put_file(paths[0])
+        self.assertEqual(12, size)
+        self.assertEqual((key, size), store.put_file(paths[1]))
+        self.assertEqual(key, store.put(b"same\0content"))
+        # identical files are stored once
+        self.assertListEqual([key], os.listdir(os.path.dirname(store.path(key))))
+
+        copy_path = os.path.join(self.test_method_out_dir, "copy.txt")
+        store.copy(key, copy_path)
+        with open(copy_path, "rb") as f:
+            self.assertEqual(b"same\0content", f.read())
+
+    def test_file_content(self):
+        self.assertIsNone(get_blob_store(None))
+
+        target = get_file_target(b"inline", "@build_dir@/a.txt")
+        self.assertEqual(b"inline", get_file_content(target))
+
+        store = BlobStore(os.path.join(self.test_method_out_dir, "blobs"))
+        set_file_content(target, b"stored", store)
+        self.assertNotIn("content", target)
+        self.assertEqual(6, target["size"])
+        self.assertEqual(b"stored", get_file_content(target, store))
+
+        target = get_blob_file_target(target["content_hash"], 6, "@build_dir@/b.txt")
+        self.assertRaises(ValueError, get_file_content, target)
+        set_file_content(target, b"inline")
+        self.assertEqual(
+            {"type": "file", "content": b"inline", "output": "@build_dir@/b.txt"},
+            target,
+        )
+
+    def test_save_and_load_build_object_model(self):
+        from build_migrator.core import BuildMigrator
+
+        out_dir = os.path.join(self.test_method_out_dir, "out")
+        bom_dir = os.path.join(self.test_method_out_dir, "bom")
+        os.makedirs(bom_dir)
+
+        migrator = BuildMigrator(settings={})
+        store = get_blob_store(out_dir, migrator)
+        key = store.put(b"content")
+        bom_path = os.path.join(bom_dir, "bom.pickle")
+        migrator.save_build_object_model(
+            bom_path, [get_blob_file_target(key, 7, "@build_dir@/a.txt")]
+        )
+        # blobs are copied next to the Build Object Model
+        self.assertIn(key, BlobStore(os.path.join(bom_dir, "blobs")))
+
+        migrator = BuildMigrator(settings={})
+        targets = migrator.load_build_object_model(bom_path)
+        store = get_blob_store(
+            os.path.join(self.test_method_out_dir, "out2"), migrator
+        )
+        self.assertEqual(b"content", get_file_content(targets[0], store))
+        # blob is read from fallback directory, not copied
+        self.assertFalse(os.path.exists(store.directory))
@@ -0,0 +1,204 @@
+import io
+import os
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common import bom_stream  # noqa: E402
+from build_migrator.common.bom_stream import BomReader, BomWriter  # noqa: E402
+from build_migrator.common.records import (  # noqa: E402
+    ModuleRecord,
+    SourceRecord,
+    to_record,
+)
+from build_migrator.core import BuildMigrator  # noqa: E402
+from build_migrator.helpers import (  # noqa: E402
+    ModuleTypes,
+    get_module_target,
+    get_source_file_reference,
+)
+
+
+def _write(targets):
+    f = io.BytesIO()
+    writer = BomWriter(f)
+    for target in targets:
+        writer.write(target)
+    writer.close()
+    return f.getvalue()
+
+
+def _read(data):
+    return BomReader(io.BytesIO(data)).read()
+
+
+# not supported by marshal
+class _Value(object):
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, _Value) and self.value == other.value
+
+
+class TestBomStream(base.TestBase):
+    targets = [
+        {
+            "type": "module",
+            "module_type": "static_lib",
+            "name": "a",
+            "output": "@build_dir@/liba.a",
+            "msvc_import_lib": None,
+            "compile_flags": ["-O2", "-DA"],
+            "sources": [
+                {"path": "@source_dir@/a.c", "compile_flags": ["-O2"], "language": "C"}
+            ],
+            "dependencies": [],
+        },
+        {
+            "type": "module",
+            "module_type": "shared_lib",
+            "name": "b",
+            "output": "@build_dir@/b.dll",
+            "msvc_import_lib": ["@build_dir@/b.lib"],
+            "libs": ["@build_dir@/liba.a", "-lm"],
+            "dependencies": ["@build_dir@/liba.a"],
+            "version": None,
+        },
+        {
+            "type": "file",
+            "output": "@build_dir@/c.txt",
+            "content": b"\0\xff",
+            "size": 2,
+        },
+        {
+            "type": "module",
+            "module_type": "executable",
+            "name": "d",
+            "output": "@build_dir@/d",
+            "dependencies": ["@build_dir@/b.lib", "@build_dir@/c.txt"],
+        },
+        {
+            "type": "variable",
+            "name": "v",
+            "value": [1, -2 ** 40, 2 ** 70, 0.5, True, False, (1, "x")],
+            "properties": {1: "int key"},
+        },
+    ]
+
+    def test_round_trip(self):
+        data = _write(self.targets)
+        self.assertListEqual(self.targets, _read(data))
+        self.assertListEqual(self.targets, list(BomReader(io.BytesIO(data))))
+
+    def test_records(self):
+        flag = "-DFLAG"
+        targets = [
+            get_module_target(
+                ModuleTypes.static_lib,
+                "a",
+                "@build_dir@/liba.a",
+                compile_flags=[flag],
+                sources=[
+                    get_source_file_reference("a.c", "C", [flag]),
+                    {"path": "b.c", "language": "C"},
+                ],
+            ),
+            to_record({"type": "directory", "output": "@build_dir@/dir"}),
+        ]
+        targets[0]["c_flags"] = ["-O2"]
+        del targets[0]["version"]
+
+        loaded = _read(_write(targets))
+        self.assertListEqual(targets, loaded)
+        self.assertIsInstance(loaded[0], ModuleRecord)
+        self.assertIsInstance(loaded[0]["sources"][0], SourceRecord)
+        self.assertIs(dict, type(loaded[0]["sources"][1]))
+        self.assertNotIn("version", loaded[0])
+        for t1, t2 in zip(targets, loaded):
+            self.assertIs(type(t1), type(t2))
+        if bom_stream.MARSHAL_VERSION >= 3:
+            # strings are shared
+            self.assertIs(
+                loaded[0]["compile_flags"][0],
+                loaded[0]["sources"][0]["compile_flags"][0],
+            )
+
+    def test_chunks(self):
+        targets = [
+            {"type": "directory", "output": "@build_dir@/%d" % idx, "dependencies": []}
+            for idx in range(25)
+        ]
+        # chunk with values not supported by marshal is pickled
+        targets[12]["value"] = _Value(1)
+        chunk_size = bom_stream.CHUNK_SIZE
+        bom_stream.CHUNK_SIZE = 10
+        try:
+            data = _write(targets)
+        finally:
+            bom_stream.CHUNK_SIZE = chunk_size
+        self.assertListEqual(targets, _read(data))
+
+    def test_partial_load(self):
+        migrator = BuildMigrator()
+        targets = [to_record(t) for t in self.targets]
+        for ext in [".bom", ".pickle"]:
+            path = os.path.join(self.test_method_out_dir, "bom" + ext)
+            migrator.save_build_object_model(path, targets)
+
+        def outputs(top_level_outputs):
+            """Returns outputs of targets loaded from each format"""
+            result = []
+            for ext in [".bom", ".pickle"]:
+                path = os.path.join(self.test_method_out_dir, "bom" + ext)
+                loaded = migrator.load_build_object_model(path, top_level_outputs)
+                result.append([t.get("output") for t in loaded])
+            self.assertEqual(result[0], result[1])
+            return result[0]
+
+        self.assertListEqual(
+            ["@build_dir@/liba.a", "@build_dir@/b.dll", None],
+            outputs(["@build_dir@/b.dll"]),
+        )
+        self.assertListEqual(
+            [
+                "@build_dir@/liba.a",
+                "@build_dir@/b.dll",
+                "@build_dir@/c.txt",
+                "@build_dir@/d",
+                None,
+            ],
+            outputs(["@build_dir@/d"]),
+        )
+        all_outputs = [t.get("output") for t in self.targets]
+        self.assertListEqual(all_outputs, outputs(None))
+        self.assertListEqual(all_outputs, outputs([]))
+        for ext in [".bom", ".pickle"]:
+            self.assertRaises(
+                ValueError,
+                migrator.load_build_object_model,
+                os.path.join(self.test_method_out_dir, "bom" + ext),
+                ["@build_dir@/missing"],
+            )
+
+    def test_invalid_file(self):
+        data = _write(self.targets)
+        self.assertRaises(ValueError, _read, b"garbage")
+        self.assertRaises(ValueError, _read, data[:-10])
+        # version 65535
+        newer = data[:6] + b"\xff\xff" + data[8:]
+        self.assertRaises(ValueError, _read, newer)
+        # marshal version 65535
+        newer = data[:8] + b"\xff\xff" + data[10:]
+        self.assertRaises(ValueError, _read, newer)
+        # corrupted chunk
+        corrupted = data[:15] + b"\xff" * 8 + data[23:]
+        self.assertRaises(ValueError, _read, corrupted)
+
+    def test_save_and_load(self):
+        path = os.path.join(self.test_method_out_dir, "bom.bom")
+        bom_stream.save(path, self.targets)
+        self.assertListEqual(self.targets, bom_stream.load(path))
+        self.assertTrue(bom_stream.is_bom_stream_path(path))
+        self.assertFalse(bom_stream.is_bom_stream_path("bom.pickle"))
@@ -0,0 +1,96 @@
+import os
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.dependency_graph import DependencyGraph  # noqa: E402
+from build_migrator.helpers import (  # noqa: E402
+    filter_top_level_targets,
+    get_target_and_dependencies,
+)
+
+
+def _target(output, dependencies=None, **kwargs):
+    target = {"type": "cmd", "output": output, "dependencies": dependencies or []}
+    target.update(kwargs)
+    return target
+
+
+def _outputs(targets):
+    return [t["output"] for t in targets]
+
+
+class TestDependencyGraph(base.TestBase):
+    def _get_targets(self):
+        return [
+            _target("a.o", ["a.c"]),
+            _target("b.o", ["b.c", "a.h"]),
+            _target("a.dll", ["a.o", "b.o"], msvc_import_lib=["a.lib"]),
+            _target("main.exe", ["a.lib", "b.o"]),
+        ]
+
+    def test_index(self):
+        targets = self._get_targets()
+        graph = DependencyGraph(targets)
+        self.assertIs(targets[2], graph["a.lib"])
+        self.assertIs(targets[2], graph.get("a.dll"))
+        self.assertIn("b.o", graph)
+        self.assertNotIn("a.c", graph)
+        self.assertIsNone(graph.get("a.c"))
+        self.assertEqual(5, len(graph))
+        self.assertEqual(["a.dll", "b.o"], _outputs(graph.get_dependencies(targets[3])))
+        self.assertEqual(["a.dll", "main.exe"], _outputs(graph.get_dependents(targets[1])))
+        self.assertEqual(["main.exe"], _outputs(graph.get_dependents(targets[2])))
+
+    def test_duplicate_outputs(self):
+        # e.g., object libraries compiled from the same source
+        a = _target("x.o", ["a.c"])
+        b = _target("x.o", ["b.c"])
+        main = _target("main.exe", ["x.o"])
+        graph = DependencyGraph([a, b, main])
+        # the last target wins, as in dictionaries built from target lists
+        self.assertIs(b, graph["x.o"])
+        self.assertEqual([], graph.get_dependents(a))
+        self.assertEqual([main], graph.get_dependents(b))
+
+        graph = DependencyGraph([a, main])
+        self.assertIs(a, graph.get("x.o"))
+        self.assertEqual([main], graph.get_dependents(a))
+        graph = DependencyGraph([b, a])
+        self.assertIs(a, graph.get("x.o"))
+        self.assertEqual([], graph.get_dependents(a))
+
+    def test_traversal(self):
+        targets = self._get_targets()
+        graph = DependencyGraph(targets)
+        skip_set = set()
+        self.assertEqual(
+            ["a.o", "b.o", "a.dll", "main.exe"],
+            _outputs(graph.iter_target_and_dependencies(targets[3], skip_set)),
+        )
+        self.assertEqual(set(["a.o", "b.o", "a.dll", "main.exe"]), skip_set)
+        self.assertEqual(
+            [],
+            _outputs(get_target_and_dependencies(targets[2], graph, skip_set)),
+        )
+        self.assertEqual(
+            ["a.o", "b.o", "a.dll"],
+            _outputs(get_target_and_dependencies(targets[2], graph, set())),
+        )
+
+        # deeper than recursion limit
+        chain = [_target("0")]
+        for idx in range(1, sys.getrecursionlimit() + 100):
+            chain.append(_target(str(idx), [str(idx - 1)]))
+        graph = DependencyGraph(chain)
+        self.assertEqual(
+            len(chain),
+            len(list(graph.iter_target_and_dependencies(chain[-1]))),
+        )
+        self.assertEqual(
+            chain, filter_top_level_targets(chain, top_level_output=[chain[-1]["output"]])
+        )
+        self.assertRaises(
+            ValueError, filter_top_level_targets, chain, top_level_output=["missing"]
+        )
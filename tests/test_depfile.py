@@ -0,0 +1,40 @@
+import os
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.depfile import parse_depfile, read_depfile  # noqa: E402
+
+
+class TestDepfile(base.TestBase):
+    def test_parse_depfile(self):
+        self.assertListEqual([], parse_depfile(""))
+        self.assertListEqual([(["a.o"], [])], parse_depfile("a.o:"))
+        self.assertListEqual(
+            [(["a.o"], ["a.c", "a.h", "b.h"])],
+            parse_depfile("a.o: a.c a.h \\\n  b.h\n"),
+        )
+        self.assertListEqual(
+            [(["a.o"], ["a.c", "a.h"]), (["a.h"], [])],
+            parse_depfile("a.o: a.c \\\r\n a.h\r\n\r\na.h:\r\n"),
+        )
+        self.assertListEqual(
+            [(["a.o", "a.d"], ["a.c"])], parse_depfile("a.o a.d : a.c"),
+        )
+
+    def test_parse_depfile_escaping(self):
+        self.assertListEqual(
+            [(["a b.o"], ["dir with spaces/a.c", "#.h", "$.h"])],
+            parse_depfile("a\\ b.o: dir\\ with\\ spaces/a.c \\#.h $$.h"),
+        )
+        self.assertListEqual(
+            [(["C:\\build\\a.obj"], ["C:\\src\\a.c", "C:\\src\\include\\a.h"])],
+            parse_depfile("C:\\build\\a.obj: C:\\src\\a.c \\\n C:\\src\\include\\a.h"),
+        )
+
+    def test_read_depfile(self):
+        path = os.path.join(self.test_method_out_dir, "a.d")
+        with open(path, "wt") as f:
+            f.write("a.o: a.c a.h b.h\nb.o: b.c b.h\na.h:\nb.h:\n")
+        self.assertListEqual(["a.c", "a.h", "b.h", "b.c"], read_depfile(path))
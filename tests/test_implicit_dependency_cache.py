@@ -0,0 +1,90 @@
+import os
+import sys
+import time
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.implicit_dependency_cache import (
+    ImplicitDependencyCache,
+)  # noqa: E402
+
+
+class TestImplicitDependencyCache(base.TestBase):
+    def _write(self, relpath, content):
+        path = os.path.join(self.test_method_out_dir, relpath)
+        with open(path, "wt") as f:
+            f.write(content)
+        return path
+
+    def _create_cache(self, max_size=1024 * 1024):
+        return ImplicitDependencyCache(
+            os.path.join(self.test_method_out_dir, "cache"), max_size
+        )
+
+    def test_hit_and_miss(self):
+        cwd = self.test_method_out_dir
+        self._write("a.c", '#include "a.h"')
+        self._write("a.h", "")
+        cmd = ["gcc", "-M", "a.c"]
+
+        cache = self._create_cache()
+        self.assertIsNone(cache.get("gcc", cmd, cwd, ["a.c"]))
+        cache.put("gcc", cmd, cwd, ["a.c"], ["a.h"])
+        self.assertEqual(["a.h"], cache.get("gcc", cmd, cwd, ["a.c"]))
+        self.assertIsNone(cache.get("gcc", cmd + ["-DA"], cwd, ["a.c"]))
+        self.assertIsNone(cache.get("nasm", cmd, cwd, ["a.c"]))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(3, cache.misses)
+        cache.close()
+
+        # persists between runs
+        cache = self._create_cache()
+        self.assertEqual(["a.h"], cache.get("gcc", cmd, cwd, ["a.c"]))
+
+    def test_invalidation(self):
+        cwd = self.test_method_out_dir
+        self._write("a.c", '#include "a.h"')
+        self._write("a.h", "")
+        cmd = ["gcc", "-M", "a.c"]
+
+        cache = self._create_cache()
+        cache.put("gcc", cmd, cwd, ["a.c"], ["a.h"])
+        cache.close()
+
+        self._write("a.h", '#include "b.h"')
+        cache = self._create_cache()
+        self.assertIsNone(cache.get("gcc", cmd, cwd, ["a.c"]))
+        cache.put("gcc", cmd, cwd, ["a.c"], ["a.h", "b.h"])
+        cache.close()
+
+        self._write("a.c", "")
+        cache = self._create_cache()
+        self.assertIsNone(cache.get("gcc", cmd, cwd, ["a.c"]))
+
+    def test_eviction(self):
+        cwd = self.test_method_out_dir
+        self._write("a.c", "")
+
+        cache = self._create_cache()
+        for idx in range(10):
+            cache.put("gcc", ["gcc", "-D%d" % idx], cwd, ["a.c"], [])
+        cache.close()
+
+        # make entry 0 the most recently used one
+        past = time.time() - 100
+        for root, _, files in os.walk(cache.directory):
+            for f in files:
+                os.utime(os.path.join(root, f), (past, past))
+        cache = self._create_cache()
+        self.assertEqual([], cache.get("gcc", ["gcc", "-D0"], cwd, ["a.c"]))
+        entry_size = os.path.getsize(
+            cache._get_entry_path(cache._get_key("gcc", ["gcc", "-D0"], cwd, ["a.c"]))
+        )
+        cache.max_size = entry_size
+        cache.close()
+
+        cache = self._create_cache()
+        self.assertEqual([], cache.get("gcc", ["gcc", "-D0"], cwd, ["a.c"]))
+        for idx in range(1, 10):
+            self.assertIsNone(cache.get("gcc", ["gcc", "-D%d" % idx], cwd, ["a.c"]))
@@ -0,0 +1,57 @@
+import bz2
+import gzip
+import os
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common import log_source  # noqa: E402
+from build_migrator.common.log_source import open_log_source  # noqa: E402
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+
+class TestLogSource(base.TestBase):
+    content = b"first\r\nsecond\rthird\n\nfourth \xff\xfe\nlast"
+    expected_lines = ["first", "second", "third", "", u"fourth \ufffd\ufffd", "last"]
+
+    def _read(self, path):
+        with open_log_source(path) as lines:
+            return list(lines)
+
+    def _write(self, name, content, open_func=open):
+        path = os.path.join(self.test_method_out_dir, name)
+        with open_func(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_plain(self):
+        path = self._write("build.log", self.content)
+        self.assertListEqual(self.expected_lines, self._read(path))
+        path = self._write("empty.log", b"")
+        self.assertListEqual([], self._read(path))
+
+    def test_chunks(self):
+        chunk_size = log_source.LogSource.chunk_size
+        log_source.LogSource.chunk_size = 3
+        try:
+            path = self._write("build.log", self.content)
+            self.assertListEqual(self.expected_lines, self._read(path))
+        finally:
+            log_source.LogSource.chunk_size = chunk_size
+
+    def test_compressed(self):
+        formats = [("gz", gzip.GzipFile), ("bz2", bz2.BZ2File)]
+        if lzma is not None:
+            formats.append(("xz", lzma.LZMAFile))
+        for ext, open_func in formats:
+            # detected by extension
+            path = self._write("build.log." + ext, self.content, open_func)
+            self.assertListEqual(self.expected_lines, self._read(path))
+            # detected by magic
+            path = self._write(ext + ".log", self.content, open_func)
+            self.assertListEqual(self.expected_lines, self._read(path))
@@ -0,0 +1,25 @@
+import logging
+import os
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.logging_ex import LazyFormat  # noqa: E402
+
+
+class TestLoggingEx(base.TestBase):
+    def test_lazy_format(self):
+        calls = []
+
+        def _format(value):
+            calls.append(value)
+            return "<%s>" % value
+
+        logger = logging.getLogger("test_logging_ex")
+        logger.setLevel(logging.INFO)
+        logger.debug("%s", LazyFormat(_format, 1))
+        self.assertListEqual([], calls)
+
+        self.assertEqual("<2>", "%s" % LazyFormat(_format, 2))
+        self.assertListEqual([2], calls)
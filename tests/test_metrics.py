@@ -0,0 +1,53 @@
+import json
+import os
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.metrics import call_measured, Metrics  # noqa: E402
+
+
+class TestMetrics(base.TestBase):
+    def test_metrics(self):
+        metrics = Metrics()
+        with metrics.stage("optimize") as stage:
+            stage["targets"] = 1
+        call_measured(metrics, "optimize", "Split", lambda t: [t, t], {})
+        call_measured(metrics, "optimize", "Split", lambda t: None, {})
+        call_measured(metrics, "generate", "Gen", lambda t: False, [{}, {}])
+        metrics.add_cache_stats("cache", 3, 1)
+        metrics.add_cache_stats("empty", 0, 0)
+
+        path = os.path.join(self.test_method_out_dir, "metrics.json")
+        metrics.save(path)
+        with open(path) as f:
+            result = json.load(f)
+
+        self.assertEqual(1, result["stages"]["optimize"]["calls"])
+        self.assertEqual(1, result["stages"]["optimize"]["targets"])
+        split = result["modules"]["optimize"]["Split"]
+        self.assertEqual(2, split["calls"])
+        self.assertEqual(2, split["targets_in"])
+        self.assertEqual(2, split["targets_out"])
+        gen = result["modules"]["generate"]["Gen"]
+        self.assertEqual(2, gen["targets_in"])
+        self.assertEqual(0, gen["targets_out"])
+        self.assertEqual(0.75, result["caches"]["cache"]["hit_rate"])
+        self.assertIsNone(result["caches"]["empty"]["hit_rate"])
+
+    def test_merge(self):
+        metrics = Metrics()
+        call_measured(metrics, "parse", "Gcc", lambda t: t, {})
+        metrics.add_cache_stats("cache", 1, 1)
+        other = Metrics()
+        call_measured(other, "parse", "Gcc", lambda t: [t, t], {})
+        call_measured(other, "parse", "Ar", lambda t: t, {})
+        other.add_cache_stats("cache", 2, 0)
+
+        metrics.merge(other)
+        gcc = metrics.modules["parse"]["Gcc"]
+        self.assertEqual(2, gcc.calls)
+        self.assertEqual(3, gcc.targets_out)
+        self.assertEqual(1, metrics.modules["parse"]["Ar"].calls)
+        self.assertDictEqual({"hits": 3, "misses": 1}, metrics.caches["cache"])
@@ -0,0 +1,116 @@
+import os
+import shutil
+import struct
+import sys
+import time
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.ninja_deps import NinjaDeps  # noqa: E402
+
+
+def write_ninja_deps(path, records, version=4):
+    """records: list of (output, [inputs])"""
+    ids = {}
+
+    def _write_path(f, p):
+        if p in ids:
+            return ids[p]
+        data = p.encode("utf-8")
+        data += b"\0" * ((4 - len(data) % 4) % 4)
+        f.write(struct.pack("<I", len(data) + 4))
+        f.write(data)
+        f.write(struct.pack("<I", ~len(ids) & 0xFFFFFFFF))
+        ids[p] = len(ids)
+        return ids[p]
+
+    with open(path, "wb") as f:
+        f.write(b"# ninjadeps\n")
+        f.write(struct.pack("<i", version))
+        for output, inputs in records:
+            input_ids = [_write_path(f, p) for p in [output] + inputs]
+            output_id = input_ids.pop(0)
+            mtime = struct.pack("<q" if version >= 4 else "<i", 12345)
+            data = struct.pack("<i", output_id) + mtime
+            data += struct.pack("<%di" % len(input_ids), *input_ids)
+            f.write(struct.pack("<I", len(data) | 0x80000000))
+            f.write(data)
+
+
+class TestNinjaDeps(base.TestBase):
+    def test_read(self):
+        for version in [3, 4]:
+            path = os.path.join(self.test_method_out_dir, "v%d.ninja_deps" % version)
+            write_ninja_deps(
+                path,
+                [
+                    ("a.o", ["../src/a.c", "a.h"]),
+                    ("obj/b.o", ["/src/b.c", "a.h", "/usr/include/stdio.h"]),
+                    # overrides the first record
+                    ("a.o", ["../src/a.c"]),
+                ],
+                version=version,
+            )
+            deps = NinjaDeps(path)
+            self.assertEqual(2, len(deps))
+            self.assertListEqual(["../src/a.c"], deps.get("a.o"))
+            self.assertListEqual(
+                ["/src/b.c", "a.h", "/usr/include/stdio.h"],
+                deps.get(os.path.join(self.test_method_out_dir, "obj/b.o")),
+            )
+            self.assertIsNone(deps.get("c.o"))
+
+    def test_truncated(self):
+        path = os.path.join(self.test_method_out_dir, ".ninja_deps")
+        write_ninja_deps(path, [("a.o", ["a.c"]), ("b.o", ["b.c"])])
+        with open(path, "rb") as f:
+            content = f.read()
+        with open(path, "wb") as f:
+            f.write(content[:-2])
+        deps = NinjaDeps(path)
+        self.assertListEqual(["a.c"], deps.get("a.o"))
+        self.assertIsNone(deps.get("b.o"))
+
+    def test_invalid(self):
+        path = os.path.join(self.test_method_out_dir, ".ninja_deps")
+        with open(path, "wb") as f:
+            f.write(b"# ninjalog v5\n")
+        self.assertRaises(ValueError, NinjaDeps, path)
+
+    def test_parse(self):
+        """Check that dependencies recorded by Ninja are used
+        instead of running preprocessor, unless they're outdated
+        """
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        test_data_dir = os.path.join(self.test_method_out_dir, "data")
+        shutil.copytree(self.test_method_dir, test_data_dir)
+        build_dir = os.path.join(test_data_dir, "build")
+        write_ninja_deps(
+            os.path.join(build_dir, ".ninja_deps"),
+            [("foo.o", ["../source/foo.c", "generated.h"])],
+        )
+
+        # generated.h is listed in .ninja_deps only
+        now = time.time()
+        os.utime(os.path.join(build_dir, "foo.o"), (now, now))
+        self.parse_and_generate(
+            "linux",
+            presets=["linux", "ninja"],
+            log_type="ninja",
+            test_data_dir=test_data_dir,
+        )
+
+        # outdated dependencies are ignored: older than the source file
+        source = os.path.join(test_data_dir, "source", "foo.c")
+        past = os.path.getmtime(source) - 1000
+        os.utime(os.path.join(build_dir, "foo.o"), (past, past))
+        self.parse_and_generate(
+            "linux",
+            presets=["linux", "ninja"],
+            log_type="ninja",
+            cmakelists_name="CMakeLists_outdated.txt",
+            test_data_dir=test_data_dir,
+        )
@@ -0,0 +1,80 @@
+import logging
+import os
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.optimizers import order_by_dependency  # noqa: E402
+from build_migrator.optimizers.order_by_dependency import (  # noqa: E402
+    OrderTargetByDependency,
+)
+
+
+def _target(output, dependencies=None, **kwargs):
+    target = {"type": "cmd", "output": output, "dependencies": dependencies or []}
+    target.update(kwargs)
+    return target
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestOrderTargetByDependency(base.TestBase):
+    def _optimize(self, targets):
+        handler = _ListHandler()
+        logger = order_by_dependency.logger
+        logger.addHandler(handler)
+        try:
+            result = OrderTargetByDependency().optimize(targets)
+        finally:
+            logger.removeHandler(handler)
+        return [t.get("output") for t in result], handler.messages
+
+    def test_stable_order(self):
+        targets = [
+            _target("a", ["d", "c.lib", "external"]),
+            _target("b"),
+            {"type": "class", "dependencies": ["e"]},
+            _target("c", ["e"], msvc_import_lib=["c.lib"]),
+            _target("d", ["c"]),
+            _target("e"),
+            _target("f", ["a"]),
+        ]
+        # dependencies are placed before the first target that needs them
+        self.assertEqual(
+            (["e", "c", "d", "a", "b", None, "f"], []), self._optimize(targets)
+        )
+        # already ordered targets aren't moved
+        self.assertEqual(
+            (["e", "c", "d", "a", "b", None, "f"], []), self._optimize(targets)
+        )
+
+    def test_cycles(self):
+        targets = [
+            _target("a", ["b"]),
+            _target("b", ["c", "a"]),
+            _target("c", ["a"]),
+            _target("d", ["d", "a"]),
+        ]
+        outputs, messages = self._optimize(targets)
+        self.assertEqual(["c", "b", "a", "d"], outputs)
+        # all cycles are reported at once
+        self.assertEqual(1, len(messages))
+        self.assertEqual(
+            ["Dependency cycles found:", "a -> b -> a", "a -> b -> c -> a", "d -> d"],
+            messages[0].splitlines(),
+        )
+
+    def test_deep_chain(self):
+        count = sys.getrecursionlimit() + 100
+        targets = [_target(str(idx + 1), [str(idx)]) for idx in range(count)]
+        targets.append(_target("0"))
+        outputs, _ = self._optimize(list(reversed(targets)))
+        self.assertEqual([str(idx) for idx in range(count + 1)], outputs)
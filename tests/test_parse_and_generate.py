@@ -1,7 +1,12 @@
+import gzip
+import json
 import os
+import pickle
 import shutil
 import subprocess
 import sys
+import threading
+import time
 import unittest
 
 __module_dir = os.path.dirname(os.path.abspath(__file__))
@@ -50,6 +55,252 @@ class TestParseAndGenerate(base.TestBase):
         path = os.path.join(prebuilt_dir, "include/openssl/opensslconf.h")
         self.assertTrue(os.path.exists(path), path)
 
+    def test_implicit_deps_jobs(self):
+        """Check that concurrent search for implicit dependencies doesn't change the result
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir("relpath_unix")
+
+        thread_count = threading.active_count()
+        # ignore_compile_flags: workaround for SailfishOS
+        self.parse_and_generate(
+            "linux",
+            cmake_project_name="openssl",
+            ignore_compile_flags=["-m(32|64)"],
+            implicit_deps_jobs=4,
+        )
+        # worker threads are joined when parsing is finished
+        self.assertEqual(thread_count, threading.active_count())
+
+    def test_implicit_deps_cache(self):
+        """Check that implicit dependencies are cached in output directory
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir("relpath_unix")
+
+        # ignore_compile_flags: workaround for SailfishOS
+        self.parse_and_generate(
+            "linux",
+            cmake_project_name="openssl",
+            ignore_compile_flags=["-m(32|64)"],
+            implicit_deps_cache_size=1,
+        )
+
+        cache_dir = os.path.join(self.test_method_out_dir, "out", "implicit_deps_cache")
+        entries = [f for _, _, files in os.walk(cache_dir) for f in files]
+        self.assertEqual(3, len(entries))
+
+    def test_compressed_log(self):
+        """Check that compressed build logs are decompressed on the fly
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir("relpath_unix")
+
+        build_log = os.path.join(self.test_method_out_dir, "build.log.gz")
+        with open(os.path.join(self.test_method_dir, "build.log"), "rb") as f_in:
+            with gzip.GzipFile(build_log, "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+
+        # ignore_compile_flags: workaround for SailfishOS
+        self.parse_and_generate(
+            "linux",
+            cmake_project_name="openssl",
+            ignore_compile_flags=["-m(32|64)"],
+            logs=[build_log],
+        )
+
+    def test_trace_out(self):
+        """Check that parsing trace is written in JSON Lines format
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir("relpath_unix")
+
+        trace_out = os.path.join(self.test_method_out_dir, "trace.jsonl")
+        # ignore_compile_flags: workaround for SailfishOS
+        self.parse_and_generate(
+            "linux",
+            cmake_project_name="openssl",
+            ignore_compile_flags=["-m(32|64)"],
+            trace_out=trace_out,
+        )
+
+        with open(trace_out) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual("log", records[0]["event"])
+        self.assertEqual("end", records[-1]["event"])
+        outputs = dict(
+            (r["output"], r["line"])
+            for r in records
+            if r["event"] == "target" and r["type"] == "module"
+        )
+        self.assertDictEqual(
+            {
+                "@build_dir@/initialize_cc.o": 1,
+                "@build_dir@/crypto/aes/aes-x86_64.o": 3,
+                "@build_dir@/ssl/tls_srp.o": 4,
+                "@build_dir@/libopenssl_1_1.a": 5,
+            },
+            outputs,
+        )
+
+    def test_trace_out_error(self):
+        """Check that parsing trace is written if parsing fails
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir("relpath_unix")
+
+        trace_out = os.path.join(self.test_method_out_dir, "trace.jsonl")
+        missing_log = os.path.join(self.test_method_out_dir, "missing.log")
+        with self.assertRaises(EnvironmentError):
+            # ignore_compile_flags: workaround for SailfishOS
+            self.parse_and_generate(
+                "linux",
+                cmake_project_name="openssl",
+                ignore_compile_flags=["-m(32|64)"],
+                trace_out=trace_out,
+                logs=[self.get_test_data("build.log"), missing_log],
+            )
+
+        with open(trace_out) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual("log", records[0]["event"])
+        self.assertNotIn("end", [r["event"] for r in records])
+
+    def test_save_and_load_bom_stream(self):
+        """Check that Build Object Model saved in .bom format
+        produces the same CMakeLists.txt after loading
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir("relpath_unix")
+
+        bom_path = os.path.join(self.test_method_out_dir, "bom.bom")
+        # ignore_compile_flags: workaround for SailfishOS
+        self.parse_and_generate(
+            "linux",
+            cmake_project_name="openssl",
+            ignore_compile_flags=["-m(32|64)"],
+            commands=["parse", "optimize"],
+            save=bom_path,
+        )
+        with open(bom_path, "rb") as f:
+            self.assertEqual(b"BMBOM", f.read(5))
+
+        self.parse_and_generate(
+            "linux",
+            cmake_project_name="openssl",
+            ignore_compile_flags=["-m(32|64)"],
+            commands=["generate"],
+            load=bom_path,
+        )
+
+    def test_metrics_out(self):
+        """Check that metrics of parsers, optimizers and generators are saved
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir("relpath_unix")
+
+        metrics_out = os.path.join(self.test_method_out_dir, "metrics.json")
+        # ignore_compile_flags: workaround for SailfishOS
+        self.parse_and_generate(
+            "linux",
+            cmake_project_name="openssl",
+            ignore_compile_flags=["-m(32|64)"],
+            metrics_out=metrics_out,
+        )
+
+        with open(metrics_out) as f:
+            metrics = json.load(f)
+        self.assertListEqual(
+            ["generate", "optimize", "parse"], sorted(metrics["stages"])
+        )
+        self.assertEqual(1, metrics["stages"]["parse"]["calls"])
+        parsers = metrics["modules"]["parse"]
+        # 6 log entries including end of file
+        self.assertEqual(6, parsers["LineAccumulator"]["calls"])
+        self.assertEqual(5, parsers["CommandTokenizer"]["calls"])
+        passed_sources = metrics["modules"]["optimize"]["PassSources"]
+        self.assertEqual(metrics["stages"]["parse"]["targets"], passed_sources["targets_in"])
+        self.assertGreater(passed_sources["targets_in"], passed_sources["targets_out"])
+        self.assertIn("CMakeModule", metrics["modules"]["generate"])
+        path_normalizer = metrics["caches"]["path_normalizer"]
+        self.assertGreater(path_normalizer["misses"], 0)
+        self.assertGreater(path_normalizer["hit_rate"], 0)
+        argument_parser = metrics["caches"]["argument_parser"]
+        self.assertGreater(argument_parser["misses"], 0)
+
+    def test_msvc_show_includes_batch(self):
+        """Check that sources compiled with the same flags are passed
+        to single 'cl.exe /Zs /showIncludes' invocation
+        """
+
+        test_data_dir = os.path.join(self.test_method_out_dir, "data")
+        shutil.copytree(self.test_method_dir, test_data_dir)
+        invocations = os.path.join(test_data_dir, "build", "invocations.txt")
+
+        for batch_size, expected_invocations in [(1, 3), (2, 2), (8, 2)]:
+            if os.path.exists(invocations):
+                os.remove(invocations)
+            self.parse_and_generate(
+                "windows",
+                presets=["windows", "autotools"],
+                tokenizer_ruleset="posix",
+                test_data_dir=test_data_dir,
+                show_includes_batch_size=batch_size,
+            )
+            with open(invocations) as f:
+                self.assertEqual(expected_invocations, len(f.readlines()))
+
+            # headers are attributed to the right sources
+            bom_path = os.path.join(self.test_method_out_dir, "bom.pickle")
+            self.parse_and_generate(
+                "windows",
+                presets=["windows", "autotools"],
+                tokenizer_ruleset="posix",
+                test_data_dir=test_data_dir,
+                show_includes_batch_size=batch_size,
+                commands=["parse"],
+                save=bom_path,
+            )
+            with open(bom_path, "rb") as f:
+                targets = pickle.load(f)
+            dependencies = {}
+            for target in targets:
+                if target.get("module_type") == "object_lib":
+                    dependencies[target["output"]] = sorted(
+                        os.path.basename(d)
+                        for d in target["dependencies"]
+                        if d.endswith(".h")
+                    )
+            self.assertDictEqual(
+                {
+                    "@build_dir@/a.obj": ["a.h", "common.h"],
+                    "@build_dir@/b.obj": ["common.h"],
+                    "@build_dir@/c.obj": ["c.h"],
+                },
+                dependencies,
+            )
+
     def test_generate_from_build_log_with_absolute_paths_windows(self):
         """Check that build log that uses absolute paths can be processed correctly (Windows / MSVC)
         """
@@ -184,6 +435,18 @@ class TestParseAndGenerate(base.TestBase):
 
         self.parse_and_generate("linux")
 
+    def test_response_file_removed_parse_jobs(self):
+        """Check that content of inline response file is complete
+        if commands that write and use it are parsed in different shards
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir("response_file_removed")
+
+        self.parse_and_generate("linux", parse_jobs=2)
+
     def test_response_file_not_found(self):
         """
         Check that build logs with nonexistent response files,
@@ -232,6 +495,69 @@ class TestParseAndGenerate(base.TestBase):
 
         self.parse_and_generate("linux")
 
+    def test_multiple_logs_parse_jobs(self):
+        """Check that logs parsed in separate processes produce
+        the same CMakeLists.txt
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir("multiple_logs")
+
+        metrics_out = os.path.join(self.test_method_out_dir, "metrics.json")
+        trace_out = os.path.join(self.test_method_out_dir, "trace.jsonl")
+        self.parse_and_generate(
+            "linux", parse_jobs=2, metrics_out=metrics_out, trace_out=trace_out
+        )
+
+        # metrics and trace events of subprocesses are merged
+        with open(metrics_out) as f:
+            metrics = json.load(f)
+        self.assertEqual(2, metrics["modules"]["parse"]["Clang_Gcc"]["calls"])
+        with open(trace_out) as f:
+            events = [json.loads(line) for line in f]
+        self.assertListEqual(
+            ["build1.log", "build2.log"],
+            [os.path.basename(e["log"]) for e in events if e["event"] == "log"],
+        )
+        self.assertEqual("end", events[-1]["event"])
+
+    def test_dependent_logs_parse_jobs(self):
+        """Check that logs that refer to outputs of previous logs
+        produce the same CMakeLists.txt when parsed in separate processes
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir(
+            "generate_for_selected_targets_with_multiple_build_logs"
+        )
+
+        build_dir = os.path.join(self.test_method_dir, "build")
+        targets = [
+            "a.static",
+            os.path.join(build_dir, "libb.so.2.0.1"),
+            os.path.join(build_dir, "LICENSE"),
+        ]
+        trace_out = os.path.join(self.test_method_out_dir, "trace.jsonl")
+        self.parse_and_generate(
+            "linux",
+            log_type="make",
+            targets=targets,
+            parse_jobs=2,
+            trace_out=trace_out,
+        )
+
+        # build2.log is parsed again, its trace events are written once
+        with open(trace_out) as f:
+            events = [json.loads(line) for line in f]
+        self.assertListEqual(
+            ["build1.log", "build2.log"],
+            [os.path.basename(e["log"]) for e in events if e["event"] == "log"],
+        )
+
     def test_working_directory_change(self):
         """Check that working directory changes are processed correctly
         """
@@ -312,6 +638,18 @@ class TestParseAndGenerate(base.TestBase):
             flag_optimizer_ver="2",
             aggressive_optimization=True
         )
+        # the same result with another engine
+        self.parse_and_generate(
+            "linux",
+            max_relpath_level=0,
+            path_aliases=[
+                [path + "/include", "@external_include_dir@"],
+                [path + "/lib/libexternal.a", "@external_lib@"]
+            ],
+            flag_optimizer_ver="2",
+            aggressive_optimization=True,
+            common_set_engine="bitset",
+        )
 
 
     def test_resolve_library_unix(self):
@@ -347,6 +685,28 @@ class TestParseAndGenerate(base.TestBase):
 
         self.parse_and_generate("linux", presets=["linux", "ninja"])
 
+    def test_ninja_parse_jobs(self):
+        """Check that Ninja log parsed in shards produces
+        the same CMakeLists.txt
+        """
+
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        self.set_test_data_subdir("ninja")
+
+        metrics_out = os.path.join(self.test_method_out_dir, "metrics.json")
+        self.parse_and_generate(
+            "linux", presets=["linux", "ninja"], parse_jobs=8, metrics_out=metrics_out
+        )
+
+        # Each line is a separate shard, all of them are parsed at once.
+        # Link command refers to object from previous shard, so it's parsed again.
+        with open(metrics_out) as f:
+            metrics = json.load(f)
+        self.assertEqual(5, metrics["caches"]["log_shards"]["hits"])
+        self.assertEqual(1, metrics["caches"]["log_shards"]["misses"])
+
     def test_darwin(self):
         """Check that Mac OS X / Darwin logs can be processed correctly
         """
@@ -533,6 +893,33 @@ class TestParseAndGenerate(base.TestBase):
 
         self.parse_and_generate("windows")
 
+    def test_gcc_depfile(self):
+        """Check that depfile written during the build (-MD -MF) is used
+        instead of running preprocessor, unless it's outdated
+        """
+        if not self.has_gcc:
+            self.skipTest("GCC not found in PATH")
+
+        # mtimes are modified, test data is copied
+        test_data_dir = os.path.join(self.test_method_out_dir, "data")
+        shutil.copytree(self.test_method_dir, test_data_dir)
+        depfile = os.path.join(test_data_dir, "build", "foo.d")
+
+        # generated.h is listed in depfile only
+        now = time.time()
+        os.utime(depfile, (now, now))
+        self.parse_and_generate("linux", test_data_dir=test_data_dir)
+
+        # outdated depfile is ignored: older than the source file
+        source = os.path.join(test_data_dir, "source", "foo.c")
+        past = os.path.getmtime(source) - 1000
+        os.utime(depfile, (past, past))
+        self.parse_and_generate(
+            "linux",
+            cmakelists_name="CMakeLists_outdated.txt",
+            test_data_dir=test_data_dir,
+        )
+
     def test_gcc_assembler_dependencies(self):
         """
         Check that GCC (GNU) assembler file dependencies are discovered and processed
@@ -1,12 +1,15 @@
 import cProfile
 import logging
 import os
+import pickle
 import sys
+import time
 import unittest
 
 __module_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, __module_dir)
 import base  # noqa: E402
+import benchmark  # noqa: E402
 
 
 class TestPerformance(base.TestBase):
@@ -58,3 +61,214 @@ class TestPerformance(base.TestBase):
         finally:
             profiler.disable()
             profiler.print_stats(sort="cumtime")
+
+    @unittest.skipUnless(
+        os.environ.get("BUILD_MIGRATOR_BENCHMARK"),
+        "Set BUILD_MIGRATOR_BENCHMARK=1 to run benchmarks",
+    )
+    def test_parse_throughput(self):
+        """Measures build log lines parsed per second.
+        Most lines are not commands, as in typical make logs.
+        """
+        test_data_dir = os.path.join(self.test_method_out_dir, "in")
+        build_dir = os.path.join(test_data_dir, "build")
+        source_dir = os.path.join(test_data_dir, "source")
+        build_log = os.path.join(test_data_dir, "build.log")
+        self.makedirs(build_dir)
+        self.makedirs(source_dir)
+
+        line_count = 0
+        with open(build_log, "w") as f:
+            for idx in range(10000):
+                f.write("make[1]: Entering directory '{}'\n".format(build_dir))
+                f.write("[{}%] Building CXX object src/{}.o\n".format(idx % 100, idx))
+                f.write(
+                    "../source/{idx}.cpp:{idx}:5: warning: unused variable 'x'"
+                    " [-Wunused-variable]\n".format(idx=idx)
+                )
+                f.write("     int x = {};\n".format(idx))
+                f.write("make[1]: Leaving directory '{}'\n".format(build_dir))
+                line_count += 5
+                if idx % 10 == 0:
+                    f.write("cp ../source/{idx}.txt {idx}.txt\n".format(idx=idx))
+                    line_count += 1
+                    with open(os.path.join(source_dir, "{}.txt".format(idx)), "w"):
+                        pass
+
+        root_logger = logging.getLogger()
+        level = root_logger.level
+        root_logger.setLevel(logging.WARNING)
+        try:
+            start = time.time()
+            self.parse_and_generate(
+                "linux",
+                test_data_dir=test_data_dir,
+                log_type="make",
+                commands=["parse"],
+            )
+            elapsed = time.time() - start
+        finally:
+            root_logger.setLevel(level)
+        print(
+            "Parsed {} lines in {:.2f} s: {:.0f} lines/s".format(
+                line_count, elapsed, line_count / elapsed
+            )
+        )
+
+    def test_synthetic_logs(self):
+        """Checks that synthetic build logs used by benchmarks are parsed
+        completely: 20 objects, 8 libraries (or 4 executables and 4 object
+        directories for msbuild), 20 sources and 21 headers.
+        """
+
+        root_logger = logging.getLogger()
+        level = root_logger.level
+        root_logger.setLevel(logging.WARNING)
+        try:
+            for log_type in benchmark.log_types:
+                project = benchmark.SyntheticProject(
+                    os.path.join(self.test_method_out_dir, log_type),
+                    log_type,
+                    commands=20,
+                    sources_per_lib=5,
+                    dependency_depth=2,
+                    flags=4,
+                    headers=2,
+                    preprocess_every=3,
+                )
+                project.create()
+                out_dir = os.path.join(self.test_method_out_dir, log_type + "-out")
+                result = benchmark.run_benchmark(project, out_dir)
+                self.assertEqual(69, result["parse_targets"], log_type)
+                # strings are stored once: marshal refers to repeated string
+                # objects in .bom files, pickle to interned strings (see Vocabulary)
+                self.assertLess(result["size_pickle"], 2 * result["size_bom"], log_type)
+                self.assertLess(result["size_bom"], 2 * result["size_pickle"], log_type)
+                if log_type != "msbuild":
+                    with open(os.path.join(out_dir, "CMakeLists.txt")) as f:
+                        cmakelists = f.read()
+                    self.assertIn("target_link_libraries(1 PRIVATE 0)", cmakelists)
+                    self.assertNotIn("target_link_libraries(2 ", cmakelists)
+        finally:
+            root_logger.setLevel(level)
+
+    def test_synthetic_logs_parse_jobs(self):
+        """Checks that make and ninja logs parsed in shards produce
+        the same Build Object Model and CMakeLists.txt.
+        """
+
+        root_logger = logging.getLogger()
+        level = root_logger.level
+        root_logger.setLevel(logging.WARNING)
+        try:
+            for log_type in ["make", "ninja"]:
+                project = benchmark.SyntheticProject(
+                    os.path.join(self.test_method_out_dir, log_type),
+                    log_type,
+                    commands=40,
+                    sources_per_lib=5,
+                    dependency_depth=2,
+                    flags=4,
+                    headers=2,
+                    preprocess_every=3,
+                )
+                project.create()
+                results = []
+                for parse_jobs in [1, 8]:
+                    out_dir = os.path.join(
+                        self.test_method_out_dir, "%s-%d" % (log_type, parse_jobs)
+                    )
+                    benchmark.run_benchmark(project, out_dir, parse_jobs=parse_jobs)
+                    with open(os.path.join(out_dir, "bom.pickle"), "rb") as f:
+                        targets = pickle.load(f)
+                    with open(os.path.join(out_dir, "CMakeLists.txt")) as f:
+                        cmakelists = f.read()
+                    results.append((targets, cmakelists))
+                self.assertEqual(results[0], results[1], log_type)
+        finally:
+            root_logger.setLevel(level)
+
+    def test_synthetic_bom(self):
+        bom = benchmark.get_synthetic_bom(120, "record", sources_per_lib=50)
+        self.assertEqual(123, len(bom))
+        self.assertEqual(
+            bom[:51], benchmark.get_synthetic_bom(50, "dict", sources_per_lib=50)
+        )
+        self.assertEqual(50, len(bom[50]["objects"]))
+        self.assertEqual(20, len(bom[0]["sources"][0]["compile_flags"]))
+
+    @unittest.skipUnless(
+        os.environ.get("BUILD_MIGRATOR_BENCHMARK") and sys.platform.startswith("linux"),
+        "Set BUILD_MIGRATOR_BENCHMARK=1 to run benchmarks",
+    )
+    def test_bom_memory(self):
+        """Measures RSS of Build Object Model with 100k sources"""
+        result = benchmark.measure_bom_memory(100000)
+        print(result)
+        self.assertLess(result["rss_record"], result["rss_dict"])
+
+    @unittest.skipUnless(
+        os.environ.get("BUILD_MIGRATOR_BENCHMARK") and sys.platform.startswith("linux"),
+        "Set BUILD_MIGRATOR_BENCHMARK=1 to run benchmarks",
+    )
+    def test_optimizer_memory(self):
+        """Measures RSS of GroupCommonFlagsV2 run on 20k sources"""
+        result = benchmark.measure_optimizer_memory(20000)
+        print(result)
+        self.assertLess(result["rss_transaction"], result["rss_copy"])
+
+    def test_compare_with_baseline(self):
+        baseline = {"make-1000": {"parse": 1.0, "optimize": 0.1, "total": 1.1}}
+        results = {
+            "make-1000": {"parse": 1.3, "optimize": 0.13, "total": 1.43},
+            "ninja-1000": {"parse": 9.0, "total": 9.0},
+        }
+        baseline_path = os.path.join(self.test_method_out_dir, "baseline.json")
+        benchmark.save_baseline(baseline_path, baseline)
+        self.assertListEqual(
+            # optimize: 30% slower, but within min_delta
+            [("make-1000", "parse", 1.0, 1.3), ("make-1000", "total", 1.1, 1.43)],
+            benchmark.compare(benchmark.load_baseline(baseline_path), results, 0.2),
+        )
+        self.assertListEqual([], benchmark.compare(baseline, results, 0.5))
+
+    @unittest.skipUnless(
+        os.environ.get("BUILD_MIGRATOR_BENCHMARK"),
+        "Set BUILD_MIGRATOR_BENCHMARK=1 to run benchmarks",
+    )
+    def test_synthetic_benchmarks(self):
+        """Runs benchmarks on synthetic logs of all types.
+
+        BUILD_MIGRATOR_BENCHMARK_SCALE: comma-separated numbers of compile
+            commands. Default: 1000.
+        BUILD_MIGRATOR_BENCHMARK_BASELINE: fail if any stage is slower than
+            in the given baseline (see benchmark.py --save) by more than
+            BUILD_MIGRATOR_BENCHMARK_THRESHOLD. Default: 0.2.
+        """
+        scales = [
+            int(scale)
+            for scale in os.environ.get("BUILD_MIGRATOR_BENCHMARK_SCALE", "1000").split(",")
+        ]
+        root_logger = logging.getLogger()
+        level = root_logger.level
+        root_logger.setLevel(logging.WARNING)
+        try:
+            results = benchmark.run_benchmarks(
+                self.test_method_out_dir, benchmark.log_types, scales
+            )
+        finally:
+            root_logger.setLevel(level)
+        benchmark.save_baseline(
+            os.path.join(self.test_method_out_dir, "results.json"), results
+        )
+        baseline = os.environ.get("BUILD_MIGRATOR_BENCHMARK_BASELINE")
+        if baseline:
+            threshold = float(
+                os.environ.get("BUILD_MIGRATOR_BENCHMARK_THRESHOLD", "0.2")
+            )
+            self.assertListEqual(
+                [],
+                benchmark.compare(
+                    benchmark.load_baseline(baseline), results, threshold
+                ),
+            )
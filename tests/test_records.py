@@ -0,0 +1,122 @@
+import copy
+import os
+import pickle
+import pprint
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.records import (  # noqa: E402
+    InterfaceRecord,
+    ModuleRecord,
+    SourceRecord,
+    to_record,
+)
+from build_migrator.helpers import (  # noqa: E402
+    ModuleTypes,
+    get_interface_target,
+    get_minified_target,
+    get_module_target,
+    get_source_file_reference,
+)
+
+
+class TestRecords(base.TestBase):
+    def test_dict_compatibility(self):
+        target = get_module_target(
+            ModuleTypes.static_lib,
+            "a",
+            "@build_dir@/liba.a",
+            sources=[get_source_file_reference("a.c", "C")],
+        )
+        self.assertIsInstance(target, ModuleRecord)
+        self.assertIsInstance(target["sources"][0], SourceRecord)
+        expected = {
+            "type": "module",
+            "module_type": "static_lib",
+            "output": "@build_dir@/liba.a",
+            "msvc_import_lib": None,
+            "compile_flags": [],
+            "include_dirs": [],
+            "link_flags": [],
+            "libs": [],
+            "name": "a",
+            "objects": [],
+            "sources": [
+                {
+                    "path": "a.c",
+                    "language": "C",
+                    "compile_flags": [],
+                    "include_dirs": [],
+                    "dependencies": None,
+                }
+            ],
+            "version": None,
+            "compatibility_version": None,
+            "dependencies": [],
+        }
+        self.assertEqual(expected, target)
+        self.assertEqual(target, expected)
+        self.assertEqual(sorted(expected), sorted(target))
+        self.assertEqual(len(expected), len(target))
+
+        self.assertNotIn("post_build_commands", target)
+        self.assertIsNone(target.get("post_build_commands"))
+        self.assertRaises(KeyError, lambda: target["post_build_commands"])
+        self.assertNotIn("keys", target)
+        target["post_build_commands"] = []
+        target["c_flags"] = ["-O2"]
+        self.assertIn("post_build_commands", target)
+        self.assertEqual(["-O2"], target.setdefault("c_flags", []))
+        # order of fields, then order of other keys
+        self.assertEqual(list(ModuleRecord.fields) + ["c_flags"], list(target))
+        self.assertNotEqual(expected, target)
+        self.assertEqual(["-O2"], target.pop("c_flags"))
+        del target["post_build_commands"]
+        self.assertEqual(expected, target)
+        self.assertIsNone(target.pop("c_flags", None))
+        self.assertRaises(KeyError, target.pop, "post_build_commands")
+
+        self.assertEqual(expected, dict(target))
+        shallow = copy.copy(target)
+        self.assertIs(type(target), type(shallow))
+        self.assertIs(target["sources"], shallow["sources"])
+        for other in [copy.deepcopy(target), pickle.loads(pickle.dumps(target, 2))]:
+            self.assertIs(type(target), type(other))
+            self.assertIs(type(target["sources"][0]), type(other["sources"][0]))
+            self.assertIsNot(target["sources"], other["sources"])
+            self.assertEqual(target, other)
+
+    def test_to_record(self):
+        target = get_interface_target("a", include_dirs=["include"])
+        self.assertIsInstance(target, InterfaceRecord)
+        converted = to_record(dict(target))
+        self.assertIsInstance(converted, InterfaceRecord)
+        self.assertEqual(target, converted)
+        self.assertIs(target, to_record(target))
+
+        unknown = {"type": "unknown", "output": "a"}
+        self.assertIs(unknown, to_record(unknown))
+
+    def test_to_dict(self):
+        target = get_module_target(
+            ModuleTypes.static_lib,
+            "a",
+            "@build_dir@/liba.a",
+            sources=[get_source_file_reference("a.c", "C", ["-O2"])],
+        )
+        converted = target.to_dict()
+        self.assertIs(dict, type(converted))
+        self.assertIs(dict, type(converted["sources"][0]))
+        self.assertIsNot(
+            target["sources"][0]["compile_flags"],
+            converted["sources"][0]["compile_flags"],
+        )
+        self.assertEqual(target, converted)
+        # minified targets are formatted by pprint as dictionaries
+        self.assertEqual(
+            pprint.pformat(converted, width=40),
+            pprint.pformat(get_minified_target(target), width=40),
+        )
+        self.assertIn("\n", pprint.pformat(get_minified_target(target), width=40))
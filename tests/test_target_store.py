@@ -0,0 +1,48 @@
+import os
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.target_store import TargetStore  # noqa: E402
+
+
+class TestTargetStore(base.TestBase):
+    def test_order_and_index(self):
+        a = {"output": "a", "name": "x"}
+        b = {"output": "b.dll", "name": "b", "msvc_import_lib": ["b.lib"]}
+        c = {"output": "c", "name": "x"}
+        store = TargetStore([a, b])
+        store.add(c)
+        self.assertEqual(3, len(store))
+        self.assertListEqual([a, b, c], list(store))
+        self.assertIs(b, store.find("b.lib"))
+        self.assertListEqual([a, c], store.find_by_name("x"))
+        self.assertListEqual([[a, c]], store.get_duplicate_names())
+        self.assertRaises(ValueError, store.add, a)
+
+        store.remove(b)
+        self.assertListEqual([a, c], list(store))
+        self.assertIsNone(store.find("b.dll"))
+        self.assertIsNone(store.find("b.lib"))
+        self.assertListEqual([], store.find_by_name("b"))
+
+        # removed target is added to the end
+        store.add(b)
+        self.assertListEqual([a, c, b], list(store))
+
+    def test_set_output_and_name(self):
+        a = {"output": "a", "name": "x"}
+        c = {"output": "c", "name": "x"}
+        store = TargetStore([a, c])
+        store.set_output(a, "a#1")
+        self.assertEqual("a#1", a["output"])
+        self.assertIsNone(store.find("a"))
+        self.assertIs(a, store.find("a#1"))
+
+        store.set_name(c, "y")
+        self.assertEqual("y", c["name"])
+        self.assertListEqual([a], store.find_by_name("x"))
+        self.assertListEqual([c], store.find_by_name("y"))
+        self.assertListEqual([], store.get_duplicate_names())
+        self.assertListEqual([a, c], list(store))
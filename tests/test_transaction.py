@@ -0,0 +1,102 @@
+import argparse
+import copy
+import os
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.transaction import Transaction  # noqa: E402
+from build_migrator.common.vocabulary import Vocabulary  # noqa: E402
+from build_migrator.helpers import (  # noqa: E402
+    ModuleTypes,
+    get_module_target,
+    get_source_file_reference,
+)
+from build_migrator.optimizers.group_common_flags_v2 import (  # noqa: E402
+    GroupCommonFlagsV2,
+)
+
+
+def _get_targets():
+    targets = []
+    for lib in ["a", "b", "c"]:
+        sources = [
+            get_source_file_reference(
+                "@source_dir@/%s%d.c" % (lib, idx),
+                "C",
+                ["-DCOMMON", "-DLIB_" + lib, "-O%d" % idx, ["-arch", "x86_64"]],
+                ["@source_dir@/include"],
+            )
+            for idx in range(3)
+        ]
+        targets.append(
+            get_module_target(
+                ModuleTypes.static_lib,
+                lib,
+                "@build_dir@/lib%s.a" % lib,
+                sources=sources,
+                link_flags=["-static"],
+            )
+        )
+    return targets
+
+
+class TestTransaction(base.TestBase):
+    def test_commit(self):
+        target = {"compile_flags": ["-O2"]}
+        flags = target["compile_flags"]
+        with Transaction() as transaction:
+            transaction.set(target, "compile_flags", ["-O2", "-g"])
+            transaction.set(target, "_id", 1)
+            self.assertEqual(2, len(transaction))
+        self.assertEqual({"compile_flags": ["-O2", "-g"], "_id": 1}, target)
+        self.assertEqual(["-O2"], flags)
+        self.assertEqual(0, len(transaction))
+
+    def test_rollback(self):
+        target = {"compile_flags": ["-O2"]}
+        flags = target["compile_flags"]
+        with self.assertRaises(ValueError):
+            with Transaction() as transaction:
+                transaction.set(target, "compile_flags", [])
+                transaction.set(target, "compile_flags", ["-g"])
+                transaction.set(target, "_id", 1)
+                raise ValueError()
+        self.assertEqual({"compile_flags": ["-O2"]}, target)
+        self.assertIs(flags, target["compile_flags"])
+        self.assertEqual(0, len(transaction))
+
+    def _get_optimizer(self):
+        context = argparse.Namespace(platform_name="linux", vocabulary=Vocabulary())
+        return GroupCommonFlagsV2(
+            context, flag_optimizer_ver=2, aggressive_optimization=True
+        )
+
+    def test_optimizer_edits_targets(self):
+        targets = _get_targets()
+        result = self._get_optimizer().optimize(targets)
+        # targets aren't copied
+        self.assertIs(targets[0], result[-3])
+        self.assertListEqual(
+            ["-DCOMMON", ["-arch", "x86_64"]],
+            result[0]["properties"]["compile_flags"],
+        )
+        self.assertListEqual(["-DLIB_a"], targets[0]["compile_flags"])
+        for source in targets[0]["sources"]:
+            self.assertNotIn("_id", source)
+            self.assertNotIn("-DCOMMON", source["compile_flags"])
+
+    def test_optimizer_rollback(self):
+        targets = _get_targets()
+        expected = copy.deepcopy(targets)
+        optimizer = self._get_optimizer()
+
+        def get_id(value):
+            raise RuntimeError("get_id")
+
+        # fails in aggressive optimization, after flags are grouped
+        optimizer.vocabulary.get_id = get_id
+        with self.assertRaises(RuntimeError):
+            optimizer.optimize(targets)
+        self.assertListEqual(expected, targets)
@@ -0,0 +1,57 @@
+import os
+import pickle
+import sys
+
+__module_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, __module_dir)
+import base  # noqa: E402
+from build_migrator.common.vocabulary import Vocabulary  # noqa: E402
+
+
+def _new_string(s):
+    # equal, but not the same object
+    return "".join(list(s))
+
+
+def _get_source(path):
+    return {
+        "path": path,
+        "compile_flags": [_new_string("-DNDEBUG"), [_new_string("-arch"), "x86_64"]],
+        "include_dirs": [_new_string("@source_dir@/include")],
+        "content": _new_string("content"),
+    }
+
+
+class TestVocabulary(base.TestBase):
+    def test_intern_target(self):
+        vocabulary = Vocabulary()
+        sources = [_get_source("a.c"), _get_source("b.c")]
+        flags = sources[0]["compile_flags"]
+        target = {"output": "lib.a", "sources": sources}
+        self.assertIs(target, vocabulary.intern_target(target))
+        self.assertIs(flags, sources[0]["compile_flags"])
+
+        a, b = sources
+        self.assertEqual(_get_source("a.c"), a)
+        self.assertIs(a["compile_flags"][0], b["compile_flags"][0])
+        self.assertIs(a["compile_flags"][1][0], b["compile_flags"][1][0])
+        self.assertIsNot(a["compile_flags"][1], b["compile_flags"][1])
+        self.assertIs(a["include_dirs"][0], b["include_dirs"][0])
+        # file contents aren't interned
+        self.assertIsNot(a["content"], b["content"])
+
+        # shared strings are pickled once
+        unshared = {"output": "lib.a", "sources": [_get_source(s["path"]) for s in sources]}
+        self.assertLess(len(pickle.dumps(target)), len(pickle.dumps(unshared)))
+
+    def test_ids(self):
+        vocabulary = Vocabulary()
+        a = vocabulary.get_id("-DNDEBUG")
+        b = vocabulary.get_id(["-arch", "x86_64"])
+        self.assertEqual(a, vocabulary.get_id(_new_string("-DNDEBUG")))
+        self.assertEqual(b, vocabulary.get_id(("-arch", "x86_64")))
+        self.assertNotEqual(a, b)
+        self.assertEqual(2, len(vocabulary))
+        self.assertEqual("-DNDEBUG", vocabulary.get_value(a))
+        self.assertEqual(("-arch", "x86_64"), vocabulary.get_value(b))
+        self.assertEqual([8, 2], vocabulary.lengths)